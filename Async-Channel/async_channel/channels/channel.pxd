@@ -24,20 +24,35 @@ cdef class Channel(object):
     cdef public list producers
     cdef public list consumers
 
+    cdef dict _consumers_by_filters
+    cdef int _selections_count
+    cdef dict _consumers_by_priority_level
+    cdef list _consumer_instances
+
     cdef public producer.Producer internal_producer
 
     cdef public bint is_paused
     cdef public bint is_synchronized
 
+    cdef public dict pending_items_by_priority_level
+    cdef public dict ready_channels_by_priority_level
+
     cpdef void add_new_consumer(self, object consumer, dict consumer_filters)
     cpdef list get_consumers(self)
     cpdef list get_prioritized_consumers(self, int priority_level)
     cpdef object get_producers(self)
     cpdef void unregister_producer(self, producer.Producer producer)
     cpdef list get_consumer_from_filters(self, dict consumer_filters)
+    cpdef bint is_direct_dispatch(self)
+    cpdef void set_ready_channels_by_priority_level(self, dict ready_channels_by_priority_level)
     cpdef void flush(self)
 
     cdef list _filter_consumers(self, dict consumer_filters)
+    cdef void _add_selection(self, dict consumer_filters, list filtered_consumers)
+    cdef void _use_synchronized_queue(self, object consumer)
+    cdef void _set_queue_ready_channels(self, object queue)
+    cdef void _add_to_routing_index(self, dict consumer_filters)
+    cdef void _remove_from_routing_index(self, dict consumer_filters)
     cdef bint _should_pause_producers(self)
     cdef bint _should_resume_producers(self)
 
@@ -45,4 +60,7 @@ cpdef Channel set_chan(Channel chan, str name)
 cpdef void del_chan(str name)
 cpdef Channel get_chan(str chan_name)
 
+cdef list _without(list consumers, object consumer)
+cdef void _add_matching_selection_nodes(dict selection_node, dict consumer_filters, list selection_nodes)
 cdef bint _check_filters(dict consumer_filters, dict expected_filters)
+cdef bint _check_filter(dict consumer_filters, object key, object value)
@@ -19,9 +19,13 @@ Defines the channel core class : Channel
 import typing
 
 import async_channel.util.logging_util as logging
+import async_channel.util.synchronized_queue as synchronized_queue
 import async_channel.enums
 import async_channel.channels.channel_instances as channel_instances
 
+# Routing index selection node key of the selected consumers
+_SELECTED_CONSUMERS_KEY = None
+
 
 # pylint: disable=undefined-variable, not-callable
 class Channel:
@@ -41,6 +45,13 @@ class Channel:
     # Consumer instance in consumer filters
     INSTANCE_KEY = "consumer_instance"
 
+    # When True, consumers of synchronized channels are using a SynchronizedQueue: pending items are counted
+    # by priority level to avoid going through every consumer queue to know if some are left to process
+    SYNCHRONIZED_DIRECT_DISPATCH = True
+
+    # Maximum number of resolved selections kept in the routing index, the routing index is reset when reached
+    MAX_ROUTING_INDEX_SELECTIONS = 1024
+
     # Channel default consumer priority level
     DEFAULT_PRIORITY_LEVEL = (
         async_channel.enums.ChannelConsumerPriorityLevels.HIGH.value
@@ -58,6 +69,16 @@ class Channel:
         # Channel subscribed consumers list
         self.consumers = []
 
+        # Routing index: consumer instances by selection filters and by priority level.
+        # Selections are stored in a tree of {filter key: {filter value: selection node}} dicts following the
+        # selection filters order, selected consumers are stored in the last node.
+        # Selections are resolved once and then kept up to date when consumers are added or removed.
+        # Indexed lists are replaced instead of being modified: returned lists are never changed afterwards.
+        self._consumers_by_filters = {}
+        self._selections_count = 0
+        self._consumers_by_priority_level = {}
+        self._consumer_instances = []
+
         # Used to perform global send from non-producer context
         self.internal_producer = None
 
@@ -67,6 +88,12 @@ class Channel:
         # Used to synchronize producers and consumer
         self.is_synchronized = False
 
+        # Synchronized consumers pending items count by priority level (see SYNCHRONIZED_DIRECT_DISPATCH)
+        self.pending_items_by_priority_level = {}
+
+        # Ready channels dicts by priority level shared by a scheduler (see set_ready_channels_by_priority_level)
+        self.ready_channels_by_priority_level = None
+
     @classmethod
     def get_name(cls) -> str:
         """
@@ -127,7 +154,64 @@ class Channel:
         :return: None
         """
         consumer_filters[self.INSTANCE_KEY] = consumer
+        if self.is_direct_dispatch():
+            self._use_synchronized_queue(consumer)
         self.consumers.append(consumer_filters)
+        self._add_to_routing_index(consumer_filters)
+
+    def is_direct_dispatch(self) -> bool:
+        """
+        :return: True if consumer queues are synchronized queues counting their pending items
+        """
+        return self.is_synchronized and self.SYNCHRONIZED_DIRECT_DISPATCH
+
+    def _use_synchronized_queue(self, consumer) -> None:
+        """
+        Replaces the consumer queue by a SynchronizedQueue counting pending items in this channel
+        :param consumer: the consumer to update
+        """
+        if (
+            isinstance(consumer.queue, synchronized_queue.SynchronizedQueue)
+            and consumer.queue.pending_items_by_priority_level
+            is self.pending_items_by_priority_level
+        ):
+            return
+        queue = synchronized_queue.SynchronizedQueue(
+            self.pending_items_by_priority_level, consumer.priority_level
+        )
+        while not consumer.queue.empty():
+            queue.put_nowait(consumer.queue.get_nowait())
+        consumer.queue = queue
+        self._set_queue_ready_channels(queue)
+
+    def set_ready_channels_by_priority_level(
+        self, ready_channels_by_priority_level
+    ) -> None:
+        """
+        Makes direct dispatch consumer queues mark this channel as ready for their priority level when an item is put
+        Used by schedulers to process channels only when they have pending items instead of polling them
+        :param ready_channels_by_priority_level: the scheduler ready channels dict (used as an ordered set)
+        by priority level, None to stop marking this channel as ready
+        """
+        self.ready_channels_by_priority_level = ready_channels_by_priority_level
+        for consumer in self.get_consumers():
+            if isinstance(consumer.queue, synchronized_queue.SynchronizedQueue):
+                self._set_queue_ready_channels(consumer.queue)
+
+    def _set_queue_ready_channels(self, queue) -> None:
+        """
+        Updates the queue ready channels dict according to ready_channels_by_priority_level
+        :param queue: the SynchronizedQueue to update
+        """
+        if self.ready_channels_by_priority_level is None:
+            queue.set_ready_channels(None, None)
+        else:
+            queue.set_ready_channels(
+                self.ready_channels_by_priority_level.setdefault(
+                    queue.priority_level, {}
+                ),
+                self,
+            )
 
     def get_consumer_from_filters(self, consumer_filters) -> list:
         """
@@ -144,34 +228,121 @@ class Channel:
         """
         Returns all consumers instance
         Can be overwritten according to the class needs
-        :return: the subscribed consumers list
+        :return: the subscribed consumers list, should not be modified
         """
-        return [consumer[self.INSTANCE_KEY] for consumer in self.consumers]
+        return self._consumer_instances
 
     def get_prioritized_consumers(self, priority_level) -> list:
         """
         Returns all consumers instance
         Can be overwritten according to the class needs
-        :return: the subscribed consumers list
-        """
-        return [
-            consumer[self.INSTANCE_KEY]
-            for consumer in self.consumers
-            if consumer[self.INSTANCE_KEY].priority_level <= priority_level
-        ]
+        :return: the subscribed consumers list, should not be modified
+        """
+        try:
+            return self._consumers_by_priority_level[priority_level]
+        except KeyError:
+            prioritized_consumers = [
+                consumer[self.INSTANCE_KEY]
+                for consumer in self.consumers
+                if consumer[self.INSTANCE_KEY].priority_level <= priority_level
+            ]
+            self._consumers_by_priority_level[priority_level] = prioritized_consumers
+            return prioritized_consumers
 
     def _filter_consumers(self, consumer_filters) -> list:
         """
         Returns the consumers that match the selection
         Returns all consumer instances if consumer_filter is empty
         :param consumer_filters: listed consumer filters
-        :return: the list of the filtered consumers
+        :return: the list of the filtered consumers, should not be modified
+        """
+        try:
+            selection_node = self._consumers_by_filters
+            for key, value in consumer_filters.items():
+                selection_node = selection_node[key][value]
+            return selection_node[_SELECTED_CONSUMERS_KEY]
+        except KeyError:
+            filtered_consumers = [
+                consumer[self.INSTANCE_KEY]
+                for consumer in self.consumers
+                if _check_filters(consumer, consumer_filters)
+            ]
+            self._add_selection(consumer_filters, filtered_consumers)
+            return filtered_consumers
+        except TypeError:
+            # unhashable filter value: can't be indexed
+            return [
+                consumer[self.INSTANCE_KEY]
+                for consumer in self.consumers
+                if _check_filters(consumer, consumer_filters)
+            ]
+
+    def _add_selection(self, consumer_filters, filtered_consumers) -> None:
+        """
+        Adds the resolved selection to the routing index, resets the routing index when it is full
+        :param consumer_filters: the selection filters
+        :param filtered_consumers: the consumers matching the selection
+        """
+        if self._selections_count >= self.MAX_ROUTING_INDEX_SELECTIONS:
+            self._consumers_by_filters = {}
+            self._selections_count = 0
+        selection_node = self._consumers_by_filters
+        try:
+            for key, value in consumer_filters.items():
+                selection_node = selection_node.setdefault(key, {}).setdefault(
+                    value, {}
+                )
+        except TypeError:
+            # unhashable filter value: can't be indexed
+            return
+        selection_node[_SELECTED_CONSUMERS_KEY] = filtered_consumers
+        self._selections_count += 1
+
+    def _add_to_routing_index(self, consumer_filters) -> None:
+        """
+        Adds the consumer to the already resolved selections it matches
+        :param consumer_filters: the added consumer filters
         """
-        return [
-            consumer[self.INSTANCE_KEY]
-            for consumer in self.consumers
-            if _check_filters(consumer, consumer_filters)
-        ]
+        consumer = consumer_filters[self.INSTANCE_KEY]
+        self._consumer_instances = self._consumer_instances + [consumer]
+        selection_nodes = []
+        _add_matching_selection_nodes(
+            self._consumers_by_filters, consumer_filters, selection_nodes
+        )
+        for selection_node in selection_nodes:
+            selection_node[_SELECTED_CONSUMERS_KEY] = selection_node[
+                _SELECTED_CONSUMERS_KEY
+            ] + [consumer]
+        for priority_level, prioritized_consumers in list(
+            self._consumers_by_priority_level.items()
+        ):
+            if consumer.priority_level <= priority_level:
+                self._consumers_by_priority_level[priority_level] = (
+                    prioritized_consumers + [consumer]
+                )
+
+    def _remove_from_routing_index(self, consumer_filters) -> None:
+        """
+        Removes the consumer from the resolved selections it matches
+        :param consumer_filters: the removed consumer filters
+        """
+        consumer = consumer_filters[self.INSTANCE_KEY]
+        self._consumer_instances = _without(self._consumer_instances, consumer)
+        selection_nodes = []
+        _add_matching_selection_nodes(
+            self._consumers_by_filters, consumer_filters, selection_nodes
+        )
+        for selection_node in selection_nodes:
+            selection_node[_SELECTED_CONSUMERS_KEY] = _without(
+                selection_node[_SELECTED_CONSUMERS_KEY], consumer
+            )
+        for priority_level, prioritized_consumers in list(
+            self._consumers_by_priority_level.items()
+        ):
+            if consumer in prioritized_consumers:
+                self._consumers_by_priority_level[priority_level] = _without(
+                    prioritized_consumers, consumer
+                )
 
     async def remove_consumer(self, consumer: CONSUMER_CLASS) -> None:
         """
@@ -182,6 +353,9 @@ class Channel:
         for consumer_candidate in self.consumers:
             if consumer == consumer_candidate[self.INSTANCE_KEY]:
                 self.consumers.remove(consumer_candidate)
+                self._remove_from_routing_index(consumer_candidate)
+                if isinstance(consumer.queue, synchronized_queue.SynchronizedQueue):
+                    consumer.queue.release()
                 await self._check_producers_state()
                 await consumer.stop()
 
@@ -352,6 +526,38 @@ def get_chan(chan_name) -> Channel:
     return channel_instances.ChannelInstances.instance().channels[chan_name]
 
 
+def _without(consumers, consumer) -> list:
+    """
+    :param consumers: the consumers list
+    :param consumer: the consumer to exclude
+    :return: a new list of the given consumers without the given consumer
+    """
+    return [
+        consumer_candidate
+        for consumer_candidate in consumers
+        if consumer_candidate is not consumer
+    ]
+
+
+def _add_matching_selection_nodes(
+    selection_node, consumer_filters, selection_nodes
+) -> None:
+    """
+    Adds the routing index selection nodes of the selections matching the consumer to selection_nodes
+    Only visits the routing index branches matching the consumer filters
+    :param selection_node: the routing index node to look into
+    :param consumer_filters: consumer filters
+    :param selection_nodes: the list to add the matching selection nodes to
+    """
+    for key, children in selection_node.items():
+        if key is _SELECTED_CONSUMERS_KEY:
+            selection_nodes.append(selection_node)
+            continue
+        for value, child in children.items():
+            if _check_filter(consumer_filters, key, value):
+                _add_matching_selection_nodes(child, consumer_filters, selection_nodes)
+
+
 def _check_filters(consumer_filters, expected_filters) -> bool:
     """
     Checks if the consumer match the specified filters
@@ -360,16 +566,26 @@ def _check_filters(consumer_filters, expected_filters) -> bool:
     :param expected_filters: selected filters
     :return: True if the consumer match the selection, else False
     """
-    try:
-        for key, value in expected_filters.items():
-            if value == async_channel.CHANNEL_WILDCARD:
-                continue
-            if isinstance(consumer_filters[key], list):
-                if set(consumer_filters[key]) & {value, async_channel.CHANNEL_WILDCARD}:
-                    continue
-                return False
-            if consumer_filters[key] not in [value, async_channel.CHANNEL_WILDCARD]:
-                return False
+    for key, value in expected_filters.items():
+        if not _check_filter(consumer_filters, key, value):
+            return False
+    return True
+
+
+def _check_filter(consumer_filters, key, value) -> bool:
+    """
+    Checks if the consumer match the specified filter
+    :param consumer_filters: consumer filters
+    :param key: the selected filter key
+    :param value: the selected filter value
+    :return: True if the consumer match the filter, else False
+    """
+    if value == async_channel.CHANNEL_WILDCARD:
         return True
+    try:
+        consumer_value = consumer_filters[key]
     except KeyError:
         return False
+    if isinstance(consumer_value, list):
+        return bool(set(consumer_value) & {value, async_channel.CHANNEL_WILDCARD})
+    return consumer_value in [value, async_channel.CHANNEL_WILDCARD]
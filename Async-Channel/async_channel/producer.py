@@ -129,12 +129,39 @@ class Producer:
         :param timeout: Time to wait for consumers in join call
         waiting for them when started before this check (when check, their queue is empty but a task is running)
         """
+        if self.channel.is_direct_dispatch():
+            await self._direct_dispatch_perform_consumers_queue(
+                priority_level, join_consumers, timeout
+            )
+            return
         for consumer in self.channel.get_prioritized_consumers(priority_level):
-            while not consumer.queue.empty():
-                await consumer.perform(await consumer.queue.get())
+            queue = consumer.queue
+            while not queue.empty():
+                await consumer.perform(queue.get_nowait())
             if join_consumers:
                 await consumer.join(timeout)
 
+    async def _direct_dispatch_perform_consumers_queue(
+        self, priority_level, join_consumers, timeout
+    ) -> None:
+        """
+        synchronized_perform_consumers_queue for direct dispatch channels: consumer queues are only read when
+        the channel has pending items and only consumers running in a task can have to be joined
+        :param priority_level: the consumer minimal priority level
+        :param join_consumers: True if consumer tasks should be joined
+        :param timeout: Time to wait for consumers in join call
+        """
+        has_pending_items = not self.is_consumers_queue_empty(priority_level)
+        if not (has_pending_items or join_consumers):
+            return
+        for consumer in self.channel.get_prioritized_consumers(priority_level):
+            if has_pending_items:
+                queue = consumer.queue
+                while not queue.empty():
+                    await consumer.perform(queue.get_nowait())
+            if join_consumers and consumer.consume_task is not None:
+                await consumer.join(timeout)
+
     async def stop(self) -> None:
         """
         Stops non-triggered tasks management
@@ -168,6 +195,14 @@ class Producer:
         :param priority_level: the consumer minimal priority level
         :return: the check result
         """
+        if self.channel.is_direct_dispatch():
+            for (
+                consumers_priority_level,
+                pending_items,
+            ) in self.channel.pending_items_by_priority_level.items():
+                if pending_items and consumers_priority_level <= priority_level:
+                    return False
+            return True
         for consumer in self.channel.get_consumers():
             if consumer.priority_level <= priority_level and not consumer.queue.empty():
                 return False
@@ -0,0 +1,159 @@
+#  Drakkar-Software Async-Channel
+#  Copyright (c) Drakkar-Software, All rights reserved.
+#
+#  This library is free software; you can redistribute it and/or
+#  modify it under the terms of the GNU Lesser General Public
+#  License as published by the Free Software Foundation; either
+#  version 3.0 of the License, or (at your option) any later version.
+#
+#  This library is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the GNU
+#  Lesser General Public License for more details.
+#
+#  You should have received a copy of the GNU Lesser General Public
+#  License along with this library.
+"""
+Define the SynchronizedQueue used by consumers of synchronized channels
+"""
+import asyncio
+import collections
+
+
+class SynchronizedQueue:
+    """
+    An unbounded asyncio.Queue replacement keeping its channel pending items count by priority level up to date.
+    Synchronized channels are drained by the caller (see Producer.synchronized_perform_consumers_queue):
+    - puts and gets on a non-empty queue are plain deque operations
+    - checking whether a channel has pending items doesn't require to go through every consumer queue
+    - when a ready channels dict is set, putting an item marks the queue channel as ready for its priority level
+    Getting from an empty queue and joining it are waiting the same way as with an asyncio.Queue.
+    """
+
+    def __init__(self, pending_items_by_priority_level, priority_level):
+        self.maxsize = 0
+        self.pending_items_by_priority_level = pending_items_by_priority_level
+        self.priority_level = priority_level
+        self.pending_items_by_priority_level.setdefault(self.priority_level, 0)
+        self._items = collections.deque()
+        self._getters = collections.deque()
+        self._unfinished_tasks = 0
+        self._finished = None
+        self.ready_channels = None
+        self.channel = None
+
+    def qsize(self) -> int:
+        """
+        :return: the number of items in the queue
+        """
+        return len(self._items)
+
+    def empty(self) -> bool:
+        """
+        :return: True if the queue is empty
+        """
+        return not self._items
+
+    def full(self) -> bool:
+        """
+        :return: False: the queue is unbounded
+        """
+        return False
+
+    async def put(self, item) -> None:
+        """
+        Put an item into the queue without waiting: the queue is unbounded
+        :param item: the item to put
+        """
+        self.put_nowait(item)
+
+    def put_nowait(self, item) -> None:
+        """
+        Put an item into the queue
+        :param item: the item to put
+        """
+        self._items.append(item)
+        self.pending_items_by_priority_level[self.priority_level] += 1
+        self._unfinished_tasks += 1
+        if self.ready_channels is not None:
+            self.ready_channels[self.channel] = None
+        if self._finished is not None:
+            self._finished.clear()
+        self._wakeup_next_getter()
+
+    async def get(self):
+        """
+        Remove and return an item from the queue, wait for an item to be available if the queue is empty
+        :return: the removed item
+        """
+        while not self._items:
+            getter = asyncio.get_event_loop().create_future()
+            self._getters.append(getter)
+            try:
+                await getter
+            except BaseException:
+                getter.cancel()
+                try:
+                    self._getters.remove(getter)
+                except ValueError:
+                    pass
+                if self._items and not getter.cancelled():
+                    # this getter has been woken up: wake up the next one instead
+                    self._wakeup_next_getter()
+                raise
+        return self.get_nowait()
+
+    def get_nowait(self):
+        """
+        Remove and return an item from the queue
+        :return: the removed item, raises asyncio.QueueEmpty when the queue is empty
+        """
+        if not self._items:
+            raise asyncio.QueueEmpty()
+        self.pending_items_by_priority_level[self.priority_level] -= 1
+        return self._items.popleft()
+
+    def task_done(self) -> None:
+        """
+        Indicate that a formerly enqueued task is complete
+        """
+        if self._unfinished_tasks <= 0:
+            raise ValueError("task_done() called too many times")
+        self._unfinished_tasks -= 1
+        if self._unfinished_tasks == 0 and self._finished is not None:
+            self._finished.set()
+
+    async def join(self) -> None:
+        """
+        Wait until every item in the queue has been processed
+        """
+        if self._unfinished_tasks > 0:
+            if self._finished is None:
+                self._finished = asyncio.Event()
+            await self._finished.wait()
+
+    def set_ready_channels(self, ready_channels, channel) -> None:
+        """
+        Set the ready channels dict in which channel is marked as ready when an item is put
+        :param ready_channels: the ready channels dict (used as an ordered set), None to disable
+        :param channel: the channel to mark as ready
+        """
+        self.ready_channels = ready_channels
+        self.channel = channel
+        if self.ready_channels is not None and self._items:
+            self.ready_channels[self.channel] = None
+
+    def _wakeup_next_getter(self) -> None:
+        while self._getters:
+            getter = self._getters.popleft()
+            if not getter.done():
+                getter.set_result(None)
+                break
+
+    def release(self) -> None:
+        """
+        Stop counting the queue items as pending: to be called when its consumer leaves the channel
+        """
+        self.pending_items_by_priority_level[self.priority_level] -= len(self._items)
+        self.pending_items_by_priority_level = {self.priority_level: len(self._items)}
+        self.set_ready_channels(None, None)
@@ -218,6 +218,71 @@ async def test_remove_consumer(test_channel):
     assert channels.get_chan(tests.EMPTY_TEST_CHANNEL).get_consumers() == []
 
 
+@pytest.mark.asyncio
+async def test_routing_index_update(test_channel):
+    channel = channels.get_chan(tests.EMPTY_TEST_CHANNEL)
+    consumer_1 = await channel.new_consumer(tests.empty_test_callback, {"A": 1, "B": 2})
+    consumer_2 = await channel.new_consumer(
+        tests.empty_test_callback, {"A": async_channel.CHANNEL_WILDCARD, "B": 3},
+        priority_level=async_channel.ChannelConsumerPriorityLevels.OPTIONAL.value
+    )
+    selected_consumers = channel.get_consumer_from_filters({"A": 1, "B": 2})
+    assert selected_consumers == [consumer_1]
+    # resolved selections are reused
+    assert channel.get_consumer_from_filters({"A": 1, "B": 2}) is selected_consumers
+    high_priority_consumers = channel.get_prioritized_consumers(
+        async_channel.ChannelConsumerPriorityLevels.HIGH.value
+    )
+    assert high_priority_consumers == [consumer_1]
+    all_consumers = channel.get_consumers()
+    assert all_consumers == [consumer_1, consumer_2]
+
+    consumer_3 = await channel.new_consumer(tests.empty_test_callback, {"A": [1, 5], "B": 2})
+    consumer_4 = await channel.new_consumer(tests.empty_test_callback, {"A": 5, "B": 2})
+    assert channel.get_consumer_from_filters({"A": 1, "B": 2}) == [consumer_1, consumer_3]
+    assert channel.get_consumer_from_filters({"A": 1, "B": async_channel.CHANNEL_WILDCARD}) == \
+           [consumer_1, consumer_2, consumer_3]
+    assert channel.get_prioritized_consumers(async_channel.ChannelConsumerPriorityLevels.HIGH.value) == \
+           [consumer_1, consumer_3, consumer_4]
+    assert channel.get_consumers() == [consumer_1, consumer_2, consumer_3, consumer_4]
+    # previously returned lists are not modified
+    assert selected_consumers == [consumer_1]
+    assert high_priority_consumers == [consumer_1]
+    assert all_consumers == [consumer_1, consumer_2]
+
+    await channel.remove_consumer(consumer_1)
+    assert channel.get_consumer_from_filters({"A": 1, "B": 2}) == [consumer_3]
+    assert channel.get_consumer_from_filters({"A": 1, "B": async_channel.CHANNEL_WILDCARD}) == \
+           [consumer_2, consumer_3]
+    assert channel.get_prioritized_consumers(async_channel.ChannelConsumerPriorityLevels.HIGH.value) == \
+           [consumer_3, consumer_4]
+    assert channel.get_consumers() == [consumer_2, consumer_3, consumer_4]
+
+
+
+@pytest.mark.asyncio
+async def test_routing_index_max_selections(test_channel):
+    channel = channels.get_chan(tests.EMPTY_TEST_CHANNEL)
+    consumer_1 = await channel.new_consumer(tests.empty_test_callback, {"A": 1, "B": 2})
+    consumer_2 = await channel.new_consumer(tests.empty_test_callback, {"A": [1, 2], "B": 3})
+    with mock.patch.object(tests.EmptyTestChannel, "MAX_ROUTING_INDEX_SELECTIONS", 2):
+        selected_consumers = channel.get_consumer_from_filters({"A": 1, "B": 2})
+        assert selected_consumers == [consumer_1]
+        assert channel.get_consumer_from_filters({"A": 1}) == [consumer_1, consumer_2]
+        assert channel.get_consumer_from_filters({"A": 1, "B": 2}) is selected_consumers
+        # routing index is full: reset
+        assert channel.get_consumer_from_filters({"B": 3}) == [consumer_2]
+        assert channel.get_consumer_from_filters({"A": 1, "B": 2}) is not selected_consumers
+        assert channel.get_consumer_from_filters({"A": 1, "B": 2}) == selected_consumers
+    # unhashable selection
+    assert channel.get_consumer_from_filters({"C": 1, "B": [3]}) == []
+    assert channel.get_consumer_from_filters({"A": 2, "B": [3]}) == []
+    consumer_3 = await channel.new_consumer(tests.empty_test_callback, {"A": 2, "B": 3})
+    assert channel.get_consumer_from_filters({"A": 2}) == [consumer_2, consumer_3]
+    await channel.remove_consumer(consumer_2)
+    assert channel.get_consumer_from_filters({"A": 2}) == [consumer_3]
+    assert channel.get_consumer_from_filters({"A": 1}) == [consumer_1]
+
 @pytest.mark.asyncio
 async def test_unregister_producer(test_channel):
     assert channels.get_chan(tests.EMPTY_TEST_CHANNEL).producers == []
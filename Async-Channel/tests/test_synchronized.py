@@ -271,3 +271,87 @@ async def test_producer_synchronized_perform_consumers_queue_with_multiple_consu
         assert producer.is_consumers_queue_empty(1)
         assert producer.is_consumers_queue_empty(2)
         assert producer.is_consumers_queue_empty(3)
+
+
+@pytest.mark.asyncio
+async def test_synchronized_queue_pending_items(synchronized_channel):
+    async def callback():
+        pass
+
+    test_consumer_1 = await synchronized_channel.new_consumer(callback, priority_level=1)
+    test_consumer_2 = await synchronized_channel.new_consumer(callback, priority_level=2)
+    assert isinstance(test_consumer_1.queue, util.SynchronizedQueue)
+    assert isinstance(test_consumer_2.queue, util.SynchronizedQueue)
+
+    producer = SynchronizedProducerTest(channels.get_chan(TEST_SYNCHRONIZED_CHANNEL))
+    await producer.run()
+
+    await producer.send({})
+    await test_consumer_1.queue.put({})
+    assert test_consumer_1.queue.qsize() == 2
+    assert synchronized_channel.pending_items_by_priority_level == {1: 2, 2: 1}
+    await producer.synchronized_perform_consumers_queue(1, True, 1)
+    assert synchronized_channel.pending_items_by_priority_level == {1: 0, 2: 1}
+    assert producer.is_consumers_queue_empty(1)
+    assert not producer.is_consumers_queue_empty(2)
+
+    # removed consumers pending items are not pending anymore
+    await synchronized_channel.remove_consumer(test_consumer_2)
+    assert synchronized_channel.pending_items_by_priority_level == {1: 0, 2: 0}
+    assert producer.is_consumers_queue_empty(2)
+    assert test_consumer_2.queue.qsize() == 1
+
+
+@pytest.mark.asyncio
+async def test_synchronized_queue_get_and_join():
+    pending_items_by_priority_level = {}
+    queue = util.SynchronizedQueue(pending_items_by_priority_level, 1)
+    assert queue.empty()
+    with pytest.raises(asyncio.QueueEmpty):
+        queue.get_nowait()
+
+    get_task = asyncio.create_task(queue.get())
+    await tests.wait_asyncio_next_cycle()
+    assert not get_task.done()
+    await queue.put("item")
+    assert await asyncio.wait_for(get_task, 1) == "item"
+    assert pending_items_by_priority_level == {1: 0}
+
+    join_task = asyncio.create_task(queue.join())
+    await tests.wait_asyncio_next_cycle()
+    assert not join_task.done()
+    queue.task_done()
+    await asyncio.wait_for(join_task, 1)
+    with pytest.raises(ValueError):
+        queue.task_done()
+
+
+@pytest.mark.asyncio
+async def test_synchronized_queue_ready_channels(synchronized_channel):
+    async def callback():
+        pass
+
+    test_consumer_1 = await synchronized_channel.new_consumer(callback, priority_level=1)
+    producer = SynchronizedProducerTest(channels.get_chan(TEST_SYNCHRONIZED_CHANNEL))
+    await producer.run()
+    await producer.send({})
+
+    # already pending items are marked as ready
+    ready_channels_by_priority_level = {}
+    synchronized_channel.set_ready_channels_by_priority_level(ready_channels_by_priority_level)
+    assert ready_channels_by_priority_level == {1: {synchronized_channel: None}}
+    ready_channels_by_priority_level[1].clear()
+
+    # new consumers are also marking the channel as ready
+    test_consumer_2 = await synchronized_channel.new_consumer(callback, priority_level=2)
+    assert ready_channels_by_priority_level == {1: {}, 2: {}}
+    await producer.send({})
+    assert ready_channels_by_priority_level == {1: {synchronized_channel: None}, 2: {synchronized_channel: None}}
+
+    synchronized_channel.set_ready_channels_by_priority_level(None)
+    ready_channels_by_priority_level[1].clear()
+    ready_channels_by_priority_level[2].clear()
+    await producer.send({})
+    assert ready_channels_by_priority_level == {1: {}, 2: {}}
+    assert test_consumer_1.queue.ready_channels is None
+    assert test_consumer_2.queue.qsize() == 2
@@ -0,0 +1,103 @@
+#  Drakkar-Software Async-Channel
+#  Copyright (c) Drakkar-Software, All rights reserved.
+#
+#  This library is free software; you can redistribute it and/or
+#  modify it under the terms of the GNU Lesser General Public
+#  License as published by the Free Software Foundation; either
+#  version 3.0 of the License, or (at your option) any later version.
+#
+#  This library is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the GNU
+#  Lesser General Public License for more details.
+#
+#  You should have received a copy of the GNU Lesser General Public
+#  License along with this library.
+import time
+import pytest
+
+import async_channel.channels as channels
+import async_channel.producer as channel_producer
+import async_channel.util as util
+import tests
+
+CHANNELS_COUNT = 20
+CONSUMERS_BY_PRIORITY_LEVEL = 2
+PRIORITY_LEVELS = (0, 1, 2)
+EVENTS_COUNT = 5000
+
+
+class SynchronizedBenchmarkProducer(channel_producer.Producer):
+    async def pause(self):
+        pass
+
+    async def resume(self):
+        pass
+
+
+class DirectDispatchChannel(channels.Channel):
+    PRODUCER_CLASS = SynchronizedBenchmarkProducer
+    CONSUMER_CLASS = tests.EmptyTestConsumer
+
+    def __init__(self, test_id):
+        super().__init__()
+        self.chan_id = test_id
+
+
+class QueueDispatchChannel(DirectDispatchChannel):
+    SYNCHRONIZED_DIRECT_DISPATCH = False
+
+
+async def _create_producers(channel_class, callback):
+    producers = []
+    for index in range(CHANNELS_COUNT):
+        name = f"{channel_class.__name__}{index}"
+        channels.del_chan(name)
+        channel = await util.create_channel_instance(channel_class, channels.set_chan, is_synchronized=True,
+                                                     test_id=name)
+        channels.del_chan(channel.get_name())
+        for priority_level in PRIORITY_LEVELS:
+            for _ in range(CONSUMERS_BY_PRIORITY_LEVEL):
+                await channel.new_consumer(callback, priority_level=priority_level)
+        producer = SynchronizedBenchmarkProducer(channel)
+        await producer.run()
+        producers.append(producer)
+    return producers
+
+
+def _is_empty(producers, priority_level):
+    for producer in producers:
+        if not producer.is_consumers_queue_empty(priority_level):
+            return False
+    return True
+
+
+async def _run(channel_class):
+    calls = []
+
+    async def callback(index):
+        calls.append(index)
+
+    producers = await _create_producers(channel_class, callback)
+    t0 = time.perf_counter()
+    for index in range(EVENTS_COUNT):
+        # one channel receives data at each iteration, every channel is refreshed the backtesting way
+        await producers[index % CHANNELS_COUNT].send({"index": index})
+        for priority_level in PRIORITY_LEVELS:
+            while not _is_empty(producers, priority_level):
+                for producer in producers:
+                    await producer.synchronized_perform_consumers_queue(priority_level, True, 1)
+    elapsed = time.perf_counter() - t0
+    for producer in producers:
+        await producer.channel.stop()
+    return elapsed, calls
+
+
+@pytest.mark.asyncio
+async def test_synchronized_direct_dispatch_events_per_second():
+    queue_elapsed, queue_calls = await _run(QueueDispatchChannel)
+    direct_elapsed, direct_calls = await _run(DirectDispatchChannel)
+    # same consumer calls in the same order
+    assert direct_calls == queue_calls
+    assert len(direct_calls) == EVENTS_COUNT * len(PRIORITY_LEVELS) * CONSUMERS_BY_PRIORITY_LEVEL
+    assert direct_elapsed < queue_elapsed
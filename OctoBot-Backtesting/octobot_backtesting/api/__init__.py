@@ -22,6 +22,7 @@ from octobot_backtesting.api import exchange_data_collector
 
 from octobot_backtesting.api.data_file_converters import (
     convert_data_file,
+    convert_data_file_to_columnar,
 )
 from octobot_backtesting.api.data_file import (
     get_all_available_data_files,
@@ -37,6 +38,7 @@ from octobot_backtesting.api.importer import (
     get_available_time_frames,
     get_available_symbols,
     get_data_timestamp_interval,
+    get_data_timestamps,
     get_all_ohlcvs,
     stop_importer,
 )
@@ -48,11 +50,18 @@ from octobot_backtesting.api.backtesting import (
     get_backtesting_starting_time,
     get_backtesting_ending_time,
     register_backtesting_timestamp_whitelist,
+    register_backtesting_timestamps_schedule,
+    get_backtesting_timestamps_schedule,
     get_backtesting_timestamp_whitelist,
     is_backtesting_enabled,
     get_backtesting_data_files,
     get_backtesting_duration,
     create_and_init_backtest_data,
+    create_and_init_shared_memory_data,
+    get_shared_memory_data_headers,
+    close_shared_memory_data,
+    create_and_init_shared_memory_backtest_data,
+    stop_backtest_data,
     get_preloaded_candles_manager,
     initialize_backtesting,
     initialize_independent_backtesting_config,
@@ -74,6 +83,7 @@ from octobot_backtesting.api.exchange_data_collector import (
 
 __all__ = [
     "convert_data_file",
+    "convert_data_file_to_columnar",
     "get_all_available_data_files",
     "delete_data_file",
     "get_file_description",
@@ -85,6 +95,7 @@ __all__ = [
     "get_available_time_frames",
     "get_available_symbols",
     "get_data_timestamp_interval",
+    "get_data_timestamps",
     "get_all_ohlcvs",
     "stop_importer",
     "set_time_updater_interval",
@@ -94,11 +105,18 @@ __all__ = [
     "get_backtesting_starting_time",
     "get_backtesting_ending_time",
     "register_backtesting_timestamp_whitelist",
+    "register_backtesting_timestamps_schedule",
+    "get_backtesting_timestamps_schedule",
     "get_backtesting_timestamp_whitelist",
     "is_backtesting_enabled",
     "get_backtesting_data_files",
     "get_backtesting_duration",
     "create_and_init_backtest_data",
+    "create_and_init_shared_memory_data",
+    "get_shared_memory_data_headers",
+    "close_shared_memory_data",
+    "create_and_init_shared_memory_backtest_data",
+    "stop_backtest_data",
     "get_preloaded_candles_manager",
     "initialize_backtesting",
     "initialize_independent_backtesting_config",
@@ -24,6 +24,7 @@ import octobot_backtesting.api as api
 import octobot_backtesting.errors as errors
 import octobot_backtesting.backtesting as backtesting_class
 import octobot_backtesting.backtest_data as backtest_data
+import octobot_backtesting.shared_memory_backtest_data as shared_memory_backtest_data
 import octobot_backtesting.constants as constants
 
 
@@ -112,8 +113,15 @@ async def _get_min_max_timestamps(importers, run_on_common_part_only, start_time
     return min_timestamp, max_timestamp
 
 
+async def _get_data_timestamps_schedule(importers, time_frame, min_timestamp, max_timestamp):
+    timestamps = set()
+    for importer in importers:
+        timestamps.update(await api.get_data_timestamps(importer, time_frame, min_timestamp, max_timestamp))
+    return timestamps
+
+
 async def adapt_backtesting_channels(backtesting, config, importer_class, run_on_common_part_only=True,
-                                     start_timestamp=None, end_timestamp=None):
+                                     start_timestamp=None, end_timestamp=None, use_data_timestamps_schedule=None):
     importers = backtesting.get_importers(importer_class)
     if not importers:
         raise RuntimeError("No exchange importer has been found for this data file, backtesting can't start.")
@@ -131,6 +139,17 @@ async def adapt_backtesting_channels(backtesting, config, importer_class, run_on
         backtesting,
         minimum_timestamp=int(min_timestamp),
         maximum_timestamp=int(max_timestamp))
+    if use_data_timestamps_schedule is None:
+        use_data_timestamps_schedule = config.get(constants.CONFIG_BACKTESTING, {}).get(
+            constants.CONFIG_BACKTESTING_USE_DATA_TIMESTAMPS_SCHEDULE, False
+        )
+    if use_data_timestamps_schedule:
+        # only iterate on timestamps with data instead of going through every time_interval
+        register_backtesting_timestamps_schedule(
+            backtesting,
+            await _get_data_timestamps_schedule(importers, min_time_frame_to_consider,
+                                                int(min_timestamp), int(max_timestamp))
+        )
     try:
         import octobot_trading.api as exchange_api
 
@@ -183,6 +202,14 @@ def register_backtesting_timestamp_whitelist(backtesting, timestamps, check_call
                                                           append_to_whitelist=append_to_whitelist)
 
 
+def register_backtesting_timestamps_schedule(backtesting, timestamps):
+    backtesting.time_manager.register_timestamps_schedule(timestamps)
+
+
+def get_backtesting_timestamps_schedule(backtesting) -> list:
+    return backtesting.time_manager.timestamps_schedule
+
+
 def get_backtesting_timestamp_whitelist(backtesting) -> list:
     return backtesting.time_manager.timestamps_whitelist
 
@@ -209,6 +236,34 @@ async def create_and_init_backtest_data(data_files, config, tentacles_config) ->
     return backtest_data_inst
 
 
+async def create_and_init_shared_memory_data(data_files, config) -> shared_memory_backtest_data.SharedMemoryData:
+    shared_memory_data = shared_memory_backtest_data.SharedMemoryData(data_files, config)
+    await shared_memory_data.initialize()
+    return shared_memory_data
+
+
+def get_shared_memory_data_headers(shared_memory_data) -> dict:
+    return shared_memory_data.headers_by_data_file
+
+
+def close_shared_memory_data(shared_memory_data) -> None:
+    shared_memory_data.close()
+
+
+async def create_and_init_shared_memory_backtest_data(
+        data_files, config, tentacles_config, shared_headers_by_data_file
+) -> shared_memory_backtest_data.SharedMemoryBacktestData:
+    backtest_data_inst = shared_memory_backtest_data.SharedMemoryBacktestData(
+        data_files, config, tentacles_config, shared_headers_by_data_file
+    )
+    await backtest_data_inst.initialize()
+    return backtest_data_inst
+
+
+async def stop_backtest_data(backtest_data_inst) -> None:
+    await backtest_data_inst.stop()
+
+
 async def get_preloaded_candles_manager(backtesting, exchange, symbol, time_frame):
     if backtesting.backtest_data is None:
         return None 
@@ -29,3 +29,11 @@ async def convert_data_file(data_file_path) -> typing.Optional[str]:
                 if await converter.convert():
                     return converter.converted_file
     return None
+
+
+async def convert_data_file_to_columnar(data_file_path) -> typing.Optional[str]:
+    if data_file_path and path.isfile(data_file_path):
+        converter = converters.ColumnarDataConverter(data_file_path)
+        if await converter.can_convert() and await converter.convert():
+            return converter.converted_file
+    return None
@@ -13,7 +13,9 @@
 #
 #  You should have received a copy of the GNU Lesser General Public
 #  License along with this library.
+import octobot_backtesting.data as data
 import octobot_backtesting.enums as backtesting_enums
+import octobot_backtesting.errors as backtesting_errors
 import octobot_backtesting.importers as importers
 import octobot_backtesting.util as util
 
@@ -59,8 +61,19 @@ async def get_data_timestamp_interval(exchange_importer, time_frame=None) -> (fl
     return await exchange_importer.get_data_timestamp_interval(time_frame=time_frame_value)
 
 
+async def get_data_timestamps(exchange_importer, time_frame=None,
+                              inferior_timestamp=-1, superior_timestamp=-1) -> list:
+    time_frame_value = time_frame.value if time_frame is not None else None
+    return await exchange_importer.get_data_timestamps(time_frame=time_frame_value,
+                                                       inferior_timestamp=inferior_timestamp,
+                                                       superior_timestamp=superior_timestamp)
+
+
 async def get_all_ohlcvs(database_path, exchange_name, symbol, time_frame,
                          inferior_timestamp=-1, superior_timestamp=-1) -> list:
+    if data.get_data_type(database_path) is backtesting_enums.DataFormats.COLUMNAR_DATA:
+        return await _get_all_columnar_ohlcvs(database_path, exchange_name, symbol, time_frame,
+                                              inferior_timestamp, superior_timestamp)
     timestamps, operations = importers.get_operations_from_timestamps(superior_timestamp, inferior_timestamp)
     try:
         async with databases.new_sqlite_database(database_path) as database:
@@ -75,5 +88,23 @@ async def get_all_ohlcvs(database_path, exchange_name, symbol, time_frame,
         return []
 
 
+async def _get_all_columnar_ohlcvs(database_path, exchange_name, symbol, time_frame,
+                                   inferior_timestamp, superior_timestamp) -> list:
+    importer = importers.ColumnarExchangeDataImporter({}, database_path)
+    try:
+        await importer.initialize()
+        return [
+            candle_with_metadata[-1]
+            for candle_with_metadata in await importer.get_ohlcv_from_timestamps(
+                exchange_name=exchange_name, symbol=symbol, time_frame=time_frame,
+                inferior_timestamp=inferior_timestamp, superior_timestamp=superior_timestamp
+            )
+        ]
+    except backtesting_errors.BacktestingFileNotFound:
+        return []
+    finally:
+        await importer.stop()
+
+
 async def stop_importer(importer) -> None:
     await importer.stop()
@@ -24,6 +24,11 @@ cdef class ChannelsManager:
     cdef object iteration_task
     cdef bint should_stop
     cdef dict producers_by_priority_levels
+    cdef list priority_levels
+    cdef dict ready_channels_by_priority_level
+    cdef dict ready_channel_producers
+    cdef dict ready_channel_indexes
+    cdef list polled_producers
 
     cdef str matrix_id
 
@@ -34,11 +39,16 @@ cdef class ChannelsManager:
     cpdef void clear_empty_channels_producers(self)
     cpdef void update_producers_by_priority_levels(self)
 
+    cdef object _pop_next_ready_channel(self, int priority_level, int processed_index)
+    cdef bint _has_ready_channels(self, int priority_level)
+    cdef void _register_ready_channels(self)
+    cdef void _unregister_ready_channels(self)
     cdef list _get_trading_producers(self)
     cdef list _get_evaluator_producers(self)
 
 cdef list _get_backtesting_producers()
 cdef list _get_channel_producers(object channel)
+cdef list _get_polled_producers(list producers)
 cdef bint _check_producers_consumers_emptiness(list producers, int priority_level)
 cdef bint _check_producers_has_priority_consumers(list producers, int priority_level)
 cdef list _get_producers_with_priority_level_consumers(list producers, int priority_level)
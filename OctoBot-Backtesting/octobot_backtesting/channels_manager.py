@@ -39,6 +39,17 @@ class ChannelsManager:
         self.should_stop = False
         self.producers_by_priority_levels = {}
 
+        # direct dispatch channels are not polled: they are marked as ready when an item is pushed in their
+        # consumers queues and only ready channels are processed
+        self.priority_levels = sorted(
+            priority_level.value
+            for priority_level in channel_enums.ChannelConsumerPriorityLevels
+        )
+        self.ready_channels_by_priority_level = {}
+        self.ready_channel_producers = {}
+        self.ready_channel_indexes = {}
+        self.polled_producers = []
+
     async def initialize(self) -> None:
         """
         Initialize Backtesting channels manager
@@ -49,10 +60,12 @@ class ChannelsManager:
                                                             self._get_trading_producers() +
                                                             self._get_evaluator_producers())
             self.producers = copy.copy(self.initial_producers)
+            self._register_ready_channels()
+            self.polled_producers = _get_polled_producers(self.producers)
 
             self.producers_by_priority_levels = {
-                priority_level.value: self.producers
-                for priority_level in channel_enums.ChannelConsumerPriorityLevels
+                priority_level: self.polled_producers
+                for priority_level in self.priority_levels
             }
 
             # Initialize all producers by calling producer.start()
@@ -68,18 +81,21 @@ class ChannelsManager:
             for producer in self.initial_producers
             if producer.channel.get_consumers()
         ]
+        self.polled_producers = _get_polled_producers(self.producers)
 
     def update_producers_by_priority_levels(self):
         self.producers_by_priority_levels = {
-            priority_level.value: _get_producers_with_priority_level_consumers(self.producers, priority_level.value)
-            for priority_level in channel_enums.ChannelConsumerPriorityLevels
-            if _check_producers_has_priority_consumers(self.producers, priority_level.value)
+            priority_level: _get_producers_with_priority_level_consumers(self.polled_producers, priority_level)
+            for priority_level in self.priority_levels
+            if _check_producers_has_priority_consumers(self.polled_producers, priority_level)
         }
 
     async def handle_new_iteration(self, current_timestamp) -> None:
-        for level_key, producers in self.producers_by_priority_levels.items():
+        for level_key in self.priority_levels:
+            producers = self.producers_by_priority_levels.get(level_key, [])
             try:
-                if _check_producers_consumers_emptiness(producers, level_key):
+                if not self._has_ready_channels(level_key) and \
+                        _check_producers_consumers_emptiness(producers, level_key):
                     # avoid creating tasks when not necessary
                     continue
                 self.iteration_task = self.refresh_priority_level(producers, level_key, True)
@@ -97,13 +113,70 @@ class ChannelsManager:
         while not self.should_stop:
             for producer in producers:
                 await producer.synchronized_perform_consumers_queue(priority_level, join_consumers, self.refresh_timeout)
-            if _check_producers_consumers_emptiness(self.producers, priority_level):
+            await self._refresh_ready_channels(priority_level, join_consumers)
+            if not self._has_ready_channels(priority_level) and \
+                    _check_producers_consumers_emptiness(self.polled_producers, priority_level):
+                break
+
+    async def _refresh_ready_channels(self, priority_level: int, join_consumers: bool) -> None:
+        # process ready channels in producers order: like when polling producers, a channel that becomes ready
+        # while processing an earlier channel is processed in the same pass
+        processed_index = -1
+        while not self.should_stop:
+            channel = self._pop_next_ready_channel(priority_level, processed_index)
+            if channel is None:
+                return
+            processed_index = self.ready_channel_indexes[channel]
+            await self.ready_channel_producers[channel].synchronized_perform_consumers_queue(
+                priority_level, join_consumers, self.refresh_timeout
+            )
+
+    def _pop_next_ready_channel(self, priority_level, processed_index):
+        next_channel = None
+        next_index = None
+        for level_key in self.priority_levels:
+            if level_key > priority_level:
                 break
+            for channel in self.ready_channels_by_priority_level.get(level_key, ()):
+                index = self.ready_channel_indexes[channel]
+                if index > processed_index and (next_index is None or index < next_index):
+                    next_channel = channel
+                    next_index = index
+        if next_channel is not None:
+            # consumers up to priority_level are processed: channel is not ready anymore for those levels
+            for level_key in self.priority_levels:
+                if level_key > priority_level:
+                    break
+                self.ready_channels_by_priority_level.get(level_key, {}).pop(next_channel, None)
+        return next_channel
+
+    def _has_ready_channels(self, priority_level):
+        for level_key, ready_channels in self.ready_channels_by_priority_level.items():
+            if ready_channels and level_key <= priority_level:
+                return True
+        return False
+
+    def _register_ready_channels(self):
+        for producer in self.producers:
+            channel = producer.channel
+            if channel.is_direct_dispatch() and channel not in self.ready_channel_producers:
+                self.ready_channel_indexes[channel] = len(self.ready_channel_producers)
+                self.ready_channel_producers[channel] = producer
+                channel.set_ready_channels_by_priority_level(self.ready_channels_by_priority_level)
+
+    def _unregister_ready_channels(self):
+        for channel in self.ready_channel_producers:
+            channel.set_ready_channels_by_priority_level(None)
+        self.ready_channel_producers = {}
+        self.ready_channel_indexes = {}
+        self.ready_channels_by_priority_level = {}
 
     def stop(self):
         self.should_stop = True
 
     def flush(self):
+        self._unregister_ready_channels()
+        self.polled_producers = []
         self.producers = []
         self.initial_producers = []
         self.producers_by_priority_levels = {}
@@ -138,6 +211,14 @@ def _get_backtesting_producers():
     ]
 
 
+def _get_polled_producers(producers):
+    return [
+        producer
+        for producer in producers
+        if not producer.channel.is_direct_dispatch()
+    ]
+
+
 def _check_producers_consumers_emptiness(producers, priority_level):
     for producer in producers:
         if not producer.is_consumers_queue_empty(priority_level):
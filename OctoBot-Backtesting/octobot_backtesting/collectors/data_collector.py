@@ -82,7 +82,12 @@ class DataCollector:
 
     def create_database(self) -> None:
         if not self.database:
-            self.database = databases.SQLiteDatabase(self.temp_file_path)
+            self.database = databases.SQLiteDatabase(
+                self.temp_file_path,
+                journal_mode=databases.SQLiteDatabase.JOURNAL_MODE_WAL,
+                synchronous=databases.SQLiteDatabase.SYNCHRONOUS_NORMAL,
+                commit_interval=constants.BACKTESTING_DATA_FILE_COMMIT_INTERVAL
+            )
 
     def finalize_database(self):
         os.rename(self.temp_file_path, self.file_path)
@@ -19,18 +19,33 @@ import octobot_commons.enums as enums
 
 CONFIG_BACKTESTING = "backtesting"
 CONFIG_BACKTESTING_DATA_FILES = "files"
+CONFIG_BACKTESTING_USE_DATA_TIMESTAMPS_SCHEDULE = "use_data_timestamps_schedule"
+CONFIG_BACKTESTING_USE_BATCHED_OHLCV_UPDATES = "use_batched_ohlcv_updates"
 CONFIG_ANALYSIS_ENABLED_OPTION = "post_analysis_enabled"
 CONFIG_BACKTESTING_OTHER_MARKETS_STARTING_PORTFOLIO = 10000
 BACKTESTING_DATA_OHLCV = "ohlcv"
 BACKTESTING_DATA_TRADES = "trades"
 BACKTESTING_FILE_PATH = os.path.join(CONFIG_BACKTESTING, "data")
 BACKTESTING_DATA_FILE_EXT = ".data"
+BACKTESTING_COLUMNAR_DATA_FILE_EXT = ".cdata"
 BACKTESTING_DATA_FILE_TEMP_EXT = ".part"
 BACKTESTING_DATA_FILE_SEPARATOR = "_"
 BACKTESTING_DATA_FILE_TIME_WRITE_FORMAT = '%Y%m%d_%H%M%S'
 BACKTESTING_DATA_FILE_TIME_READ_FORMAT = BACKTESTING_DATA_FILE_TIME_WRITE_FORMAT.replace("_", "")
 BACKTESTING_DATA_FILE_TIME_DISPLAY_FORMAT = '%d %B %Y at %H:%M:%S'
 BACKTESTING_DEFAULT_JOIN_TIMEOUT = 1800  # 30min
+# collected data files are written in WAL journal mode and committed every BACKTESTING_DATA_FILE_COMMIT_INTERVAL rows
+BACKTESTING_DATA_FILE_COMMIT_INTERVAL = 10000
+
+# columnar data files
+COLUMNAR_DATA_FILE_MAGIC = b"OBCDATA\x00"
+COLUMNAR_DATA_FILE_VERSION = "1.0"
+# data blocks are aligned on 64 bytes
+COLUMNAR_DATA_FILE_ALIGNMENT = 64
+# OHLCV blocks columns: data timestamp followed by candle values (ordered by PriceIndexes)
+COLUMNAR_OHLCV_TIMESTAMP_COLUMN = 0
+COLUMNAR_OHLCV_CANDLE_COLUMNS_START = 1
+COLUMNAR_OHLCV_COLUMNS_COUNT = COLUMNAR_OHLCV_CANDLE_COLUMNS_START + len(enums.PriceIndexes)
 
 BACKTESTING_TIME_FRAMES_TO_DISPLAY = [enums.TimeFrames.THIRTY_MINUTES.value,
                                       enums.TimeFrames.ONE_HOUR.value,
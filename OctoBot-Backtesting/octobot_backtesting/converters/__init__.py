@@ -19,7 +19,14 @@ from octobot_backtesting.converters import data_converter
 from octobot_backtesting.converters.data_converter import (
     DataConverter,
 )
+from octobot_backtesting.converters import columnar_data_converter
+from octobot_backtesting.converters.columnar_data_converter import (
+    ColumnarDataConverter,
+    get_ohlcv_blocks,
+)
 
 __all__ = [
     "DataConverter",
+    "ColumnarDataConverter",
+    "get_ohlcv_blocks",
 ]
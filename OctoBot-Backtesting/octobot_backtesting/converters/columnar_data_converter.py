@@ -0,0 +1,75 @@
+#  Drakkar-Software OctoBot-Backtesting
+#  Copyright (c) Drakkar-Software, All rights reserved.
+#
+#  This library is free software; you can redistribute it and/or
+#  modify it under the terms of the GNU Lesser General Public
+#  License as published by the Free Software Foundation; either
+#  version 3.0 of the License, or (at your option) any later version.
+#
+#  This library is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the GNU
+#  Lesser General Public License for more details.
+#
+#  You should have received a copy of the GNU Lesser General Public
+#  License along with this library.
+import os.path as path
+
+import octobot_commons.databases as databases
+
+import octobot_backtesting.constants as constants
+import octobot_backtesting.converters.data_converter as data_converter
+import octobot_backtesting.data as data
+import octobot_backtesting.enums as enums
+import octobot_backtesting.importers as importers
+
+
+class ColumnarDataConverter(data_converter.DataConverter):
+    """
+    ColumnarDataConverter converts regular data files into columnar data files.
+    OHLCV candles are parsed once during conversion and are then memory-mapped by ColumnarExchangeDataImporter.
+    """
+
+    def __init__(self, backtesting_file_to_convert):
+        super().__init__(backtesting_file_to_convert)
+        self.converted_file = f"{path.splitext(self.file_to_convert)[0]}{constants.BACKTESTING_COLUMNAR_DATA_FILE_EXT}"
+
+    async def can_convert(self) -> bool:
+        return data.get_data_type(self.file_to_convert) is enums.DataFormats.REGULAR_COLLECTOR_DATA \
+            and await data.get_file_description(self.file_to_convert) is not None
+
+    async def convert(self) -> bool:
+        try:
+            async with databases.new_sqlite_database(self.file_to_convert) as database:
+                description = await data.get_database_description(database)
+                ohlcv_blocks = await get_ohlcv_blocks(database, description)
+            data.write_columnar_data_file(self.converted_file, description, ohlcv_blocks)
+            return True
+        except Exception as e:
+            self.logger.exception(e, True, f"Error while converting {self.file_to_convert} into columnar data: {e}")
+            return False
+
+
+async def get_ohlcv_blocks(database, description):
+    """
+    :param database: the database of a regular data file
+    :param description: the data file description as returned by get_database_description
+    :return: the database OHLCV blocks as expected by write_columnar_data_file
+    """
+    ohlcv_blocks = []
+    for symbol in description[enums.DataFormatKeys.SYMBOLS.value]:
+        for time_frame in description[enums.DataFormatKeys.TIME_FRAMES.value]:
+            ohlcvs = sorted(
+                importers.import_ohlcvs(await database.select(enums.ExchangeDataTables.OHLCV,
+                                                              symbol=symbol,
+                                                              time_frame=time_frame.value)),
+                key=lambda ohlcv: ohlcv[0]
+            )
+            if ohlcvs:
+                ohlcv_blocks.append((
+                    ohlcvs[0][2],
+                    symbol,
+                    time_frame,
+                    [[ohlcv[0]] + ohlcv[-1] for ohlcv in ohlcvs]
+                ))
+    return ohlcv_blocks
@@ -14,6 +14,26 @@
 #  You should have received a copy of the GNU Lesser General Public
 #  License along with this library.
 
+from octobot_backtesting.data import columnar_data_file
+from octobot_backtesting.data.columnar_data_file import (
+    write_columnar_data_file,
+    read_columnar_data_file_header,
+    load_columnar_ohlcvs,
+    get_columnar_data_file_description,
+    get_description_from_header,
+    get_columnar_ohlcv_values,
+    get_block_header,
+    get_header_from_description,
+    get_ohlcvs_from_header,
+)
+
+from octobot_backtesting.data import shared_memory_data
+from octobot_backtesting.data.shared_memory_data import (
+    create_shared_memory_ohlcvs,
+    attach_shared_memory_ohlcvs,
+    release_shared_memories,
+)
+
 from octobot_backtesting.data import data_file_manager
 from octobot_backtesting.data.data_file_manager import (
     get_backtesting_file_name,
@@ -28,6 +48,18 @@ from octobot_backtesting.data.data_file_manager import (
 )
 
 __all__ = [
+    "write_columnar_data_file",
+    "read_columnar_data_file_header",
+    "load_columnar_ohlcvs",
+    "get_columnar_data_file_description",
+    "get_description_from_header",
+    "get_columnar_ohlcv_values",
+    "get_block_header",
+    "get_header_from_description",
+    "get_ohlcvs_from_header",
+    "create_shared_memory_ohlcvs",
+    "attach_shared_memory_ohlcvs",
+    "release_shared_memories",
     "get_backtesting_file_name",
     "get_data_type",
     "get_file_ending",
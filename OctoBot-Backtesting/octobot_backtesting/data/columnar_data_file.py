@@ -0,0 +1,187 @@
+#  Drakkar-Software OctoBot-Backtesting
+#  Copyright (c) Drakkar-Software, All rights reserved.
+#
+#  This library is free software; you can redistribute it and/or
+#  modify it under the terms of the GNU Lesser General Public
+#  License as published by the Free Software Foundation; either
+#  version 3.0 of the License, or (at your option) any later version.
+#
+#  This library is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the GNU
+#  Lesser General Public License for more details.
+#
+#  You should have received a copy of the GNU Lesser General Public
+#  License along with this library.
+import json
+import struct
+import numpy as np
+
+import octobot_commons.enums as common_enums
+
+import octobot_backtesting.constants as constants
+import octobot_backtesting.enums as enums
+
+# magic bytes followed by the little endian uint64 header size
+_PREAMBLE_FORMAT = f"<{len(constants.COLUMNAR_DATA_FILE_MAGIC)}sQ"
+_PREAMBLE_SIZE = struct.calcsize(_PREAMBLE_FORMAT)
+
+
+def write_columnar_data_file(file_path, description, ohlcv_blocks):
+    """
+    Writes a columnar data file: a small json header followed by one float64 block per (symbol, time frame).
+    Blocks are stored column by column to make each column a contiguous array once memory-mapped
+    :param file_path: path of the file to write
+    :param description: data file description as returned by get_database_description
+    :param ohlcv_blocks: list of (cryptocurrency, symbol, time_frame, values) where values are
+    timestamp sorted rows of COLUMNAR_OHLCV_COLUMNS_COUNT columns
+    """
+    blocks_header = []
+    blocks_values = []
+    offset = 0
+    for cryptocurrency, symbol, time_frame, values in ohlcv_blocks:
+        values = get_columnar_ohlcv_values(values)
+        blocks_header.append(get_block_header(cryptocurrency, symbol, time_frame, values, {
+            enums.ColumnarDataFileKeys.OFFSET.value: offset
+        }))
+        blocks_values.append(values)
+        offset += _get_aligned_size(values.nbytes)
+    header = json.dumps(get_header_from_description(description, blocks_header)).encode()
+    with open(file_path, "wb") as data_file:
+        data_file.write(struct.pack(_PREAMBLE_FORMAT, constants.COLUMNAR_DATA_FILE_MAGIC, len(header)))
+        data_file.write(header)
+        _write_padding(data_file, _PREAMBLE_SIZE + len(header))
+        for values in blocks_values:
+            data_file.write(values.tobytes())
+            _write_padding(data_file, values.nbytes)
+
+
+def get_columnar_ohlcv_values(values):
+    """
+    :param values: timestamp sorted rows of COLUMNAR_OHLCV_COLUMNS_COUNT columns
+    :return: the given values as a contiguous float64 array with one row per column
+    """
+    return np.ascontiguousarray(
+        np.asarray(values, dtype=np.float64).reshape(-1, constants.COLUMNAR_OHLCV_COLUMNS_COUNT).T
+    )
+
+
+def get_block_header(cryptocurrency, symbol, time_frame, values, location):
+    """
+    :param values: the block values as returned by get_columnar_ohlcv_values
+    :param location: the keys telling where to find the block values
+    :return: the header of an OHLCV block
+    """
+    return {
+        enums.ColumnarDataFileKeys.CRYPTOCURRENCY.value: cryptocurrency,
+        enums.ColumnarDataFileKeys.SYMBOL.value: symbol,
+        enums.ColumnarDataFileKeys.TIME_FRAME.value: common_enums.TimeFrames(time_frame).value,
+        **location,
+        enums.ColumnarDataFileKeys.COUNT.value: values.shape[1],
+    }
+
+
+def get_header_from_description(description, blocks_header):
+    """
+    :param description: data file description as returned by get_database_description
+    :param blocks_header: the header of each OHLCV block
+    :return: a json serializable columnar data header
+    """
+    return {
+        enums.DataFormatKeys.TIMESTAMP.value: description[enums.DataFormatKeys.TIMESTAMP.value],
+        enums.DataFormatKeys.VERSION.value: constants.COLUMNAR_DATA_FILE_VERSION,
+        enums.DataFormatKeys.EXCHANGE.value: description[enums.DataFormatKeys.EXCHANGE.value],
+        enums.DataFormatKeys.SYMBOLS.value: description[enums.DataFormatKeys.SYMBOLS.value],
+        enums.DataFormatKeys.TIME_FRAMES.value: [
+            common_enums.TimeFrames(time_frame).value
+            for time_frame in description[enums.DataFormatKeys.TIME_FRAMES.value]
+        ],
+        enums.DataFormatKeys.START_TIMESTAMP.value: description[enums.DataFormatKeys.START_TIMESTAMP.value],
+        enums.DataFormatKeys.END_TIMESTAMP.value: description[enums.DataFormatKeys.END_TIMESTAMP.value],
+        enums.DataFormatKeys.CANDLES_LENGTH.value: description[enums.DataFormatKeys.CANDLES_LENGTH.value],
+        enums.ColumnarDataFileKeys.OHLCV_BLOCKS.value: blocks_header,
+    }
+
+
+def read_columnar_data_file_header(file_path):
+    """
+    :param file_path: path of the columnar data file
+    :return: the parsed header of the file and the position of its first data block
+    """
+    with open(file_path, "rb") as data_file:
+        magic, header_size = struct.unpack(_PREAMBLE_FORMAT, data_file.read(_PREAMBLE_SIZE))
+        if magic != constants.COLUMNAR_DATA_FILE_MAGIC:
+            raise ValueError(f"{file_path} is not a columnar data file")
+        header = json.loads(data_file.read(header_size))
+    return header, _get_aligned_size(_PREAMBLE_SIZE + header_size)
+
+
+def load_columnar_ohlcvs(file_path):
+    """
+    Memory-maps every OHLCV block of a columnar data file: candles are only read from disk when accessed
+    :param file_path: path of the columnar data file
+    :return: the file header and the OHLCV (cryptocurrency, values) by time frame value by symbol where values
+    has one row per column
+    """
+    header, data_start = read_columnar_data_file_header(file_path)
+    return header, get_ohlcvs_from_header(
+        header,
+        lambda block: np.memmap(
+            file_path, dtype=np.float64, mode="r",
+            offset=data_start + block[enums.ColumnarDataFileKeys.OFFSET.value],
+            shape=(constants.COLUMNAR_OHLCV_COLUMNS_COUNT, block[enums.ColumnarDataFileKeys.COUNT.value])
+        )
+    )
+
+
+def get_ohlcvs_from_header(header, values_factory):
+    """
+    :param header: a columnar data header
+    :param values_factory: called with each non-empty block header to get its values
+    :return: the OHLCV (cryptocurrency, values) by time frame value by symbol where values has one row per column
+    """
+    ohlcvs = {}
+    for block in header[enums.ColumnarDataFileKeys.OHLCV_BLOCKS.value]:
+        values = values_factory(block) if block[enums.ColumnarDataFileKeys.COUNT.value] \
+            else np.empty((constants.COLUMNAR_OHLCV_COLUMNS_COUNT, 0), dtype=np.float64)
+        ohlcvs.setdefault(block[enums.ColumnarDataFileKeys.SYMBOL.value], {})[
+            block[enums.ColumnarDataFileKeys.TIME_FRAME.value]
+        ] = (block[enums.ColumnarDataFileKeys.CRYPTOCURRENCY.value], values)
+    return ohlcvs
+
+
+def get_columnar_data_file_description(file_path):
+    """
+    :param file_path: path of the columnar data file
+    :return: the file description using the same format as get_database_description
+    """
+    header, _ = read_columnar_data_file_header(file_path)
+    return get_description_from_header(header)
+
+
+def get_description_from_header(header):
+    """
+    :param header: a columnar data file header
+    :return: the file description using the same format as get_database_description
+    """
+    return {
+        enums.DataFormatKeys.TIMESTAMP.value: header[enums.DataFormatKeys.TIMESTAMP.value],
+        enums.DataFormatKeys.VERSION.value: header[enums.DataFormatKeys.VERSION.value],
+        enums.DataFormatKeys.EXCHANGE.value: header[enums.DataFormatKeys.EXCHANGE.value],
+        enums.DataFormatKeys.SYMBOLS.value: header[enums.DataFormatKeys.SYMBOLS.value],
+        enums.DataFormatKeys.TIME_FRAMES.value: [
+            common_enums.TimeFrames(time_frame)
+            for time_frame in header[enums.DataFormatKeys.TIME_FRAMES.value]
+        ],
+        enums.DataFormatKeys.START_TIMESTAMP.value: header[enums.DataFormatKeys.START_TIMESTAMP.value],
+        enums.DataFormatKeys.END_TIMESTAMP.value: header[enums.DataFormatKeys.END_TIMESTAMP.value],
+        enums.DataFormatKeys.CANDLES_LENGTH.value: header[enums.DataFormatKeys.CANDLES_LENGTH.value],
+    }
+
+
+def _get_aligned_size(size):
+    return -(-size // constants.COLUMNAR_DATA_FILE_ALIGNMENT) * constants.COLUMNAR_DATA_FILE_ALIGNMENT
+
+
+def _write_padding(data_file, written_size):
+    data_file.write(b"\x00" * (_get_aligned_size(written_size) - written_size))
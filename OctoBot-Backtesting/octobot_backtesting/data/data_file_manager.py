@@ -26,6 +26,7 @@ import octobot_commons.errors as commons_errors
 
 import octobot_backtesting.constants as constants
 import octobot_backtesting.enums as enums
+import octobot_backtesting.data.columnar_data_file as columnar_data_file
 
 
 def get_backtesting_file_name(clazz, identifier, data_format=enums.DataFormats.REGULAR_COLLECTOR_DATA):
@@ -36,11 +37,15 @@ def get_backtesting_file_name(clazz, identifier, data_format=enums.DataFormats.R
 def get_data_type(file_name):
     if file_name.endswith(constants.BACKTESTING_DATA_FILE_EXT):
         return enums.DataFormats.REGULAR_COLLECTOR_DATA
+    if file_name.endswith(constants.BACKTESTING_COLUMNAR_DATA_FILE_EXT):
+        return enums.DataFormats.COLUMNAR_DATA
 
 
 def get_file_ending(data_type):
     if data_type == enums.DataFormats.REGULAR_COLLECTOR_DATA:
         return constants.BACKTESTING_DATA_FILE_EXT
+    if data_type == enums.DataFormats.COLUMNAR_DATA:
+        return constants.BACKTESTING_COLUMNAR_DATA_FILE_EXT
 
 
 def get_date(time_info) -> str:
@@ -89,6 +94,11 @@ async def get_database_description(database):
 
 
 async def get_file_description(database_file):
+    if get_data_type(database_file) is enums.DataFormats.COLUMNAR_DATA:
+        try:
+            return columnar_data_file.get_columnar_data_file_description(database_file)
+        except (OSError, ValueError, KeyError):
+            return None
     database = None
     try:
         database = databases.SQLiteDatabase(database_file)
@@ -103,7 +113,7 @@ async def get_file_description(database_file):
 
 
 def is_valid_ending(ending):
-    return ending in [constants.BACKTESTING_DATA_FILE_EXT]
+    return ending in [constants.BACKTESTING_DATA_FILE_EXT, constants.BACKTESTING_COLUMNAR_DATA_FILE_EXT]
 
 
 def get_all_available_data_files(data_collector_path):
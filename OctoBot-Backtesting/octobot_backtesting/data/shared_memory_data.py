@@ -0,0 +1,97 @@
+#  Drakkar-Software OctoBot-Backtesting
+#  Copyright (c) Drakkar-Software, All rights reserved.
+#
+#  This library is free software; you can redistribute it and/or
+#  modify it under the terms of the GNU Lesser General Public
+#  License as published by the Free Software Foundation; either
+#  version 3.0 of the License, or (at your option) any later version.
+#
+#  This library is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the GNU
+#  Lesser General Public License for more details.
+#
+#  You should have received a copy of the GNU Lesser General Public
+#  License along with this library.
+import multiprocessing.shared_memory as shared_memory
+import numpy as np
+
+import octobot_backtesting.constants as constants
+import octobot_backtesting.data.columnar_data_file as columnar_data_file
+import octobot_backtesting.enums as enums
+
+
+def create_shared_memory_ohlcvs(description, ohlcv_blocks):
+    """
+    Copies OHLCV blocks into shared memory blocks that other processes can attach to without copying them
+    :param description: data file description as returned by get_database_description
+    :param ohlcv_blocks: list of (cryptocurrency, symbol, time_frame, values) where values are
+    timestamp sorted rows of COLUMNAR_OHLCV_COLUMNS_COUNT columns
+    :return: a picklable columnar data header locating each block by its shared memory name and the created
+    shared memory blocks that should be released using release_shared_memories(..., unlink=True) when unused
+    """
+    blocks_header = []
+    shared_memories = []
+    try:
+        for cryptocurrency, symbol, time_frame, values in ohlcv_blocks:
+            values = columnar_data_file.get_columnar_ohlcv_values(values)
+            shared_memory_name = None
+            if values.nbytes:
+                shared_block = shared_memory.SharedMemory(create=True, size=values.nbytes)
+                shared_memories.append(shared_block)
+                np.ndarray(values.shape, dtype=np.float64, buffer=shared_block.buf)[:] = values
+                shared_memory_name = shared_block.name
+            blocks_header.append(columnar_data_file.get_block_header(cryptocurrency, symbol, time_frame, values, {
+                enums.ColumnarDataFileKeys.SHARED_MEMORY_NAME.value: shared_memory_name
+            }))
+    except Exception:
+        release_shared_memories(shared_memories, unlink=True)
+        raise
+    return columnar_data_file.get_header_from_description(description, blocks_header), shared_memories
+
+
+def attach_shared_memory_ohlcvs(header):
+    """
+    Attaches to the shared memory blocks of a header created by create_shared_memory_ohlcvs
+    :param header: the header returned by create_shared_memory_ohlcvs
+    :return: the OHLCV (cryptocurrency, values) by time frame value by symbol where values are read-only
+    views on the shared memory blocks and the attached shared memory blocks that should be released using
+    release_shared_memories when unused
+    """
+    shared_memories = []
+
+    def _attach(block):
+        shared_block = shared_memory.SharedMemory(name=block[enums.ColumnarDataFileKeys.SHARED_MEMORY_NAME.value])
+        shared_memories.append(shared_block)
+        values = np.ndarray(
+            (constants.COLUMNAR_OHLCV_COLUMNS_COUNT, block[enums.ColumnarDataFileKeys.COUNT.value]),
+            dtype=np.float64, buffer=shared_block.buf
+        )
+        values.flags.writeable = False
+        return values
+
+    try:
+        return columnar_data_file.get_ohlcvs_from_header(header, _attach), shared_memories
+    except Exception:
+        release_shared_memories(shared_memories)
+        raise
+
+
+def release_shared_memories(shared_memories, unlink=False):
+    """
+    Closes the given shared memory blocks
+    :param shared_memories: the shared memory blocks to close
+    :param unlink: when True, also destroys the blocks: to be done by their creator only
+    """
+    for shared_block in shared_memories:
+        try:
+            shared_block.close()
+        except BufferError:
+            # views on this block are still referenced: it will be closed when garbage collected
+            pass
+        if unlink:
+            try:
+                shared_block.unlink()
+            except FileNotFoundError:
+                pass
+    shared_memories.clear()
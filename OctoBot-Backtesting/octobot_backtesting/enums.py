@@ -18,6 +18,7 @@ import enum
 
 class DataFormats(enum.Enum):
     REGULAR_COLLECTOR_DATA = 0
+    COLUMNAR_DATA = 1
 
 
 class DataFormatKeys(enum.Enum):
@@ -36,6 +37,16 @@ class DataFormatKeys(enum.Enum):
     VERSION = "version"
 
 
+class ColumnarDataFileKeys(enum.Enum):
+    OHLCV_BLOCKS = "ohlcv_blocks"
+    CRYPTOCURRENCY = "cryptocurrency"
+    SYMBOL = "symbol"
+    TIME_FRAME = "time_frame"
+    OFFSET = "offset"
+    SHARED_MEMORY_NAME = "shared_memory_name"
+    COUNT = "count"
+
+
 class ReportFormat(enum.Enum):
     SYMBOL_REPORT = "symbol_report"
     BOT_REPORT = "bot_report"
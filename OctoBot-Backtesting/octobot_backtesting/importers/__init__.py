@@ -24,6 +24,8 @@ from octobot_backtesting.importers import exchanges
 
 from octobot_backtesting.importers.exchanges import (
     ExchangeDataImporter,
+    ColumnarExchangeDataImporter,
+    SharedMemoryExchangeDataImporter,
     get_operations_from_timestamps,
     import_ohlcvs,
     import_tickers,
@@ -35,6 +37,8 @@ from octobot_backtesting.importers.exchanges import (
 __all__ = [
     "DataImporter",
     "ExchangeDataImporter",
+    "ColumnarExchangeDataImporter",
+    "SharedMemoryExchangeDataImporter",
     "get_operations_from_timestamps",
     "import_ohlcvs",
     "import_tickers",
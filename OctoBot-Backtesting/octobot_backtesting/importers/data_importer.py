@@ -43,6 +43,9 @@ class DataImporter:
     async def get_data_timestamp_interval(self, time_frame=None):
         raise NotImplementedError("get_data_timestamp_interval is not implemented")
 
+    async def get_data_timestamps(self, time_frame=None, inferior_timestamp=-1, superior_timestamp=-1) -> list:
+        raise NotImplementedError("get_data_timestamps is not implemented")
+
     async def stop(self) -> None:
         if not self.should_stop:
             self.should_stop = True
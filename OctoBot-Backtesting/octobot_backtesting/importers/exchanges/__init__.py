@@ -16,10 +16,18 @@
 
 from octobot_backtesting.importers.exchanges import exchange_importer
 from octobot_backtesting.importers.exchanges import util
+from octobot_backtesting.importers.exchanges import columnar_exchange_importer
+from octobot_backtesting.importers.exchanges import shared_memory_exchange_importer
 
 from octobot_backtesting.importers.exchanges.exchange_importer import (
     ExchangeDataImporter,
 )
+from octobot_backtesting.importers.exchanges.columnar_exchange_importer import (
+    ColumnarExchangeDataImporter,
+)
+from octobot_backtesting.importers.exchanges.shared_memory_exchange_importer import (
+    SharedMemoryExchangeDataImporter,
+)
 
 from octobot_backtesting.importers.exchanges.util import (
     get_operations_from_timestamps,
@@ -32,6 +40,8 @@ from octobot_backtesting.importers.exchanges.util import (
 
 __all__ = [
     "ExchangeDataImporter",
+    "ColumnarExchangeDataImporter",
+    "SharedMemoryExchangeDataImporter",
     "get_operations_from_timestamps",
     "import_ohlcvs",
     "import_tickers",
@@ -0,0 +1,168 @@
+#  Drakkar-Software OctoBot-Backtesting
+#  Copyright (c) Drakkar-Software, All rights reserved.
+#
+#  This library is free software; you can redistribute it and/or
+#  modify it under the terms of the GNU Lesser General Public
+#  License as published by the Free Software Foundation; either
+#  version 3.0 of the License, or (at your option) any later version.
+#
+#  This library is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the GNU
+#  Lesser General Public License for more details.
+#
+#  You should have received a copy of the GNU Lesser General Public
+#  License along with this library.
+import numpy as np
+
+import octobot_commons.constants as common_constants
+import octobot_commons.enums as common_enums
+import octobot_commons.databases as databases
+
+import octobot_backtesting.constants as constants
+import octobot_backtesting.data as data
+import octobot_backtesting.enums as enums
+import octobot_backtesting.errors as errors
+import octobot_backtesting.importers.exchanges.exchange_importer as exchange_importer
+
+
+class ColumnarExchangeDataImporter(exchange_importer.ExchangeDataImporter):
+    """
+    Reads OHLCV data from columnar data files.
+    Candles are memory-mapped and selected using binary searches on their timestamps: they are never parsed
+    and only the selected candles are converted into database rows.
+    """
+
+    def __init__(self, config, file_path):
+        super().__init__(config, file_path)
+        # (cryptocurrency, values) by time frame value by symbol
+        self.ohlcvs = {}
+
+    async def initialize(self) -> None:
+        self._load_ohlcvs(*data.load_columnar_ohlcvs(self.adapt_file_path_if_necessary()))
+
+    def _load_ohlcvs(self, header, ohlcvs):
+        self.ohlcvs = ohlcvs
+        description = data.get_description_from_header(header)
+        self.version = description[enums.DataFormatKeys.VERSION.value]
+        self.exchange_name = description[enums.DataFormatKeys.EXCHANGE.value]
+        self.symbols = description[enums.DataFormatKeys.SYMBOLS.value]
+        self.time_frames = description[enums.DataFormatKeys.TIME_FRAMES.value]
+        self.available_data_types = [enums.ExchangeDataTables.OHLCV] if any(
+            values.shape[1]
+            for values_by_time_frame in self.ohlcvs.values()
+            for _, values in values_by_time_frame.values()
+        ) else []
+
+        self.logger.info(f"Loaded {self.exchange_name} {self._get_data_origin()} with "
+                         f"{', '.join(self.symbols)} on {', '.join([tf.value for tf in self.time_frames])}")
+
+    def _get_data_origin(self):
+        return "columnar data file"
+
+    async def stop(self) -> None:
+        if not self.should_stop:
+            self.should_stop = True
+            self.ohlcvs = {}
+
+    async def get_data_timestamp_interval(self, time_frame=None):
+        min_timestamps = []
+        max_timestamps = []
+        for values_by_time_frame in self.ohlcvs.values():
+            for time_frame_value, (_, values) in values_by_time_frame.items():
+                if values.shape[1] and (time_frame is None or time_frame_value == time_frame):
+                    min_timestamps.append(values[constants.COLUMNAR_OHLCV_TIMESTAMP_COLUMN, 0])
+                    max_timestamps.append(values[constants.COLUMNAR_OHLCV_TIMESTAMP_COLUMN, -1])
+        if not min_timestamps:
+            if time_frame:
+                raise errors.MissingTimeFrame(f"Missing time frame in data file: {time_frame}")
+            return 0.0, 0.0
+        # use the latest time frame start to make sure every time frame is available from the start timestamp
+        return float(max(min_timestamps)), float(max(max_timestamps))
+
+    async def get_data_timestamps(self, time_frame=None, inferior_timestamp=-1, superior_timestamp=-1) -> list:
+        data_timestamps = []
+        for values_by_time_frame in self.ohlcvs.values():
+            for time_frame_value, (_, values) in values_by_time_frame.items():
+                if time_frame is None or time_frame_value == time_frame:
+                    start_index, end_index = _get_time_window_indexes(values, inferior_timestamp, superior_timestamp)
+                    data_timestamps.append(values[constants.COLUMNAR_OHLCV_TIMESTAMP_COLUMN, start_index:end_index])
+        if not data_timestamps:
+            return []
+        return np.unique(np.concatenate(data_timestamps)).tolist()
+
+    async def get_ohlcv(self, exchange_name=None, symbol=None,
+                        time_frame=common_enums.TimeFrames.ONE_HOUR,
+                        limit=databases.SQLiteDatabase.DEFAULT_SIZE,
+                        timestamps=None,
+                        operations=None):
+        inferior_timestamp = superior_timestamp = common_constants.DEFAULT_IGNORED_VALUE
+        for timestamp, operation in zip(timestamps or [], operations or []):
+            if operation == common_enums.DataBaseOperations.SUP_EQUALS.value:
+                inferior_timestamp = float(timestamp)
+            elif operation == common_enums.DataBaseOperations.INF_EQUALS.value:
+                superior_timestamp = float(timestamp)
+        # same as database selects: most recent rows first
+        rows = sorted(
+            self._select_ohlcvs(exchange_name, symbol, time_frame, inferior_timestamp, superior_timestamp),
+            key=lambda row: row[0],
+            reverse=True
+        )
+        return rows if limit == databases.SQLiteDatabase.DEFAULT_SIZE else rows[:limit]
+
+    async def get_ohlcv_from_timestamps(self, exchange_name=None, symbol=None,
+                                        time_frame=common_enums.TimeFrames.ONE_HOUR,
+                                        limit=databases.SQLiteDatabase.DEFAULT_SIZE,
+                                        inferior_timestamp=-1, superior_timestamp=-1,
+                                        cursor=databases.ChronologicalReadDatabaseCache.DEFAULT_CURSOR) -> list:
+        """
+        Selects OHLCV rows directly from the memory-mapped candles.
+        Unlike ExchangeDataImporter, data from before a previously given inferior_timestamp can be read:
+        cursor is unused.
+        """
+        return self._select_ohlcvs(exchange_name, symbol, time_frame, inferior_timestamp, superior_timestamp)
+
+    def get_ohlcv_values(self, symbol, time_frame,
+                         inferior_timestamp=common_constants.DEFAULT_IGNORED_VALUE,
+                         superior_timestamp=common_constants.DEFAULT_IGNORED_VALUE):
+        """
+        :return: a read-only view on the selected candles values: one contiguous row per PriceIndexes value
+        """
+        try:
+            _, values = self.ohlcvs[symbol][time_frame.value]
+        except KeyError:
+            return np.empty((len(common_enums.PriceIndexes), 0), dtype=np.float64)
+        start_index, end_index = _get_time_window_indexes(values, inferior_timestamp, superior_timestamp)
+        return values[constants.COLUMNAR_OHLCV_CANDLE_COLUMNS_START:, start_index:end_index]
+
+    def _select_ohlcvs(self, exchange_name, symbol, time_frame, inferior_timestamp, superior_timestamp):
+        if exchange_name is not None and exchange_name != self.exchange_name:
+            return []
+        rows = []
+        for selected_symbol in ((symbol, ) if symbol is not None else self.ohlcvs):
+            try:
+                cryptocurrency, values = self.ohlcvs[selected_symbol][time_frame.value]
+            except KeyError:
+                continue
+            start_index, end_index = _get_time_window_indexes(values, inferior_timestamp, superior_timestamp)
+            rows += [
+                [
+                    candle_values[constants.COLUMNAR_OHLCV_TIMESTAMP_COLUMN],
+                    self.exchange_name,
+                    cryptocurrency,
+                    selected_symbol,
+                    time_frame.value,
+                    candle_values[constants.COLUMNAR_OHLCV_CANDLE_COLUMNS_START:]
+                ]
+                for candle_values in values[:, start_index:end_index].T.tolist()
+            ]
+        return rows
+
+
+def _get_time_window_indexes(values, inferior_timestamp, superior_timestamp):
+    timestamps = values[constants.COLUMNAR_OHLCV_TIMESTAMP_COLUMN]
+    start_index = 0 if inferior_timestamp == common_constants.DEFAULT_IGNORED_VALUE \
+        else int(np.searchsorted(timestamps, inferior_timestamp, side="left"))
+    end_index = len(timestamps) if superior_timestamp == common_constants.DEFAULT_IGNORED_VALUE \
+        else int(np.searchsorted(timestamps, superior_timestamp, side="right"))
+    return start_index, end_index
@@ -99,6 +99,31 @@ class ExchangeDataImporter(importers.DataImporter):
             return max(minimum_timestamp, min_ohlcv_timestamp), max(maximum_timestamp, max_ohlcv_timestamp)
         return min_ohlcv_timestamp, max_ohlcv_timestamp
 
+    async def get_data_timestamps(self, time_frame=None, inferior_timestamp=-1, superior_timestamp=-1) -> list:
+        """
+        :return: the sorted timestamps of every available data point: OHLCV and klines are only considered on
+        the given time frame when specified
+        """
+        timestamps, operations = importers.get_operations_from_timestamps(superior_timestamp, inferior_timestamp)
+        data_timestamps = set()
+        for table in [enums.ExchangeDataTables.OHLCV, enums.ExchangeDataTables.KLINE,
+                      enums.ExchangeDataTables.ORDER_BOOK, enums.ExchangeDataTables.RECENT_TRADES,
+                      enums.ExchangeDataTables.TICKER]:
+            if table in self.available_data_types:
+                kwargs = {"time_frame": time_frame} \
+                    if time_frame and table in (enums.ExchangeDataTables.OHLCV, enums.ExchangeDataTables.KLINE) \
+                    else {}
+                try:
+                    data_timestamps.update(
+                        row[0]
+                        for row in await self.database.select_distinct(
+                            table, [databases.SQLiteDatabase.TIMESTAMP_COLUMN], timestamps, operations, **kwargs
+                        )
+                    )
+                except common_errors.DatabaseNotFoundError:
+                    pass
+        return sorted(data_timestamps)
+
     async def _init_available_data_types(self):
         self.available_data_types = [table for table in enums.ExchangeDataTables
                                      if await self.database.check_table_exists(table)
@@ -143,13 +168,15 @@ class ExchangeDataImporter(importers.DataImporter):
     async def get_ohlcv_from_timestamps(self, exchange_name=None, symbol=None,
                                         time_frame=common_enums.TimeFrames.ONE_HOUR,
                                         limit=databases.SQLiteDatabase.DEFAULT_SIZE,
-                                        inferior_timestamp=-1, superior_timestamp=-1) -> list:
+                                        inferior_timestamp=-1, superior_timestamp=-1,
+                                        cursor=databases.ChronologicalReadDatabaseCache.DEFAULT_CURSOR) -> list:
         """
         Reads OHLCV history from database and populates a local ChronologicalReadDatabaseCache.
         Warning: can't read data from before last given inferior_timestamp unless associated cache is reset
+        :param cursor: name of the cache cursor of this reader, each stream of reads should use its own cursor
         """
         return await self._get_from_cache(exchange_name, symbol, time_frame, enums.ExchangeDataTables.OHLCV,
-                                          inferior_timestamp, superior_timestamp, self.get_ohlcv, limit)
+                                          inferior_timestamp, superior_timestamp, self.get_ohlcv, limit, cursor)
 
     async def get_ticker(self, exchange_name=None, symbol=None,
                          limit=databases.SQLiteDatabase.DEFAULT_SIZE,
@@ -164,13 +191,15 @@ class ExchangeDataImporter(importers.DataImporter):
 
     async def get_ticker_from_timestamps(self, exchange_name=None, symbol=None,
                                          limit=databases.SQLiteDatabase.DEFAULT_SIZE,
-                                         inferior_timestamp=-1, superior_timestamp=-1):
+                                         inferior_timestamp=-1, superior_timestamp=-1,
+                                         cursor=databases.ChronologicalReadDatabaseCache.DEFAULT_CURSOR):
         """
         Reads ticker history from database and populates a local ChronologicalReadDatabaseCache.
         Warning: can't read data from before last given inferior_timestamp unless associated cache is reset
+        :param cursor: name of the cache cursor of this reader, each stream of reads should use its own cursor
         """
         return await self._get_from_cache(exchange_name, symbol, None, enums.ExchangeDataTables.TICKER,
-                                          inferior_timestamp, superior_timestamp, self.get_ticker, limit)
+                                          inferior_timestamp, superior_timestamp, self.get_ticker, limit, cursor)
 
     async def get_order_book(self, exchange_name=None, symbol=None,
                              limit=databases.SQLiteDatabase.DEFAULT_SIZE,
@@ -185,13 +214,15 @@ class ExchangeDataImporter(importers.DataImporter):
 
     async def get_order_book_from_timestamps(self, exchange_name=None, symbol=None,
                                              limit=databases.SQLiteDatabase.DEFAULT_SIZE,
-                                             inferior_timestamp=-1, superior_timestamp=-1):
+                                             inferior_timestamp=-1, superior_timestamp=-1,
+                                             cursor=databases.ChronologicalReadDatabaseCache.DEFAULT_CURSOR):
         """
         Reads order book history from database and populates a local ChronologicalReadDatabaseCache.
         Warning: can't read data from before last given inferior_timestamp unless associated cache is reset
+        :param cursor: name of the cache cursor of this reader, each stream of reads should use its own cursor
         """
         return await self._get_from_cache(exchange_name, symbol, None, enums.ExchangeDataTables.ORDER_BOOK,
-                                          inferior_timestamp, superior_timestamp, self.get_order_book, limit)
+                                          inferior_timestamp, superior_timestamp, self.get_order_book, limit, cursor)
 
     async def get_recent_trades(self, exchange_name=None, symbol=None,
                                 limit=databases.SQLiteDatabase.DEFAULT_SIZE,
@@ -206,13 +237,16 @@ class ExchangeDataImporter(importers.DataImporter):
 
     async def get_recent_trades_from_timestamps(self, exchange_name=None, symbol=None,
                                                 limit=databases.SQLiteDatabase.DEFAULT_SIZE,
-                                                inferior_timestamp=-1, superior_timestamp=-1):
+                                                inferior_timestamp=-1, superior_timestamp=-1,
+                                                cursor=databases.ChronologicalReadDatabaseCache.DEFAULT_CURSOR):
         """
         Reads recent trades history from database and populates a local ChronologicalReadDatabaseCache.
         Warning: can't read data from before last given inferior_timestamp unless associated cache is reset
+        :param cursor: name of the cache cursor of this reader, each stream of reads should use its own cursor
         """
         return await self._get_from_cache(exchange_name, symbol, None, enums.ExchangeDataTables.RECENT_TRADES,
-                                          inferior_timestamp, superior_timestamp, self.get_recent_trades, limit)
+                                          inferior_timestamp, superior_timestamp, self.get_recent_trades, limit,
+                                          cursor)
 
     async def get_kline(self, exchange_name=None, symbol=None,
                         time_frame=common_enums.TimeFrames.ONE_HOUR,
@@ -230,16 +264,18 @@ class ExchangeDataImporter(importers.DataImporter):
     async def get_kline_from_timestamps(self, exchange_name=None, symbol=None,
                                         time_frame=common_enums.TimeFrames.ONE_HOUR,
                                         limit=databases.SQLiteDatabase.DEFAULT_SIZE,
-                                        inferior_timestamp=-1, superior_timestamp=-1):
+                                        inferior_timestamp=-1, superior_timestamp=-1,
+                                        cursor=databases.ChronologicalReadDatabaseCache.DEFAULT_CURSOR):
         """
         Reads kline history from database and populates a local ChronologicalReadDatabaseCache.
         Warning: can't read data from before last given inferior_timestamp unless associated cache is reset
+        :param cursor: name of the cache cursor of this reader, each stream of reads should use its own cursor
         """
         return await self._get_from_cache(exchange_name, symbol, time_frame, enums.ExchangeDataTables.KLINE,
-                                          inferior_timestamp, superior_timestamp, self.get_kline, limit)
+                                          inferior_timestamp, superior_timestamp, self.get_kline, limit, cursor)
 
     async def _get_from_cache(self, exchange_name, symbol, time_frame, data_type,
-                              inferior_timestamp, superior_timestamp, set_cache_method, limit):
+                              inferior_timestamp, superior_timestamp, set_cache_method, limit, cursor):
         if not self.chronological_cache.has((exchange_name, symbol, time_frame, data_type)):
             # ignore superior timestamp to select everything starting from inferior_timestamp and cache it
             select_superior_timestamp = -1
@@ -259,4 +295,4 @@ class ExchangeDataImporter(importers.DataImporter):
                 (exchange_name, symbol, time_frame, data_type)
             )
         return self.chronological_cache.get(inferior_timestamp, superior_timestamp,
-                                            (exchange_name, symbol, time_frame, data_type))
+                                            (exchange_name, symbol, time_frame, data_type), cursor=cursor)
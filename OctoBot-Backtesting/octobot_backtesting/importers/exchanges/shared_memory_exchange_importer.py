@@ -0,0 +1,41 @@
+#  Drakkar-Software OctoBot-Backtesting
+#  Copyright (c) Drakkar-Software, All rights reserved.
+#
+#  This library is free software; you can redistribute it and/or
+#  modify it under the terms of the GNU Lesser General Public
+#  License as published by the Free Software Foundation; either
+#  version 3.0 of the License, or (at your option) any later version.
+#
+#  This library is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the GNU
+#  Lesser General Public License for more details.
+#
+#  You should have received a copy of the GNU Lesser General Public
+#  License along with this library.
+import octobot_backtesting.data as data
+import octobot_backtesting.importers.exchanges.columnar_exchange_importer as columnar_exchange_importer
+
+
+class SharedMemoryExchangeDataImporter(columnar_exchange_importer.ColumnarExchangeDataImporter):
+    """
+    Reads OHLCV data from shared memory blocks created by another process using data.create_shared_memory_ohlcvs.
+    Candles are neither read from disk nor copied: every process attached to a block reads the same memory.
+    """
+
+    def __init__(self, config, file_path, shared_memory_header):
+        super().__init__(config, file_path)
+        self.shared_memory_header = shared_memory_header
+        self._shared_memories = []
+
+    async def initialize(self) -> None:
+        ohlcvs, self._shared_memories = data.attach_shared_memory_ohlcvs(self.shared_memory_header)
+        self._load_ohlcvs(self.shared_memory_header, ohlcvs)
+
+    def _get_data_origin(self):
+        return "shared memory data"
+
+    async def stop(self) -> None:
+        if not self.should_stop:
+            await super().stop()
+            data.release_shared_memories(self._shared_memories)
@@ -0,0 +1,106 @@
+#  Drakkar-Software OctoBot-Backtesting
+#  Copyright (c) Drakkar-Software, All rights reserved.
+#
+#  This library is free software; you can redistribute it and/or
+#  modify it under the terms of the GNU Lesser General Public
+#  License as published by the Free Software Foundation; either
+#  version 3.0 of the License, or (at your option) any later version.
+#
+#  This library is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the GNU
+#  Lesser General Public License for more details.
+#
+#  You should have received a copy of the GNU Lesser General Public
+#  License along with this library.
+import octobot_commons.logging as logging
+
+import octobot_backtesting.backtest_data as backtest_data
+import octobot_backtesting.converters as converters
+import octobot_backtesting.data as data
+import octobot_backtesting.enums as enums
+import octobot_backtesting.importers as importers
+import octobot_backtesting.util as util
+
+
+class SharedMemoryData:
+    """
+    Decodes data files once into shared memory blocks. Their headers can be sent to other processes where
+    SharedMemoryBacktestData will read the same candles without decoding nor copying them.
+    Only data files containing nothing but OHLCV data are shared.
+    """
+
+    def __init__(self, data_files, config):
+        self.logger = logging.get_logger(self.__class__.__name__)
+        self.data_files = data_files
+        self.config = config
+        self.headers_by_data_file = {}
+        self.default_importer = None
+        self._shared_memories = []
+
+    async def initialize(self):
+        try:
+            for data_file in self.data_files:
+                header = await self._create_shared_header(data_file)
+                if header is not None:
+                    self.headers_by_data_file[data_file] = header
+        except Exception:
+            self.close()
+            raise
+
+    async def _create_shared_header(self, data_file):
+        importer = await util.create_importer_from_backtesting_file_name(self.config, data_file,
+                                                                         default_importer=self.default_importer)
+        if importer is None:
+            return None
+        try:
+            if not isinstance(importer, importers.ExchangeDataImporter) or \
+                    any(data_type is not enums.ExchangeDataTables.OHLCV
+                        for data_type in importer.available_data_types):
+                self.logger.info(f"{data_file} is not an OHLCV only data file: it will be read by each backtesting")
+                return None
+            description = await data.get_file_description(importer.adapt_file_path_if_necessary())
+            if isinstance(importer, importers.ColumnarExchangeDataImporter):
+                ohlcv_blocks = [
+                    (cryptocurrency, symbol, time_frame_value, values.T)
+                    for symbol, values_by_time_frame in importer.ohlcvs.items()
+                    for time_frame_value, (cryptocurrency, values) in values_by_time_frame.items()
+                ]
+            else:
+                ohlcv_blocks = await converters.get_ohlcv_blocks(importer.database, description)
+            header, shared_memories = data.create_shared_memory_ohlcvs(description, ohlcv_blocks)
+            self._shared_memories += shared_memories
+            return header
+        finally:
+            await importer.stop()
+
+    def close(self):
+        """
+        Destroys the shared memory blocks: to be called once every process using them is done
+        """
+        data.release_shared_memories(self._shared_memories, unlink=True)
+        self.headers_by_data_file = {}
+
+
+class SharedMemoryBacktestData(backtest_data.BacktestData):
+    """
+    BacktestData reading the data files shared by a SharedMemoryData from its headers.
+    Data files that are not shared are read from disk.
+    """
+
+    def __init__(self, data_files, config, tentacles_config, shared_headers_by_data_file):
+        super().__init__(data_files, config, tentacles_config)
+        self.shared_headers_by_data_file = shared_headers_by_data_file
+
+    async def initialize(self):
+        self.importers_by_data_file = {}
+        for data_file in self.data_files:
+            shared_header = self.shared_headers_by_data_file.get(data_file)
+            if shared_header is None:
+                importer = await util.create_importer_from_backtesting_file_name(
+                    self.config, data_file, default_importer=self.default_importer
+                )
+            else:
+                importer = importers.SharedMemoryExchangeDataImporter(self.config, data_file, shared_header)
+                await importer.initialize()
+            self.importers_by_data_file[data_file] = importer
@@ -25,5 +25,8 @@ cdef class TimeUpdater(time_channel.TimeProducer):
 
     cdef public double starting_time
     cdef public double simulation_duration
+    cdef public double last_progress_log_time
 
     cdef public object finished_event
+
+    cdef void _log_progress(self, double current_timestamp)
@@ -21,12 +21,16 @@ import octobot_backtesting.time.channel.time as time_channel
 
 
 class TimeUpdater(time_channel.TimeProducer):
+    # minimum delay in seconds between two progress logs
+    PROGRESS_LOG_INTERVAL = 1
+
     def __init__(self, channel, backtesting):
         super().__init__(channel, backtesting)
         self.backtesting = backtesting
         self.time_manager = backtesting.time_manager
         self.starting_time = time.time()
         self.simulation_duration = 0
+        self.last_progress_log_time = 0
         self.finished_event = asyncio.Event()
 
         self.channels_manager = None
@@ -41,8 +45,7 @@ class TimeUpdater(time_channel.TimeProducer):
                 current_timestamp = self.time_manager.current_timestamp
                 await self.push(self.time_manager.current_timestamp)
 
-                self.logger.info(f"Progress : {round(min(self.backtesting.get_progress(), 1) * 100, 2)}% "
-                                 f"[{current_timestamp}]")
+                self._log_progress(current_timestamp)
 
                 # Call synchronous channels callbacks
                 await self.channels_manager.handle_new_iteration(current_timestamp)
@@ -66,6 +69,14 @@ class TimeUpdater(time_channel.TimeProducer):
         self.finished_event.set()
         self.backtesting = None
 
+    def _log_progress(self, current_timestamp):
+        # logging every iteration is slowing down the simulation: only log from time to time
+        now = time.time()
+        if now - self.last_progress_log_time >= self.PROGRESS_LOG_INTERVAL:
+            self.last_progress_log_time = now
+            self.logger.info(f"Progress : {round(min(self.backtesting.get_progress(), 1) * 100, 2)}% "
+                             f"[{current_timestamp}]")
+
     async def stop(self) -> None:
         self.channels_manager.stop()
         await super().stop()
@@ -30,6 +30,8 @@ cdef class TimeManager:
     cdef public object timestamp_accept_check_callback
     cdef readonly list timestamps_whitelist
     cdef object _timestamps_whitelist_queue
+    cdef readonly list timestamps_schedule
+    cdef int _timestamps_schedule_index
 
     cpdef void initialize(self)
     cpdef void start(self)
@@ -41,7 +43,11 @@ cdef class TimeManager:
     cpdef double get_total_iteration(self)
     cpdef double get_remaining_iteration(self)
     cpdef void register_timestamp_whitelist(self, object timestamps, object check_callback, bint append_to_whitelist=*)
+    cpdef void register_timestamps_schedule(self, object timestamps)
+    cpdef void clear_timestamps_schedule(self)
 
     cdef void _reset_time(self)
+    cdef void _step_timestamp(self)
+    cdef int _get_scheduled_iterations_count(self, double from_timestamp)
     cdef object _should_skip_current_timestamp(self)    # object to allow exception raising
     cdef bint _has_current_timestamp_in_whitelist(self)
@@ -13,6 +13,7 @@
 #
 #  You should have received a copy of the GNU Lesser General Public
 #  License along with this library.
+import bisect
 import collections
 import time
 
@@ -39,6 +40,10 @@ class TimeManager:
         self.timestamps_whitelist: set = None
         self._timestamps_whitelist_queue: collections.deque = None
 
+        # when set, time jumps from one data timestamp to the next instead of going forward by time_interval
+        self.timestamps_schedule: list = None
+        self._timestamps_schedule_index = 0
+
     def initialize(self):
         self._reset_time()
         self.time_initialized = True
@@ -62,11 +67,27 @@ class TimeManager:
         return self.current_timestamp >= self.finishing_timestamp
 
     def next_timestamp(self):
-        self.current_timestamp += self.time_interval
+        self._step_timestamp()
         if self._timestamps_whitelist_queue is not None:
             # when timestamps_whitelist is set: fast forward time to only trigger whitelisted timestamps
             while self._should_skip_current_timestamp() and self.current_timestamp <= self.finishing_timestamp:
-                self.current_timestamp += self.time_interval
+                self._step_timestamp()
+
+    def _step_timestamp(self):
+        if self.timestamps_schedule is None:
+            self.current_timestamp += self.time_interval
+            return
+        index = self._timestamps_schedule_index
+        if index > 0 and self.timestamps_schedule[index - 1] > self.current_timestamp:
+            # current timestamp has been moved backwards: look for the next timestamp from the beginning
+            index = 0
+        index = bisect.bisect_right(self.timestamps_schedule, self.current_timestamp, index)
+        self._timestamps_schedule_index = index
+        if index < len(self.timestamps_schedule):
+            self.current_timestamp = self.timestamps_schedule[index]
+        else:
+            # no more data: jump to the end
+            self.current_timestamp = max(self.finishing_timestamp, self.current_timestamp + self.time_interval)
 
     def _should_skip_current_timestamp(self):
         if self.timestamp_accept_check_callback is not None and self.timestamp_accept_check_callback():
@@ -96,11 +117,22 @@ class TimeManager:
         self.current_timestamp = timestamp
 
     def get_total_iteration(self):
+        if self.timestamps_schedule is not None:
+            return self._get_scheduled_iterations_count(self.starting_timestamp)
         return (self.finishing_timestamp - self.starting_timestamp) / self.time_interval
 
     def get_remaining_iteration(self):
+        if self.timestamps_schedule is not None:
+            return self._get_scheduled_iterations_count(self.current_timestamp)
         return (self.finishing_timestamp - self.current_timestamp) / self.time_interval
 
+    def _get_scheduled_iterations_count(self, from_timestamp):
+        return max(
+            0,
+            bisect.bisect_right(self.timestamps_schedule, self.finishing_timestamp)
+            - bisect.bisect_right(self.timestamps_schedule, from_timestamp)
+        )
+
     def register_timestamp_whitelist(self, timestamps, check_callback, append_to_whitelist=False):
         self.timestamp_accept_check_callback = check_callback
         if append_to_whitelist and self.timestamps_whitelist:
@@ -108,3 +140,15 @@ class TimeManager:
         else:
             self.timestamps_whitelist = sorted(set(timestamps))
         self._timestamps_whitelist_queue = collections.deque(self.timestamps_whitelist)
+
+    def register_timestamps_schedule(self, timestamps):
+        """
+        Use the given data timestamps as time steps: time will jump directly from one timestamp to the
+        next one instead of going forward by time_interval, which avoids empty iterations on sparse data
+        """
+        self.timestamps_schedule = sorted(set(timestamps))
+        self._timestamps_schedule_index = 0
+
+    def clear_timestamps_schedule(self):
+        self.timestamps_schedule = None
+        self._timestamps_schedule_index = 0
@@ -17,6 +17,8 @@ import os
 import typing
 
 import octobot_backtesting.constants as constants
+import octobot_backtesting.data as data
+import octobot_backtesting.enums as enums
 import octobot_backtesting.collectors as collectors
 import octobot_backtesting.importers as importers
 import octobot_commons.tentacles_management as tentacles_management
@@ -28,7 +30,10 @@ async def create_importer_from_backtesting_file_name(config,
                                                      default_importer=None) -> typing.Optional[importers.DataImporter]:
     collector_klass = tentacles_management.get_deep_class_from_parent_subclasses(
         _parse_class_name_from_backtesting_file(backtesting_file), collectors.DataCollector)
-    if collector_klass:
+    if data.get_data_type(backtesting_file) is enums.DataFormats.COLUMNAR_DATA:
+        # columnar data files are read the same way whatever their collector
+        importer_class = importers.ColumnarExchangeDataImporter
+    elif collector_klass:
         importer_class = collector_klass.IMPORTER
     else:
         commons_logging.get_logger().debug(f"No specific exchange importer identified for '{backtesting_file}' "
@@ -0,0 +1,154 @@
+#  Drakkar-Software OctoBot-Backtesting
+#  Copyright (c) Drakkar-Software, All rights reserved.
+#
+#  This library is free software; you can redistribute it and/or
+#  modify it under the terms of the GNU Lesser General Public
+#  License as published by the Free Software Foundation; either
+#  version 3.0 of the License, or (at your option) any later version.
+#
+#  This library is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the GNU
+#  Lesser General Public License for more details.
+#
+#  You should have received a copy of the GNU Lesser General Public
+#  License along with this library.
+import pytest
+import os
+import numpy as np
+from contextlib import asynccontextmanager
+
+import octobot_commons.enums as common_enums
+from octobot_backtesting.api.data_file import get_file_description
+from octobot_backtesting.api.importer import get_all_ohlcvs
+from octobot_backtesting.api.data_file_converters import convert_data_file_to_columnar
+from octobot_backtesting.converters.columnar_data_converter import ColumnarDataConverter
+from octobot_backtesting.importers.exchanges.columnar_exchange_importer import ColumnarExchangeDataImporter
+from octobot_backtesting.importers.exchanges.exchange_importer import ExchangeDataImporter
+from octobot_backtesting.util.backtesting_util import create_importer_from_backtesting_file_name
+from octobot_backtesting.enums import ExchangeDataTables, DataFormatKeys
+from octobot_commons.enums import TimeFrames
+
+# All test coroutines will be treated as marked.
+pytestmark = pytest.mark.asyncio
+
+DATA_FILE = os.path.join("tests", "static", "ExchangeHistoryDataCollector_1589740606.4862757.data")
+
+
+# use context manager instead of fixture to prevent pytest threads issues
+@asynccontextmanager
+async def get_importers(tmp_path):
+    columnar_file = await _convert(tmp_path)
+    importer = ExchangeDataImporter({}, DATA_FILE)
+    columnar_importer = ColumnarExchangeDataImporter({}, columnar_file)
+    try:
+        await importer.initialize()
+        await columnar_importer.initialize()
+        yield importer, columnar_importer
+    finally:
+        await importer.stop()
+        await columnar_importer.stop()
+
+
+async def _convert(tmp_path):
+    converter = ColumnarDataConverter(DATA_FILE)
+    converter.converted_file = str(tmp_path / "ExchangeHistoryDataCollector_1589740606.4862757.cdata")
+    assert await converter.can_convert()
+    assert await converter.convert()
+    return converter.converted_file
+
+
+async def test_converter(tmp_path):
+    converter = ColumnarDataConverter(DATA_FILE)
+    assert converter.converted_file == \
+        os.path.join("tests", "static", "ExchangeHistoryDataCollector_1589740606.4862757.cdata")
+    columnar_file = await _convert(tmp_path)
+    assert not await ColumnarDataConverter(columnar_file).can_convert()
+    assert await convert_data_file_to_columnar(columnar_file) is None
+    assert await convert_data_file_to_columnar(None) is None
+    description = await get_file_description(columnar_file, data_path="")
+    origin_description = await get_file_description(DATA_FILE, data_path="")
+    assert description[DataFormatKeys.EXCHANGE.value] == origin_description[DataFormatKeys.EXCHANGE.value] \
+        == "binance"
+    assert description[DataFormatKeys.SYMBOLS.value] == ["ETH/BTC"]
+    assert description[DataFormatKeys.TIME_FRAMES.value] == origin_description[DataFormatKeys.TIME_FRAMES.value]
+    assert description[DataFormatKeys.CANDLES_LENGTH.value] == \
+        origin_description[DataFormatKeys.CANDLES_LENGTH.value]
+
+
+async def test_initialize(tmp_path):
+    async with get_importers(tmp_path) as (importer, columnar_importer):
+        assert columnar_importer.exchange_name == importer.exchange_name == "binance"
+        assert columnar_importer.symbols == importer.symbols
+        assert columnar_importer.time_frames == importer.time_frames
+        assert columnar_importer.available_data_types == [ExchangeDataTables.OHLCV]
+
+
+async def test_create_importer_from_backtesting_file_name(tmp_path):
+    columnar_importer = await create_importer_from_backtesting_file_name({}, await _convert(tmp_path))
+    try:
+        assert isinstance(columnar_importer, ColumnarExchangeDataImporter)
+        assert columnar_importer.symbols == ["ETH/BTC"]
+    finally:
+        await columnar_importer.stop()
+
+
+async def test_get_data_timestamp_interval(tmp_path):
+    async with get_importers(tmp_path) as (importer, columnar_importer):
+        assert await columnar_importer.get_data_timestamp_interval() == (1589710680, 1590883200)
+        for time_frame in ("1h", "1M", "1m"):
+            assert await columnar_importer.get_data_timestamp_interval(time_frame) == \
+                   await importer.get_data_timestamp_interval(time_frame)
+
+
+async def test_get_data_timestamps(tmp_path):
+    async with get_importers(tmp_path) as (importer, columnar_importer):
+        assert await columnar_importer.get_data_timestamps() == await importer.get_data_timestamps()
+        assert await columnar_importer.get_data_timestamps("1h", 1587945600, 1587960000) == \
+            await importer.get_data_timestamps("1h", 1587945600, 1587960000)
+        assert await columnar_importer.get_data_timestamps("1h") == await importer.get_data_timestamps("1h")
+
+
+async def test_get_ohlcv(tmp_path):
+    async with get_importers(tmp_path) as (importer, columnar_importer):
+        assert await columnar_importer.get_ohlcv() == await importer.get_ohlcv()
+        assert await columnar_importer.get_ohlcv(symbol="ETH/BTC", time_frame=TimeFrames.ONE_DAY, limit=10) == \
+               await importer.get_ohlcv(symbol="ETH/BTC", time_frame=TimeFrames.ONE_DAY, limit=10)
+        assert await columnar_importer.get_ohlcv(exchange_name="bybit") == []
+
+
+async def test_get_ohlcv_from_timestamps(tmp_path):
+    async with get_importers(tmp_path) as (importer, columnar_importer):
+        ohlcv = await columnar_importer.get_ohlcv_from_timestamps(inferior_timestamp=1587978000,
+                                                                 superior_timestamp=1588060800)
+        assert len(ohlcv) == 24
+        assert ohlcv[0][0] == 1587978000
+        assert ohlcv[-1][0] == 1588060800
+        assert ohlcv == sorted(await importer.get_ohlcv_from_timestamps(inferior_timestamp=1587978000,
+                                                                        superior_timestamp=1588060800),
+                               key=lambda row: row[0])
+        # previous data can still be read
+        assert len(await columnar_importer.get_ohlcv_from_timestamps(superior_timestamp=1587978000)) == \
+               len(await columnar_importer.get_ohlcv_from_timestamps(inferior_timestamp=1587945600,
+                                                                     superior_timestamp=1587978000))
+        assert await columnar_importer.get_ohlcv_from_timestamps(symbol="BTC/USDT") == []
+
+
+async def test_get_ohlcv_values(tmp_path):
+    async with get_importers(tmp_path) as (_, columnar_importer):
+        rows = await columnar_importer.get_ohlcv_from_timestamps(inferior_timestamp=1587978000,
+                                                                superior_timestamp=1588060800)
+        values = columnar_importer.get_ohlcv_values("ETH/BTC", TimeFrames.ONE_HOUR,
+                                                    inferior_timestamp=1587978000, superior_timestamp=1588060800)
+        assert values.shape == (len(common_enums.PriceIndexes), 24)
+        assert not values.flags.writeable
+        assert values[common_enums.PriceIndexes.IND_PRICE_CLOSE.value].flags.c_contiguous
+        np.testing.assert_array_equal(values.T, np.array([row[-1] for row in rows]))
+        assert columnar_importer.get_ohlcv_values("BTC/USDT", TimeFrames.ONE_HOUR).shape == \
+               (len(common_enums.PriceIndexes), 0)
+
+
+async def test_get_all_ohlcvs(tmp_path):
+    columnar_file = await _convert(tmp_path)
+    assert await get_all_ohlcvs(columnar_file, "binance", "ETH/BTC", TimeFrames.FOUR_HOURS) == \
+           await get_all_ohlcvs(DATA_FILE, "binance", "ETH/BTC", TimeFrames.FOUR_HOURS)
@@ -59,6 +59,21 @@ async def test_get_data_timestamp_interval():
         assert await importer.get_data_timestamp_interval("1M") == (1501459200, 1590883200)
 
 
+async def test_get_data_timestamps():
+    async with get_importer() as importer:
+        timestamps = await importer.get_data_timestamps("1h")
+        assert len(timestamps) == 500
+        assert timestamps == sorted(timestamps)
+        assert (timestamps[0], timestamps[-1]) == await importer.get_data_timestamp_interval("1h")
+        # within a time window
+        assert await importer.get_data_timestamps("1h", 1587945600, 1587960000) == \
+            list(range(1587945600, 1587960001, 3600))
+        # over all data
+        all_timestamps = await importer.get_data_timestamps()
+        assert len(all_timestamps) > len(timestamps)
+        assert set(timestamps).issubset(all_timestamps)
+
+
 async def test_get_ohlcv():
     async with get_importer() as importer:
         # default values
@@ -102,6 +117,25 @@ async def test_get_ohlcv_from_timestamps():
         assert all(1587978000 <= data[0] <= 1588060800 for data in ohlcv)
 
 
+async def test_get_ohlcv_from_timestamps_cursors():
+    async with get_importer() as importer:
+        first_ohlcv = await importer.get_ohlcv_from_timestamps(inferior_timestamp=1587978000,
+                                                               superior_timestamp=1588060800, cursor="reader")
+        ohlcv = await importer.get_ohlcv_from_timestamps(inferior_timestamp=1588060800 + 1, cursor="reader")
+        assert ohlcv and all(data[0] > 1588060800 for data in ohlcv)
+        # each reader moves its own cursor
+        cache_data = importer.chronological_cache._get_cache_data(
+            (None, None, TimeFrames.ONE_HOUR, ExchangeDataTables.OHLCV)
+        )
+        assert list(cache_data[importer.chronological_cache.CURSORS_KEY]) == ["reader"]
+        assert await importer.get_ohlcv_from_timestamps(inferior_timestamp=1587978000,
+                                                        superior_timestamp=1588060800) == first_ohlcv
+        assert sorted(cache_data[importer.chronological_cache.CURSORS_KEY]) == \
+               sorted(["reader", importer.chronological_cache.DEFAULT_CURSOR])
+        assert cache_data[importer.chronological_cache.CURSORS_KEY]["reader"] > \
+               cache_data[importer.chronological_cache.CURSORS_KEY][importer.chronological_cache.DEFAULT_CURSOR]
+
+
 async def test_get_ticker():
     async with get_importer() as importer:
         # TODO complete this test when available datafile with ticker data
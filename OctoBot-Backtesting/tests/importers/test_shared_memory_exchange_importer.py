@@ -0,0 +1,129 @@
+#  Drakkar-Software OctoBot-Backtesting
+#  Copyright (c) Drakkar-Software, All rights reserved.
+#
+#  This library is free software; you can redistribute it and/or
+#  modify it under the terms of the GNU Lesser General Public
+#  License as published by the Free Software Foundation; either
+#  version 3.0 of the License, or (at your option) any later version.
+#
+#  This library is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the GNU
+#  Lesser General Public License for more details.
+#
+#  You should have received a copy of the GNU Lesser General Public
+#  License along with this library.
+import multiprocessing.shared_memory as shared_memory
+import pytest
+import os
+from contextlib import asynccontextmanager
+
+from octobot_backtesting.api.backtesting import create_and_init_shared_memory_backtest_data
+from octobot_backtesting.converters.columnar_data_converter import ColumnarDataConverter
+from octobot_backtesting.enums import ExchangeDataTables, ColumnarDataFileKeys
+from octobot_backtesting.importers.exchanges.exchange_importer import ExchangeDataImporter
+from octobot_backtesting.importers.exchanges.shared_memory_exchange_importer import SharedMemoryExchangeDataImporter
+from octobot_backtesting.shared_memory_backtest_data import SharedMemoryData, SharedMemoryBacktestData
+from octobot_commons.enums import TimeFrames
+
+# All test coroutines will be treated as marked.
+pytestmark = pytest.mark.asyncio
+
+DATA_FILE = os.path.join("tests", "static", "ExchangeHistoryDataCollector_1589740606.4862757.data")
+OTHER_DATA_FILE = os.path.join("tests", "static", "second_ExchangeHistoryDataCollector_1589740606.4862757.data")
+
+
+# use context manager instead of fixture to prevent pytest threads issues
+@asynccontextmanager
+async def get_shared_memory_data(data_files):
+    shared_memory_data = SharedMemoryData(data_files, {})
+    shared_memory_data.default_importer = ExchangeDataImporter
+    try:
+        await shared_memory_data.initialize()
+        yield shared_memory_data
+    finally:
+        shared_memory_data.close()
+
+
+async def _convert(tmp_path):
+    converter = ColumnarDataConverter(DATA_FILE)
+    converter.converted_file = str(tmp_path / "ExchangeHistoryDataCollector_1589740606.4862757.cdata")
+    assert await converter.convert()
+    return converter.converted_file
+
+
+async def _get_all_ohlcvs(importer):
+    return [
+        await importer.get_ohlcv_from_timestamps(exchange_name="binance", symbol="ETH/BTC", time_frame=time_frame)
+        for time_frame in importer.time_frames
+    ]
+
+
+async def test_shared_memory_importer():
+    importer = ExchangeDataImporter({}, DATA_FILE)
+    await importer.initialize()
+    async with get_shared_memory_data([DATA_FILE]) as shared_memory_data:
+        shared_importer = SharedMemoryExchangeDataImporter({}, DATA_FILE,
+                                                           shared_memory_data.headers_by_data_file[DATA_FILE])
+        try:
+            await shared_importer.initialize()
+            assert shared_importer.exchange_name == importer.exchange_name == "binance"
+            assert shared_importer.symbols == importer.symbols
+            assert shared_importer.time_frames == importer.time_frames
+            assert shared_importer.available_data_types == [ExchangeDataTables.OHLCV]
+            assert await _get_all_ohlcvs(shared_importer) == [
+                sorted(ohlcvs, key=lambda ohlcv: ohlcv[0]) for ohlcvs in await _get_all_ohlcvs(importer)
+            ]
+            values = shared_importer.get_ohlcv_values("ETH/BTC", TimeFrames.ONE_HOUR)
+            assert values.shape[1] > 0
+            with pytest.raises(ValueError):
+                values[0, 0] = 0
+        finally:
+            await shared_importer.stop()
+            await importer.stop()
+        assert shared_importer.ohlcvs == {}
+        assert shared_importer._shared_memories == []
+
+
+async def test_shared_memory_data_from_columnar_data_file(tmp_path):
+    columnar_file = await _convert(tmp_path)
+    async with get_shared_memory_data([DATA_FILE]) as shared_memory_data, \
+            get_shared_memory_data([columnar_file]) as columnar_shared_memory_data:
+        backtest_data = await create_and_init_shared_memory_backtest_data(
+            [DATA_FILE], {}, None, shared_memory_data.headers_by_data_file
+        )
+        columnar_backtest_data = await create_and_init_shared_memory_backtest_data(
+            [columnar_file], {}, None, columnar_shared_memory_data.headers_by_data_file
+        )
+        try:
+            assert await _get_all_ohlcvs(backtest_data.importers_by_data_file[DATA_FILE]) == \
+                   await _get_all_ohlcvs(columnar_backtest_data.importers_by_data_file[columnar_file])
+        finally:
+            await backtest_data.stop()
+            await columnar_backtest_data.stop()
+
+
+async def test_not_shared_data_files():
+    async with get_shared_memory_data([DATA_FILE]) as shared_memory_data:
+        backtest_data = SharedMemoryBacktestData([DATA_FILE, OTHER_DATA_FILE], {}, None,
+                                                 shared_memory_data.headers_by_data_file)
+        backtest_data.default_importer = ExchangeDataImporter
+        await backtest_data.initialize()
+        try:
+            assert isinstance(backtest_data.importers_by_data_file[DATA_FILE], SharedMemoryExchangeDataImporter)
+            assert type(backtest_data.importers_by_data_file[OTHER_DATA_FILE]) is ExchangeDataImporter
+        finally:
+            await backtest_data.stop()
+
+
+async def test_close():
+    async with get_shared_memory_data([DATA_FILE]) as shared_memory_data:
+        shared_memory_names = [
+            block[ColumnarDataFileKeys.SHARED_MEMORY_NAME.value]
+            for block in shared_memory_data.headers_by_data_file[DATA_FILE][ColumnarDataFileKeys.OHLCV_BLOCKS.value]
+        ]
+        assert shared_memory_names
+    assert shared_memory_data.headers_by_data_file == {}
+    for shared_memory_name in shared_memory_names:
+        with pytest.raises(FileNotFoundError):
+            shared_memory.SharedMemory(name=shared_memory_name)
@@ -0,0 +1,105 @@
+#  Drakkar-Software OctoBot-Backtesting
+#  Copyright (c) Drakkar-Software, All rights reserved.
+#
+#  This library is free software; you can redistribute it and/or
+#  modify it under the terms of the GNU Lesser General Public
+#  License as published by the Free Software Foundation; either
+#  version 3.0 of the License, or (at your option) any later version.
+#
+#  This library is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the GNU
+#  Lesser General Public License for more details.
+#
+#  You should have received a copy of the GNU Lesser General Public
+#  License along with this library.
+import mock
+import pytest
+
+import async_channel.channels as channels
+import async_channel.consumer as channel_consumer
+import async_channel.producer as channel_producer
+
+import octobot_backtesting.channels_manager as channels_manager
+
+# All test coroutines will be treated as marked.
+pytestmark = pytest.mark.asyncio
+
+
+class DirectDispatchTestChannel(channels.Channel):
+    PRODUCER_CLASS = channel_producer.Producer
+    CONSUMER_CLASS = channel_consumer.Consumer
+
+
+class PolledTestChannel(DirectDispatchTestChannel):
+    SYNCHRONIZED_DIRECT_DISPATCH = False
+
+
+async def _create_channel(channel_class):
+    channel = channel_class()
+    channel.is_synchronized = True
+    await channel.start()
+    producer = channel_producer.Producer(channel)
+    await producer.run()
+    return channel, producer
+
+
+async def _run_iterations(channel_class):
+    calls = []
+    producers = []
+    for _ in range(3):
+        producers.append((await _create_channel(channel_class))[1])
+    first, second, third = producers
+
+    async def first_callback(index):
+        calls.append(("first", index))
+        # push in a later channel and in an earlier channel
+        await third.send({"index": index})
+        await second.send({"index": index})
+
+    async def second_callback(index):
+        calls.append(("second", index))
+
+    async def third_callback(index):
+        calls.append(("third", index))
+        await second.send({"index": -index})
+
+    async def optional_callback(index):
+        calls.append(("optional", index))
+
+    await first.channel.new_consumer(first_callback)
+    await second.channel.new_consumer(second_callback, priority_level=1)
+    await third.channel.new_consumer(third_callback)
+    await third.channel.new_consumer(optional_callback, priority_level=2)
+
+    manager = channels_manager.ChannelsManager([], "")
+    with mock.patch.object(channels_manager, "_get_backtesting_producers", mock.Mock(return_value=[])), \
+            mock.patch.object(manager, "_get_trading_producers", mock.Mock(return_value=[producers])), \
+            mock.patch.object(manager, "_get_evaluator_producers", mock.Mock(return_value=[])):
+        await manager.initialize()
+    for index in range(1, 4):
+        await first.send({"index": index})
+        await manager.handle_new_iteration(index)
+        if index == 1:
+            manager.clear_empty_channels_producers()
+            manager.update_producers_by_priority_levels()
+    return manager, producers, calls
+
+
+async def test_handle_new_iteration_ready_channels():
+    manager, producers, calls = await _run_iterations(DirectDispatchTestChannel)
+    assert manager.polled_producers == []
+    assert manager.producers_by_priority_levels == {}
+    assert list(manager.ready_channel_producers.values()) == producers
+    assert not manager._has_ready_channels(2)
+
+    _, _, polled_calls = await _run_iterations(PolledTestChannel)
+    # same callbacks order as when polling producers
+    assert calls == polled_calls
+    assert calls[:5] == [("first", 1), ("third", 1), ("second", 1), ("second", -1), ("optional", 1)]
+    assert len(calls) == 15
+
+    manager.flush()
+    assert manager.ready_channel_producers == {}
+    for producer in producers:
+        assert producer.channel.ready_channels_by_priority_level is None
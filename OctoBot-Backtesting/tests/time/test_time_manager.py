@@ -0,0 +1,80 @@
+#  Drakkar-Software OctoBot-Backtesting
+#  Copyright (c) Drakkar-Software, All rights reserved.
+#
+#  This library is free software; you can redistribute it and/or
+#  modify it under the terms of the GNU Lesser General Public
+#  License as published by the Free Software Foundation; either
+#  version 3.0 of the License, or (at your option) any later version.
+#
+#  This library is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the GNU
+#  Lesser General Public License for more details.
+#
+#  You should have received a copy of the GNU Lesser General Public
+#  License along with this library.
+from octobot_backtesting.time.time_manager import TimeManager
+
+
+def _get_time_manager(starting_timestamp, finishing_timestamp, time_interval):
+    time_manager = TimeManager({})
+    time_manager.initialize()
+    time_manager.set_minimum_timestamp(starting_timestamp)
+    time_manager.set_maximum_timestamp(finishing_timestamp)
+    time_manager.time_interval = time_interval
+    time_manager.start()
+    return time_manager
+
+
+def _run(time_manager):
+    visited_timestamps = [time_manager.current_timestamp]
+    while not time_manager.has_finished():
+        time_manager.next_timestamp()
+        visited_timestamps.append(time_manager.current_timestamp)
+    return visited_timestamps
+
+
+def test_next_timestamp():
+    time_manager = _get_time_manager(0, 100, 10)
+    assert time_manager.get_total_iteration() == 10
+    assert _run(time_manager) == list(range(0, 101, 10))
+    assert time_manager.get_remaining_iteration() == 0
+
+
+def test_next_timestamp_with_schedule():
+    time_manager = _get_time_manager(0, 100, 10)
+    time_manager.register_timestamps_schedule([70, 0, 20, 30, 20, 100])
+    assert time_manager.timestamps_schedule == [0, 20, 30, 70, 100]
+    assert time_manager.get_total_iteration() == 4
+    assert time_manager.get_remaining_iteration() == 4
+    time_manager.next_timestamp()
+    assert time_manager.current_timestamp == 20
+    assert time_manager.get_remaining_iteration() == 3
+    assert _run(time_manager) == [20, 30, 70, 100]
+    assert time_manager.get_remaining_iteration() == 0
+
+    # moving time backwards
+    time_manager.set_current_timestamp(25)
+    time_manager.next_timestamp()
+    assert time_manager.current_timestamp == 30
+
+    # schedule ending before finishing timestamp: jump to the end
+    time_manager = _get_time_manager(0, 100, 10)
+    time_manager.register_timestamps_schedule([0, 50])
+    assert _run(time_manager) == [0, 50, 100]
+
+    time_manager.clear_timestamps_schedule()
+    assert time_manager.timestamps_schedule is None
+    assert time_manager.get_total_iteration() == 10
+
+
+def test_next_timestamp_with_schedule_and_whitelist():
+    time_manager = _get_time_manager(0, 100, 10)
+    time_manager.register_timestamps_schedule([0, 20, 30, 70, 100])
+    time_manager.register_timestamp_whitelist([30, 100], None)
+    time_manager.next_timestamp()
+    assert time_manager.current_timestamp == 30
+    time_manager.next_timestamp()
+    # 70 is skipped
+    assert time_manager.current_timestamp >= 100
+    assert time_manager.has_finished()
@@ -116,6 +116,7 @@ CONFIG_SIMULATOR_FEES = "fees"
 CONFIG_SIMULATOR_FEES_MAKER = "maker"
 CONFIG_SIMULATOR_FEES_TAKER = "taker"
 CONFIG_SIMULATOR_FEES_WITHDRAW = "withdraw"
+CONFIG_SIMULATOR_ORDERS_MATCHING_ENGINE = "orders-matching-engine"
 
 # Optimization campaigns
 DEFAULT_CAMPAIGN = "default_campaign"
@@ -205,5 +206,6 @@ EXTERNAL_RESOURCE_URL = "https://raw.githubusercontent.com/Drakkar-Software/Octo
 DATA_FOLDER = "data"
 DB_SEPARATOR = "_"
 TINYDB_EXT = ".json"
+SQLITE_DOCUMENT_DB_EXT = ".sqlite"
 MAX_BACKTESTING_RUNS = 500000
 MAX_OPTIMIZER_RUNS = 50000
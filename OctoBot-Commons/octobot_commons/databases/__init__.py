@@ -40,6 +40,7 @@ from octobot_commons.databases.database_caches import (
 from octobot_commons.databases.document_database_adaptors import (
     AbstractDocumentDatabaseAdaptor,
     TinyDBAdaptor,
+    SQLiteAdaptor,
 )
 
 from octobot_commons.databases.bases import (
@@ -90,6 +91,7 @@ __all__ = [
     "ChronologicalReadDatabaseCache",
     "AbstractDocumentDatabaseAdaptor",
     "TinyDBAdaptor",
+    "SQLiteAdaptor",
     "DocumentDatabase",
     "BaseDatabase",
     "MetaDatabase",
@@ -32,10 +32,11 @@ class CacheClient:
         tentacles_setup_config,
         flush_cache_when_necessary,
         config_name=None,
+        database_adaptor=document_database_adaptors.TinyDBAdaptor,
     ):
         self._flush_cache_when_necessary = flush_cache_when_necessary
         self.cache_manager = cache_manager.CacheManager(
-            database_adaptor=document_database_adaptors.TinyDBAdaptor
+            database_adaptor=database_adaptor
         )
         self.config_name = config_name or self.cache_manager.DEFAULT_CONFIG_IDENTIFIER
         self.tentacle = tentacle
@@ -13,13 +13,17 @@
 #
 #  You should have received a copy of the GNU Lesser General Public
 #  License along with this library.
+import bisect
+
 import octobot_commons.constants as constants
 
 
 class ChronologicalReadDatabaseCache:
     DATA_KEY = "data"
     DATA_SORT_KEY = "data_sort_key"
-    CHRONO_INDEX_KEY = "chrono_index"
+    DATA_TIMESTAMPS_KEY = "data_timestamps"
+    CURSORS_KEY = "cursors"
+    DEFAULT_CURSOR = "default"
 
     def __init__(self):
         self.timestamped_sorted_data = {}
@@ -39,68 +43,61 @@ class ChronologicalReadDatabaseCache:
         data = self._get_cache_data(identifiers)
         data[self.DATA_SORT_KEY] = sort_key
         data[self.DATA_KEY] = sorted(values, key=lambda x: x[sort_key])
-        data[self.CHRONO_INDEX_KEY] = 0
+        # parallel timestamps list used to bisect selection windows
+        data[self.DATA_TIMESTAMPS_KEY] = [element[sort_key] for element in data[self.DATA_KEY]]
+        data[self.CURSORS_KEY] = {}
 
     def reset_cached_indexes(self, parent=None):
         """
-        Set the cache index of each cached element at 0
+        Reset the cursors of each cached element
         :param parent: current cached element
         """
         for cached_data in (parent or self.timestamped_sorted_data).values():
             if isinstance(cached_data, dict):
-                if self.CHRONO_INDEX_KEY in cached_data:
-                    cached_data[self.CHRONO_INDEX_KEY] = 0
+                if self.CURSORS_KEY in cached_data:
+                    cached_data[self.CURSORS_KEY].clear()
                 else:
                     self.reset_cached_indexes(cached_data)
 
-    def get(self, inferior_timestamp, superior_timestamp, identifiers):
+    def get(self, inferior_timestamp, superior_timestamp, identifiers, cursor=DEFAULT_CURSOR):
         """
         Returns a cache values
         :param inferior_timestamp: timestamp to start selecting from. Use constants.DEFAULT_IGNORED_VALUE to select all
         :param superior_timestamp: timestamp to stop selecting at. Use constants.DEFAULT_IGNORED_VALUE to select all
         :param identifiers: identifiers of the cache to look into. Used to store multiple cache sets
+        :param cursor: name of the reader cursor to use. Each reader should use its own cursor
         """
         cache_data = self._get_cache_data(identifiers)
+        data = cache_data[self.DATA_KEY]
         # if one timestamp is constants.DEFAULT_IGNORED_VALUE, return every available data from/up to this timestamp
         if inferior_timestamp == constants.DEFAULT_IGNORED_VALUE:
             if superior_timestamp == constants.DEFAULT_IGNORED_VALUE:
-                return cache_data[self.DATA_KEY]
-            return [
-                element
-                for element in cache_data[self.DATA_KEY]
-                if element[cache_data[self.DATA_SORT_KEY]] <= superior_timestamp
+                return data
+            return data[
+                : bisect.bisect_right(
+                    cache_data[self.DATA_TIMESTAMPS_KEY], superior_timestamp
+                )
             ]
+        min_index = self._get_start_index(cache_data, inferior_timestamp, cursor)
         if superior_timestamp == constants.DEFAULT_IGNORED_VALUE:
-            return [
-                element
-                for element in cache_data[self.DATA_KEY]
-                if element[cache_data[self.DATA_SORT_KEY]] >= inferior_timestamp
-            ]
-        return self._get_from_time_window(
-            cache_data, inferior_timestamp, superior_timestamp
-        )
+            return data[min_index:]
+        return data[
+            min_index : bisect.bisect_right(
+                cache_data[self.DATA_TIMESTAMPS_KEY], superior_timestamp, min_index
+            )
+        ]
 
-    def _get_from_time_window(self, cache_data, inferior_timestamp, superior_timestamp):
-        data = cache_data[self.DATA_KEY]
-        data_sort_key = cache_data[self.DATA_SORT_KEY]
-        # a specific time window is requested: use the local cache index to generate it faster
-        min_index = max_index = None
-        # identify the select window considering data are time sorted
-        start_index = cache_data[self.CHRONO_INDEX_KEY]
-        for index in range(start_index, len(data)):
-            element = data[index]
-            if element[data_sort_key] >= inferior_timestamp and min_index is None:
-                min_index = index
-            if element[data_sort_key] > superior_timestamp and max_index is None:
-                max_index = index
-                # consider that since inferior_timestamp got requested, as this is a chronological database cache,
-                # is going only following requests will only be in future times. Therefore previous data can be
-                # ignored to avoid iterating over them over and over
-                cache_data[self.CHRONO_INDEX_KEY] = min_index
-                return data[min_index:max_index]
-        if min_index is None:
-            return []
-        return data[min_index:]
+    def _get_start_index(self, cache_data, inferior_timestamp, cursor):
+        timestamps = cache_data[self.DATA_TIMESTAMPS_KEY]
+        cursors = cache_data[self.CURSORS_KEY]
+        cursor_index = cursors.get(cursor, 0)
+        if cursor_index >= len(timestamps) or timestamps[cursor_index] > inferior_timestamp:
+            # this reader went back in time: search from the beginning
+            cursor_index = 0
+        # readers are usually going forward in time: only search after their previous position
+        min_index = bisect.bisect_left(timestamps, inferior_timestamp, cursor_index)
+        cursors[cursor] = min_index
+        return min_index
 
     def has(self, identifiers):
         """
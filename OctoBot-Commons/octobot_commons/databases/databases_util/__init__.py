@@ -19,3 +19,9 @@ from octobot_commons.databases.databases_util import cache_wrapper
 from octobot_commons.databases.databases_util.cache_wrapper import (
     CacheWrapper,
 )
+
+from octobot_commons.databases.databases_util import columnar_series
+from octobot_commons.databases.databases_util.columnar_series import (
+    ColumnarSeries,
+    get_series_key,
+)
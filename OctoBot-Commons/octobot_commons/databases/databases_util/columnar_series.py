@@ -0,0 +1,160 @@
+#  Drakkar-Software OctoBot-Commons
+#  Copyright (c) Drakkar-Software, All rights reserved.
+#
+#  This library is free software; you can redistribute it and/or
+#  modify it under the terms of the GNU Lesser General Public
+#  License as published by the Free Software Foundation; either
+#  version 3.0 of the License, or (at your option) any later version.
+#
+#  This library is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the GNU
+#  Lesser General Public License for more details.
+#
+#  You should have received a copy of the GNU Lesser General Public
+#  License along with this library.
+import bisect
+
+import numpy
+
+SERIES_KEY = "series"
+TITLE_KEY = "title"
+TIME_FRAME_KEY = "time_frame"
+COLUMNS_KEY = "columns"
+X_COLUMN = "x"
+MIN_X_KEY = "x_min"
+MAX_X_KEY = "x_max"
+# x first, then values
+SERIES_COLUMNS = (X_COLUMN, "y", "z", "open", "high", "low", "close", "volume")
+DEFAULT_CHUNK_SIZE = 1000
+
+
+def get_series_key(title, time_frame) -> str:
+    """
+    :return: the identifier of the (title, time_frame) series
+    """
+    return f"{title}:{time_frame}"
+
+
+def get_serializable_column(values) -> list:
+    """
+    :return: a json serializable list of the given column values
+    """
+    if isinstance(values, numpy.ndarray):
+        return values.tolist()
+    return [
+        value.item() if isinstance(value, numpy.generic) else value for value in values
+    ]
+
+
+def create_header(title, time_frame, columns, metadata) -> dict:
+    """
+    :return: the series header: identifiers, stored columns and metadata shared by every point
+    """
+    return {
+        **(metadata or {}),
+        SERIES_KEY: get_series_key(title, time_frame),
+        TITLE_KEY: title,
+        TIME_FRAME_KEY: time_frame,
+        COLUMNS_KEY: [
+            column for column in SERIES_COLUMNS if columns.get(column) is not None
+        ],
+    }
+
+
+def create_chunk(series_key, columns) -> dict:
+    """
+    :return: a chunk row containing the given columns values
+    """
+    return {
+        SERIES_KEY: series_key,
+        MIN_X_KEY: columns[X_COLUMN][0],
+        MAX_X_KEY: columns[X_COLUMN][-1],
+        **columns,
+    }
+
+
+def merge_chunks(header, chunks, min_x=None, max_x=None) -> dict:
+    """
+    :param header: the series header
+    :param chunks: the series chunks rows
+    :param min_x: when set, points before min_x are excluded
+    :param max_x: when set, points after max_x are excluded
+    :return: the header updated with the concatenated values of each column, sliced on [min_x, max_x]
+    """
+    series = dict(header)
+    columns = {column: [] for column in header[COLUMNS_KEY]}
+    for chunk in sorted(chunks, key=lambda row: row[MIN_X_KEY]):
+        for column, values in columns.items():
+            values.extend(chunk[column])
+    x_values = columns.get(X_COLUMN, [])
+    start = 0 if min_x is None else bisect.bisect_left(x_values, min_x)
+    end = len(x_values) if max_x is None else bisect.bisect_right(x_values, max_x)
+    for column, values in columns.items():
+        series[column] = values[start:end]
+    return series
+
+
+class ColumnarSeries:
+    """
+    Append-only points of a (title, time_frame) series, stored column by column.
+    Points are written by chunks of chunk_size points: the last chunk stays open and
+    is updated until it is full.
+    """
+
+    def __init__(self, header, last_x=None, chunk_size=DEFAULT_CHUNK_SIZE):
+        self.header = header
+        self.key = header[SERIES_KEY]
+        self.last_x = last_x
+        self.chunk_size = chunk_size
+        self.columns = {column: [] for column in header[COLUMNS_KEY]}
+        self.open_chunk_uuid = None
+        self.has_pending_points = False
+
+    def append(self, columns) -> int:
+        """
+        Appends the points of the given columns that are after the last stored point.
+        x values are expected in ascending order.
+        :param columns: values by column name
+        :return: the number of appended points
+        """
+        x_values = columns[X_COLUMN]
+        start = 0 if self.last_x is None else bisect.bisect_right(x_values, self.last_x)
+        if start >= len(x_values):
+            return 0
+        for column, values in self.columns.items():
+            column_values = columns.get(column)
+            if column_values is None:
+                values.extend([None] * (len(x_values) - start))
+            else:
+                values.extend(get_serializable_column(column_values[start:]))
+        self.last_x = self.columns[X_COLUMN][-1]
+        self.has_pending_points = True
+        return len(x_values) - start
+
+    def pop_full_chunk(self):
+        """
+        :return: the open chunk uuid and the values of the first chunk_size points
+        if there are enough points to fill a chunk, None otherwise
+        """
+        if len(self.columns[X_COLUMN]) < self.chunk_size:
+            return None
+        chunk = {
+            column: values[: self.chunk_size] for column, values in self.columns.items()
+        }
+        for values in self.columns.values():
+            del values[: self.chunk_size]
+        uuid = self.open_chunk_uuid
+        self.open_chunk_uuid = None
+        self.has_pending_points = bool(self.columns[X_COLUMN])
+        return uuid, create_chunk(self.key, chunk)
+
+    def get_open_chunk(self):
+        """
+        :return: the values of the points that are not part of a full chunk yet, None if there are none
+        """
+        if not self.columns[X_COLUMN]:
+            return None
+        return create_chunk(
+            self.key, {column: list(values) for column, values in self.columns.items()}
+        )
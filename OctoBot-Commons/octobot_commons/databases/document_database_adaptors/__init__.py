@@ -19,6 +19,8 @@ from octobot_commons.databases.document_database_adaptors import (
     abstract_document_database_adaptor,
 )
 from octobot_commons.databases.document_database_adaptors import tinydb_adaptor
+from octobot_commons.databases.document_database_adaptors import sqlite_query
+from octobot_commons.databases.document_database_adaptors import sqlite_adaptor
 
 
 from octobot_commons.databases.document_database_adaptors.abstract_document_database_adaptor import (
@@ -27,9 +29,21 @@ from octobot_commons.databases.document_database_adaptors.abstract_document_data
 from octobot_commons.databases.document_database_adaptors.tinydb_adaptor import (
     TinyDBAdaptor,
 )
+from octobot_commons.databases.document_database_adaptors.sqlite_query import (
+    SQLiteQuery,
+    SQLiteQueryCondition,
+)
+from octobot_commons.databases.document_database_adaptors.sqlite_adaptor import (
+    SQLiteAdaptor,
+    SQLiteDocument,
+)
 
 
 __all__ = [
     "AbstractDocumentDatabaseAdaptor",
     "TinyDBAdaptor",
+    "SQLiteQuery",
+    "SQLiteQueryCondition",
+    "SQLiteAdaptor",
+    "SQLiteDocument",
 ]
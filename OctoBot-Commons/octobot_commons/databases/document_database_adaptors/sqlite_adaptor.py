@@ -0,0 +1,387 @@
+#  Drakkar-Software OctoBot-Commons
+#  Copyright (c) Drakkar-Software, All rights reserved.
+#
+#  This library is free software; you can redistribute it and/or
+#  modify it under the terms of the GNU Lesser General Public
+#  License as published by the Free Software Foundation; either
+#  version 3.0 of the License, or (at your option) any later version.
+#
+#  This library is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the GNU
+#  Lesser General Public License for more details.
+#
+#  You should have received a copy of the GNU Lesser General Public
+#  License along with this library.
+import json
+import os
+import sqlite3
+
+import octobot_commons.constants as constants
+import octobot_commons.errors as errors
+import octobot_commons.databases.document_database_adaptors.abstract_document_database_adaptor as abstract_document_database_adaptor
+import octobot_commons.databases.document_database_adaptors.tinydb_adaptor as tinydb_adaptor
+import octobot_commons.databases.document_database_adaptors.sqlite_query as sqlite_query
+
+
+class SQLiteDocument(dict):
+    """
+    A document read from a SQLiteAdaptor table
+    """
+
+    def __init__(self, value, doc_id):
+        super().__init__(value)
+        self.doc_id = doc_id
+
+
+class SQLiteAdaptor(abstract_document_database_adaptor.AbstractDocumentDatabaseAdaptor):
+    """
+    SQLiteAdaptor is an AbstractDatabaseAdaptor storing JSON documents in a SQLite file (using the JSON1 extension).
+    Writes are incremental: only written documents are serialized and they are committed every cache_size writes.
+    Queries are created using query_factory() with the tinydb.Query syntax, queries on INDEXED_KEYS use indexes.
+    """
+
+    DEFAULT_WRITE_CACHE_SIZE = 5000
+    ID_COLUMN = "id"
+    INDEXED_KEYS = ("x", "t", "time_frame", "id")
+
+    def __init__(self, file_path: str, cache_size: int = None, **kwargs):
+        """
+        SQLiteAdaptor constructor.
+        :param file_path: path to the database file
+        :param cache_size: number of write operations before committing changes
+        :param kwargs: unused
+        """
+        super().__init__(file_path)
+        self.database = None
+        self.cache_size = cache_size
+        self._uncommitted_writes = 0
+        self._created_tables = set()
+
+    def initialize(self):
+        """
+        Initialize the database: opens the database file.
+        """
+        try:
+            self.database = sqlite3.connect(self.db_path)
+        except sqlite3.OperationalError as err:
+            raise errors.DatabaseNotFoundError(
+                f'Can\'t open database at "{self.db_path}"'
+            ) from err
+        self._uncommitted_writes = 0
+        self._created_tables = set()
+
+    @staticmethod
+    def is_file_system_based() -> bool:
+        """
+        Returns True when this database is identified as a file in the current file system,
+        False when it's managed by a database server
+        """
+        return True
+
+    @staticmethod
+    def get_db_file_ext() -> str:
+        """
+        Returns the database file extension. Implemented in file system based databases
+        """
+        return constants.SQLITE_DOCUMENT_DB_EXT
+
+    @staticmethod
+    async def create_identifier(identifier):
+        """
+        Initialize the identifier by creating it in the database
+        """
+        await tinydb_adaptor.TinyDBAdaptor.create_identifier(identifier)
+
+    @staticmethod
+    async def identifier_exists(identifier, is_full_identifier) -> bool:
+        """
+        Returns True when the given identifier is part of an existing database identifier
+        :param identifier: the identifier to look into
+        :param is_full_identifier: when True, only check identifiers that don't have sub identifiers.
+        When False, only check identifiers that have sub identifiers
+        """
+        return await tinydb_adaptor.TinyDBAdaptor.identifier_exists(
+            identifier, is_full_identifier
+        )
+
+    @staticmethod
+    async def get_sub_identifiers(identifier, ignored_identifiers):
+        """
+        Returns an iterable over the existing sub-identifiers under the given identifier
+        """
+        async for sub_identifier in tinydb_adaptor.TinyDBAdaptor.get_sub_identifiers(
+            identifier, ignored_identifiers
+        ):
+            yield sub_identifier
+
+    @staticmethod
+    async def get_single_sub_identifier(identifier, ignored_identifiers) -> str:
+        """
+        Returns the name of the only sub-identifier at a given parent identifier, None otherwise
+        example use: get the name of the only exchange the backtesting happened on if it only ran on a single exchange,
+        """
+        return await tinydb_adaptor.TinyDBAdaptor.get_single_sub_identifier(
+            identifier, ignored_identifiers
+        )
+
+    def get_uuid(self, document) -> int:
+        """
+        Returns the uuid of the document
+        :param document: the document
+        """
+        return document.doc_id
+
+    async def select(self, table_name: str, query, uuid=None) -> list:
+        """
+        Select data from the table_name table
+        :param table_name: name of the table
+        :param query: select query
+        :param uuid: id of the document
+        """
+        if uuid is None:
+            return self._select_documents(table_name, query)
+        documents = self._select_documents(table_name, None, uuid=uuid)
+        return documents[0] if documents else None
+
+    async def tables(self) -> list:
+        """
+        Select tables
+        """
+        return [
+            name
+            for (name,) in self.database.execute(
+                "SELECT name FROM sqlite_master WHERE type='table' AND name NOT LIKE 'sqlite_%'"
+            )
+        ]
+
+    async def insert(self, table_name: str, row: dict) -> int:
+        """
+        Insert dict data into the table_name table
+        :param table_name: name of the table
+        :param row: data to insert
+        """
+        return (await self.insert_many(table_name, [row]))[0]
+
+    async def upsert(self, table_name: str, row: dict, query, uuid=None) -> int:
+        """
+        Insert or update dict data into the table_name table
+        :param table_name: name of the table
+        :param row: data to insert
+        :param query: select query
+        :param uuid: id of the document
+        """
+        if uuid is None and query is None:
+            raise ValueError("A query or a uuid is required to upsert a document")
+        updated_uuids = await self.update(table_name, row, query, uuid=uuid)
+        if updated_uuids:
+            return updated_uuids
+        return [self._insert(table_name, row, uuid)]
+
+    async def insert_many(self, table_name: str, rows: list) -> list:
+        """
+        Insert multiple dict data into the table_name table
+        :param table_name: name of the table
+        :param rows: data to insert
+        """
+        return [self._insert(table_name, row, None) for row in rows]
+
+    async def update(self, table_name: str, row: dict, query, uuid=None) -> list:
+        """
+        Select data from the table_name table
+        :param table_name: name of the table
+        :param row: data to update, can also be a callable updating the given document
+        :param query: select query
+        :param uuid: id of the document
+        """
+        updated_documents = self._select_documents(table_name, query, uuid=uuid)
+        for document in updated_documents:
+            if callable(row):
+                row(document)
+            else:
+                document.update(row)
+        self._write(
+            f"UPDATE {_quoted(table_name)} SET {sqlite_query.DOCUMENT_COLUMN} = ? WHERE {self.ID_COLUMN} = ?",
+            [
+                (json.dumps(document), document.doc_id)
+                for document in updated_documents
+            ],
+        )
+        return [document.doc_id for document in updated_documents]
+
+    async def update_many(self, table_name: str, update_values: list) -> list:
+        """
+        Update multiple values from the table_name table
+        :param table_name: name of the table
+        :param update_values: values to update: list of (row, query) tuples
+        """
+        updated_uuids = set()
+        for row, query in update_values:
+            updated_uuids.update(await self.update(table_name, row, query))
+        return sorted(updated_uuids)
+
+    async def delete(self, table_name: str, query, uuid=None) -> list:
+        """
+        Delete data from the table_name table
+        :param table_name: name of the table
+        :param query: select query
+        :param uuid: id of the document
+        """
+        if uuid is None and query is None:
+            self.database.execute(f"DROP TABLE IF EXISTS {_quoted(table_name)}")
+            self._created_tables.discard(table_name)
+            return None
+        deleted_uuids = [
+            document.doc_id
+            for document in self._select_documents(table_name, query, uuid=uuid)
+        ]
+        self._write(
+            f"DELETE FROM {_quoted(table_name)} WHERE {self.ID_COLUMN} = ?",
+            [(deleted_uuid,) for deleted_uuid in deleted_uuids],
+        )
+        return deleted_uuids
+
+    async def count(self, table_name: str, query) -> int:
+        """
+        Counts documents in the table_name table
+        :param table_name: name of the table
+        :param query: select query
+        """
+        if query is None or getattr(query, "is_exact_sql", False):
+            try:
+                where_clause, parameters = _where_clause(query)
+                return self.database.execute(
+                    f"SELECT count(*) FROM {_quoted(table_name)} {where_clause}",
+                    parameters,
+                ).fetchone()[0]
+            except sqlite3.OperationalError:
+                if self._table_exists(table_name):
+                    raise
+                return 0
+        return len(self._select_documents(table_name, query))
+
+    async def query_factory(self):
+        """
+        Creates a new empty select query
+        """
+        return sqlite_query.SQLiteQuery()
+
+    async def hard_reset(self):
+        """
+        Completely reset the database
+        """
+        await self.close()
+        os.remove(self.db_path)
+        self.initialize()
+
+    async def flush(self):
+        """
+        Commits pending changes
+        """
+        self._uncommitted_writes = 0
+        self.database.commit()
+
+    async def close(self):
+        """
+        Closes the database
+        """
+        if self.database is None:
+            # when self.database didn't open properly
+            return
+        try:
+            await self.flush()
+        finally:
+            self.database.close()
+            self.database = None
+
+    def _select_documents(self, table_name, query, uuid=None) -> list:
+        where_clause, parameters = _where_clause(query, uuid=uuid)
+        try:
+            documents = [
+                SQLiteDocument(json.loads(document), doc_id)
+                for doc_id, document in self.database.execute(
+                    f"SELECT {self.ID_COLUMN}, {sqlite_query.DOCUMENT_COLUMN} FROM {_quoted(table_name)} "
+                    f"{where_clause} ORDER BY {self.ID_COLUMN}",
+                    parameters,
+                )
+            ]
+        except sqlite3.OperationalError:
+            if self._table_exists(table_name):
+                raise
+            return []
+        if query is None or getattr(query, "is_exact_sql", False):
+            return documents
+        return [document for document in documents if query(document)]
+
+    def _insert(self, table_name, row, uuid) -> int:
+        self._ensure_table(table_name)
+        if uuid is None:
+            cursor = self.database.execute(
+                f"INSERT INTO {_quoted(table_name)} ({sqlite_query.DOCUMENT_COLUMN}) VALUES (?)",
+                (json.dumps(row),),
+            )
+        else:
+            cursor = self.database.execute(
+                f"INSERT INTO {_quoted(table_name)} ({self.ID_COLUMN}, {sqlite_query.DOCUMENT_COLUMN}) "
+                f"VALUES (?, ?)",
+                (uuid, json.dumps(row)),
+            )
+        self._on_write(1)
+        return cursor.lastrowid
+
+    def _write(self, statement, parameters):
+        if parameters:
+            self.database.executemany(statement, parameters)
+            self._on_write(len(parameters))
+
+    def _on_write(self, writes_count):
+        self._uncommitted_writes += writes_count
+        if self._uncommitted_writes >= (
+            self.cache_size or self.DEFAULT_WRITE_CACHE_SIZE
+        ):
+            self._uncommitted_writes = 0
+            self.database.commit()
+
+    def _table_exists(self, table_name) -> bool:
+        return (
+            self.database.execute(
+                "SELECT 1 FROM sqlite_master WHERE type='table' AND name=?",
+                (table_name,),
+            ).fetchone()
+            is not None
+        )
+
+    def _ensure_table(self, table_name):
+        if table_name in self._created_tables:
+            return
+        self._created_tables.add(table_name)
+        if self._table_exists(table_name):
+            return
+        self.database.execute(
+            f"CREATE TABLE {_quoted(table_name)} ("
+            f"{self.ID_COLUMN} INTEGER PRIMARY KEY AUTOINCREMENT, "
+            f"{sqlite_query.DOCUMENT_COLUMN} TEXT NOT NULL)"
+        )
+        for key in self.INDEXED_KEYS:
+            self.database.execute(
+                f"CREATE INDEX {_quoted(f'{table_name}_{key}')} ON {_quoted(table_name)} "
+                f"({sqlite_query.get_indexed_expression(key)})"
+            )
+
+
+def _quoted(identifier):
+    escaped_identifier = identifier.replace('"', '""')
+    return f'"{escaped_identifier}"'
+
+
+def _where_clause(query, uuid=None):
+    clauses = []
+    parameters = []
+    if uuid is not None:
+        clauses.append(f"{SQLiteAdaptor.ID_COLUMN} = ?")
+        parameters.append(uuid)
+    sql = getattr(query, "sql", None)
+    if sql is not None:
+        clauses.append(f"({sql})")
+        parameters += query.parameters
+    return (f"WHERE {' AND '.join(clauses)}" if clauses else ""), parameters
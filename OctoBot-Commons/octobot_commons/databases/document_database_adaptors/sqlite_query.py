@@ -0,0 +1,290 @@
+#  Drakkar-Software OctoBot-Commons
+#  Copyright (c) Drakkar-Software, All rights reserved.
+#
+#  This library is free software; you can redistribute it and/or
+#  modify it under the terms of the GNU Lesser General Public
+#  License as published by the Free Software Foundation; either
+#  version 3.0 of the License, or (at your option) any later version.
+#
+#  This library is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the GNU
+#  Lesser General Public License for more details.
+#
+#  You should have received a copy of the GNU Lesser General Public
+#  License along with this library.
+import operator
+import re
+
+DOCUMENT_COLUMN = "doc"
+# json_type() values of documents values that can be compared to python values
+_NUMBER_JSON_TYPES = "('integer', 'real', 'true', 'false')"
+_TEXT_JSON_TYPES = "('text')"
+_MAX_SQL_INTEGER = 2**63
+
+
+class SQLiteQueryCondition:
+    """
+    A document condition, usable as a SQLiteAdaptor query: can be combined using &, | and ~ like tinydb queries.
+    When possible, a condition is associated to a SQL expression on the JSON documents column to filter documents
+    using the database indexes. Documents are otherwise filtered by calling the condition.
+    """
+
+    def __init__(self, test, sql=None, parameters=(), is_exact_sql=False):
+        """
+        :param test: callable returning True when a document matches the condition
+        :param sql: the SQL expression matching at least every matching document, None when unavailable
+        :param parameters: the SQL expression bound parameters
+        :param is_exact_sql: True when the SQL expression matches exactly the matching documents
+        """
+        self.test = test
+        self.sql = sql
+        self.parameters = tuple(parameters)
+        self.is_exact_sql = sql is not None and is_exact_sql
+
+    def __call__(self, document) -> bool:
+        return self.test(document)
+
+    def __and__(self, other):
+        if self.sql is not None and other.sql is not None:
+            sql = f"({self.sql}) AND ({other.sql})"
+            parameters = self.parameters + other.parameters
+        elif self.sql is not None:
+            sql, parameters = self.sql, self.parameters
+        else:
+            sql, parameters = other.sql, other.parameters
+        return SQLiteQueryCondition(
+            lambda document: self(document) and other(document),
+            sql,
+            parameters,
+            self.is_exact_sql and other.is_exact_sql,
+        )
+
+    def __or__(self, other):
+        has_sql = self.sql is not None and other.sql is not None
+        return SQLiteQueryCondition(
+            lambda document: self(document) or other(document),
+            f"({self.sql}) OR ({other.sql})" if has_sql else None,
+            self.parameters + other.parameters if has_sql else (),
+            self.is_exact_sql and other.is_exact_sql,
+        )
+
+    def __invert__(self):
+        # coalesce: missing values are NULL in SQL but don't match conditions
+        return SQLiteQueryCondition(
+            lambda document: not self(document),
+            f"NOT coalesce({self.sql}, 0)" if self.is_exact_sql else None,
+            self.parameters if self.is_exact_sql else (),
+            self.is_exact_sql,
+        )
+
+
+class SQLiteQuery:
+    """
+    SQLiteQuery creates SQLiteQueryCondition using the tinydb.Query syntax:
+    query.key == value, query["key"].sub_key > value, query.key.one_of(values), query.fragment(dict), ...
+    """
+
+    def __init__(self, path=()):
+        self._path = path
+
+    def __getattr__(self, item):
+        if item.startswith("__"):
+            raise AttributeError(item)
+        return SQLiteQuery(self._path + (item,))
+
+    def __getitem__(self, item):
+        return SQLiteQuery(self._path + (item,))
+
+    def __eq__(self, other):
+        return self._comparison(operator.eq, "=", other)
+
+    def __ne__(self, other):
+        if not _is_sql_value(other):
+            return self._condition(lambda value: value != other)
+        # values of other types are different
+        return self._condition(
+            lambda value: value != other,
+            f"json_type({self._json_path_sql()}) IS NOT NULL "
+            f"AND NOT {self._comparison_sql('=', other)}",
+            (other,),
+        )
+
+    def __lt__(self, other):
+        return self._comparison(operator.lt, "<", other)
+
+    def __le__(self, other):
+        return self._comparison(operator.le, "<=", other)
+
+    def __gt__(self, other):
+        return self._comparison(operator.gt, ">", other)
+
+    def __ge__(self, other):
+        return self._comparison(operator.ge, ">=", other)
+
+    def exists(self):
+        """
+        :return: a condition matching documents having a value at this path
+        """
+        return self._condition(
+            lambda value: True, f"json_type({self._json_path_sql()}) IS NOT NULL"
+        )
+
+    def one_of(self, items):
+        """
+        :param items: the values to look for
+        :return: a condition matching documents having one of the given items as value at this path
+        """
+        items = list(items)
+        sql = None
+        if items and all(_is_sql_value(item) for item in items):
+            sql = " OR ".join(
+                self._comparison_sql("=", item) for item in items
+            )
+        return self._condition(
+            lambda value: value in items,
+            sql,
+            items,
+        )
+
+    def fragment(self, document):
+        """
+        :param document: the key/values to look for
+        :return: a condition matching documents containing every key/value of the given document at this path
+        """
+        # use SQL expressions when possible to filter documents
+        sql_conditions = [
+            condition
+            for condition in (self[key] == value for key, value in document.items())
+            if condition.sql is not None
+        ]
+        return SQLiteQueryCondition(
+            lambda document_to_check: _is_fragment(
+                self._resolve, document_to_check, document
+            ),
+            " AND ".join(f"({condition.sql})" for condition in sql_conditions) or None,
+            [
+                parameter
+                for condition in sql_conditions
+                for parameter in condition.parameters
+            ],
+            len(sql_conditions) == len(document),
+        )
+
+    def test(self, func, *args):
+        """
+        :param func: the function to call on this path value
+        :param args: additional args to give to func
+        :return: a condition matching documents for which func(value, *args) returns True
+        """
+        return self._condition(lambda value: func(value, *args))
+
+    def matches(self, regex, flags=0):
+        """
+        :return: a condition matching documents which value at this path fully matches the given regex
+        """
+        return self._condition(
+            lambda value: re.fullmatch(regex, value, flags) is not None
+        )
+
+    def search(self, regex, flags=0):
+        """
+        :return: a condition matching documents which value at this path contains the given regex
+        """
+        return self._condition(lambda value: re.search(regex, value, flags) is not None)
+
+    def any(self, cond):
+        """
+        :param cond: a condition or a list of values
+        :return: a condition matching documents which value at this path is a list with at least one element
+        matching cond or contained in cond when cond is a list
+        """
+        if callable(cond):
+            return self._condition(lambda value: any(cond(element) for element in value))
+        return self._condition(lambda value: any(element in cond for element in value))
+
+    def all(self, cond):
+        """
+        :param cond: a condition or a list of values
+        :return: a condition matching documents which value at this path is a list with every element
+        matching cond or containing every element of cond when cond is a list
+        """
+        if callable(cond):
+            return self._condition(lambda value: all(cond(element) for element in value))
+        return self._condition(lambda value: all(element in value for element in cond))
+
+    def noop(self):
+        """
+        :return: a condition matching every document
+        """
+        return SQLiteQueryCondition(lambda _: True, "1", is_exact_sql=True)
+
+    def _comparison(self, compare, sql_operator, other):
+        if not _is_sql_value(other):
+            return self._condition(lambda value: compare(value, other))
+        return self._condition(
+            lambda value: compare(value, other),
+            self._comparison_sql(sql_operator, other),
+            (other,),
+        )
+
+    def _comparison_sql(self, sql_operator, other):
+        json_path = self._json_path_sql()
+        # compare only similar types as in python
+        json_types = _TEXT_JSON_TYPES if isinstance(other, str) else _NUMBER_JSON_TYPES
+        return (
+            f"(json_extract({json_path}) {sql_operator} ? "
+            f"AND json_type({json_path}) IN {json_types})"
+        )
+
+    def _condition(self, test, sql=None, parameters=()):
+        if not self._path:
+            raise RuntimeError("Empty query path")
+
+        def _path_test(document):
+            try:
+                value = self._resolve(document)
+            except (KeyError, TypeError, IndexError):
+                return False
+            return test(value)
+
+        return SQLiteQueryCondition(
+            _path_test,
+            sql if self._json_path_sql() is not None else None,
+            parameters,
+            True,
+        )
+
+    def _resolve(self, document):
+        value = document
+        for part in self._path:
+            value = value[part]
+        return value
+
+    def _json_path_sql(self):
+        if not all(isinstance(part, str) and '"' not in part for part in self._path):
+            return None
+        json_path = "$" + "".join(f'."{part}"' for part in self._path)
+        escaped_json_path = json_path.replace("'", "''")
+        return f"{DOCUMENT_COLUMN}, '{escaped_json_path}'"
+
+
+def get_indexed_expression(key):
+    """
+    :return: the SQL expression to index to speed up queries on the given key
+    """
+    return f"json_extract({SQLiteQuery((key,))._json_path_sql()})"
+
+
+def _is_sql_value(value):
+    return isinstance(value, str) or (
+        isinstance(value, (int, float)) and abs(value) < _MAX_SQL_INTEGER
+    )
+
+
+def _is_fragment(resolve, document, fragment):
+    try:
+        value = resolve(document)
+        return all(key in value and value[key] == val for key, val in fragment.items())
+    except (KeyError, TypeError, IndexError):
+        return False
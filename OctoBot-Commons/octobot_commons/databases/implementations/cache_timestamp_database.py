@@ -55,22 +55,60 @@ class CacheTimestampDatabase(cache_database.CacheDatabase):
         :param min_timestamp: timestamp to start returning data from
         """
         try:
-            await self._ensure_local_cache(
-                commons_enums.CacheDatabaseColumns.TIMESTAMP.value
-            )
-            values = [
-                values[name]
-                for value_timestamp, values in self._local_cache.items()
-                if min_timestamp <= value_timestamp <= timestamp and name in values
-            ]
-            if limit != -1:
-                return values[-limit:]
-            return values
+            return (
+                await self._get_values_by_name(timestamp, [name], limit, min_timestamp)
+            )[name]
         except IndexError:
             raise errors.NoCacheValue(f"No cache value associated to {name}")
         except KeyError:
             raise errors.NoCacheValue(f"No {name} value associated to {name} cache.")
 
+    async def get_values_batch(
+        self,
+        timestamp: float,
+        names: list,
+        limit=-1,
+        min_timestamp=0,
+    ) -> dict:
+        """
+        Returns all the values of each given identifier up to the given timestamp
+        :param timestamp: last timestamp to read get data to
+        :param names: identifiers of the values to get
+        :param limit: maximum number of elements to return for each identifier
+        :param min_timestamp: timestamp to start returning data from
+        :return: the values list by identifier
+        """
+        try:
+            return await self._get_values_by_name(
+                timestamp, names, limit, min_timestamp
+            )
+        except (IndexError, KeyError):
+            raise errors.NoCacheValue(f"No cache value associated to {names}")
+
+    async def _get_values_by_name(self, timestamp, names, limit, min_timestamp):
+        await self._ensure_local_cache(
+            commons_enums.CacheDatabaseColumns.TIMESTAMP.value
+        )
+        values_by_name = {name: [] for name in names}
+        # self._local_cache is sorted by timestamp: only go through the [min_timestamp, timestamp] range,
+        # starting from the most recent values when limited
+        is_limited = limit > 0
+        missing_values_count = len(names) * limit if is_limited else -1
+        for value_timestamp in self._local_cache.irange(
+            min_timestamp, timestamp, reverse=is_limited
+        ):
+            values = self._local_cache[value_timestamp]
+            for name, name_values in values_by_name.items():
+                if name in values and (not is_limited or len(name_values) < limit):
+                    name_values.append(values[name])
+                    missing_values_count -= 1
+            if missing_values_count == 0:
+                break
+        if is_limited:
+            for name_values in values_by_name.values():
+                name_values.reverse()
+        return values_by_name
+
     async def set(
         self,
         timestamp: float,
@@ -14,6 +14,8 @@
 #  You should have received a copy of the GNU Lesser General Public
 #  License along with this library.
 import octobot_commons.databases.bases.base_database as base_database
+import octobot_commons.databases.databases_util.columnar_series as columnar_series
+import octobot_commons.enums as commons_enums
 
 
 class DBReader(base_database.BaseDatabase):
@@ -37,3 +39,43 @@ class DBReader(base_database.BaseDatabase):
         :return: all data of the selected table
         """
         return await self._database.select(table_name, None)
+
+    async def select_series(
+        self, title=None, time_frame=None, min_x=None, max_x=None
+    ) -> list:
+        """
+        Reads columnar series. Only the chunks containing points in [min_x, max_x] are read.
+        :param title: when set, only series with this title are selected
+        :param time_frame: when set, only series with this time frame are selected
+        :param min_x: when set, points before min_x are excluded
+        :param max_x: when set, points after max_x are excluded
+        :return: the selected series headers, each containing the values of its columns
+        """
+        query = await self.search()
+        headers_query = None
+        if title is not None:
+            headers_query = query.title == title
+        if time_frame is not None:
+            time_frame_query = query.time_frame == time_frame
+            headers_query = (
+                time_frame_query
+                if headers_query is None
+                else headers_query & time_frame_query
+            )
+        headers = await self._database.select(
+            commons_enums.DBTables.SERIES.value, headers_query
+        )
+        selected_series = []
+        for header in headers:
+            chunks_query = query.series == header[columnar_series.SERIES_KEY]
+            if min_x is not None:
+                chunks_query &= query[columnar_series.MAX_X_KEY] >= min_x
+            if max_x is not None:
+                chunks_query &= query[columnar_series.MIN_X_KEY] <= max_x
+            chunks = await self._database.select(
+                commons_enums.DBTables.SERIES_CHUNKS.value, chunks_query
+            )
+            selected_series.append(
+                columnar_series.merge_chunks(header, chunks, min_x=min_x, max_x=max_x)
+            )
+        return selected_series
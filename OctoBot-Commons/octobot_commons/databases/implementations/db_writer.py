@@ -16,6 +16,8 @@
 #  License along with this library.
 import octobot_commons.databases.bases.base_database as base_database
 import octobot_commons.databases.document_database_adaptors as adaptors
+import octobot_commons.databases.databases_util.columnar_series as columnar_series
+import octobot_commons.enums as commons_enums
 import octobot_commons.errors as commons_errors
 import octobot_commons.logging as commons_logging
 
@@ -38,6 +40,7 @@ class DBWriter(base_database.BaseDatabase):
         )
         self.rows_buffer = {}
         self.rows_buffer_size = self.MAX_ROWS_BUFFER_SIZE
+        self.series = {}
 
     async def log(self, table_name: str, row: dict, cache=True, rows_buffering=False):
         """
@@ -152,12 +155,102 @@ class DBWriter(base_database.BaseDatabase):
         await self.delete_all(table_name)
         await self.log_many(table_name, rows, cache=cache)
 
+    def has_series(self, title: str, time_frame: str) -> bool:
+        """
+        :return: True if points have already been logged into the (title, time_frame) series by this writer
+        """
+        return columnar_series.get_series_key(title, time_frame) in self.series
+
+    async def log_series(
+        self,
+        title: str,
+        time_frame: str,
+        columns: dict,
+        metadata: dict = None,
+        chunk_size=columnar_series.DEFAULT_CHUNK_SIZE,
+        write_open_chunk=False,
+    ) -> int:
+        """
+        Appends points to the (title, time_frame) columnar series.
+        The series header, holding the given metadata, is written once. Points values are
+        stored by column in chunks of chunk_size points.
+        Only points that are after the last point of the series are appended.
+        :param title: title of the series
+        :param time_frame: time frame of the series
+        :param columns: values by column name, x values are required and expected in ascending order
+        :param metadata: values shared by every point of the series
+        :param chunk_size: number of points by chunk
+        :param write_open_chunk: when True, points of the open chunk are also written right away instead of on
+        flush, making them available to readers (used for live values)
+        :return: the number of appended points
+        """
+        series_key = columnar_series.get_series_key(title, time_frame)
+        try:
+            series = self.series[series_key]
+        except KeyError:
+            series = self.series[series_key] = await self._load_series(
+                title, time_frame, columns, metadata, chunk_size
+            )
+        appended_points = series.append(columns)
+        while (full_chunk := series.pop_full_chunk()) is not None:
+            await self._write_series_chunk(*full_chunk)
+        if write_open_chunk:
+            await self._write_open_chunk(series)
+        return appended_points
+
+    async def _load_series(self, title, time_frame, columns, metadata, chunk_size):
+        query = await self.search()
+        series_query = query.series == columnar_series.get_series_key(
+            title, time_frame
+        )
+        headers = await self._database.select(
+            commons_enums.DBTables.SERIES.value, series_query
+        )
+        if headers:
+            # series already stored: append after its last point
+            chunks = await self._database.select(
+                commons_enums.DBTables.SERIES_CHUNKS.value, series_query
+            )
+            return columnar_series.ColumnarSeries(
+                headers[0],
+                last_x=max(
+                    (chunk[columnar_series.MAX_X_KEY] for chunk in chunks),
+                    default=None,
+                ),
+                chunk_size=chunk_size,
+            )
+        header = columnar_series.create_header(title, time_frame, columns, metadata)
+        await self._database.insert(commons_enums.DBTables.SERIES.value, header)
+        return columnar_series.ColumnarSeries(header, chunk_size=chunk_size)
+
+    async def _write_series_chunk(self, uuid, chunk):
+        if uuid is None:
+            return await self._database.insert(
+                commons_enums.DBTables.SERIES_CHUNKS.value, chunk
+            )
+        await self._database.upsert(
+            commons_enums.DBTables.SERIES_CHUNKS.value, chunk, None, uuid=uuid
+        )
+        return uuid
+
+    async def _write_open_chunk(self, series):
+        if series.has_pending_points:
+            series.open_chunk_uuid = await self._write_series_chunk(
+                series.open_chunk_uuid, series.get_open_chunk()
+            )
+            series.has_pending_points = False
+
+    async def _flush_series(self):
+        for series in self.series.values():
+            await self._write_open_chunk(series)
+
     async def flush(self):
         """
         Flushes all caches and "commit" to the database then forces the database to flush its own internal cache if any
         """
         try:
             await self._flush_all_rows_buffers(cache=True)
+            await self._flush_series()
             await super().flush()
         except TypeError as err:
             commons_logging.get_logger(str(self)).exception(
@@ -26,7 +26,12 @@ cdef class SQLiteDatabase:
 
     cdef dict cache
 
-    cdef str __insert_values(self, double timestamp, str inserting_values)
+    cdef public str journal_mode
+    cdef public str synchronous
+    cdef public int commit_interval
+    cdef int _uncommitted_rows
+
+    cdef tuple __insert_values(self, object timestamp, object inserting_values)
     cdef str __select_order_by(self, str order_by, str sort)
     cdef str __select_group_by(self, str group_by)
     cdef str __max(self, list columns)
@@ -31,10 +31,33 @@ class SQLiteDatabase:
     DEFAULT_WHERE_OPERATION = "="
     DEFAULT_SIZE = -1
     CACHE_SIZE = 50
+    # commit after each write by default
+    DEFAULT_COMMIT_INTERVAL = 1
+    JOURNAL_MODE_WAL = "WAL"
+    JOURNAL_MODE_DELETE = "DELETE"
+    SYNCHRONOUS_NORMAL = "NORMAL"
 
-    def __init__(self, file_name):
+    def __init__(
+        self,
+        file_name,
+        journal_mode=None,
+        synchronous=None,
+        commit_interval=DEFAULT_COMMIT_INTERVAL,
+    ):
+        """
+        :param file_name: the database file
+        :param journal_mode: the journal_mode pragma to use, default SQLite journal mode when None
+        (the journal mode is set back to DELETE on stop when using WAL to keep the database in a single file)
+        :param synchronous: the synchronous pragma to use, default SQLite synchronous when None
+        :param commit_interval: the number of written rows after which changes are committed,
+        pending changes are always committed on commit() and stop()
+        """
         self.file_name = file_name
         self.logger = logging.get_logger(self.__class__.__name__)
+        self.journal_mode = journal_mode
+        self.synchronous = synchronous
+        self.commit_interval = commit_interval
+        self._uncommitted_rows = 0
 
         self.tables = []
         self.cache = {}
@@ -48,6 +71,7 @@ class SQLiteDatabase:
         try:
             self.connection = await aiosqlite.connect(self.file_name)
             self._cursor_pool = cursor_pool.CursorPool(self.connection)
+            await self.__init_pragmas()
             await self.__init_tables_list()
         except (sqlite3.OperationalError, sqlite3.DatabaseError) as err:
             raise errors.DatabaseNotFoundError(err)
@@ -78,59 +102,95 @@ class SQLiteDatabase:
             await self.__create_table(table, **kwargs)
 
         # Insert a row of data
-        inserting_values = [f"'{value}'" for value in kwargs.values()]
         await self.__execute_insert(
-            table, self.__insert_values(timestamp, ", ".join(inserting_values))
+            table, [self.__insert_values(timestamp, kwargs.values())]
         )
 
     async def insert_all(self, table, timestamp, **kwargs):
-        # TODO refactor with : cursor.executemany("INSERT INTO my_table VALUES (?,?)", values)
         if table.value not in self.tables:
             await self.__create_table(table, **kwargs)
 
-        insert_values = []
-
-        for index, values in enumerate(timestamp):
-            # Insert a row of data
-            inserting_values = [
-                f"'{value if not isinstance(value, list) else value[index]}'"
-                for value in kwargs.values()
-            ]
-            insert_values.append(
-                self.__insert_values(values, ", ".join(inserting_values))
-            )
+        await self.__execute_insert(
+            table,
+            [
+                self.__insert_values(
+                    row_timestamp,
+                    [
+                        value if not isinstance(value, list) else value[index]
+                        for value in kwargs.values()
+                    ],
+                )
+                for index, row_timestamp in enumerate(timestamp)
+            ],
+        )
 
-        await self.__execute_insert(table, ", ".join(insert_values))
+    async def insert_many(self, table, columns, rows):
+        """
+        Bulk insert rows using bound parameters
+        :param table: the table to insert into, created with columns if missing
+        :param columns: the name of the table columns, without the timestamp column
+        :param rows: the list of rows to insert, each row is a (timestamp, *columns values) tuple,
+        values are bound as is: use strings to store values the same way as insert() and insert_all()
+        :return: None
+        """
+        if table.value not in self.tables:
+            await self.__create_table(table, **{column: None for column in columns})
+        await self.__execute_insert(table, rows)
 
     async def update(self, table, updated_value_by_column, **kwargs):
         # Update a row of data
-        updating_values = [
-            f"{key} = '{value}'" for key, value in updated_value_by_column.items()
-        ]
+        updating_values = [f"{key} = ?" for key in updated_value_by_column]
+        # where values are bound as text, like when they used to be quoted in queries
+        where_values = {
+            key: value for key, value in kwargs.items() if value is not None
+        }
         await self.__execute_update(
             table,
             ", ".join(updating_values),
-            self.__where_clauses_from_kwargs(**kwargs),
+            self.__where_clauses_from_kwargs(
+                should_quote_value=False, **{key: "?" for key in where_values}
+            ),
+            [str(value) for value in updated_value_by_column.values()]
+            + [str(value) for value in where_values.values()],
         )
 
-    def __insert_values(self, timestamp, inserting_values) -> str:
-        return f"({timestamp}, {inserting_values})"
+    async def commit(self) -> None:
+        """
+        Commit pending changes
+        """
+        if self._uncommitted_rows:
+            self._uncommitted_rows = 0
+            await self.connection.commit()
 
-    async def __execute_insert(self, table, insert_items) -> None:
-        async with self.aio_cursor() as cursor:
-            await cursor.execute(f"INSERT INTO {table.value} VALUES {insert_items}")
+    def __insert_values(self, timestamp, inserting_values) -> tuple:
+        # values are stored as text, like when they used to be quoted in queries
+        return tuple([timestamp] + [str(value) for value in inserting_values])
 
-        # Save (commit) the changes
-        await self.connection.commit()
+    async def __execute_insert(self, table, rows) -> None:
+        if not rows:
+            return
+        async with self.aio_cursor() as cursor:
+            await cursor.executemany(
+                f"INSERT INTO {table.value} VALUES ({', '.join('?' * len(rows[0]))})",
+                rows,
+            )
+        await self.__commit_if_necessary(len(rows))
 
-    async def __execute_update(self, table, update_items, where_clauses) -> None:
+    async def __execute_update(
+        self, table, update_items, where_clauses, parameters
+    ) -> None:
         async with self.aio_cursor() as cursor:
             await cursor.execute(
-                f"UPDATE {table.value} SET {update_items} WHERE {where_clauses}"
+                f"UPDATE {table.value} SET {update_items} WHERE {where_clauses}",
+                parameters,
             )
+        await self.__commit_if_necessary(1)
 
-        # Save (commit) the changes
-        await self.connection.commit()
+    async def __commit_if_necessary(self, written_rows) -> None:
+        # Save (commit) the changes every commit_interval written rows
+        self._uncommitted_rows += written_rows
+        if self._uncommitted_rows >= self.commit_interval:
+            await self.commit()
 
     async def select(
         self,
@@ -188,6 +248,47 @@ class SQLiteDatabase:
         sort=DEFAULT_SORT,
         **kwargs,
     ):
+        return await self.__execute_select(
+            table=table,
+            where_clauses=self.__where_clauses_from_timestamps(
+                timestamps, operations, **kwargs
+            ),
+            additional_clauses=self.__select_order_by(order_by, sort),
+            size=size,
+        )
+
+    async def select_distinct(
+        self,
+        table,
+        distinct_columns,
+        timestamps: list = None,
+        operations: list = None,
+        order_by=DEFAULT_ORDER_BY,
+        sort=DEFAULT_SORT,
+        **kwargs,
+    ):
+        """
+        Select the distinct values of distinct_columns, can be filtered by timestamps
+        :param table: the table to select from
+        :param distinct_columns: the columns to select distinct values of
+        :param timestamps: the timestamps to compare the timestamp column to
+        :param operations: the operations to use for each timestamp
+        :param order_by: the column to sort the result by
+        :param sort: the sort direction
+        :return: the list of distinct values rows
+        """
+        return await self.__execute_select(
+            table=table,
+            select_items=f"DISTINCT {self.__selected_columns(distinct_columns)}",
+            where_clauses=self.__where_clauses_from_timestamps(
+                timestamps or [], operations or [], **kwargs
+            ),
+            additional_clauses=self.__select_order_by(order_by, sort),
+        )
+
+    def __where_clauses_from_timestamps(
+        self, timestamps, operations, **kwargs
+    ) -> str:
         timestamps_where_clauses = self.__where_clauses_from_operations(
             keys=[self.TIMESTAMP_COLUMN] * len(timestamps),
             values=timestamps,
@@ -200,13 +301,7 @@ class SQLiteDatabase:
             if where_clause and timestamps_where_clauses
             else where_clause
         )
-        final_where_close = f"{final_where_close}{timestamps_where_clauses}"
-        return await self.__execute_select(
-            table=table,
-            where_clauses=final_where_close,
-            additional_clauses=self.__select_order_by(order_by, sort),
-            size=size,
-        )
+        return f"{final_where_close}{timestamps_where_clauses}"
 
     def __where_clauses_from_kwargs(self, should_quote_value=True, **kwargs) -> str:
         return self.__where_clauses_from_operations(
@@ -327,12 +422,32 @@ class SQLiteDatabase:
         finally:
             self.tables.append(table.value)
 
+    async def __init_pragmas(self):
+        async with self.aio_cursor() as cursor:
+            if self.journal_mode is not None:
+                await cursor.execute(f"PRAGMA journal_mode={self.journal_mode}")
+            if self.synchronous is not None:
+                await cursor.execute(f"PRAGMA synchronous={self.synchronous}")
+
     async def __init_tables_list(self):
         async with self.aio_cursor() as cursor:
             await cursor.execute("SELECT name FROM sqlite_master WHERE type='table'")
             self.tables = [res[0] for res in await cursor.fetchall()]
 
     async def stop(self):
+        try:
+            if self.connection is not None:
+                await self.commit()
+                if self.journal_mode == self.JOURNAL_MODE_WAL:
+                    # checkpoint and remove the write-ahead log file
+                    async with self.aio_cursor() as cursor:
+                        await cursor.execute(
+                            f"PRAGMA journal_mode={self.JOURNAL_MODE_DELETE}"
+                        )
+        finally:
+            await self.__close()
+
+    async def __close(self):
         try:
             await self._cursor_pool.close()
         finally:
@@ -343,8 +458,8 @@ class SQLiteDatabase:
 
 
 @contextlib.asynccontextmanager
-async def new_sqlite_database(file_path):
-    local_database = SQLiteDatabase(file_path)
+async def new_sqlite_database(file_path, **kwargs):
+    local_database = SQLiteDatabase(file_path, **kwargs)
     try:
         await local_database.initialize()
         yield local_database
@@ -269,6 +269,7 @@ class DisplayedElementTypes(enum.Enum):
 
 class DBTables(enum.Enum):
     METADATA = "metadata"
+    PARTIAL_WINDOW_METADATA = "partial_window_metadata"
     INPUTS = "inputs"
     PORTFOLIO = "portfolio"
     ORDERS = "all_orders"
@@ -277,6 +278,8 @@ class DBTables(enum.Enum):
     CANDLES = "candles"
     CANDLES_SOURCE = "candles_source"
     CACHE_SOURCE = "cache_source"
+    SERIES = "series"
+    SERIES_CHUNKS = "series_chunks"
     SYMBOL = "symbol"
     FEES_AMOUNT = "fees_amount"
     FEES_CURRENCY = "fees_currency"
@@ -31,6 +31,7 @@ from octobot_commons.logging.logging_util import (
     error_notifier_callbacks,
     LOGS_MAX_COUNT,
     add_log,
+    flush_log_notifications,
     get_errors_count,
     reset_errors_count,
     register_error_notifier,
@@ -52,6 +53,7 @@ __all__ = [
     "error_notifier_callbacks",
     "LOGS_MAX_COUNT",
     "add_log",
+    "flush_log_notifications",
     "get_errors_count",
     "reset_errors_count",
     "register_error_notifier",
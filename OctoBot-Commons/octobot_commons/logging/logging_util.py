@@ -15,7 +15,11 @@
 #  You should have received a copy of the GNU Lesser General Public
 #  License along with this library.
 
+import asyncio
+import collections
 import logging
+import threading
+import time
 
 import octobot_commons.timestamp_util as timestamp_util
 
@@ -24,15 +28,38 @@ LOG_NEW_ERRORS_COUNT = "log_new_errors_count"
 
 BACKTESTING_NEW_ERRORS_COUNT: str = "log_backtesting_errors_count"
 
+LOGS_MAX_COUNT = 1000
+
 logs_database = {
-    LOG_DATABASE: [],
+    # the oldest log is dropped when LOGS_MAX_COUNT logs are stored
+    LOG_DATABASE: collections.deque(maxlen=LOGS_MAX_COUNT),
     LOG_NEW_ERRORS_COUNT: 0,
     BACKTESTING_NEW_ERRORS_COUNT: 0,
 }
 
 error_notifier_callbacks = []
 
-LOGS_MAX_COUNT = 1000
+# error notifiers are called once for LOGS_NOTIFICATION_BATCH_SIZE logs
+# or LOGS_NOTIFICATION_INTERVAL seconds after the first log to notify, from this log event loop
+LOGS_NOTIFICATION_BATCH_SIZE = 100
+LOGS_NOTIFICATION_INTERVAL = 0.5
+_pending_notifications_count = 0
+_notification_timer = None
+_notification_loop = None
+_notification_lock = threading.Lock()
+
+# a logger message repeated more than REPEATED_LOGS_MAX_COUNT times in REPEATED_LOGS_INTERVAL seconds is not
+# stored again during this interval
+REPEATED_LOGS_MAX_COUNT = 5
+REPEATED_LOGS_INTERVAL = 60
+# repeated logs of the last REPEATED_LOGS_MAX_TRACKED_COUNT (logger, message, level):
+# [interval start time, stored count, skipped count]
+REPEATED_LOGS_MAX_TRACKED_COUNT = 1000
+_last_stored_logs = collections.OrderedDict()
+# stored logs time, formatted at most once per second
+LOG_TIME_FORMAT = "%Y-%m-%d %H:%M:%S"
+_last_log_second = None
+_last_log_time = None
 
 STORED_LOG_MIN_LEVEL = logging.WARNING
 ERROR_PUBLICATION_ENABLED = True
@@ -96,21 +123,134 @@ def add_log(level, source, message, keep_log=True, call_notifiers=True):
     if keep_log:
         logs_database[LOG_DATABASE].append(
             {
-                "Time": timestamp_util.get_now_time(),
+                "Time": _get_log_time(),
                 "Level": logging.getLevelName(level),
                 "Source": str(source),
                 "Message": message,
             }
         )
-        if len(logs_database[LOG_DATABASE]) > LOGS_MAX_COUNT:
-            logs_database[LOG_DATABASE].pop(0)
         # do not count this error if keep_log is False
-        if level >= logging.ERROR:
-            logs_database[LOG_NEW_ERRORS_COUNT] += 1
-            logs_database[BACKTESTING_NEW_ERRORS_COUNT] += 1
+        _count_error(level)
     if call_notifiers:
-        for callback in error_notifier_callbacks:
-            callback()
+        _schedule_notifiers()
+
+
+def _count_error(level):
+    """
+    Count the log in errors counters if its level is at least logging.ERROR
+    :param level: the log level
+    """
+    if level >= logging.ERROR:
+        logs_database[LOG_NEW_ERRORS_COUNT] += 1
+        logs_database[BACKTESTING_NEW_ERRORS_COUNT] += 1
+
+
+def _schedule_notifiers():
+    """
+    Call error notifiers when LOGS_NOTIFICATION_BATCH_SIZE logs are waiting to be notified,
+    otherwise schedule a call in LOGS_NOTIFICATION_INTERVAL seconds on the running event loop
+    if not scheduled yet. Without running event loop, error notifiers are called right away.
+    """
+    global _pending_notifications_count, _notification_timer, _notification_loop
+    if not error_notifier_callbacks:
+        return
+    try:
+        loop = asyncio.get_running_loop()
+    except RuntimeError:
+        loop = None
+    with _notification_lock:
+        _pending_notifications_count += 1
+        should_notify = (
+            loop is None or _pending_notifications_count >= LOGS_NOTIFICATION_BATCH_SIZE
+        )
+        if not should_notify and (
+            _notification_timer is None or _notification_loop.is_closed()
+        ):
+            # a timer of a closed loop will never be called
+            _notification_timer = loop.call_later(
+                LOGS_NOTIFICATION_INTERVAL, _on_notification_timer
+            )
+            _notification_loop = loop
+    if should_notify:
+        _notify_pending_logs()
+
+
+def _on_notification_timer():
+    """
+    Call error notifiers for the logs received since the timer start
+    """
+    global _notification_timer
+    with _notification_lock:
+        _notification_timer = None
+    _notify_pending_logs()
+
+
+def _notify_pending_logs():
+    """
+    Call error notifiers if logs are waiting to be notified
+    """
+    global _pending_notifications_count
+    with _notification_lock:
+        if not _pending_notifications_count:
+            return
+        _pending_notifications_count = 0
+    for callback in error_notifier_callbacks:
+        callback()
+
+
+def flush_log_notifications():
+    """
+    Call error notifiers now if logs are waiting to be notified
+    """
+    global _notification_timer
+    with _notification_lock:
+        if _notification_timer is not None:
+            _notification_timer.cancel()
+            _notification_timer = None
+    _notify_pending_logs()
+
+
+def _get_log_time():
+    """
+    :return: the current time formatted for logs, only formatted once per second
+    """
+    global _last_log_second, _last_log_time
+    now_second = int(time.time())
+    if now_second != _last_log_second:
+        _last_log_time = timestamp_util.convert_timestamp_to_datetime(
+            now_second, time_format=LOG_TIME_FORMAT
+        )
+        _last_log_second = now_second
+    return _last_log_time
+
+
+def _get_message_to_store(logger_name, message, level):
+    """
+    :param logger_name: the log source
+    :param message: the log message
+    :param level: the log level
+    :return: the message to store, None when this message has been repeated too many times by this logger
+    """
+    now = time.time()
+    key = (logger_name, message, level)
+    last_log = _last_stored_logs.get(key)
+    skipped_count = 0
+    if last_log is not None:
+        _last_stored_logs.move_to_end(key)
+        if now - last_log[0] < REPEATED_LOGS_INTERVAL:
+            if last_log[1] >= REPEATED_LOGS_MAX_COUNT:
+                last_log[2] += 1
+                return None
+            last_log[1] += 1
+            return message
+        skipped_count = last_log[2]
+    _last_stored_logs[key] = [now, 1, 0]
+    while len(_last_stored_logs) > REPEATED_LOGS_MAX_TRACKED_COUNT:
+        _last_stored_logs.popitem(last=False)
+    if skipped_count:
+        # new interval: also store the count of skipped messages
+        return f"{message} (repeated {skipped_count} more times)"
+    return message
 
 
 def get_errors_count(counter=LOG_NEW_ERRORS_COUNT):
@@ -132,7 +272,8 @@ def reset_errors_count(counter=LOG_NEW_ERRORS_COUNT):
 
 def register_error_notifier(callback):
     """
-    Register an error notifier
+    Register an error notifier, called from the event loop of the notified logs or right away
+    from the logging thread when it has no running event loop
     :param callback: the callback to call when the notifier is triggered
     """
     error_notifier_callbacks.append(callback)
@@ -251,10 +392,15 @@ class BotLogger:
         :param message: the log message
         :param level: the log level
         """
+        message_to_store = _get_message_to_store(self.logger_name, message, level)
+        if message_to_store is None:
+            # too many repeated messages: only count errors
+            _count_error(level)
+            return
         add_log(
             level,
             self.logger_name,
-            message,
+            message_to_store,
             call_notifiers=ERROR_PUBLICATION_ENABLED,
         )
 
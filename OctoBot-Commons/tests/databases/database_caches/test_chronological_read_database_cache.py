@@ -0,0 +1,71 @@
+#  Drakkar-Software OctoBot-Commons
+#  Copyright (c) Drakkar-Software, All rights reserved.
+#
+#  This library is free software; you can redistribute it and/or
+#  modify it under the terms of the GNU Lesser General Public
+#  License as published by the Free Software Foundation; either
+#  version 3.0 of the License, or (at your option) any later version.
+#
+#  This library is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the GNU
+#  Lesser General Public License for more details.
+#
+#  You should have received a copy of the GNU Lesser General Public
+#  License along with this library.
+import pytest
+
+import octobot_commons.databases as databases
+
+
+IDENTIFIERS = ("binance", "BTC/USDT", "1h", "ohlcv")
+
+
+@pytest.fixture
+def cache():
+    chronological_cache = databases.ChronologicalReadDatabaseCache()
+    # unsorted values
+    chronological_cache.set([[timestamp, str(timestamp)] for timestamp in (5, 1, 3, 2, 4, 7, 6)], 0, IDENTIFIERS)
+    return chronological_cache
+
+
+def _timestamps(values):
+    return [value[0] for value in values]
+
+
+def test_has(cache):
+    assert cache.has(IDENTIFIERS)
+    assert not cache.has(("binance", "ETH/USDT", "1h", "ohlcv"))
+    cache.clear()
+    assert not cache.has(IDENTIFIERS)
+
+
+def test_get_unbounded(cache):
+    assert _timestamps(cache.get(-1, -1, IDENTIFIERS)) == [1, 2, 3, 4, 5, 6, 7]
+    assert _timestamps(cache.get(-1, 3, IDENTIFIERS)) == [1, 2, 3]
+    assert _timestamps(cache.get(-1, 0, IDENTIFIERS)) == []
+    assert _timestamps(cache.get(5, -1, IDENTIFIERS)) == [5, 6, 7]
+    assert _timestamps(cache.get(8, -1, IDENTIFIERS)) == []
+
+
+def test_get_time_window(cache):
+    assert _timestamps(cache.get(2, 4, IDENTIFIERS)) == [2, 3, 4]
+    assert _timestamps(cache.get(3, 3, IDENTIFIERS)) == [3]
+    assert _timestamps(cache.get(4, 10, IDENTIFIERS)) == [4, 5, 6, 7]
+    assert _timestamps(cache.get(8, 10, IDENTIFIERS)) == []
+    # going back in time is supported
+    assert _timestamps(cache.get(1, 2, IDENTIFIERS)) == [1, 2]
+
+
+def test_get_with_cursors(cache):
+    assert _timestamps(cache.get(1, 2, IDENTIFIERS, cursor="updater")) == [1, 2]
+    assert _timestamps(cache.get(5, 6, IDENTIFIERS, cursor="evaluator")) == [5, 6]
+    # readers at different times do not impact each other
+    assert _timestamps(cache.get(2, 3, IDENTIFIERS, cursor="updater")) == [2, 3]
+    assert _timestamps(cache.get(6, 7, IDENTIFIERS, cursor="evaluator")) == [6, 7]
+    assert _timestamps(cache.get(3, 4, IDENTIFIERS, cursor="updater")) == [3, 4]
+    cursors = cache._get_cache_data(IDENTIFIERS)[cache.CURSORS_KEY]
+    assert cursors == {"updater": 2, "evaluator": 5}
+    cache.reset_cached_indexes()
+    assert cursors == {}
+    assert _timestamps(cache.get(1, 1, IDENTIFIERS, cursor="updater")) == [1]
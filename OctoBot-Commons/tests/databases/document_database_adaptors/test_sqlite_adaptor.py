@@ -0,0 +1,175 @@
+#  Drakkar-Software OctoBot-Commons
+#  Copyright (c) Drakkar-Software, All rights reserved.
+#
+#  This library is free software; you can redistribute it and/or
+#  modify it under the terms of the GNU Lesser General Public
+#  License as published by the Free Software Foundation; either
+#  version 3.0 of the License, or (at your option) any later version.
+#
+#  This library is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the GNU
+#  Lesser General Public License for more details.
+#
+#  You should have received a copy of the GNU Lesser General Public
+#  License along with this library.
+import os
+import pytest
+import pytest_asyncio
+
+import octobot_commons.databases as databases
+import octobot_commons.enums as enums
+
+# All test coroutines will be treated as marked.
+pytestmark = pytest.mark.asyncio
+
+TABLE = "table"
+DOCUMENTS = [
+    {"x": 1, "t": 10.5, "time_frame": "1h", "id": "a", "kind": "line", "values": [1, 2], "nested": {"y": 1}},
+    {"x": 2, "t": 11, "time_frame": "4h", "id": "b", "kind": "line", "values": [3]},
+    {"x": 3, "t": 12, "time_frame": "1h", "id": "c", "kind": None},
+    {"x": "3", "t": 13, "time_frame": "1h", "id": "d", "kind": "scatter", "nested": {"y": 2}},
+    {"x": True, "t": 14, "id": "e"},
+    {"x": [1, 2], "t": 15, "id": "f"},
+]
+
+
+async def _create_adaptor(adaptor_class, tmp_path):
+    adaptor = adaptor_class(os.path.join(tmp_path, f"db{adaptor_class.get_db_file_ext()}"), cache_size=2)
+    adaptor.initialize()
+    await adaptor.insert_many(TABLE, DOCUMENTS)
+    return adaptor
+
+
+@pytest_asyncio.fixture
+async def adaptors(tmp_path):
+    tinydb_adaptor = await _create_adaptor(databases.TinyDBAdaptor, tmp_path)
+    sqlite_adaptor = await _create_adaptor(databases.SQLiteAdaptor, tmp_path)
+    yield tinydb_adaptor, sqlite_adaptor
+    await tinydb_adaptor.close()
+    await sqlite_adaptor.close()
+
+
+def _queries(query):
+    return [
+        query.x == 1,
+        query.x == 3,
+        query.x == "3",
+        query.x == [1, 2],
+        query.x != 1,
+        query.t > 11,
+        query.t <= 12,
+        query.t >= 12,
+        query.t < 11,
+        query.kind == None,
+        query.kind != "line",
+        query.nested.y == 2,
+        query["time_frame"] == "1h",
+        query.time_frame.one_of(["4h", "1h"]),
+        query.x.one_of([2, "3"]),
+        query.kind.exists(),
+        ~query.kind.exists(),
+        ~(query.x == 1),
+        (query.time_frame == "1h") & (query.t > 11),
+        (query.time_frame == "1h") | (query.id == "b"),
+        (query.time_frame == "1h") & query.values.test(lambda values: len(values) > 1),
+        ~((query.x == 3) | query.nested.exists()),
+        query.fragment({"time_frame": "1h", "kind": "scatter"}),
+        query.fragment({"kind": None}),
+        query.nested.fragment({"y": 1}),
+        query.values.any([3]),
+        query.values.all([1, 2]),
+        query.id.matches("[a-c]"),
+        query.id.search("d"),
+        query.noop(),
+    ]
+
+
+async def test_select(adaptors):
+    tinydb_adaptor, sqlite_adaptor = adaptors
+    assert await sqlite_adaptor.select(TABLE, None) == DOCUMENTS
+    assert await sqlite_adaptor.select(TABLE, None, uuid=2) == DOCUMENTS[1]
+    assert sqlite_adaptor.get_uuid(await sqlite_adaptor.select(TABLE, None, uuid=2)) == 2
+    assert await sqlite_adaptor.select(TABLE, None, uuid=200) is None
+    assert await sqlite_adaptor.select("unknown", None) == []
+    assert await sqlite_adaptor.count("unknown", None) == 0
+    tiny_queries = _queries(await tinydb_adaptor.query_factory())
+    sqlite_queries = _queries(await sqlite_adaptor.query_factory())
+    for tiny_query, sqlite_query in zip(tiny_queries, sqlite_queries):
+        expected = await tinydb_adaptor.select(TABLE, tiny_query)
+        assert await sqlite_adaptor.select(TABLE, sqlite_query) == expected, tiny_query
+        assert [sqlite_adaptor.get_uuid(doc) for doc in await sqlite_adaptor.select(TABLE, sqlite_query)] == \
+            [tinydb_adaptor.get_uuid(doc) for doc in expected]
+        assert await sqlite_adaptor.count(TABLE, sqlite_query) == await tinydb_adaptor.count(TABLE, tiny_query)
+
+
+async def test_indexed_queries(adaptors):
+    _, sqlite_adaptor = adaptors
+    query = await sqlite_adaptor.query_factory()
+    for condition in (query.t == 12, query.t > 1, query.time_frame.one_of(["1h"]), query.id == "a",
+                      query.fragment({"time_frame": "1h", "t": 12})):
+        assert condition.is_exact_sql
+        plan = sqlite_adaptor.database.execute(
+            f'EXPLAIN QUERY PLAN SELECT id FROM "{TABLE}" WHERE {condition.sql}', condition.parameters
+        ).fetchall()
+        assert any("USING INDEX" in str(step) for step in plan), plan
+    assert not query.kind.test(lambda _: True).is_exact_sql
+    assert not query.fragment({"t": [1]}).is_exact_sql
+
+
+async def test_writes(adaptors):
+    for adaptor in adaptors:
+        query = await adaptor.query_factory()
+        assert await adaptor.tables() == [TABLE]
+        assert await adaptor.insert(TABLE, {"x": 10}) == 7
+        assert await adaptor.update(TABLE, {"kind": "bar"}, query.x == 3) == [3]
+        assert await adaptor.update(TABLE, {"kind": "bar"}, query.x == 10) == [7]
+        assert await adaptor.upsert(TABLE, {"x": 11}, query.x == 11) == [8]
+        assert await adaptor.upsert(TABLE, {"kind": "area"}, query.x == 11) == [8]
+        assert await adaptor.upsert(TABLE, {"x": 12}, None, uuid=20) == [20]
+        assert await adaptor.select(TABLE, None, uuid=20) == {"x": 12}
+        assert await adaptor.update_many(TABLE, [({"y": 1}, query.x == 12), ({"y": 2}, query.x == 10)]) == [7, 20]
+        assert await adaptor.delete(TABLE, query.x.one_of([11, 12])) == [8, 20]
+        assert await adaptor.delete(TABLE, None, uuid=1) == [1]
+        assert await adaptor.count(TABLE, query.kind == "bar") == 2
+        await adaptor.flush()
+    tinydb_adaptor, sqlite_adaptor = adaptors
+    assert await sqlite_adaptor.select(TABLE, None) == await tinydb_adaptor.select(TABLE, None)
+    await sqlite_adaptor.delete(TABLE, None)
+    assert await sqlite_adaptor.tables() == []
+    assert await sqlite_adaptor.select(TABLE, None) == []
+
+
+async def test_close_and_reopen(tmp_path):
+    adaptor = await _create_adaptor(databases.SQLiteAdaptor, tmp_path)
+    await adaptor.insert_many("other", [{"x": 1}, {"x": 2}, {"x": 3}])
+    await adaptor.close()
+    await adaptor.close()
+    adaptor.initialize()
+    try:
+        assert sorted(await adaptor.tables()) == ["other", TABLE]
+        assert await adaptor.select(TABLE, None) == DOCUMENTS
+        await adaptor.hard_reset()
+        assert await adaptor.tables() == []
+    finally:
+        await adaptor.close()
+
+
+async def test_cache_timestamp_database(tmp_path):
+    database = databases.CacheTimestampDatabase(os.path.join(tmp_path, "cache.sqlite"),
+                                                database_adaptor=databases.SQLiteAdaptor)
+    try:
+        await database.set_values([1, 2, 3], ["a", "b", "c"])
+        await database.set(2, "B")
+        assert await database.get(2) == "B"
+        assert await database.get_values(3, limit=2) == ["B", "c"]
+    finally:
+        await database.close()
+    database = databases.CacheTimestampDatabase(os.path.join(tmp_path, "cache.sqlite"),
+                                                database_adaptor=databases.SQLiteAdaptor)
+    try:
+        assert await database.get_values(3) == ["a", "B", "c"]
+        assert (await database.get_metadata())[enums.CacheDatabaseColumns.TYPE.value] == \
+            databases.CacheTimestampDatabase.__name__
+    finally:
+        await database.close()
@@ -0,0 +1,78 @@
+#  Drakkar-Software OctoBot-Commons
+#  Copyright (c) Drakkar-Software, All rights reserved.
+#
+#  This library is free software; you can redistribute it and/or
+#  modify it under the terms of the GNU Lesser General Public
+#  License as published by the Free Software Foundation; either
+#  version 3.0 of the License, or (at your option) any later version.
+#
+#  This library is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the GNU
+#  Lesser General Public License for more details.
+#
+#  You should have received a copy of the GNU Lesser General Public
+#  License along with this library.
+import os
+import pytest
+import pytest_asyncio
+
+import octobot_commons.databases as databases
+import octobot_commons.enums as enums
+
+# All test coroutines will be treated as marked.
+pytestmark = pytest.mark.asyncio
+
+
+@pytest_asyncio.fixture
+async def cache_database(tmp_path):
+    database = databases.CacheTimestampDatabase(os.path.join(tmp_path, "cache.json"))
+    await database.set_values(
+        list(range(10)),
+        [f"v{index}" for index in range(10)],
+        additional_values_by_key={"other": [index * 10 for index in range(10)]}
+    )
+    # not all timestamps have an "extra" value
+    for timestamp in range(0, 10, 3):
+        await database.set(timestamp, timestamp + 0.5, name="extra")
+    yield database
+    await database.close()
+
+
+def _naive_get_values(database, timestamp, name, limit=-1, min_timestamp=0):
+    values = [
+        values[name]
+        for value_timestamp, values in database._local_cache.items()
+        if min_timestamp <= value_timestamp <= timestamp and name in values
+    ]
+    return values[-limit:] if limit != -1 else values
+
+
+async def test_get_values(cache_database):
+    assert await cache_database.get_values(4) == ["v0", "v1", "v2", "v3", "v4"]
+    assert await cache_database.get_values(4, limit=2) == ["v3", "v4"]
+    assert await cache_database.get_values(4, limit=2, min_timestamp=4) == ["v4"]
+    assert await cache_database.get_values(100, name="extra", limit=3) == [3.5, 6.5, 9.5]
+    assert await cache_database.get_values(-1) == []
+    assert await cache_database.get_values(4, name="unknown") == []
+    for timestamp in (-1, 0, 4.5, 9, 100):
+        for name in (enums.CacheDatabaseColumns.VALUE.value, "other", "extra"):
+            for limit in (-1, 1, 2, 4, 20):
+                for min_timestamp in (0, 2, 9):
+                    assert await cache_database.get_values(timestamp, name=name, limit=limit,
+                                                           min_timestamp=min_timestamp) == \
+                        _naive_get_values(cache_database, timestamp, name, limit, min_timestamp)
+
+
+async def test_get_values_batch(cache_database):
+    value = enums.CacheDatabaseColumns.VALUE.value
+    assert await cache_database.get_values_batch(6, [value, "extra"], limit=2) == {
+        value: ["v5", "v6"],
+        "extra": [3.5, 6.5],
+    }
+    assert await cache_database.get_values_batch(6, ["other", "extra"], min_timestamp=5) == {
+        "other": [50, 60],
+        "extra": [6.5],
+    }
+    assert await cache_database.get_values_batch(6, []) == {}
+
@@ -0,0 +1,98 @@
+#  Drakkar-Software OctoBot-Commons
+#  Copyright (c) Drakkar-Software, All rights reserved.
+#
+#  This library is free software; you can redistribute it and/or
+#  modify it under the terms of the GNU Lesser General Public
+#  License as published by the Free Software Foundation; either
+#  version 3.0 of the License, or (at your option) any later version.
+#
+#  This library is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the GNU
+#  Lesser General Public License for more details.
+#
+#  You should have received a copy of the GNU Lesser General Public
+#  License along with this library.
+import os
+import numpy
+import pytest
+
+import octobot_commons.databases as databases
+import octobot_commons.enums as enums
+
+# All test coroutines will be treated as marked.
+pytestmark = pytest.mark.asyncio
+
+ADAPTORS = (databases.TinyDBAdaptor, databases.SQLiteAdaptor)
+METADATA = {"kind": "scattergl", "mode": "lines", "chart": "sub-chart", "color": "blue"}
+
+
+def _db_path(tmp_path, database_adaptor):
+    return os.path.join(tmp_path, f"symbol{database_adaptor.get_db_file_ext()}")
+
+
+@pytest.mark.parametrize("database_adaptor", ADAPTORS)
+async def test_log_series(tmp_path, database_adaptor):
+    path = _db_path(tmp_path, database_adaptor)
+    async with databases.DBWriterReader.database(path, database_adaptor=database_adaptor) as writer:
+        assert not writer.has_series("rsi", "1h")
+        x = numpy.arange(0, 25, dtype=numpy.int64) * 10
+        assert await writer.log_series("rsi", "1h", {"x": x, "y": x / 10}, METADATA, chunk_size=10) == 25
+        assert writer.has_series("rsi", "1h")
+        # already logged points are skipped
+        assert await writer.log_series("rsi", "1h", {"x": x[-3:], "y": x[-3:] / 10}, METADATA) == 0
+        assert await writer.log_series("rsi", "1h", {"x": [240, 250], "y": [24, 25]}, METADATA) == 1
+        assert await writer.log_series("rsi", "4h", {"x": [0], "close": [1], "volume": [2]}) == 1
+        # full chunks are written, remaining points are written on flush
+        assert len(await writer.all(enums.DBTables.SERIES_CHUNKS.value)) == 2
+        await writer.flush()
+        chunks = await writer.all(enums.DBTables.SERIES_CHUNKS.value)
+        assert len(chunks) == 4
+        assert len(await writer.all(enums.DBTables.SERIES.value)) == 2
+        # open chunk is updated on flush
+        assert await writer.log_series("rsi", "1h", {"x": [260], "y": [26]}) == 1
+        await writer.flush()
+        assert len(await writer.all(enums.DBTables.SERIES_CHUNKS.value)) == 4
+
+    async with databases.DBWriterReader.database(path, database_adaptor=database_adaptor) as reader:
+        rsi_1h, = await reader.select_series(title="rsi", time_frame="1h")
+        assert {key: rsi_1h[key] for key in METADATA} == METADATA
+        assert rsi_1h["columns"] == ["x", "y"]
+        assert rsi_1h["x"] == list(range(0, 270, 10))
+        assert rsi_1h["y"] == list(range(0, 27))
+        rsi_4h, = await reader.select_series(time_frame="4h")
+        assert (rsi_4h["x"], rsi_4h["close"], rsi_4h["volume"]) == ([0], [1], [2])
+        assert len(await reader.select_series()) == 2
+        assert await reader.select_series(title="unknown") == []
+        # time range slicing
+        rsi_1h, = await reader.select_series(title="rsi", time_frame="1h", min_x=95, max_x=130)
+        assert (rsi_1h["x"], rsi_1h["y"]) == ([100, 110, 120, 130], [10, 11, 12, 13])
+        rsi_1h, = await reader.select_series(title="rsi", time_frame="1h", min_x=250)
+        assert rsi_1h["x"] == [250, 260]
+        rsi_1h, = await reader.select_series(title="rsi", time_frame="1h", max_x=-1)
+        assert rsi_1h["x"] == rsi_1h["y"] == []
+
+        # reopened series are appended after their last point
+        assert not reader.has_series("rsi", "1h")
+        assert await reader.log_series("rsi", "1h", {"x": [250, 260, 270], "y": [0, 0, 27]}, METADATA) == 1
+        await reader.flush()
+        assert len(await reader.all(enums.DBTables.SERIES.value)) == 2
+        rsi_1h, = await reader.select_series(title="rsi", time_frame="1h", min_x=250)
+        assert (rsi_1h["x"], rsi_1h["y"]) == ([250, 260, 270], [25, 26, 27])
+
+
+@pytest.mark.parametrize("database_adaptor", ADAPTORS)
+async def test_log_series_write_open_chunk(tmp_path, database_adaptor):
+    path = _db_path(tmp_path, database_adaptor)
+    async with databases.DBWriterReader.database(path, database_adaptor=database_adaptor) as writer:
+        assert await writer.log_series("rsi", "1h", {"x": [0, 10], "y": [0, 1]}, METADATA) == 2
+        # open chunk is only written on flush
+        assert await writer.all(enums.DBTables.SERIES_CHUNKS.value) == []
+        # live values: open chunk is written right away and updated with each new point
+        assert await writer.log_series("rsi", "1h", {"x": [20], "y": [2]}, METADATA, write_open_chunk=True) == 1
+        rsi_1h, = await writer.select_series(title="rsi", time_frame="1h")
+        assert (rsi_1h["x"], rsi_1h["y"]) == ([0, 10, 20], [0, 1, 2])
+        assert await writer.log_series("rsi", "1h", {"x": [30], "y": [3]}, METADATA, write_open_chunk=True) == 1
+        assert len(await writer.all(enums.DBTables.SERIES_CHUNKS.value)) == 1
+        rsi_1h, = await writer.select_series(title="rsi", time_frame="1h")
+        assert (rsi_1h["x"], rsi_1h["y"]) == ([0, 10, 20, 30], [0, 1, 2, 3])
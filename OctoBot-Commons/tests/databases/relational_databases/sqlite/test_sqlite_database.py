@@ -46,10 +46,10 @@ async def get_database(data_file=DATA_FILE1):
 
 # use context manager instead of fixture to prevent pytest threads issues
 @contextlib.asynccontextmanager
-async def get_temp_empty_database():
+async def get_temp_empty_database(**kwargs):
     database_name = "temp_empty_database"
     try:
-        async with databases.new_sqlite_database(database_name) as db:
+        async with databases.new_sqlite_database(database_name, **kwargs) as db:
             yield db
     finally:
         # prevent "generator didn't stop after athrow(), see https://github.com/python-trio/trio/issues/2081"
@@ -147,6 +147,23 @@ async def test_select_from_timestamp():
         assert len(candles) == 0
 
 
+async def test_select_distinct():
+    async with get_database() as database:
+        timestamps = await database.select_distinct(OHLCV, ["timestamp"], time_frame="1h")
+        assert len(timestamps) == 500
+        assert timestamps[0] == (1589742000,)
+        assert timestamps == sorted(timestamps, reverse=True)
+
+        operations = [enums.DataBaseOperations.INF_EQUALS.value, enums.DataBaseOperations.SUP_EQUALS.value]
+        timestamps = await database.select_distinct(OHLCV, ["timestamp"],
+                                                    ["1587960000", "1587945600"],
+                                                    operations,
+                                                    sort=enums.DataBaseOrderBy.ASC.value,
+                                                    time_frame="1h")
+        assert timestamps == [(timestamp,) for timestamp in range(1587945600, 1587960001, 3600)]
+        assert await database.select_distinct(OHLCV, ["timestamp"], symbol="xyz") == []
+
+
 async def test_gather_concurrent_select():
     async with get_database() as database:
         timestamps_1h = [ohlcv[0] for ohlcv in await database.select(OHLCV, time_frame="1h")]
@@ -241,6 +258,69 @@ async def test_insert_all():
         assert await temp_empty_database.select(OHLCV, date="05") == [(2, 'abc', '10', '05')]
 
 
+async def test_insert_quoted_value():
+    async with get_temp_empty_database() as temp_empty_database:
+        await temp_empty_database.insert(OHLCV, 1, symbol="x'yz", price=None)
+        assert await temp_empty_database.select(OHLCV) == [(1, "x'yz", 'None')]
+        await temp_empty_database.update(OHLCV, {"price": "'1'"}, symbol="x'yz")
+        assert await temp_empty_database.select(OHLCV) == [(1, "x'yz", "'1'")]
+        # where values are bound: quotes are not interpreted
+        await temp_empty_database.update(OHLCV, {"price": "2"}, symbol="x' OR '1'='1")
+        assert await temp_empty_database.select(OHLCV) == [(1, "x'yz", "'1'")]
+        await temp_empty_database.update(OHLCV, {"price": "3"}, timestamp=1, symbol="x'yz", date=None)
+        assert await temp_empty_database.select(OHLCV) == [(1, "x'yz", "3")]
+
+
+async def test_insert_many():
+    async with get_temp_empty_database() as temp_empty_database:
+        await temp_empty_database.insert_many(OHLCV, ["symbol", "price"], [])
+        assert await temp_empty_database.select(OHLCV) == []
+        await temp_empty_database.insert_many(OHLCV, ["symbol", "price"], [(1, "xyz", "1"), (2, "abc", 10)])
+        # values are bound as is
+        assert await temp_empty_database.select(OHLCV) == [(2, 'abc', 10), (1, 'xyz', '1')]
+
+
+async def test_commit_interval():
+    async with get_temp_empty_database(commit_interval=3) as temp_empty_database:
+        with mock.patch.object(temp_empty_database.connection, "commit",
+                               mock.AsyncMock(wraps=temp_empty_database.connection.commit)) as commit_mock:
+            await temp_empty_database.insert(OHLCV, 1, symbol="xyz")
+            await temp_empty_database.update(OHLCV, {"symbol": "abc"}, symbol="xyz")
+            commit_mock.assert_not_called()
+            # uncommitted changes are visible from the database connection
+            assert await temp_empty_database.select(OHLCV) == [(1, 'abc')]
+            await temp_empty_database.insert_all(OHLCV, timestamp=[2, 3], symbol="xyz")
+            commit_mock.assert_awaited_once()
+            await temp_empty_database.commit()
+            commit_mock.assert_awaited_once()
+            await temp_empty_database.insert(OHLCV, 4, symbol="xyz")
+            await temp_empty_database.commit()
+            assert commit_mock.await_count == 2
+
+
+async def test_write_ahead_logging():
+    database_name = "temp_empty_database"
+    try:
+        async with get_temp_empty_database(journal_mode=databases.SQLiteDatabase.JOURNAL_MODE_WAL,
+                                           synchronous=databases.SQLiteDatabase.SYNCHRONOUS_NORMAL,
+                                           commit_interval=100) as temp_empty_database:
+            await temp_empty_database.insert_many(OHLCV, ["symbol"], [(i, "xyz") for i in range(10)])
+            async with temp_empty_database.aio_cursor() as cursor:
+                await cursor.execute("PRAGMA journal_mode")
+                assert await cursor.fetchall() == [("wal",)]
+            assert os.path.isfile(f"{database_name}-wal")
+            # pending changes are committed and the write-ahead log is merged on stop
+            await temp_empty_database.stop()
+            assert not os.path.isfile(f"{database_name}-wal")
+            await temp_empty_database.initialize()
+            assert await temp_empty_database.select_count(OHLCV, ["*"]) == [(10,)]
+            async with temp_empty_database.aio_cursor() as cursor:
+                await cursor.execute("PRAGMA journal_mode")
+                assert await cursor.fetchall() == [("wal",)]
+    finally:
+        assert not os.path.isfile(f"{database_name}-wal")
+
+
 async def test_create_index():
     async with get_temp_empty_database() as temp_empty_database:
         await temp_empty_database.insert(OHLCV, 1, symbol="xyz", price="1", date="01")
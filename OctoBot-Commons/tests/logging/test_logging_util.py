@@ -13,6 +13,7 @@
 #
 #  You should have received a copy of the GNU Lesser General Public
 #  License along with this library.
+import asyncio
 import mock
 import pytest
 
@@ -74,3 +75,103 @@ def test_exception(logger, call_wrapper):
 
     logger.exception(err, True, "error", skip_post_callback=True)
     call_wrapper.callback_mock.assert_not_called()
+
+
+def test_add_log_keeps_last_logs():
+    logging_util.logs_database[logging.LOG_DATABASE].clear()
+    for index in range(logging.LOGS_MAX_COUNT + 10):
+        logging.add_log(logging_util.logging.WARNING, "test", f"log {index}", call_notifiers=False)
+    logs = list(logging_util.logs_database[logging.LOG_DATABASE])
+    assert len(logs) == logging.LOGS_MAX_COUNT
+    assert logs[0]["Message"] == "log 10"
+    assert logs[-1]["Message"] == f"log {logging.LOGS_MAX_COUNT + 9}"
+
+
+def test_repeated_logs_rate_limit(logger):
+    logging_util.logs_database[logging.LOG_DATABASE].clear()
+    logging.reset_errors_count()
+    for _ in range(logging_util.REPEATED_LOGS_MAX_COUNT + 10):
+        logger.error("repeated error", skip_post_callback=True)
+    logger.error("other error", skip_post_callback=True)
+    messages = [log["Message"] for log in logging_util.logs_database[logging.LOG_DATABASE]]
+    assert messages == ["repeated error"] * logging_util.REPEATED_LOGS_MAX_COUNT + ["other error"]
+    # skipped errors are counted
+    assert logging.get_errors_count() == logging_util.REPEATED_LOGS_MAX_COUNT + 11
+
+    logger.error("other error", skip_post_callback=True)
+    with mock.patch.object(logging_util, "REPEATED_LOGS_MAX_COUNT", 2):
+        logger.error("other error", skip_post_callback=True)
+        with mock.patch.object(logging_util, "REPEATED_LOGS_INTERVAL", 0):
+            # new interval
+            logger.error("other error", skip_post_callback=True)
+    messages = [log["Message"] for log in logging_util.logs_database[logging.LOG_DATABASE]]
+    assert messages[-3:] == ["other error", "other error", "other error (repeated 1 more times)"]
+
+
+def test_repeated_logs_rate_limit_per_message(logger):
+    logging_util.logs_database[logging.LOG_DATABASE].clear()
+    logging_util._last_stored_logs.clear()
+    with mock.patch.object(logging_util, "REPEATED_LOGS_MAX_COUNT", 2):
+        for _ in range(5):
+            # alternated messages are rate limited as well
+            logger.error("error 1", skip_post_callback=True)
+            logger.error("error 2", skip_post_callback=True)
+        with mock.patch.object(logging_util, "REPEATED_LOGS_INTERVAL", 0):
+            # new interval: skipped counts are kept for each message
+            logger.error("error 1", skip_post_callback=True)
+            logger.error("error 2", skip_post_callback=True)
+        with mock.patch.object(logging_util, "REPEATED_LOGS_MAX_TRACKED_COUNT", 1):
+            logger.error("error 3", skip_post_callback=True)
+            assert list(logging_util._last_stored_logs) == [("test", "error 3", logging_util.logging.ERROR)]
+    messages = [log["Message"] for log in logging_util.logs_database[logging.LOG_DATABASE]]
+    assert messages == [
+        "error 1", "error 2", "error 1", "error 2",
+        "error 1 (repeated 3 more times)", "error 2 (repeated 3 more times)",
+        "error 3"
+    ]
+
+
+def test_error_notifications_without_event_loop(logger):
+    notifier = mock.Mock()
+    logging.register_error_notifier(notifier)
+    try:
+        logger.error("error", skip_post_callback=True)
+        # no event loop to call notifiers from: called right away
+        notifier.assert_called_once_with()
+        notifier.reset_mock()
+        logging.flush_log_notifications()
+        notifier.assert_not_called()
+    finally:
+        logging.error_notifier_callbacks.remove(notifier)
+
+
+@pytest.mark.asyncio
+async def test_batched_error_notifications(logger):
+    notifier = mock.Mock()
+    logging.register_error_notifier(notifier)
+    try:
+        with mock.patch.object(logging_util, "LOGS_NOTIFICATION_INTERVAL", 10):
+            for index in range(logging_util.LOGS_NOTIFICATION_BATCH_SIZE - 1):
+                logger.error(f"error {index}", skip_post_callback=True)
+            # waiting for batch size or timer
+            notifier.assert_not_called()
+            logger.error("last error", skip_post_callback=True)
+            # batch size reached
+            notifier.assert_called_once_with()
+            notifier.reset_mock()
+            logger.error("new error", skip_post_callback=True)
+            notifier.assert_not_called()
+            logging.flush_log_notifications()
+            notifier.assert_called_once_with()
+            notifier.reset_mock()
+            logging.flush_log_notifications()
+            # nothing to notify
+            notifier.assert_not_called()
+        with mock.patch.object(logging_util, "LOGS_NOTIFICATION_INTERVAL", 0.01):
+            logger.error("timer error", skip_post_callback=True)
+            notifier.assert_not_called()
+            await asyncio.sleep(0.2)
+            # notified from the event loop
+            notifier.assert_called_once_with()
+    finally:
+        logging.error_notifier_callbacks.remove(notifier)
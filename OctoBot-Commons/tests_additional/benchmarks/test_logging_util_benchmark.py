@@ -0,0 +1,86 @@
+#  Drakkar-Software OctoBot-Commons
+#  Copyright (c) Drakkar-Software, All rights reserved.
+#
+#  This library is free software; you can redistribute it and/or
+#  modify it under the terms of the GNU Lesser General Public
+#  License as published by the Free Software Foundation; either
+#  version 3.0 of the License, or (at your option) any later version.
+#
+#  This library is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the GNU
+#  Lesser General Public License for more details.
+#
+#  You should have received a copy of the GNU Lesser General Public
+#  License along with this library.
+import json
+import time
+import mock
+import pytest
+
+import octobot_commons.logging as logging
+import octobot_commons.logging.logging_util as logging_util
+
+# candles of a backtesting run, a verbose strategy logs a few warnings at each candle
+CANDLES_COUNT = 5000
+STRATEGIES_COUNT = 4
+
+# backtesting logs are emitted from the bot event loop
+pytestmark = pytest.mark.asyncio
+
+
+class _TrimmedListLogs(list):
+    # previous logs storage: a list trimmed from its first element
+    def append(self, log):
+        super().append(log)
+        if len(self) > logging.LOGS_MAX_COUNT:
+            self.pop(0)
+
+
+def _web_interface_notifier():
+    # general notifications are serialized and sent to every web interface client
+    json.dumps({"errors_count": logging.get_errors_count()})
+
+
+def _run_backtesting(loggers):
+    logging_util.logs_database[logging.LOG_DATABASE].clear()
+    t0 = time.perf_counter()
+    for candle in range(CANDLES_COUNT):
+        for logger in loggers:
+            logger.warning("Not enough funds to create a new order")
+            logger.warning(f"Skipping signal at candle {candle}")
+            logger.error(f"Failed to cancel order {candle}", skip_post_callback=True)
+    elapsed = time.perf_counter() - t0
+    logging.flush_log_notifications()
+    return CANDLES_COUNT * len(loggers) * 3 / elapsed
+
+
+async def test_backtesting_log_calls_per_second():
+    loggers = [logging.get_logger(f"VerboseStrategy{index}") for index in range(STRATEGIES_COUNT)]
+    for logger in loggers:
+        # only measure the bot logging pipeline
+        logger.logger.propagate = False
+        logger.logger.handlers = [logging_util.logging.NullHandler()]
+    notifier = mock.Mock(side_effect=_web_interface_notifier)
+    logging.register_error_notifier(notifier)
+    origin_logs = logging_util.logs_database[logging.LOG_DATABASE]
+    try:
+        logging_util.logs_database[logging.LOG_DATABASE] = _TrimmedListLogs()
+        with mock.patch.object(logging_util, "LOGS_NOTIFICATION_BATCH_SIZE", 1), \
+                mock.patch.object(logging_util, "REPEATED_LOGS_MAX_COUNT", CANDLES_COUNT):
+            unbatched_logs_per_second = _run_backtesting(loggers)
+        unbatched_notifications_count = notifier.call_count
+        notifier.reset_mock()
+        logging_util.logs_database[logging.LOG_DATABASE] = origin_logs
+        logs_per_second = _run_backtesting(loggers)
+        assert 0 < notifier.call_count < unbatched_notifications_count
+    finally:
+        logging_util.logs_database[logging.LOG_DATABASE] = origin_logs
+        logging.error_notifier_callbacks.remove(notifier)
+        for logger in loggers:
+            logger.logger.propagate = True
+            logger.logger.handlers = []
+    # last logs are kept
+    assert len(origin_logs) == logging.LOGS_MAX_COUNT
+    assert origin_logs[-1]["Message"] == f"Failed to cancel order {CANDLES_COUNT - 1}"
+    assert logs_per_second > unbatched_logs_per_second
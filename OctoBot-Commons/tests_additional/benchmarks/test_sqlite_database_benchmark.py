@@ -0,0 +1,79 @@
+#  Drakkar-Software OctoBot
+#  Copyright (c) Drakkar-Software, All rights reserved.
+#
+#  This library is free software; you can redistribute it and/or
+#  modify it under the terms of the GNU Lesser General Public
+#  License as published by the Free Software Foundation; either
+#  version 3.0 of the License, or (at your option) any later version.
+#
+#  This library is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the GNU
+#  Lesser General Public License for more details.
+#
+#  You should have received a copy of the GNU Lesser General Public
+#  License along with this library.
+import json
+import os
+import random
+import time
+import mock
+import pytest
+
+import octobot_commons.asyncio_tools as asyncio_tools
+import octobot_commons.databases as databases
+
+# All test coroutines will be treated as marked.
+pytestmark = pytest.mark.asyncio
+
+ORDER_BOOK = mock.Mock(value="order_book")
+RECENT_TRADES = mock.Mock(value="recent_trades")
+# increase TICKS_COUNT to measure rows per second on multi-GB collector files (~2.5KB per tick)
+TICKS_COUNT = 5000
+# committing after each write is way too slow to run TICKS_COUNT ticks
+LEGACY_TICKS_COUNT = 1000
+ORDER_BOOK_DEPTH = 20
+RECENT_TRADES_COUNT = 10
+
+
+def _generate_ticks(ticks_count):
+    # order book and recent trades snapshots like a live exchange data collector
+    rand = random.Random(42)
+    ticks = []
+    for timestamp in range(ticks_count):
+        price = 10000 + rand.random() * 100
+        asks = json.dumps([[price + index, rand.random()] for index in range(ORDER_BOOK_DEPTH)])
+        bids = json.dumps([[price - index, rand.random()] for index in range(ORDER_BOOK_DEPTH)])
+        trades = [json.dumps({"price": price, "amount": rand.random()}) for _ in range(RECENT_TRADES_COUNT)]
+        ticks.append((timestamp, asks, bids, trades))
+    return ticks
+
+
+async def _collect(database_name, ticks, **kwargs):
+    try:
+        t0 = time.perf_counter()
+        async with databases.new_sqlite_database(database_name, **kwargs) as database:
+            for timestamp, asks, bids, trades in ticks:
+                await database.insert(ORDER_BOOK, timestamp, exchange_name="binance", symbol="BTC/USDT",
+                                      asks=asks, bids=bids)
+                await database.insert_all(RECENT_TRADES, [timestamp] * len(trades), exchange_name="binance",
+                                          symbol="BTC/USDT", recent_trades=trades)
+        elapsed = time.perf_counter() - t0
+        async with databases.new_sqlite_database(database_name) as database:
+            assert await database.select_count(ORDER_BOOK, ["*"]) == [(len(ticks),)]
+            assert await database.select_count(RECENT_TRADES, ["*"]) == [(len(ticks) * RECENT_TRADES_COUNT,)]
+        # prevent "generator didn't stop after athrow(), see https://github.com/python-trio/trio/issues/2081"
+        await asyncio_tools.wait_asyncio_next_cycle()
+        return len(ticks) * (1 + RECENT_TRADES_COUNT) / elapsed
+    finally:
+        os.remove(database_name)
+
+
+async def test_collector_rows_per_second():
+    ticks = _generate_ticks(TICKS_COUNT)
+    legacy_rows_per_second = await _collect("temp_legacy_collector_database", ticks[:LEGACY_TICKS_COUNT])
+    rows_per_second = await _collect("temp_collector_database", ticks,
+                                     journal_mode=databases.SQLiteDatabase.JOURNAL_MODE_WAL,
+                                     synchronous=databases.SQLiteDatabase.SYNCHRONOUS_NORMAL,
+                                     commit_interval=10000)
+    assert rows_per_second > legacy_rows_per_second
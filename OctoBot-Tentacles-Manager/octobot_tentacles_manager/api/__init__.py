@@ -61,6 +61,7 @@ from octobot_tentacles_manager.api.configurator import (
     refresh_profile_tentacles_setup_config,
     get_code_hash,
     get_config_hash,
+    clear_tentacles_hashes,
 )
 from octobot_tentacles_manager.api.updater import (
     update_all_tentacles,
@@ -121,6 +122,7 @@ __all__ = [
     "set_tentacles_setup_configuration_path",
     "get_code_hash",
     "get_config_hash",
+    "clear_tentacles_hashes",
     "ensure_setup_configuration",
     "refresh_profile_tentacles_setup_config",
     "update_all_tentacles",
@@ -161,3 +161,7 @@ def get_code_hash(tentacles: list) -> str:
 def get_config_hash(tentacles: list,
                     tentacles_setup_config: configuration.TentaclesSetupConfiguration) -> str:
     return util.get_tentacles_config_hash(tentacles, tentacles_setup_config)
+
+
+def clear_tentacles_hashes() -> None:
+    util.clear_tentacles_hashes()
@@ -23,6 +23,7 @@ from octobot_tentacles_manager.configuration.tentacles_setup_configuration impor
 )
 from octobot_tentacles_manager.configuration.tentacle_configuration import (
     get_config,
+    get_config_file_path,
     update_config,
     factory_reset_config,
     get_config_schema_path,
@@ -37,6 +38,7 @@ from octobot_tentacles_manager.configuration.config_file import (
 __all__ = [
     "TentaclesSetupConfiguration",
     "get_config",
+    "get_config_file_path",
     "update_config",
     "factory_reset_config",
     "get_config_schema_path",
@@ -26,6 +26,10 @@ def get_config(tentacles_setup_config, klass) -> dict:
     return configuration.read_config(_get_config_file_path(tentacles_setup_config, klass))
 
 
+def get_config_file_path(tentacles_setup_config, klass) -> str:
+    return _get_config_file_path(tentacles_setup_config, klass)
+
+
 def update_config(tentacles_setup_config, klass, config_update) -> None:
     config_file = _get_config_file_path(tentacles_setup_config, klass)
     current_config = configuration.read_config(config_file)
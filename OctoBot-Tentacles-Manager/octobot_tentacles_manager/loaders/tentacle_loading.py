@@ -33,6 +33,8 @@ def reload_tentacle_by_tentacle_class(tentacles_path=constants.TENTACLES_PATH):
         for tentacle in loaded_tentacles
         for klass in tentacle.tentacle_class_names
     }
+    # tentacles code and configuration might have changed
+    util.clear_tentacles_hashes()
 
 
 def get_tentacle_classes() -> dict:
@@ -50,6 +50,9 @@ from octobot_tentacles_manager.util.tentacle_cleaner import (
     remove_dir_or_file,
 )
 from octobot_tentacles_manager.util.hashing import (
+    TentaclesHashes,
+    get_tentacles_hashes,
+    clear_tentacles_hashes,
     get_tentacles_code_hash,
     get_tentacles_config_hash,
 )
@@ -57,6 +60,9 @@ from octobot_tentacles_manager.util.hashing import (
 __all__ = [
     "cleanup_temp_dirs",
     "remove_dir_or_file",
+    "TentaclesHashes",
+    "get_tentacles_hashes",
+    "clear_tentacles_hashes",
     "get_tentacles_code_hash",
     "get_tentacles_config_hash",
     "remove_dir_or_file_from_path",
@@ -13,6 +13,7 @@
 #
 #  You should have received a copy of the GNU Lesser General Public
 #  License along with this library.
+import os
 import json
 import inspect
 import hashlib
@@ -20,20 +21,108 @@ import hashlib
 import octobot_tentacles_manager.configuration.tentacle_configuration as tentacle_configuration
 
 
+class TentaclesHashes:
+    """
+    Memoizes tentacles code hashes and configuration files.
+    Code is read again when its source file is modified, configuration files are read again
+    when they are modified. Call clear() to invalidate everything when tentacles are reloaded.
+    """
+    def __init__(self):
+        # code location: (source file path, source file mtime, source code)
+        self._sources = {}
+        # code locations and source files mtimes: code hash
+        self._code_hashes = {}
+        # configuration file path: (file mtime, json configuration)
+        self._file_configs = {}
+
+    def get_code_hash(self, tentacles: list) -> str:
+        sources_key = tuple(
+            self._get_source_key(_get_code_location(linked_tentacle))
+            for linked_tentacle in tentacles
+        )
+        try:
+            return self._code_hashes[sources_key]
+        except KeyError:
+            full_code = "".join(
+                self._sources[code_location][2]
+                for code_location, _ in sources_key
+            )
+            code_hash = self._code_hashes[sources_key] = hashlib.sha256(full_code.encode()).hexdigest()
+            return code_hash
+
+    def get_config_hash(self, identifying_tentacles: list, tentacles_setup_config) -> str:
+        # configurations are not memoized by content: hashing them is as fast as looking them up
+        full_config = "".join(
+            json.dumps(linked_tentacle.specific_config)
+            if hasattr(linked_tentacle, "specific_config") and linked_tentacle.specific_config
+            else self._get_file_config(tentacles_setup_config, linked_tentacle.__class__)
+            for linked_tentacle in identifying_tentacles
+        )
+        return hashlib.sha256(full_config.encode()).hexdigest()
+
+    def clear(self):
+        self._sources.clear()
+        self._code_hashes.clear()
+        self._file_configs.clear()
+
+    def _get_source_key(self, code_location) -> tuple:
+        try:
+            source_file, mtime, _ = self._sources[code_location]
+            if _get_mtime(source_file) == mtime:
+                return code_location, mtime
+        except KeyError:
+            source_file = _get_source_file(code_location)
+        mtime = _get_mtime(source_file)
+        self._sources[code_location] = (source_file, mtime, inspect.getsource(code_location))
+        return code_location, mtime
+
+    def _get_file_config(self, tentacles_setup_config, klass) -> str:
+        config_file = tentacle_configuration.get_config_file_path(tentacles_setup_config, klass)
+        mtime = _get_mtime(config_file)
+        try:
+            config_mtime, config = self._file_configs[config_file]
+            if config_mtime == mtime:
+                return config
+        except KeyError:
+            pass
+        config = json.dumps(tentacle_configuration.get_config(tentacles_setup_config, klass))
+        self._file_configs[config_file] = (mtime, config)
+        return config
+
+
+def _get_code_location(linked_tentacle):
+    return linked_tentacle.get_script() if hasattr(linked_tentacle, "get_script") \
+        else linked_tentacle.__class__
+
+
+def _get_source_file(code_location):
+    try:
+        return inspect.getsourcefile(code_location)
+    except TypeError:
+        return None
+
+
+def _get_mtime(file_path):
+    try:
+        return os.path.getmtime(file_path)
+    except (TypeError, OSError):
+        return None
+
+
+_TENTACLES_HASHES = TentaclesHashes()
+
+
+def get_tentacles_hashes() -> TentaclesHashes:
+    return _TENTACLES_HASHES
+
+
+def clear_tentacles_hashes() -> None:
+    _TENTACLES_HASHES.clear()
+
+
 def get_tentacles_code_hash(tentacles: list) -> str:
-    full_code = ""
-    for linked_tentacle in tentacles:
-        code_location = linked_tentacle.get_script() if hasattr(linked_tentacle, "get_script") \
-            else linked_tentacle.__class__
-        full_code = f"{full_code}{inspect.getsource(code_location)}"
-    return hashlib.sha256(full_code.encode()).hexdigest()
+    return _TENTACLES_HASHES.get_code_hash(tentacles)
 
 
 def get_tentacles_config_hash(identifying_tentacles: list, tentacles_setup_config) -> str:
-    full_config = ""
-    for linked_tentacle in identifying_tentacles:
-        config = linked_tentacle.specific_config if hasattr(linked_tentacle, "specific_config") \
-            and linked_tentacle.specific_config else \
-            tentacle_configuration.get_config(tentacles_setup_config, linked_tentacle.__class__)
-        full_config = f"{full_config}{json.dumps(config)}"
-    return hashlib.sha256(full_config.encode()).hexdigest()
+    return _TENTACLES_HASHES.get_config_hash(identifying_tentacles, tentacles_setup_config)
@@ -0,0 +1,82 @@
+#  Drakkar-Software OctoBot-Tentacles-Manager
+#  Copyright (c) Drakkar-Software, All rights reserved.
+#
+#  This library is free software; you can redistribute it and/or
+#  modify it under the terms of the GNU Lesser General Public
+#  License as published by the Free Software Foundation; either
+#  version 3.0 of the License, or (at your option) any later version.
+#
+#  This library is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the GNU
+#  Lesser General Public License for more details.
+#
+#  You should have received a copy of the GNU Lesser General Public
+#  License along with this library.
+import os
+import sys
+import json
+import inspect
+import hashlib
+import importlib.util
+import unittest.mock as mock
+
+import octobot_tentacles_manager.util.hashing as hashing
+
+
+def _load_tentacle_class(tmp_path, code):
+    module_path = os.path.join(tmp_path, "tentacle_module.py")
+    with open(module_path, "w") as module_file:
+        module_file.write(code)
+    spec = importlib.util.spec_from_file_location(f"tentacle_module_{tmp_path.name}", module_path)
+    module = importlib.util.module_from_spec(spec)
+    sys.modules[spec.name] = module
+    spec.loader.exec_module(module)
+    return module.Tentacle, module_path
+
+
+def _naive_code_hash(tentacles):
+    return hashlib.sha256("".join(inspect.getsource(tentacle.__class__) for tentacle in tentacles).encode()).hexdigest()
+
+
+def test_get_code_hash(tmp_path):
+    tentacles_hashes = hashing.TentaclesHashes()
+    tentacle_class, module_path = _load_tentacle_class(tmp_path, "class Tentacle:\n    pass\n")
+    tentacles = [tentacle_class(), tentacle_class()]
+    code_hash = tentacles_hashes.get_code_hash(tentacles)
+    assert code_hash == _naive_code_hash(tentacles)
+    with mock.patch.object(inspect, "getsource", mock.Mock()) as getsource_mock:
+        # memoized
+        assert tentacles_hashes.get_code_hash(tentacles) == code_hash
+        getsource_mock.assert_not_called()
+
+    # source file is updated: hash is computed again
+    with open(module_path, "w") as module_file:
+        module_file.write("class Tentacle:\n    value = 1\n")
+    os.utime(module_path, (0, os.path.getmtime(module_path) + 10))
+    updated_code_hash = tentacles_hashes.get_code_hash(tentacles)
+    assert updated_code_hash != code_hash
+    assert updated_code_hash == _naive_code_hash(tentacles)
+
+
+def test_get_config_hash():
+    tentacles_hashes = hashing.TentaclesHashes()
+    tentacle = mock.Mock(specific_config={"period": 14})
+    other_tentacle = mock.Mock(specific_config={"period": 21})
+    config_hash = tentacles_hashes.get_config_hash([tentacle, other_tentacle], None)
+    assert config_hash == hashlib.sha256(
+        f"{json.dumps(tentacle.specific_config)}{json.dumps(other_tentacle.specific_config)}".encode()
+    ).hexdigest()
+    assert tentacles_hashes.get_config_hash([tentacle, other_tentacle], None) == config_hash
+    tentacle.specific_config["period"] = 12
+    assert tentacles_hashes.get_config_hash([tentacle, other_tentacle], None) != config_hash
+
+
+def test_clear(tmp_path):
+    tentacles_hashes = hashing.TentaclesHashes()
+    tentacle_class, _ = _load_tentacle_class(tmp_path, "class Tentacle:\n    pass\n")
+    code_hash = tentacles_hashes.get_code_hash([tentacle_class()])
+    tentacles_hashes.clear()
+    with mock.patch.object(inspect, "getsource", mock.Mock(return_value="")) as getsource_mock:
+        assert tentacles_hashes.get_code_hash([tentacle_class()]) != code_hash
+        getsource_mock.assert_called_once_with(tentacle_class)
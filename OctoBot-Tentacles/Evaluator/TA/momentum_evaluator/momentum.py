@@ -24,6 +24,7 @@ import octobot_commons.data_util as data_util
 import octobot_evaluators.evaluators as evaluators
 import octobot_evaluators.util as evaluators_util
 import octobot_trading.api as trading_api
+import octobot_trading.exchange_data as trading_exchange_data
 import tentacles.Evaluator.Util as EvaluatorUtil
 
 
@@ -45,15 +46,25 @@ class RSIMomentumEvaluator(evaluators.TAEvaluator):
 
     async def ohlcv_callback(self, exchange: str, exchange_id: str,
                              cryptocurrency: str, symbol: str, time_frame, candle, inc_in_construction_data):
-        candle_data = trading_api.get_symbol_close_candles(self.get_exchange_symbol_data(exchange, exchange_id, symbol),
-                                                           time_frame,
-                                                           include_in_construction=inc_in_construction_data)
-        await self.evaluate(cryptocurrency, symbol, time_frame, candle_data, candle)
+        symbol_candles = self.get_exchange_symbol_data(exchange, exchange_id, symbol)
+        rsi_indicator = _get_indicator(symbol_candles, time_frame, inc_in_construction_data,
+                                       trading_exchange_data.RSIIndicator, self.period_length)
+        if rsi_indicator is None:
+            candle_data = trading_api.get_symbol_close_candles(symbol_candles,
+                                                               time_frame,
+                                                               include_in_construction=inc_in_construction_data)
+            await self.evaluate(cryptocurrency, symbol, time_frame, candle_data, candle)
+        else:
+            await self._evaluate_rsi(cryptocurrency, symbol, time_frame, rsi_indicator.get_values(), candle)
 
     async def evaluate(self, cryptocurrency, symbol, time_frame, candle_data, candle):
+        rsi_v = None
         if candle_data is not None and len(candle_data) > self.period_length:
             rsi_v = tulipy.rsi(candle_data, period=self.period_length)
+        await self._evaluate_rsi(cryptocurrency, symbol, time_frame, rsi_v, candle)
 
+    async def _evaluate_rsi(self, cryptocurrency, symbol, time_frame, rsi_v, candle):
+        if rsi_v is not None:
             if len(rsi_v) and not math.isnan(rsi_v[-1]):
                 long_trend = EvaluatorUtil.TrendAnalysis.get_trend(rsi_v, self.long_term_averages)
                 short_trend = EvaluatorUtil.TrendAnalysis.get_trend(rsi_v, self.short_term_averages)
@@ -193,10 +204,8 @@ class RSIWeightMomentumEvaluator(evaluators.TAEvaluator):
 
     def _get_rsi_averages(self, symbol_candles, time_frame, include_in_construction):
         # compute the slow and fast RSI average
-        candle_data = trading_api.get_symbol_close_candles(symbol_candles, time_frame,
-                                                           include_in_construction=include_in_construction)
-        if len(candle_data) > self.period_length:
-            rsi_v = tulipy.rsi(candle_data, period=self.period_length)
+        rsi_v = _get_rsi_values(symbol_candles, time_frame, self.period_length, include_in_construction)
+        if rsi_v is not None:
             rsi_v = data_util.drop_nan(rsi_v)
             if len(rsi_v):
                 slow_average = numpy.mean(rsi_v[-self.slow_eval_count:])
@@ -273,18 +282,36 @@ class BBMomentumEvaluator(evaluators.TAEvaluator):
 
     async def ohlcv_callback(self, exchange: str, exchange_id: str,
                              cryptocurrency: str, symbol: str, time_frame, candle, inc_in_construction_data):
-        candle_data = trading_api.get_symbol_close_candles(self.get_exchange_symbol_data(exchange, exchange_id, symbol),
+        symbol_candles = self.get_exchange_symbol_data(exchange, exchange_id, symbol)
+        candle_data = trading_api.get_symbol_close_candles(symbol_candles,
                                                            time_frame,
                                                            self.period_length,
                                                            include_in_construction=inc_in_construction_data)
-        await self.evaluate(cryptocurrency, symbol, time_frame, candle_data, candle)
+        bbands_indicator = None
+        if len(candle_data) >= self.period_length:
+            bbands_indicator = _get_indicator(symbol_candles, time_frame, inc_in_construction_data,
+                                              trading_exchange_data.BBandsIndicator, self.period_length, 2)
+        if bbands_indicator is None:
+            await self.evaluate(cryptocurrency, symbol, time_frame, candle_data, candle)
+        else:
+            await self._evaluate_bands(cryptocurrency, symbol, time_frame, candle_data,
+                                       bbands_indicator.get_values("lower", limit=1),
+                                       bbands_indicator.get_values("middle", limit=1),
+                                       bbands_indicator.get_values("upper", limit=1),
+                                       candle)
 
     async def evaluate(self, cryptocurrency, symbol, time_frame, candle_data, candle):
-        self.eval_note = commons_constants.START_PENDING_EVAL_NOTE
+        lower_band = middle_band = upper_band = None
         if len(candle_data) >= self.period_length:
             # compute bollinger bands
             lower_band, middle_band, upper_band = tulipy.bbands(candle_data, self.period_length, 2)
+        await self._evaluate_bands(cryptocurrency, symbol, time_frame, candle_data, lower_band, middle_band,
+                                   upper_band, candle)
 
+    async def _evaluate_bands(self, cryptocurrency, symbol, time_frame, candle_data, lower_band, middle_band,
+                              upper_band, candle):
+        self.eval_note = commons_constants.START_PENDING_EVAL_NOTE
+        if lower_band is not None and middle_band is not None and upper_band is not None:
             # if close to lower band => low value => bad,
             # therefore if close to middle, value is keeping up => good
             # finally if up the middle one or even close to the upper band => very good
@@ -352,11 +379,22 @@ class ADXMomentumEvaluator(evaluators.TAEvaluator):
         close_candles = trading_api.get_symbol_close_candles(symbol_candles, time_frame,
                                                              include_in_construction=inc_in_construction_data)
         if len(close_candles) > self._get_minimal_data():
-            high_candles = trading_api.get_symbol_high_candles(symbol_candles, time_frame,
-                                                               include_in_construction=inc_in_construction_data)
-            low_candles = trading_api.get_symbol_low_candles(symbol_candles, time_frame,
-                                                             include_in_construction=inc_in_construction_data)
-            await self.evaluate(cryptocurrency, symbol, time_frame, close_candles, high_candles, low_candles, candle)
+            adx_indicator = _get_indicator(symbol_candles, time_frame, inc_in_construction_data,
+                                           trading_exchange_data.ADXIndicator, self.period_length)
+            if adx_indicator is None:
+                high_candles = trading_api.get_symbol_high_candles(symbol_candles, time_frame,
+                                                                   include_in_construction=inc_in_construction_data)
+                low_candles = trading_api.get_symbol_low_candles(symbol_candles, time_frame,
+                                                                 include_in_construction=inc_in_construction_data)
+                await self.evaluate(cryptocurrency, symbol, time_frame, close_candles, high_candles, low_candles,
+                                    candle)
+            else:
+                instant_ema = trading_api.get_symbol_indicator(symbol_candles, time_frame,
+                                                               trading_exchange_data.EMAIndicator, 2)
+                slow_ema = trading_api.get_symbol_indicator(symbol_candles, time_frame,
+                                                            trading_exchange_data.EMAIndicator, 20)
+                await self._evaluate_adx(cryptocurrency, symbol, time_frame, adx_indicator.get_values(),
+                                         instant_ema.get_values(), slow_ema.get_values(), candle)
         else:
             self.eval_note = commons_constants.START_PENDING_EVAL_NOTE
             await self.evaluation_completed(cryptocurrency, symbol, time_frame,
@@ -364,14 +402,21 @@ class ADXMomentumEvaluator(evaluators.TAEvaluator):
                                                                                     time_frame=time_frame))
 
     async def evaluate(self, cryptocurrency, symbol, time_frame, close_candles, high_candles, low_candles, candle):
-        self.eval_note = commons_constants.START_PENDING_EVAL_NOTE
+        adx = instant_ema = slow_ema = None
         if len(close_candles) >= self._get_minimal_data():
+            adx = tulipy.adx(high_candles, low_candles, close_candles, self.period_length)
+            instant_ema = tulipy.ema(close_candles, 2)
+            slow_ema = tulipy.ema(close_candles, 20)
+        await self._evaluate_adx(cryptocurrency, symbol, time_frame, adx, instant_ema, slow_ema, candle)
+
+    async def _evaluate_adx(self, cryptocurrency, symbol, time_frame, adx, instant_ema, slow_ema, candle):
+        self.eval_note = commons_constants.START_PENDING_EVAL_NOTE
+        if adx is not None:
             min_adx = 7.5
             max_adx = 45
             neutral_adx = 25
-            adx = tulipy.adx(high_candles, low_candles, close_candles, self.period_length)
-            instant_ema = data_util.drop_nan(tulipy.ema(close_candles, 2))
-            slow_ema = data_util.drop_nan(tulipy.ema(close_candles, 20))
+            instant_ema = data_util.drop_nan(instant_ema)
+            slow_ema = data_util.drop_nan(slow_ema)
             adx = data_util.drop_nan(adx)
 
             if len(adx):
@@ -470,17 +515,31 @@ class MACDMomentumEvaluator(evaluators.TAEvaluator):
 
     async def ohlcv_callback(self, exchange: str, exchange_id: str,
                              cryptocurrency: str, symbol: str, time_frame, candle, inc_in_construction_data):
-        candle_data = trading_api.get_symbol_close_candles(self.get_exchange_symbol_data(exchange, exchange_id, symbol),
+        symbol_candles = self.get_exchange_symbol_data(exchange, exchange_id, symbol)
+        candle_data = trading_api.get_symbol_close_candles(symbol_candles,
                                                            time_frame,
                                                            include_in_construction=inc_in_construction_data)
-        await self.evaluate(cryptocurrency, symbol, time_frame, candle_data, candle)
+        macd_indicator = None
+        if len(candle_data) > self.long_period_length:
+            macd_indicator = _get_indicator(symbol_candles, time_frame, inc_in_construction_data,
+                                            trading_exchange_data.MACDIndicator, self.short_period_length,
+                                            self.long_period_length, self.signal_period_length)
+        if macd_indicator is None:
+            await self.evaluate(cryptocurrency, symbol, time_frame, candle_data, candle)
+        else:
+            await self._evaluate_macd_hist(cryptocurrency, symbol, time_frame, macd_indicator.get_values("histogram"),
+                                           candle)
 
     async def evaluate(self, cryptocurrency, symbol, time_frame, candle_data, candle):
-        self.eval_note = commons_constants.START_PENDING_EVAL_NOTE
+        macd_hist = None
         if len(candle_data) > self.long_period_length:
             macd, macd_signal, macd_hist = tulipy.macd(candle_data, self.short_period_length,
                                                        self.long_period_length, self.signal_period_length)
+        await self._evaluate_macd_hist(cryptocurrency, symbol, time_frame, macd_hist, candle)
 
+    async def _evaluate_macd_hist(self, cryptocurrency, symbol, time_frame, macd_hist, candle):
+        self.eval_note = commons_constants.START_PENDING_EVAL_NOTE
+        if macd_hist is not None:
             # on macd hist => M pattern: bearish movement, W pattern: bullish movement
             #                 max on hist: optimal sell or buy
             macd_hist = data_util.drop_nan(macd_hist)
@@ -537,14 +596,21 @@ class KlingerOscillatorMomentumEvaluator(evaluators.TAEvaluator):
         high_candles = trading_api.get_symbol_high_candles(symbol_candles, time_frame,
                                                            include_in_construction=inc_in_construction_data)
         if len(high_candles) >= self.short_period:
-            low_candles = trading_api.get_symbol_low_candles(symbol_candles, time_frame,
-                                                             include_in_construction=inc_in_construction_data)
-            close_candles = trading_api.get_symbol_close_candles(symbol_candles, time_frame,
+            kvo_indicator = _get_indicator(symbol_candles, time_frame, inc_in_construction_data,
+                                           trading_exchange_data.KVOIndicator, self.short_period, self.long_period,
+                                           self.ema_signal_period)
+            if kvo_indicator is None:
+                low_candles = trading_api.get_symbol_low_candles(symbol_candles, time_frame,
                                                                  include_in_construction=inc_in_construction_data)
-            volume_candles = trading_api.get_symbol_volume_candles(symbol_candles, time_frame,
-                                                                   include_in_construction=inc_in_construction_data)
-            await self.evaluate(cryptocurrency, symbol, time_frame, high_candles, low_candles,
-                                close_candles, volume_candles, candle)
+                close_candles = trading_api.get_symbol_close_candles(symbol_candles, time_frame,
+                                                                     include_in_construction=inc_in_construction_data)
+                volume_candles = trading_api.get_symbol_volume_candles(symbol_candles, time_frame,
+                                                                       include_in_construction=inc_in_construction_data)
+                await self.evaluate(cryptocurrency, symbol, time_frame, high_candles, low_candles,
+                                    close_candles, volume_candles, candle)
+            else:
+                await self._evaluate_kvo(cryptocurrency, symbol, time_frame,
+                                         *_get_kvo_indicator_values(kvo_indicator, self.ema_signal_period), candle)
         else:
             self.eval_note = commons_constants.START_PENDING_EVAL_NOTE
             await self.evaluation_completed(cryptocurrency, symbol, time_frame,
@@ -553,17 +619,13 @@ class KlingerOscillatorMomentumEvaluator(evaluators.TAEvaluator):
 
     async def evaluate(self, cryptocurrency, symbol, time_frame, high_candles, low_candles,
                        close_candles, volume_candles, candle):
-        eval_proposition = commons_constants.START_PENDING_EVAL_NOTE
-        kvo = tulipy.kvo(high_candles,
-                         low_candles,
-                         close_candles,
-                         volume_candles,
-                         self.short_period,
-                         self.long_period)
-        kvo = data_util.drop_nan(kvo)
-        if len(kvo) >= self.ema_signal_period:
-            kvo_ema = tulipy.ema(kvo, self.ema_signal_period)
+        kvo, kvo_ema = _get_kvo_values(high_candles, low_candles, close_candles, volume_candles,
+                                       self.short_period, self.long_period, self.ema_signal_period)
+        await self._evaluate_kvo(cryptocurrency, symbol, time_frame, kvo, kvo_ema, candle)
 
+    async def _evaluate_kvo(self, cryptocurrency, symbol, time_frame, kvo, kvo_ema, candle):
+        eval_proposition = commons_constants.START_PENDING_EVAL_NOTE
+        if kvo_ema is not None:
             ema_difference = kvo - kvo_ema
 
             if len(ema_difference) > 1:
@@ -625,14 +687,21 @@ class KlingerOscillatorReversalConfirmationMomentumEvaluator(evaluators.TAEvalua
         high_candles = trading_api.get_symbol_high_candles(symbol_candles, time_frame,
                                                            include_in_construction=inc_in_construction_data)
         if len(high_candles) >= self.short_period:
-            low_candles = trading_api.get_symbol_low_candles(symbol_candles, time_frame,
-                                                             include_in_construction=inc_in_construction_data)
-            close_candles = trading_api.get_symbol_close_candles(symbol_candles, time_frame,
+            kvo_indicator = _get_indicator(symbol_candles, time_frame, inc_in_construction_data,
+                                           trading_exchange_data.KVOIndicator, self.short_period, self.long_period,
+                                           self.ema_signal_period)
+            if kvo_indicator is None:
+                low_candles = trading_api.get_symbol_low_candles(symbol_candles, time_frame,
                                                                  include_in_construction=inc_in_construction_data)
-            volume_candles = trading_api.get_symbol_volume_candles(symbol_candles, time_frame,
-                                                                   include_in_construction=inc_in_construction_data)
-            await self.evaluate(cryptocurrency, symbol, time_frame, high_candles, low_candles,
-                                close_candles, volume_candles, candle)
+                close_candles = trading_api.get_symbol_close_candles(symbol_candles, time_frame,
+                                                                     include_in_construction=inc_in_construction_data)
+                volume_candles = trading_api.get_symbol_volume_candles(symbol_candles, time_frame,
+                                                                       include_in_construction=inc_in_construction_data)
+                await self.evaluate(cryptocurrency, symbol, time_frame, high_candles, low_candles,
+                                    close_candles, volume_candles, candle)
+            else:
+                await self._evaluate_kvo(cryptocurrency, symbol, time_frame,
+                                         *_get_kvo_indicator_values(kvo_indicator, self.ema_signal_period), candle)
         else:
             self.eval_note = False
             await self.evaluation_completed(cryptocurrency, symbol, time_frame,
@@ -641,26 +710,59 @@ class KlingerOscillatorReversalConfirmationMomentumEvaluator(evaluators.TAEvalua
 
     async def evaluate(self, cryptocurrency, symbol, time_frame, high_candles, low_candles,
                        close_candles, volume_candles, candle):
+        kvo = kvo_ema = None
         if len(high_candles) >= self.short_period:
-            kvo = tulipy.kvo(high_candles,
-                             low_candles,
-                             close_candles,
-                             volume_candles,
-                             self.short_period,
-                             self.long_period)
-            kvo = data_util.drop_nan(kvo)
-            if len(kvo) >= self.ema_signal_period:
-
-                kvo_ema = tulipy.ema(kvo, self.ema_signal_period)
-                ema_difference = kvo - kvo_ema
-
-                if len(ema_difference) > 1:
-                    zero_crossing_indexes = EvaluatorUtil.TrendAnalysis.get_threshold_change_indexes(ema_difference, 0)
-                    max_elements = 7
-                    to_consider_kvo = min(max_elements, len(ema_difference) - zero_crossing_indexes[-1])
-                    self.eval_note = EvaluatorUtil.TrendAnalysis.min_has_just_been_reached(
-                        ema_difference[-to_consider_kvo:],
-                        acceptance_window=0.9, delay=1)
+            kvo, kvo_ema = _get_kvo_values(high_candles, low_candles, close_candles, volume_candles,
+                                           self.short_period, self.long_period, self.ema_signal_period)
+        await self._evaluate_kvo(cryptocurrency, symbol, time_frame, kvo, kvo_ema, candle)
+
+    async def _evaluate_kvo(self, cryptocurrency, symbol, time_frame, kvo, kvo_ema, candle):
+        if kvo_ema is not None:
+            ema_difference = kvo - kvo_ema
+
+            if len(ema_difference) > 1:
+                zero_crossing_indexes = EvaluatorUtil.TrendAnalysis.get_threshold_change_indexes(ema_difference, 0)
+                max_elements = 7
+                to_consider_kvo = min(max_elements, len(ema_difference) - zero_crossing_indexes[-1])
+                self.eval_note = EvaluatorUtil.TrendAnalysis.min_has_just_been_reached(
+                    ema_difference[-to_consider_kvo:],
+                    acceptance_window=0.9, delay=1)
         await self.evaluation_completed(cryptocurrency, symbol, time_frame,
                                         eval_time=evaluators_util.get_eval_time(full_candle=candle,
                                                                                 time_frame=time_frame))
+
+
+def _get_indicator(symbol_candles, time_frame, include_in_construction, indicator_class, *indicator_params):
+    # incremental indicators are updated on closed candles only: in construction candles require a full computation
+    if include_in_construction:
+        return None
+    return trading_api.get_symbol_indicator(symbol_candles, time_frame, indicator_class, *indicator_params)
+
+
+def _get_rsi_values(symbol_candles, time_frame, period_length, include_in_construction):
+    rsi_indicator = _get_indicator(symbol_candles, time_frame, include_in_construction,
+                                   trading_exchange_data.RSIIndicator, period_length)
+    if rsi_indicator is None:
+        candle_data = trading_api.get_symbol_close_candles(symbol_candles, time_frame,
+                                                           include_in_construction=include_in_construction)
+        if candle_data is not None and len(candle_data) > period_length:
+            return tulipy.rsi(candle_data, period=period_length)
+        return None
+    rsi_v = rsi_indicator.get_values()
+    return rsi_v if len(rsi_v) else None
+
+
+def _get_kvo_values(high_candles, low_candles, close_candles, volume_candles, short_period, long_period,
+                    signal_period):
+    kvo = data_util.drop_nan(tulipy.kvo(high_candles,
+                                        low_candles,
+                                        close_candles,
+                                        volume_candles,
+                                        short_period,
+                                        long_period))
+    return kvo, tulipy.ema(kvo, signal_period) if len(kvo) >= signal_period else None
+
+
+def _get_kvo_indicator_values(kvo_indicator, signal_period):
+    kvo = kvo_indicator.get_values("kvo")
+    return kvo, kvo_indicator.get_values("signal") if len(kvo) >= signal_period else None
@@ -58,6 +58,12 @@ class DisplayedElements(display.DisplayTranslator):
             ]
             for db in dbs:
                 for table_name in await db.tables():
+                    if table_name == commons_enums.DBTables.SERIES_CHUNKS.value:
+                        # read with series
+                        continue
+                    if table_name == commons_enums.DBTables.SERIES.value:
+                        self._add_series(graphs_by_parts, await db.select_series(time_frame=time_frame))
+                        continue
                     display_data = await db.all(table_name)
                     if table_name == commons_enums.DBTables.INPUTS.value:
                         inputs += display_data
@@ -116,12 +122,54 @@ class DisplayedElements(display.DisplayTranslator):
                 )
         return exchange_name, symbol, time_frame
 
+    def _add_series(self, graphs_by_parts, series):
+        for element in series:
+            chart = element["chart"]
+            if chart is None:
+                continue
+            if chart in graphs_by_parts:
+                graphs_by_parts[chart][element["title"]] = element
+            else:
+                graphs_by_parts[chart] = {element["title"]: element}
+
+    def _plot_series(self, part, title, series):
+        points_count = len(series["x"])
+        y = series.get("y", None)
+        part.plot(
+            kind=series.get("kind", None),
+            x=series["x"],
+            y=y,
+            open=series.get("open", None),
+            high=series.get("high", None),
+            low=series.get("low", None),
+            close=series.get("close", None),
+            volume=series.get("volume", None),
+            title=title,
+            text=self._get_series_style_values(series, "text", points_count),
+            x_type="date",
+            # use log scale for all positive charts
+            y_type="log" if y is None or 0 <= min(value or 0 for value in y) else None,
+            mode=series.get("mode", None),
+            own_yaxis=series.get("own_yaxis", False),
+            color=self._get_series_style_values(series, "color", points_count),
+            size=self._get_series_style_values(series, "size", points_count),
+            symbol=self._get_series_style_values(series, "shape", points_count))
+
+    def _get_series_style_values(self, series, key, points_count):
+        value = series.get(key, None)
+        return None if value is None else [value] * points_count
+
     def _plot_graphs(self, graphs_by_parts):
         for part, datasets in graphs_by_parts.items():
             with self.part(part, element_type=commons_enums.DisplayedElementTypes.CHART.value) as part:
                 for title, dataset in datasets.items():
                     if not dataset:
                         continue
+                    if isinstance(dataset, dict):
+                        # columnar series
+                        if dataset["x"]:
+                            self._plot_series(part, title, dataset)
+                        continue
                     x = []
                     y = []
                     open = []
@@ -66,11 +66,8 @@ async def plot(ctx, title, x=None,
 
     x_shift = -commons_enums.TimeFramesMinutes[commons_enums.TimeFrames(ctx.time_frame)] * \
         commons_constants.MINUTE_TO_SECONDS if shift_to_open_candle_time else 0
-    if not await ctx.symbol_writer.contains_row(
-            commons_enums.DBTables.CACHE_SOURCE.value if cache_value is not None else title,
-            count_query
-    ):
-        if cache_value is not None:
+    if cache_value is not None:
+        if not await ctx.symbol_writer.contains_row(commons_enums.DBTables.CACHE_SOURCE.value, count_query):
             table = commons_enums.DBTables.CACHE_SOURCE.value
             # save x_shift to be applied when displaying and not to change actual cached values
             cache_data = {
@@ -96,86 +93,63 @@ async def plot(ctx, title, x=None,
                             & (update_query.time_frame == ctx.time_frame)
                             & (update_query.title == title))
             await ctx.symbol_writer.upsert(table, cache_data, update_query)
-        else:
-            adapted_x = None
-            if x is not None:
-                try:
-                    min_available_data = len(x)
-                except TypeError:
-                    min_available_data = None
-                if y is not None:
-                    min_available_data = len(y)
-                    if isinstance(y, list) and not isinstance(x, list):
-                        x = [x] * len(y)
-                if z is not None:
-                    min_available_data = len(z) if min_available_data is None else min(min_available_data, len(z))
-                    if isinstance(z, list) and not isinstance(z, list):
-                        x = [x] * len(z)
-                adapted_x = x[-min_available_data:] if min_available_data != len(x) else x
-            if adapted_x is None:
-                raise RuntimeError("No confirmed adapted_x")
-            adapted_x = [(a_x + x_shift) * x_multiplier for a_x in adapted_x] if isinstance(adapted_x, list) \
-                else adapted_x * x_multiplier
-            await ctx.symbol_writer.log_many(
-                title,
-                [
-                    {
-                        "x": value,
-                        "y": _get_value_from_array(y, index),
-                        "z": _get_value_from_array(z, index),
-                        "open": _get_value_from_array(open, index),
-                        "high": _get_value_from_array(high, index),
-                        "low": _get_value_from_array(low, index),
-                        "close": _get_value_from_array(close, index),
-                        "volume": _get_value_from_array(volume, index),
-                        "time_frame": ctx.time_frame,
-                        "kind": kind,
-                        "mode": mode,
-                        "line_shape": line_shape,
-                        "chart": chart,
-                        "own_yaxis": own_yaxis,
-                        "color": color,
-                        "text": text,
-                        "size": size,
-                        "shape": shape,
-                    }
-                    for index, value in enumerate(adapted_x)
-                ],
-                cache=False
-            )
-    elif cache_value is None and x is not None:
+        return
+    # plotted values are stored as a columnar series: style is stored once in the series header
+    metadata = {
+        "kind": kind,
+        "mode": mode,
+        "line_shape": line_shape,
+        "chart": chart,
+        "own_yaxis": own_yaxis,
+        "color": color,
+        "text": text,
+        "size": size,
+        "shape": shape,
+    }
+    # in live mode, points are written right away to be displayed without waiting for the series chunk to be full
+    write_open_chunk = not ctx.exchange_manager.is_backtesting
+    if not ctx.symbol_writer.has_series(title, ctx.time_frame):
+        adapted_x = None
+        if x is not None:
+            try:
+                min_available_data = len(x)
+            except TypeError:
+                min_available_data = None
+            if y is not None:
+                min_available_data = len(y)
+                if isinstance(y, list) and not isinstance(x, list):
+                    x = [x] * len(y)
+            if z is not None:
+                min_available_data = len(z) if min_available_data is None else min(min_available_data, len(z))
+                if isinstance(z, list) and not isinstance(z, list):
+                    x = [x] * len(z)
+            adapted_x = x[-min_available_data:] if min_available_data != len(x) else x
+        if adapted_x is None:
+            raise RuntimeError("No confirmed adapted_x")
+        adapted_x = [(a_x + x_shift) * x_multiplier for a_x in adapted_x] if isinstance(adapted_x, list) \
+            else adapted_x * x_multiplier
+        await ctx.symbol_writer.log_series(
+            title,
+            ctx.time_frame,
+            _get_series_columns(adapted_x, slice(None, len(adapted_x)), y=y, z=z, open=open, high=high, low=low,
+                                close=close, volume=volume),
+            metadata,
+            write_open_chunk=write_open_chunk
+        )
+    elif x is not None:
+        # only the latest value can be new: points that are already in the series are skipped
         if isinstance(y, list) and not isinstance(x, list):
             x = [x] * len(y)
         elif isinstance(z, list) and not isinstance(x, list):
             x = [x] * len(z)
-        if len(x) and \
-                not ctx.symbol_writer.contains_row(title,
-                                                   {"x": _get_value_from_array(x, -1) * x_multiplier}):
-            x_value = (_get_value_from_array(x, -1) + x_shift) * x_multiplier
-            await ctx.symbol_writer.upsert(
+        if len(x):
+            await ctx.symbol_writer.log_series(
                 title,
-                {
-                    "time_frame": ctx.time_frame,
-                    "x": x_value,
-                    "y": _get_value_from_array(y, -1),
-                    "z": _get_value_from_array(z, -1),
-                    "open": _get_value_from_array(open, -1),
-                    "high": _get_value_from_array(high, -1),
-                    "low": _get_value_from_array(low, -1),
-                    "close": _get_value_from_array(close, -1),
-                    "volume": _get_value_from_array(volume, -1),
-                    "kind": kind,
-                    "mode": mode,
-                    "line_shape": line_shape,
-                    "chart": chart,
-                    "own_yaxis": own_yaxis,
-                    "color": color,
-                    "text": text,
-                    "size": size,
-                    "shape": shape,
-                },
-                None,
-                cache_query={"x": x_value}
+                ctx.time_frame,
+                _get_series_columns([(_get_value_from_array(x, -1) + x_shift) * x_multiplier], slice(-1, None),
+                                    y=y, z=z, open=open, high=high, low=low, close=close, volume=volume),
+                metadata,
+                write_open_chunk=write_open_chunk
             )
 
 
@@ -201,6 +175,17 @@ async def plot_shape(ctx, title, value, y_value,
         )
 
 
+def _get_series_columns(x, values_slice, **values_by_column):
+    return {
+        "x": x,
+        **{
+            column: values[values_slice]
+            for column, values in values_by_column.items()
+            if values is not None
+        }
+    }
+
+
 def _get_value_from_array(array, index, multiplier=1):
     if array is None:
         return None
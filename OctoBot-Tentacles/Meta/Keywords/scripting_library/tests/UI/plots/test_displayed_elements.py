@@ -0,0 +1,52 @@
+#  Drakkar-Software OctoBot-Trading
+#  Copyright (c) Drakkar-Software, All rights reserved.
+#
+#  This library is free software; you can redistribute it and/or
+#  modify it under the terms of the GNU Lesser General Public
+#  License as published by the Free Software Foundation; either
+#  version 3.0 of the License, or (at your option) any later version.
+#
+#  This library is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the GNU
+#  Lesser General Public License for more details.
+#
+#  You should have received a copy of the GNU Lesser General Public
+#  License along with this library.
+import os
+import pytest
+
+import tentacles.Meta.Keywords.scripting_library.UI.plots.displayed_elements as displayed_elements
+import octobot_commons.databases as databases
+import octobot_commons.enums as commons_enums
+
+
+# All test coroutines will be treated as marked.
+pytestmark = pytest.mark.asyncio
+
+
+async def test_plot_series(tmp_path):
+    async with databases.DBWriterReader.database(os.path.join(tmp_path, "symbol.json")) as writer:
+        await writer.log_series("rsi", "1h", {"x": [1000, 2000], "y": [30, 70]},
+                                {"kind": "scattergl", "mode": "lines", "chart": "sub-chart", "color": "blue"})
+        await writer.log_series("pnl", "1h", {"x": [1000, 2000], "y": [-1, 2]},
+                                {"kind": "scattergl", "mode": "markers", "chart": "sub-chart", "size": 3})
+        await writer.log_series("empty", "1h", {"x": [], "y": []}, {"chart": "main-chart"})
+        await writer.log_series("hidden", "1h", {"x": [1000], "y": [1]}, {"chart": None})
+        await writer.flush()
+        elements = displayed_elements.DisplayedElements()
+        graphs_by_parts = {}
+        elements._add_series(graphs_by_parts, await writer.select_series(time_frame="1h"))
+        assert sorted(graphs_by_parts) == ["main-chart", "sub-chart"]
+        elements._plot_graphs(graphs_by_parts)
+
+    assert elements.nested_elements["main-chart"].elements == []
+    rsi, pnl = sorted(elements.nested_elements["sub-chart"].elements, key=lambda element: element.title, reverse=True)
+    assert (rsi.kind, rsi.mode, rsi.x, rsi.y, rsi.x_type) == ("scattergl", "lines", [1000, 2000], [30, 70], "date")
+    # positive series are displayed using log scale
+    assert rsi.y_type == "log"
+    # style values are repeated for each point
+    assert rsi.color == ["blue", "blue"]
+    assert rsi.size is None
+    assert (pnl.mode, pnl.y, pnl.y_type, pnl.color, pnl.size) == ("markers", [-1, 2], None, None, [3, 3])
+    assert commons_enums.DisplayedElementTypes.CHART.value == elements.nested_elements["sub-chart"].type
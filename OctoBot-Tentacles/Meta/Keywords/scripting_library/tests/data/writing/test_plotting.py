@@ -0,0 +1,62 @@
+#  Drakkar-Software OctoBot-Trading
+#  Copyright (c) Drakkar-Software, All rights reserved.
+#
+#  This library is free software; you can redistribute it and/or
+#  modify it under the terms of the GNU Lesser General Public
+#  License as published by the Free Software Foundation; either
+#  version 3.0 of the License, or (at your option) any later version.
+#
+#  This library is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the GNU
+#  Lesser General Public License for more details.
+#
+#  You should have received a copy of the GNU Lesser General Public
+#  License along with this library.
+import os
+import pytest
+
+import tentacles.Meta.Keywords.scripting_library.data.writing.plotting as plotting
+import octobot_commons.databases as databases
+import octobot_commons.enums as commons_enums
+
+from tentacles.Meta.Keywords.scripting_library.tests import event_loop, mock_context
+from tentacles.Meta.Keywords.scripting_library.tests.exchanges import backtesting_trader, backtesting_config, \
+    backtesting_exchange_manager, fake_backtesting
+
+
+# All test coroutines will be treated as marked.
+pytestmark = pytest.mark.asyncio
+
+
+async def test_plot_backtesting(mock_context, tmp_path):
+    mock_context.time_frame = commons_enums.TimeFrames.ONE_HOUR.value
+    async with databases.DBWriterReader.database(os.path.join(tmp_path, "symbol.json")) as writer:
+        mock_context.symbol_writer = writer
+        await plotting.plot(mock_context, "rsi", x=[1, 2, 3], y=[10, 20, 30], color="blue")
+        # in backtesting, open chunks are written on flush
+        assert await writer.all(commons_enums.DBTables.SERIES_CHUNKS.value) == []
+        # only the latest value is appended
+        await plotting.plot(mock_context, "rsi", x=[1, 2, 3, 4], y=[10, 20, 30, 40], color="blue")
+        await writer.flush()
+        rsi, = await writer.select_series(title="rsi", time_frame=mock_context.time_frame)
+        # x are shifted to candles open time and in milliseconds
+        assert rsi["x"] == [-3599000, -3598000, -3597000, -3596000]
+        assert rsi["y"] == [10, 20, 30, 40]
+        assert rsi["columns"] == ["x", "y"]
+        assert (rsi["kind"], rsi["mode"], rsi["chart"], rsi["color"]) == \
+            ("scattergl", "lines", commons_enums.PlotCharts.SUB_CHART.value, "blue")
+
+
+async def test_plot_live(mock_context, tmp_path):
+    mock_context.time_frame = commons_enums.TimeFrames.ONE_HOUR.value
+    mock_context.exchange_manager.is_backtesting = False
+    async with databases.DBWriterReader.database(os.path.join(tmp_path, "symbol.json")) as writer:
+        mock_context.symbol_writer = writer
+        await plotting.plot(mock_context, "close", x=[1, 2], close=[10, 20], shift_to_open_candle_time=False)
+        # in live, values are written right away
+        close, = await writer.select_series(title="close")
+        assert (close["x"], close["close"]) == ([1000, 2000], [10, 20])
+        await plotting.plot(mock_context, "close", x=[1, 2, 3], close=[10, 20, 30], shift_to_open_candle_time=False)
+        close, = await writer.select_series(title="close")
+        assert (close["x"], close["close"]) == ([1000, 2000, 3000], [10, 20, 30])
@@ -42,6 +42,7 @@ from octobot_trading.api.symbol_data import (
     get_symbol_low_candles,
     get_symbol_volume_candles,
     get_symbol_time_candles,
+    get_symbol_indicator,
     create_new_candles_manager,
     force_set_mark_price,
     is_mark_price_initialized,
@@ -50,6 +51,7 @@ from octobot_trading.api.symbol_data import (
 from octobot_trading.api.trades import (
     get_trade_history,
     get_total_paid_trading_fees,
+    enable_trades_archive,
     get_trade_exchange_name,
     parse_trade_type,
     trade_to_dict,
@@ -204,12 +206,14 @@ __all__ = [
     "get_symbol_low_candles",
     "get_symbol_volume_candles",
     "get_symbol_time_candles",
+    "get_symbol_indicator",
     "create_new_candles_manager",
     "force_set_mark_price",
     "is_mark_price_initialized",
     "get_config_symbols",
     "get_trade_history",
     "get_total_paid_trading_fees",
+    "enable_trades_archive",
     "get_trade_exchange_name",
     "parse_trade_type",
     "trade_to_dict",
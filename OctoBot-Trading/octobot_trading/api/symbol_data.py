@@ -89,6 +89,13 @@ def get_symbol_time_candles(symbol_data, time_frame, limit=-1, include_in_constr
     return exchange_data.get_symbol_time_candles(symbol_data, time_frame, limit, include_in_construction)
 
 
+def get_symbol_indicator(symbol_data, time_frame, indicator_class, *indicator_params):
+    """
+    :return: the incremental indicator of the given class and parameters, up to date with the closed candles
+    """
+    return get_symbol_candles_manager(symbol_data, time_frame).get_indicator(indicator_class, *indicator_params)
+
+
 def create_new_candles_manager(candles=None, max_candles_count=None) -> exchange_data.CandlesManager:
     manager = exchange_data.CandlesManager(max_candles_count=max_candles_count)
     if candles is not None:
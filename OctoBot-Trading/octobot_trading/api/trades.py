@@ -46,6 +46,10 @@ def get_total_paid_trading_fees(exchange_manager) -> dict:
     return exchange_manager.exchange_personal_data.trades_manager.get_total_paid_fees()
 
 
+def enable_trades_archive(exchange_manager) -> None:
+    exchange_manager.exchange_personal_data.trades_manager.enable_trades_archive()
+
+
 def get_trade_exchange_name(trade) -> str:
     return trade.exchange_manager.get_exchange_name()
 
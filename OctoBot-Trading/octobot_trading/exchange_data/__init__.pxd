@@ -56,6 +56,8 @@ from octobot_trading.exchange_data.order_book cimport (
     OrderBookTickerProducer,
     OrderBookTickerChannel,
     OrderBookManager,
+    L2OrderBookSide,
+    L2OrderBookManager,
     OrderBookUpdaterSimulator,
 )
 
@@ -68,6 +70,8 @@ from octobot_trading.exchange_data.prices cimport (
     calculate_mark_price_from_recent_trade_prices,
     MarkPriceUpdater,
     PriceEventsManager,
+    PriceTrigger,
+    OrdersMatchingEngine,
 )
 
 from octobot_trading.exchange_data cimport recent_trades
@@ -135,6 +139,8 @@ __all__ = [
     "OrderBookTickerProducer",
     "OrderBookTickerChannel",
     "OrderBookManager",
+    "L2OrderBookSide",
+    "L2OrderBookManager",
     "OrderBookUpdaterSimulator",
     "MarkPriceUpdaterSimulator",
     "MarkPriceProducer",
@@ -143,6 +149,8 @@ __all__ = [
     "calculate_mark_price_from_recent_trade_prices",
     "MarkPriceUpdater",
     "PriceEventsManager",
+    "PriceTrigger",
+    "OrdersMatchingEngine",
     "RecentTradeProducer",
     "RecentTradeChannel",
     "LiquidationsProducer",
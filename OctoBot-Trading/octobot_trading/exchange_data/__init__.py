@@ -41,6 +41,13 @@ from octobot_trading.exchange_data.ohlcv import (
     get_symbol_volume_candles,
     get_symbol_time_candles,
     get_candle_as_list,
+    IncrementalIndicator,
+    EMAIndicator,
+    RSIIndicator,
+    MACDIndicator,
+    BBandsIndicator,
+    ADXIndicator,
+    KVOIndicator,
     OHLCVUpdaterSimulator,
     OHLCVProducer,
     OHLCVChannel,
@@ -54,6 +61,8 @@ from octobot_trading.exchange_data.order_book import (
     OrderBookTickerProducer,
     OrderBookTickerChannel,
     OrderBookManager,
+    L2OrderBookSide,
+    L2OrderBookManager,
     OrderBookUpdaterSimulator,
 )
 from octobot_trading.exchange_data import prices
@@ -65,6 +74,8 @@ from octobot_trading.exchange_data.prices import (
     calculate_mark_price_from_recent_trade_prices,
     MarkPriceUpdater,
     PriceEventsManager,
+    PriceTrigger,
+    OrdersMatchingEngine,
 )
 from octobot_trading.exchange_data import recent_trades
 from octobot_trading.exchange_data.recent_trades import (
@@ -158,6 +169,13 @@ __all__ = [
     "get_symbol_volume_candles",
     "get_symbol_time_candles",
     "get_candle_as_list",
+    "IncrementalIndicator",
+    "EMAIndicator",
+    "RSIIndicator",
+    "MACDIndicator",
+    "BBandsIndicator",
+    "ADXIndicator",
+    "KVOIndicator",
     "OHLCVUpdaterSimulator",
     "OHLCVProducer",
     "OHLCVChannel",
@@ -168,6 +186,8 @@ __all__ = [
     "OrderBookTickerProducer",
     "OrderBookTickerChannel",
     "OrderBookManager",
+    "L2OrderBookSide",
+    "L2OrderBookManager",
     "OrderBookUpdaterSimulator",
     "MarkPriceUpdaterSimulator",
     "MarkPriceProducer",
@@ -176,6 +196,8 @@ __all__ = [
     "calculate_mark_price_from_recent_trade_prices",
     "MarkPriceUpdater",
     "PriceEventsManager",
+    "PriceTrigger",
+    "OrdersMatchingEngine",
     "RecentTradeProducer",
     "RecentTradeChannel",
     "LiquidationsProducer",
@@ -14,7 +14,7 @@
 #
 #  You should have received a copy of the GNU Lesser General Public
 #  License along with this library.
-cimport octobot_trading.exchange_data.prices.price_events_manager as price_events_manager
+cimport octobot_trading.exchange_data.prices.orders_matching_engine as orders_matching_engine
 cimport octobot_trading.exchange_data.order_book.order_book_manager as order_book_manager
 cimport octobot_trading.exchange_data.prices.prices_manager as prices_manager
 cimport octobot_trading.exchange_data.recent_trades.recent_trades_manager as recent_trades_manager
@@ -30,13 +30,15 @@ cdef class ExchangeSymbolData:
     cdef public dict symbol_candles
     cdef public dict symbol_klines
 
-    cdef public price_events_manager.PriceEventsManager price_events_manager
+    cdef public orders_matching_engine.OrdersMatchingEngine price_events_manager
     cdef public order_book_manager.OrderBookManager order_book_manager
     cdef public prices_manager.PricesManager prices_manager
     cdef public recent_trades_manager.RecentTradesManager recent_trades_manager
     cdef public ticker_manager.TickerManager ticker_manager
     cdef public funding_manager.FundingManager funding_manager
 
+    cdef object _create_order_book_manager(self)
+
     cpdef list handle_recent_trade_update(self, list recent_trades, bint replace_all=*)
     cpdef void handle_order_book_update(self, list asks, list bids)
     cpdef void handle_order_book_ticker_update(self, double ask_quantity, double ask_price,
@@ -24,7 +24,7 @@ import octobot_trading.exchange_data.ticker.ticker_manager as ticker_manager
 import octobot_trading.exchange_data.order_book.order_book_manager as order_book_manager
 import octobot_trading.exchange_data.kline.kline_manager as kline_manager
 import octobot_trading.exchange_data.prices.prices_manager as prices_manager
-import octobot_trading.exchange_data.prices.price_events_manager as price_events_manager
+import octobot_trading.exchange_data.prices.orders_matching_engine as orders_matching_engine
 import octobot_trading.exchange_data.recent_trades.recent_trades_manager as recent_trades_manager
 import octobot_trading.exchange_data.funding.funding_manager as funding_manager
 
@@ -37,8 +37,9 @@ class ExchangeSymbolData:
         self.symbol = symbol
         self.exchange_manager = exchange_manager
 
-        self.price_events_manager = price_events_manager.PriceEventsManager()
-        self.order_book_manager = order_book_manager.OrderBookManager()
+        # also matches simulated orders when the orders matching engine is used
+        self.price_events_manager = orders_matching_engine.OrdersMatchingEngine()
+        self.order_book_manager = self._create_order_book_manager()
         self.prices_manager = prices_manager.PricesManager(self.exchange_manager)
         self.recent_trades_manager = recent_trades_manager.RecentTradesManager()
         self.ticker_manager = ticker_manager.TickerManager()
@@ -50,6 +51,12 @@ class ExchangeSymbolData:
 
         self.logger = logging.get_logger(f"{self.__class__.__name__} - {self.symbol}")
 
+    def _create_order_book_manager(self):
+        # store order books using the same engine as the exchange websocket
+        if self.exchange_manager.exchange_web_socket is None:
+            return order_book_manager.OrderBookManager()
+        return self.exchange_manager.exchange_web_socket.get_order_book_manager_class()()
+
     # candle functions
     async def handle_candles_update(self, time_frame, new_symbol_candles_data, replace_all=False, partial=False):
         try:
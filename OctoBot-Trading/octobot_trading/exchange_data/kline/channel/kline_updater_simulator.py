@@ -43,6 +43,7 @@ class KlineUpdaterSimulator(kline_updater.KlineUpdater):
                         symbol=pair,
                         time_frame=time_frame,
                         inferior_timestamp=timestamp,
+                        cursor=self.CHANNEL_NAME,
                         limit=1)
                     if kline_data and kline_data[0][0] > self.last_timestamp_pushed:
                         self.last_timestamp_pushed = kline_data[0][0]
@@ -16,6 +16,7 @@
 
 from octobot_trading.exchange_data.ohlcv import candles_manager
 from octobot_trading.exchange_data.ohlcv import candles_adapter
+from octobot_trading.exchange_data.ohlcv import incremental_indicators
 from octobot_trading.exchange_data.ohlcv import channel
 
 from octobot_trading.exchange_data.ohlcv.candles_manager import (
@@ -33,6 +34,15 @@ from octobot_trading.exchange_data.ohlcv.candles_adapter import (
     get_symbol_time_candles,
     get_candle_as_list,
 )
+from octobot_trading.exchange_data.ohlcv.incremental_indicators import (
+    IncrementalIndicator,
+    EMAIndicator,
+    RSIIndicator,
+    MACDIndicator,
+    BBandsIndicator,
+    ADXIndicator,
+    KVOIndicator,
+)
 from octobot_trading.exchange_data.ohlcv.channel import (
     OHLCVUpdaterSimulator,
     OHLCVProducer,
@@ -52,6 +62,13 @@ __all__ = [
     "get_symbol_volume_candles",
     "get_symbol_time_candles",
     "get_candle_as_list",
+    "IncrementalIndicator",
+    "EMAIndicator",
+    "RSIIndicator",
+    "MACDIndicator",
+    "BBandsIndicator",
+    "ADXIndicator",
+    "KVOIndicator",
     "OHLCVUpdaterSimulator",
     "OHLCVProducer",
     "OHLCVChannel",
@@ -40,6 +40,11 @@ cdef class CandlesManager(util.Initializable):
 
     cdef public bint reached_max
 
+    cdef np.ndarray _candles
+    cdef int _candles_end
+    cdef object _last_candle_time
+    cdef dict _indicators
+
     cpdef np.ndarray get_symbol_close_candles(self, int limit=*)
     cpdef np.ndarray get_symbol_open_candles(self, int limit=*)
     cpdef np.ndarray get_symbol_high_candles(self, int limit=*)
@@ -56,8 +61,12 @@ cdef class CandlesManager(util.Initializable):
     # private
     cdef void _set_all_candles(self, object new_candles_data)
     cdef void _change_current_candle(self)
-    cdef bint _should_add_new_candle(self, new_open_time)
     cdef void _check_max_candles(self)
+    cdef int _get_window_start(self)
+    cdef void _update_candles_views(self)
+    cdef bint _should_add_new_candle(self, new_open_time)
     cdef object _inc_candle_index(self)
     cdef void _reset_candles(self)
-    cdef np.ndarray _extract_limited_data(self, np.float64_t[::1] data, int limit=*, int max_limit=*)
+    cdef np.ndarray _extract_limited_data(self, np.ndarray data, int limit=*, int max_limit=*)
+
+cdef np.ndarray _read_only_view(np.ndarray data)
@@ -15,7 +15,6 @@
 #  License along with this library.
 import numpy as np
 
-import octobot_commons.data_util as data_util
 import octobot_commons.enums as enums
 import octobot_commons.logging as logging
 
@@ -23,6 +22,14 @@ import octobot_trading.util as util
 
 
 class CandlesManager(util.Initializable):
+    """
+    Stores the latest max_candles_count candles in chronological order.
+    Candles are appended to a single (len(PriceIndexes), 2 * max_candles_count) float64 block so that any
+    window of the latest candles is a contiguous view of this block. When the block is full, the latest
+    max_candles_count candles are moved to a new block: appending a candle is O(1) (amortized) and getters
+    return read-only views instead of copies. Stored candles are never written again, returned views
+    therefore keep their values when new candles are added.
+    """
     MAX_CANDLES_COUNT = 1000
 
     def __init__(self, max_candles_count=None):
@@ -49,6 +56,11 @@ class CandlesManager(util.Initializable):
         self.volume_candles = None
 
         self.reached_max = False
+
+        self._candles = None
+        self._candles_end = 0
+        self._last_candle_time = None
+        self._indicators = {}
         self._reset_candles()
 
     async def initialize_impl(self):
@@ -65,12 +77,12 @@ class CandlesManager(util.Initializable):
         self.time_candles_index = 0
         self.volume_candles_index = 0
 
-        self.close_candles = np.full(self.max_candles_count, fill_value=np.nan, dtype=np.float64)
-        self.open_candles = np.full(self.max_candles_count, fill_value=np.nan, dtype=np.float64)
-        self.high_candles = np.full(self.max_candles_count, fill_value=np.nan, dtype=np.float64)
-        self.low_candles = np.full(self.max_candles_count, fill_value=np.nan, dtype=np.float64)
-        self.time_candles = np.full(self.max_candles_count, fill_value=np.nan, dtype=np.float64)
-        self.volume_candles = np.full(self.max_candles_count, fill_value=np.nan, dtype=np.float64)
+        self._candles = np.full((len(enums.PriceIndexes), 2 * self.max_candles_count),
+                                fill_value=np.nan, dtype=np.float64)
+        self._candles_end = 0
+        self._last_candle_time = None
+        self._indicators = {}
+        self._update_candles_views()
 
     # getters
     def get_symbol_candles_count(self):
@@ -122,6 +134,26 @@ class CandlesManager(util.Initializable):
             candles_index += 1
         return candles
 
+    def get_indicator(self, indicator_class, *indicator_params):
+        """
+        Returns the incremental indicator of the given class and parameters, updated on each new candle.
+        Indicators are created on their first call from the stored candles, following calls are O(1).
+        Indicators keep their state when the oldest candles are dropped: see IncrementalIndicator for the
+        difference with tulipy values on the stored candles
+        :param indicator_class: the IncrementalIndicator class to get
+        :param indicator_params: the indicator parameters (periods, ...)
+        :return: the up-to-date indicator
+        """
+        key = (indicator_class, indicator_params)
+        try:
+            return self._indicators[key]
+        except KeyError:
+            indicator = indicator_class(self.max_candles_count, *indicator_params)
+            for candle in self._candles[:, self._get_window_start(): self._candles_end].T.tolist():
+                indicator.update(candle)
+            self._indicators[key] = indicator
+            return indicator
+
     def replace_all_candles(self, all_candles_data):
         self._reset_candles()
         self._set_all_candles(all_candles_data)
@@ -133,10 +165,9 @@ class CandlesManager(util.Initializable):
         :param candles_data: new candles data
         :return:
         """
-        # check old candles
+        # check old candles: already stored ones are skipped by add_new_candle
         for old_candle in candles_data[:-1]:
-            if old_candle[enums.PriceIndexes.IND_PRICE_TIME.value] not in self.time_candles:
-                self.add_new_candle(old_candle)
+            self.add_new_candle(old_candle)
 
         try:
             self.add_new_candle(candles_data[-1])
@@ -148,16 +179,18 @@ class CandlesManager(util.Initializable):
         :param new_candle_data: new candles data
         :return:
         """
-        if self._should_add_new_candle(new_candle_data[enums.PriceIndexes.IND_PRICE_TIME.value]):
+        new_open_time = new_candle_data[enums.PriceIndexes.IND_PRICE_TIME.value]
+        if self._should_add_new_candle(new_open_time):
             try:
+                candle_values = [new_candle_data[price_index.value] for price_index in enums.PriceIndexes]
                 self._check_max_candles()
-                self.close_candles[self.close_candles_index] = new_candle_data[enums.PriceIndexes.IND_PRICE_CLOSE.value]
-                self.open_candles[self.open_candles_index] = new_candle_data[enums.PriceIndexes.IND_PRICE_OPEN.value]
-                self.high_candles[self.high_candles_index] = new_candle_data[enums.PriceIndexes.IND_PRICE_HIGH.value]
-                self.low_candles[self.low_candles_index] = new_candle_data[enums.PriceIndexes.IND_PRICE_LOW.value]
-                self.time_candles[self.time_candles_index] = new_candle_data[enums.PriceIndexes.IND_PRICE_TIME.value]
-                self.volume_candles[self.volume_candles_index] = new_candle_data[enums.PriceIndexes.IND_PRICE_VOL.value]
+                self._candles[:, self._candles_end] = candle_values
+                for indicator in self._indicators.values():
+                    indicator.update(candle_values)
+                self._last_candle_time = new_open_time
+                self._change_current_candle()
                 self._inc_candle_index()
+                self._update_candles_views()
             except IndexError as e:
                 self.logger.error(f"Fail to add new candle {new_candle_data} : {e}")
 
@@ -170,19 +203,35 @@ class CandlesManager(util.Initializable):
             self.add_new_candle(new_candles_data)
 
     def _change_current_candle(self):
-        self.close_candles = data_util.shift_value_array(self.close_candles, -1, np.nan, np.float64)
-        self.open_candles = data_util.shift_value_array(self.open_candles, -1, np.nan, np.float64)
-        self.high_candles = data_util.shift_value_array(self.high_candles, -1, np.nan, np.float64)
-        self.low_candles = data_util.shift_value_array(self.low_candles, -1, np.nan, np.float64)
-        self.volume_candles = data_util.shift_value_array(self.volume_candles, -1, np.nan, np.float64)
-        self.time_candles = data_util.shift_value_array(self.time_candles, -1, np.nan, np.float64)
-
-    def _should_add_new_candle(self, new_open_time):
-        return new_open_time not in self.time_candles
+        self._candles_end += 1
 
     def _check_max_candles(self):
-        if self.reached_max:
-            self._change_current_candle()
+        if self._candles_end == 2 * self.max_candles_count:
+            # the block is full: move the latest candles to a new block instead of overwriting this one
+            # which can still be used by returned views
+            candles = np.full((len(enums.PriceIndexes), 2 * self.max_candles_count),
+                              fill_value=np.nan, dtype=np.float64)
+            candles[:, :self.max_candles_count] = self._candles[:, self._candles_end - self.max_candles_count:]
+            self._candles = candles
+            self._candles_end = self.max_candles_count
+
+    def _get_window_start(self):
+        # oldest to newest candles: stored from the first slot until max_candles_count candles are stored
+        return self._candles_end - self.max_candles_count if self.reached_max else 0
+
+    def _update_candles_views(self):
+        window_start = self._get_window_start()
+        window = self._candles[:, window_start: window_start + self.max_candles_count]
+        self.close_candles = window[enums.PriceIndexes.IND_PRICE_CLOSE.value]
+        self.open_candles = window[enums.PriceIndexes.IND_PRICE_OPEN.value]
+        self.high_candles = window[enums.PriceIndexes.IND_PRICE_HIGH.value]
+        self.low_candles = window[enums.PriceIndexes.IND_PRICE_LOW.value]
+        self.time_candles = window[enums.PriceIndexes.IND_PRICE_TIME.value]
+        self.volume_candles = window[enums.PriceIndexes.IND_PRICE_VOL.value]
+
+    def _should_add_new_candle(self, new_open_time):
+        # candles are added in chronological order: only the last candle time has to be checked
+        return self._last_candle_time is None or new_open_time > self._last_candle_time
 
     def _inc_candle_index(self):
         if self.close_candles_index < self.max_candles_count - 1:
@@ -199,10 +248,16 @@ class CandlesManager(util.Initializable):
         max_handled_limit: int = self.max_candles_count if self.reached_max else max_limit
         if limit == -1:
             if max_limit == -1:
-                return np.array(data)
-            return np.array(data[:max_handled_limit])
+                return _read_only_view(data)
+            return _read_only_view(data[:max_handled_limit])
 
         if max_limit == -1:
-            return np.array(data[-min(limit, len(data)):])
+            return _read_only_view(data[-min(limit, len(data)):])
         else:
-            return np.array(data[max(0, max_handled_limit - limit): max_handled_limit])
+            return _read_only_view(data[max(0, max_handled_limit - limit): max_handled_limit])
+
+
+def _read_only_view(data):
+    view = data.view()
+    view.flags.writeable = False
+    return view
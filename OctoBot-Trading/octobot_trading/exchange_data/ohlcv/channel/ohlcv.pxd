@@ -21,4 +21,4 @@ cdef class OHLCVProducer(exchanges_channel.ExchangeChannelProducer):
     pass
 
 cdef class OHLCVChannel(exchanges_channel.TimeFrameExchangeChannel):
-    pass
+    cpdef object get_filtered_consumers(self, str cryptocurrency=*, str symbol=*, str time_frame=*, object batched=*)
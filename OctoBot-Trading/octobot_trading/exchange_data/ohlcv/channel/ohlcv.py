@@ -26,7 +26,8 @@ class OHLCVProducer(exchanges_channel.ExchangeChannelProducer):
 
     async def perform(self, time_frame, symbol, candle, replace_all=False, partial=False):
         try:
-            if self.channel.get_filtered_consumers(symbol=constants.CHANNEL_WILDCARD) or \
+            if self.channel.get_filtered_consumers(symbol=constants.CHANNEL_WILDCARD,
+                                                   batched=constants.CHANNEL_WILDCARD) or \
                     self.channel.get_filtered_consumers(symbol=symbol, time_frame=time_frame.value):
                 await self.channel.exchange_manager.get_symbol_data(symbol) \
                     .handle_candles_update(time_frame, candle, replace_all=replace_all, partial=partial)
@@ -42,6 +43,38 @@ class OHLCVProducer(exchanges_channel.ExchangeChannelProducer):
         except Exception as e:
             self.logger.exception(e, True, f"Exception when triggering update: {e}")
 
+    async def push_batch(self, timestamp, candles_by_time_frame_by_symbol, partial=False):
+        await self.perform_batch(timestamp, candles_by_time_frame_by_symbol, partial=partial)
+
+    async def perform_batch(self, timestamp, candles_by_time_frame_by_symbol, partial=False):
+        """
+        Updates candles of every given symbol and time frame at once.
+        Symbol and time frame consumers are notified for each updated candle as usual,
+        batched consumers are notified only once with every last candle
+        :param timestamp: the current timestamp
+        :param candles_by_time_frame_by_symbol: {symbol: {time_frame: [candle, ...]}}
+        :param partial: when True, candles are to be added to the current candles
+        """
+        try:
+            if self.channel.get_consumers():
+                last_candles_by_symbol = {}
+                for symbol, candles_by_time_frame in candles_by_time_frame_by_symbol.items():
+                    symbol_data = self.channel.exchange_manager.get_symbol_data(symbol)
+                    cryptocurrency = self.channel.exchange_manager.exchange.get_pair_cryptocurrency(symbol)
+                    last_candles = last_candles_by_symbol[symbol] = {}
+                    for time_frame, candles in candles_by_time_frame.items():
+                        await symbol_data.handle_candles_update(time_frame, candles, partial=partial)
+                        last_candles[time_frame.value] = candles[-1]
+                        await self.send(cryptocurrency=cryptocurrency,
+                                        time_frame=time_frame.value,
+                                        symbol=symbol,
+                                        candle=candles[-1])
+                await self.send_batch(timestamp, last_candles_by_symbol)
+        except asyncio.CancelledError:
+            self.logger.info("Update tasks cancelled.")
+        except Exception as e:
+            self.logger.exception(e, True, f"Exception when triggering batch update: {e}")
+
     async def send(self, cryptocurrency, symbol, time_frame, candle):
         for consumer in self.channel.get_filtered_consumers(symbol=symbol, time_frame=time_frame):
             await consumer.queue.put({
@@ -54,6 +87,49 @@ class OHLCVProducer(exchanges_channel.ExchangeChannelProducer):
             })
 
 
+    async def send_batch(self, timestamp, candles_by_time_frame_by_symbol):
+        for consumer in self.channel.get_filtered_consumers(batched=True):
+            await consumer.queue.put({
+                "exchange": self.channel.exchange_manager.exchange_name,
+                "exchange_id": self.channel.exchange_manager.id,
+                "timestamp": timestamp,
+                "candles": candles_by_time_frame_by_symbol
+            })
+
+
 class OHLCVChannel(exchanges_channel.TimeFrameExchangeChannel):
+    """
+    Batched consumers (registered using batched=True) are receiving every symbol and time frame last candle
+    in a single notification when candles are pushed using push_batch. They are not notified on single
+    symbol and time frame updates.
+    """
     PRODUCER_CLASS = OHLCVProducer
     CONSUMER_CLASS = exchanges_channel.ExchangeChannelConsumer
+    BATCHED_KEY = "batched"
+
+    def get_filtered_consumers(self,
+                               cryptocurrency=constants.CHANNEL_WILDCARD,
+                               symbol=constants.CHANNEL_WILDCARD,
+                               time_frame=constants.CHANNEL_WILDCARD,
+                               batched=False):
+        return self.get_consumer_from_filters({
+            self.CRYPTOCURRENCY_KEY: cryptocurrency,
+            self.SYMBOL_KEY: symbol,
+            self.TIME_FRAME_KEY: time_frame,
+            self.BATCHED_KEY: batched
+        })
+
+    async def _add_new_consumer_and_run(self, consumer,
+                                        cryptocurrency=constants.CHANNEL_WILDCARD,
+                                        symbol=constants.CHANNEL_WILDCARD,
+                                        time_frame=constants.CHANNEL_WILDCARD,
+                                        batched=False):
+        self.add_new_consumer(consumer,
+                              {
+                                  self.CRYPTOCURRENCY_KEY: cryptocurrency,
+                                  self.SYMBOL_KEY: symbol,
+                                  self.TIME_FRAME_KEY: time_frame,
+                                  self.BATCHED_KEY: batched
+                              })
+        await self._run_consumer(consumer,
+                                 symbol=symbol)
@@ -37,3 +37,12 @@ cdef class OHLCVUpdaterSimulator(ohlcv_updater.OHLCVUpdater):
     cdef bint require_last_init_candles_pairs_push
     cdef list traded_pairs
     cdef list traded_time_frame
+
+    cdef public bint use_batched_updates
+    cdef dict _preloaded_timestamps
+    cdef dict _preloaded_ohlcv_data
+
+    cdef list _get_preloaded_ohlcv_data(self, tuple key, double superior_timestamp)
+    cdef void _reset_preloaded_ohlcv_data(self)
+    cdef double _get_superior_timestamp(self, object time_frame, double timestamp)
+    cdef list _get_candles_to_push(self, list ohlcv_data, object time_frame, str pair, double timestamp)
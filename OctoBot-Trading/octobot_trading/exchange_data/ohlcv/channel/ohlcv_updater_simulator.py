@@ -13,7 +13,10 @@
 #
 #  You should have received a copy of the GNU Lesser General Public
 #  License along with this library.
+import bisect
+
 import octobot_backtesting.api as api
+import octobot_backtesting.constants as backtesting_constants
 
 import octobot_commons.constants as constants
 import octobot_commons.enums as enums
@@ -42,6 +45,13 @@ class OHLCVUpdaterSimulator(ohlcv_updater.OHLCVUpdater):
         self.traded_pairs = self._get_traded_pairs()
         self.traded_time_frame = self._get_time_frames()
 
+        # when True, every pair and time frame candles are resolved from preloaded candles and pushed at once
+        self.use_batched_updates = self.channel.exchange_manager.config.get(
+            backtesting_constants.CONFIG_BACKTESTING, {}
+        ).get(backtesting_constants.CONFIG_BACKTESTING_USE_BATCHED_OHLCV_UPDATES, False)
+        self._preloaded_timestamps = None
+        self._preloaded_ohlcv_data = None
+
     async def start(self):
         if not self.is_initialized:
             await self._initialize(False)
@@ -49,32 +59,10 @@ class OHLCVUpdaterSimulator(ohlcv_updater.OHLCVUpdater):
 
     async def handle_timestamp(self, timestamp, **kwargs):
         try:
-            pushed_data = False
-            for pair in self.traded_pairs:
-                for time_frame in self.traded_time_frame:
-                    # Use last_timestamp_pushed + 1 for inferior timestamp to avoid select of an already selected candle
-                    # (selection is <= and >=)
-                    # Use timestamp + self.future_candle_sec_length to include the future candle on the future candles
-                    # time frame that will be sorted in exchange simulator for later uses.
-                    ohlcv_data: list = await self.exchange_data_importer.get_ohlcv_from_timestamps(
-                        exchange_name=self.exchange_name,
-                        symbol=pair,
-                        time_frame=time_frame,
-                        inferior_timestamp=self.last_timestamp_pushed + 1,
-                        superior_timestamp=timestamp + (self.future_candle_sec_length
-                                                        if self.future_candle_time_frame is time_frame else 0)
-                    )
-                    if ohlcv_data:
-                        pushed_data = await self._handle_ohlcv_data(ohlcv_data, time_frame, pair, timestamp)
-                    elif self.require_last_init_candles_pairs_push:
-                        # triggered on first iteration to initialize large candles that might be pushed much later
-                        # otherwise but are required to complete TA evaluation
-                        if time_frame.value in self.last_candles_by_pair_by_time_frame[pair]:
-                            await self.push(time_frame,
-                                            pair,
-                                            [self.last_candles_by_pair_by_time_frame[pair][time_frame.value][-1]],
-                                            partial=True)
-                            pushed_data = True
+            if self.use_batched_updates:
+                pushed_data = await self._push_batched_ohlcv_data(timestamp)
+            else:
+                pushed_data = await self._push_ohlcv_data_by_pair(timestamp)
             self.channel.exchange_manager.exchange.is_unreachable = not pushed_data
 
         except errors.DatabaseNotFoundError as e:
@@ -89,7 +77,103 @@ class OHLCVUpdaterSimulator(ohlcv_updater.OHLCVUpdater):
             self.last_timestamp_pushed = timestamp
             self.require_last_init_candles_pairs_push = False
 
+    async def _push_ohlcv_data_by_pair(self, timestamp):
+        pushed_data = False
+        for pair in self.traded_pairs:
+            for time_frame in self.traded_time_frame:
+                # Use last_timestamp_pushed + 1 for inferior timestamp to avoid select of an already selected candle
+                # (selection is <= and >=)
+                # Use timestamp + self.future_candle_sec_length to include the future candle on the future candles
+                # time frame that will be sorted in exchange simulator for later uses.
+                ohlcv_data: list = await self.exchange_data_importer.get_ohlcv_from_timestamps(
+                    exchange_name=self.exchange_name,
+                    symbol=pair,
+                    time_frame=time_frame,
+                    inferior_timestamp=self.last_timestamp_pushed + 1,
+                    superior_timestamp=self._get_superior_timestamp(time_frame, timestamp),
+                    cursor=self.CHANNEL_NAME
+                )
+                if ohlcv_data:
+                    pushed_data = await self._handle_ohlcv_data(ohlcv_data, time_frame, pair, timestamp)
+                elif self.require_last_init_candles_pairs_push:
+                    # triggered on first iteration to initialize large candles that might be pushed much later
+                    # otherwise but are required to complete TA evaluation
+                    if time_frame.value in self.last_candles_by_pair_by_time_frame[pair]:
+                        await self.push(time_frame,
+                                        pair,
+                                        [self.last_candles_by_pair_by_time_frame[pair][time_frame.value][-1]],
+                                        partial=True)
+                        pushed_data = True
+        return pushed_data
+
+    async def _push_batched_ohlcv_data(self, timestamp):
+        if self._preloaded_ohlcv_data is None:
+            await self._preload_ohlcv_data()
+        candles_by_time_frame_by_symbol = {}
+        for pair in self.traded_pairs:
+            for time_frame in self.traded_time_frame:
+                candles = None
+                ohlcv_data = self._get_preloaded_ohlcv_data(
+                    (pair, time_frame), self._get_superior_timestamp(time_frame, timestamp)
+                )
+                if ohlcv_data:
+                    candles = self._get_candles_to_push(ohlcv_data, time_frame, pair, timestamp)
+                elif self.require_last_init_candles_pairs_push:
+                    # same as in _push_ohlcv_data_by_pair: push initialization candles
+                    if time_frame.value in self.last_candles_by_pair_by_time_frame[pair]:
+                        candles = [self.last_candles_by_pair_by_time_frame[pair][time_frame.value][-1]]
+                if candles:
+                    if pair not in candles_by_time_frame_by_symbol:
+                        candles_by_time_frame_by_symbol[pair] = {}
+                    candles_by_time_frame_by_symbol[pair][time_frame] = candles
+        if candles_by_time_frame_by_symbol:
+            await self.push_batch(timestamp, candles_by_time_frame_by_symbol, partial=True)
+            return True
+        return False
+
+    async def _preload_ohlcv_data(self):
+        self._preloaded_timestamps = {}
+        self._preloaded_ohlcv_data = {}
+        for pair in self.traded_pairs:
+            for time_frame in self.traded_time_frame:
+                # select every candle from the backtesting start: they will be read from memory afterwards
+                ohlcv_data: list = await self.exchange_data_importer.get_ohlcv_from_timestamps(
+                    exchange_name=self.exchange_name,
+                    symbol=pair,
+                    time_frame=time_frame,
+                    inferior_timestamp=self.initial_timestamp,
+                    superior_timestamp=constants.DEFAULT_IGNORED_VALUE
+                )
+                self._preloaded_timestamps[(pair, time_frame)] = [ohlcv[0] for ohlcv in ohlcv_data]
+                self._preloaded_ohlcv_data[(pair, time_frame)] = ohlcv_data
+
+    def _get_preloaded_ohlcv_data(self, key, superior_timestamp):
+        timestamps = self._preloaded_timestamps[key]
+        # same selection as in _push_ohlcv_data_by_pair: bisect from last_timestamp_pushed instead of keeping
+        # a cursor that would have to follow backtesting time resets
+        start_index = bisect.bisect_left(timestamps, self.last_timestamp_pushed + 1)
+        return self._preloaded_ohlcv_data[key][start_index:bisect.bisect_right(timestamps, superior_timestamp,
+                                                                                start_index)]
+
+    def _reset_preloaded_ohlcv_data(self):
+        self._preloaded_timestamps = None
+        self._preloaded_ohlcv_data = None
+
+    def _get_superior_timestamp(self, time_frame, timestamp):
+        return timestamp + (self.future_candle_sec_length if self.future_candle_time_frame is time_frame else 0)
+
     async def _handle_ohlcv_data(self, ohlcv_data, time_frame, pair, timestamp):
+        candles = self._get_candles_to_push(ohlcv_data, time_frame, pair, timestamp)
+        if candles:
+            # push current candle(s)
+            await self.push(time_frame,
+                            pair,
+                            candles,
+                            partial=True)
+            return True
+        return False
+
+    def _get_candles_to_push(self, ohlcv_data, time_frame, pair, timestamp):
         has_future_candle = False
         if self.future_candle_time_frame is time_frame:
             if ohlcv_data[-1][-1][enums.PriceIndexes.IND_PRICE_TIME.value] == timestamp:
@@ -107,19 +191,14 @@ class OHLCVUpdaterSimulator(ohlcv_updater.OHLCVUpdater):
             # the exchange was down for some time. Consider it unreachable
             self.channel.exchange_manager.exchange.is_unreachable = len(ohlcv_data) < 2
         if not has_future_candle or len(ohlcv_data) > 1:
-            # push current candle(s)
-            candles = ohlcv_data[:-1] if has_future_candle else ohlcv_data
-            await self.push(time_frame,
-                            pair,
-                            [ohlcv[-1] for ohlcv in candles],
-                            partial=True)
-            return True
-        return False
+            return [ohlcv[-1] for ohlcv in (ohlcv_data[:-1] if has_future_candle else ohlcv_data)]
+        return None
 
     async def pause(self):
         await util.pause_time_consumer(self)
 
     async def stop(self):
+        self._reset_preloaded_ohlcv_data()
         await util.stop_and_pause(self)
 
     async def resume(self):
@@ -0,0 +1,330 @@
+#  Drakkar-Software OctoBot-Trading
+#  Copyright (c) Drakkar-Software, All rights reserved.
+#
+#  This library is free software; you can redistribute it and/or
+#  modify it under the terms of the GNU Lesser General Public
+#  License as published by the Free Software Foundation; either
+#  version 3.0 of the License, or (at your option) any later version.
+#
+#  This library is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the GNU
+#  Lesser General Public License for more details.
+#
+#  You should have received a copy of the GNU Lesser General Public
+#  License along with this library.
+import collections
+import math
+import numpy as np
+
+import octobot_commons.enums as enums
+
+
+class IncrementalIndicator:
+    """
+    Technical indicator state updated candle by candle: each update is O(1) regardless of the candles history size.
+    Computations follow tulipy (tulip indicators) algorithms step by step to give the same values as calling
+    tulipy on the same candles.
+    Only the latest max_size values are kept: they are stored like CandlesManager candles, in a
+    (len(OUTPUTS), 2 * max_size) block which is replaced when full. Outputs are only appended: returned views
+    are never overwritten.
+    Once more than max_size candles are given, the indicator state keeps rolling from the first given candle
+    while tulipy on the latest max_size candles restarts from the oldest of these candles: window based indicators
+    (BBands) still give the same values, the ones with a smoothed state (EMA, RSI, MACD, ADX, KVO) differ from
+    this truncated tulipy computation by the weight left to the dropped candles, which decreases exponentially
+    with the number of kept candles (and gives the same values as tulipy on the whole candles history).
+    """
+    OUTPUTS = ("value",)
+
+    def __init__(self, max_size):
+        self.max_size = max_size
+        # number of candles required before the first output value, same as tulipy "start"
+        self.start = 0
+        self.candles_count = 0
+        self._values = np.full((len(self.OUTPUTS), 2 * max_size), fill_value=np.nan, dtype=np.float64)
+        self._values_end = 0
+
+    def update(self, candle):
+        """
+        Updates the indicator with a new closed candle
+        :param candle: the candle values, indexed by PriceIndexes
+        """
+        outputs = self._compute(candle)
+        if self._values_end == 2 * self.max_size:
+            # the block is full: move the latest values to a new block instead of overwriting this one
+            # which can still be used by returned views
+            values = np.full((len(self.OUTPUTS), 2 * self.max_size), fill_value=np.nan, dtype=np.float64)
+            values[:, :self.max_size] = self._values[:, self.max_size:]
+            self._values = values
+            self._values_end = self.max_size
+        if outputs is not None:
+            self._values[:, self._values_end] = outputs
+        self._values_end += 1
+        self.candles_count += 1
+
+    def get_values(self, output=None, limit=-1):
+        """
+        :param output: the name of the output to get values from, defaults to the first one
+        :param limit: the maximum number of values to return
+        :return: a read-only view on the latest output values, from the oldest to the most recent one
+        """
+        output_index = 0 if output is None else self.OUTPUTS.index(output)
+        size = min(max(0, self.candles_count - self.start), self.max_size)
+        if limit != -1:
+            size = min(size, limit)
+        view = self._values[output_index, self._values_end - size: self._values_end].view()
+        view.flags.writeable = False
+        return view
+
+    def get_last_value(self, output=None):
+        values = self.get_values(output, limit=1)
+        return values[-1] if len(values) else np.nan
+
+    def _compute(self, candle):
+        """
+        :return: the output values for this candle or None when the indicator is not initialized yet
+        """
+        raise NotImplementedError("_compute is not implemented")
+
+
+class EMAIndicator(IncrementalIndicator):
+    OUTPUTS = ("ema",)
+
+    def __init__(self, max_size, period):
+        super().__init__(max_size)
+        self.period = period
+        self._ema = _EMA(period)
+
+    def _compute(self, candle):
+        return (self._ema.update(candle[enums.PriceIndexes.IND_PRICE_CLOSE.value]),)
+
+
+class RSIIndicator(IncrementalIndicator):
+    OUTPUTS = ("rsi",)
+
+    def __init__(self, max_size, period):
+        super().__init__(max_size)
+        self.period = period
+        self.start = period
+        self._per = 1.0 / period
+        self._smooth_up = 0
+        self._smooth_down = 0
+        self._previous_close = None
+
+    def _compute(self, candle):
+        close = candle[enums.PriceIndexes.IND_PRICE_CLOSE.value]
+        previous_close = self._previous_close
+        self._previous_close = close
+        if previous_close is None:
+            return None
+        upward = close - previous_close if close > previous_close else 0
+        downward = previous_close - close if close < previous_close else 0
+        if self.candles_count <= self.period:
+            # initial simple average
+            self._smooth_up += upward
+            self._smooth_down += downward
+            if self.candles_count < self.period:
+                return None
+            self._smooth_up /= self.period
+            self._smooth_down /= self.period
+        else:
+            self._smooth_up = (upward - self._smooth_up) * self._per + self._smooth_up
+            self._smooth_down = (downward - self._smooth_down) * self._per + self._smooth_down
+        return (100.0 * _divide(self._smooth_up, self._smooth_up + self._smooth_down),)
+
+
+class MACDIndicator(IncrementalIndicator):
+    OUTPUTS = ("macd", "signal", "histogram")
+
+    def __init__(self, max_size, short_period, long_period, signal_period):
+        super().__init__(max_size)
+        self.short_period = short_period
+        self.long_period = long_period
+        self.signal_period = signal_period
+        self.start = long_period - 1
+        self._short_ema = _EMA(short_period)
+        self._long_ema = _EMA(long_period)
+        if short_period == 12 and long_period == 26:
+            # tulipy uses rounded values for the standard MACD periods
+            self._short_ema.per = 0.15
+            self._long_ema.per = 0.075
+        self._signal_ema = _EMA(signal_period)
+
+    def _compute(self, candle):
+        close = candle[enums.PriceIndexes.IND_PRICE_CLOSE.value]
+        macd = self._short_ema.update(close) - self._long_ema.update(close)
+        if self.candles_count < self.start:
+            return None
+        signal = self._signal_ema.update(macd)
+        return macd, signal, macd - signal
+
+
+class BBandsIndicator(IncrementalIndicator):
+    OUTPUTS = ("lower", "middle", "upper")
+
+    def __init__(self, max_size, period, stddev):
+        super().__init__(max_size)
+        self.period = period
+        self.stddev = stddev
+        self.start = period - 1
+        self._scale = 1.0 / period
+        self._last_closes = collections.deque(maxlen=period)
+        self._total = 0.0
+        self._square_total = 0.0
+
+    def _compute(self, candle):
+        close = candle[enums.PriceIndexes.IND_PRICE_CLOSE.value]
+        # sums are rolled as in tulipy: add the new close before removing the oldest one
+        self._total += close
+        self._square_total += close * close
+        if len(self._last_closes) == self.period:
+            oldest_close = self._last_closes[0]
+            self._total -= oldest_close
+            self._square_total -= oldest_close * oldest_close
+        self._last_closes.append(close)
+        if len(self._last_closes) < self.period:
+            return None
+        middle = self._total * self._scale
+        standard_deviation = _square_root(self._square_total * self._scale - middle * middle)
+        return middle - standard_deviation * self.stddev, middle, middle + standard_deviation * self.stddev
+
+
+class ADXIndicator(IncrementalIndicator):
+    OUTPUTS = ("adx",)
+
+    def __init__(self, max_size, period):
+        super().__init__(max_size)
+        self.period = period
+        self.start = (period - 1) * 2
+        self._per = (period - 1) / period
+        self._inv_per = 1.0 / period
+        self._atr = 0
+        self._dm_up = 0
+        self._dm_down = 0
+        self._adx = 0.0
+        self._previous_candle = None
+
+    def _compute(self, candle):
+        previous_candle = self._previous_candle
+        self._previous_candle = candle
+        if previous_candle is None:
+            return None
+        true_range, direction_up, direction_down = _get_true_range_and_directions(candle, previous_candle)
+        if self.candles_count < self.period:
+            self._atr += true_range
+            self._dm_up += direction_up
+            self._dm_down += direction_down
+            if self.candles_count == self.period - 1:
+                self._adx += self._get_dx()
+            return None
+        self._atr = self._atr * self._per + true_range
+        self._dm_up = self._dm_up * self._per + direction_up
+        self._dm_down = self._dm_down * self._per + direction_down
+        dx = self._get_dx()
+        smoothing_index = self.candles_count - self.period
+        if smoothing_index < self.period - 2:
+            self._adx += dx
+            return None
+        if smoothing_index == self.period - 2:
+            self._adx += dx
+        else:
+            self._adx = self._adx * self._per + dx
+        return (self._adx * self._inv_per,)
+
+    def _get_dx(self):
+        di_up = _divide(self._dm_up, self._atr)
+        di_down = _divide(self._dm_down, self._atr)
+        return _divide(abs(di_up - di_down), di_up + di_down) * 100
+
+
+class KVOIndicator(IncrementalIndicator):
+    OUTPUTS = ("kvo", "signal")
+
+    def __init__(self, max_size, short_period, long_period, signal_period=None):
+        """
+        :param signal_period: when set, the signal output is the exponential moving average of the kvo values
+        """
+        super().__init__(max_size)
+        self.short_period = short_period
+        self.long_period = long_period
+        self.signal_period = signal_period
+        self.start = 1
+        self._short_ema = _EMA(short_period)
+        self._long_ema = _EMA(long_period)
+        self._signal_ema = _EMA(signal_period) if signal_period else None
+        self._cm = 0
+        self._trend = -1
+        self._previous_candle = None
+        self._previous_hlc = None
+
+    def _compute(self, candle):
+        high = candle[enums.PriceIndexes.IND_PRICE_HIGH.value]
+        low = candle[enums.PriceIndexes.IND_PRICE_LOW.value]
+        hlc = high + low + candle[enums.PriceIndexes.IND_PRICE_CLOSE.value]
+        previous_candle, previous_hlc = self._previous_candle, self._previous_hlc
+        self._previous_candle, self._previous_hlc = candle, hlc
+        if previous_candle is None:
+            return None
+        dm = high - low
+        if hlc > previous_hlc and self._trend != 1:
+            self._trend = 1
+            self._cm = previous_candle[enums.PriceIndexes.IND_PRICE_HIGH.value] - \
+                previous_candle[enums.PriceIndexes.IND_PRICE_LOW.value]
+        elif hlc < previous_hlc and self._trend != 0:
+            self._trend = 0
+            self._cm = previous_candle[enums.PriceIndexes.IND_PRICE_HIGH.value] - \
+                previous_candle[enums.PriceIndexes.IND_PRICE_LOW.value]
+        self._cm += dm
+        volume_force = candle[enums.PriceIndexes.IND_PRICE_VOL.value] * \
+            abs(_divide(dm, self._cm) * 2 - 1) * 100 * (1.0 if self._trend else -1.0)
+        kvo = self._short_ema.update(volume_force) - self._long_ema.update(volume_force)
+        return kvo, (self._signal_ema.update(kvo) if self._signal_ema is not None else np.nan)
+
+
+class _EMA:
+    """
+    Exponential moving average seeded with its first value, as in tulipy
+    """
+    def __init__(self, period):
+        self.per = 2 / (period + 1)
+        self.value = None
+
+    def update(self, value):
+        if self.value is None:
+            self.value = value
+        else:
+            self.value = (value - self.value) * self.per + self.value
+        return self.value
+
+
+def _get_true_range_and_directions(candle, previous_candle):
+    high = candle[enums.PriceIndexes.IND_PRICE_HIGH.value]
+    low = candle[enums.PriceIndexes.IND_PRICE_LOW.value]
+    previous_close = previous_candle[enums.PriceIndexes.IND_PRICE_CLOSE.value]
+    true_range = max(high - low, abs(high - previous_close), abs(low - previous_close))
+    direction_up = high - previous_candle[enums.PriceIndexes.IND_PRICE_HIGH.value]
+    direction_down = previous_candle[enums.PriceIndexes.IND_PRICE_LOW.value] - low
+    if direction_up < 0:
+        direction_up = 0
+    elif direction_up > direction_down:
+        direction_down = 0
+    if direction_down < 0:
+        direction_down = 0
+    elif direction_down > direction_up:
+        direction_up = 0
+    return true_range, direction_up, direction_down
+
+
+def _square_root(value):
+    # rounding can give slightly negative variances: return nan as tulipy does instead of raising ValueError
+    return math.sqrt(value) if value >= 0 else math.nan
+
+
+def _divide(numerator, denominator):
+    # follow IEEE 754 (and therefore tulipy) instead of raising ZeroDivisionError
+    try:
+        return numerator / denominator
+    except ZeroDivisionError:
+        if numerator == 0 or math.isnan(numerator):
+            return math.nan
+        return math.copysign(math.inf, numerator) * math.copysign(1, denominator)
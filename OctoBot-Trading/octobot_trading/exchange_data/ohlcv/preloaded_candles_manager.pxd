@@ -29,4 +29,5 @@ cdef class PreloadedCandlesManager(candles_manager.CandlesManager):
 
     # private
     cdef int _get_candle_index(self, list candle)
+    cdef np.ndarray _get_candles_block(self)
     cdef np.ndarray _get_candle_values_array(self, list candles, int key)
@@ -44,6 +44,24 @@ class PreloadedCandlesManager(candles_manager.CandlesManager):
     def get_preloaded_symbol_volume_candles(self):
         return self.volume_candles
 
+    def get_indicator(self, indicator_class, *indicator_params):
+        """
+        Preloaded candles are not added one by one: indicators are updated up to the current candle when requested,
+        each candle is therefore given once to each indicator
+        """
+        key = (indicator_class, indicator_params)
+        indicator = self._indicators.get(key)
+        if indicator is None or indicator.candles_count > self.time_candles_index:
+            # new indicator or current candle moved back: compute from the first candle
+            indicator = indicator_class(max(len(self.time_candles), 1), *indicator_params)
+            self._indicators[key] = indicator
+        if indicator.candles_count < self.time_candles_index:
+            if self._candles is None:
+                self._candles = self._get_candles_block()
+            for candle in self._candles[:, indicator.candles_count: self.time_candles_index].T.tolist():
+                indicator.update(candle)
+        return indicator
+
     def _set_all_candles(self, new_candles_data):
         self.close_candles = self._get_candle_values_array(new_candles_data, enums.PriceIndexes.IND_PRICE_CLOSE.value)
         self.open_candles = self._get_candle_values_array(new_candles_data, enums.PriceIndexes.IND_PRICE_OPEN.value)
@@ -52,6 +70,19 @@ class PreloadedCandlesManager(candles_manager.CandlesManager):
         self.time_candles = self._get_candle_values_array(new_candles_data, enums.PriceIndexes.IND_PRICE_TIME.value)
         self.volume_candles = self._get_candle_values_array(new_candles_data, enums.PriceIndexes.IND_PRICE_VOL.value)
 
+    def _get_candles_block(self):
+        # (len(PriceIndexes), preloaded candles count) candles values, as stored in CandlesManager
+        values_by_price_index = {
+            enums.PriceIndexes.IND_PRICE_CLOSE.value: self.close_candles,
+            enums.PriceIndexes.IND_PRICE_OPEN.value: self.open_candles,
+            enums.PriceIndexes.IND_PRICE_HIGH.value: self.high_candles,
+            enums.PriceIndexes.IND_PRICE_LOW.value: self.low_candles,
+            enums.PriceIndexes.IND_PRICE_VOL.value: self.volume_candles,
+            enums.PriceIndexes.IND_PRICE_TIME.value: self.time_candles
+        }
+        return np.array([values_by_price_index[price_index.value] for price_index in enums.PriceIndexes],
+                        dtype=np.float64)
+
     def _get_candle_values_array(self, candles, key):
         return np.array([candle[key] for candle in candles])
 
@@ -86,22 +117,13 @@ class PreloadedCandlesManager(candles_manager.CandlesManager):
         self.time_candles_index = current_index
         self.volume_candles_index = current_index
 
-    def _extract_limited_data(self, data, limit=-1, max_limit=-1):
-        if limit == -1:
-            if max_limit == -1:
-                return data
-            return np.array(data[:max_limit])
-
-        if max_limit == -1:
-            return np.array(data[-min(limit, len(data)):])
-        else:
-            return np.array(data[max(0, max_limit - limit): max_limit])
-
     def add_new_candle(self, new_candle_data):
         self.logger.error("add_new_candle should not be called")
 
     def _reset_candles(self):
         self.candles_initialized = False
+        self._candles = None
+        self._indicators = {}
 
         self.close_candles_index = 0
         self.open_candles_index = 0
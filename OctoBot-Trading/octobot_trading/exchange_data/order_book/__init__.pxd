@@ -15,6 +15,7 @@
 #  License along with this library.
 
 from octobot_trading.exchange_data.order_book cimport order_book_manager
+from octobot_trading.exchange_data.order_book cimport l2_order_book_manager
 from octobot_trading.exchange_data.order_book cimport channel
 
 from octobot_trading.exchange_data.order_book.channel cimport (
@@ -27,6 +28,10 @@ from octobot_trading.exchange_data.order_book.channel cimport (
 from octobot_trading.exchange_data.order_book.order_book_manager cimport (
     OrderBookManager,
 )
+from octobot_trading.exchange_data.order_book.l2_order_book_manager cimport (
+    L2OrderBookSide,
+    L2OrderBookManager,
+)
 from octobot_trading.exchange_data.order_book.channel.order_book_updater_simulator cimport (
     OrderBookUpdaterSimulator,
 )
@@ -38,5 +43,7 @@ __all__ = [
     "OrderBookTickerProducer",
     "OrderBookTickerChannel",
     "OrderBookManager",
+    "L2OrderBookSide",
+    "L2OrderBookManager",
     "OrderBookUpdaterSimulator",
 ]
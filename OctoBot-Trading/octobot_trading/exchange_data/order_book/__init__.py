@@ -15,6 +15,7 @@
 #  License along with this library.
 
 from octobot_trading.exchange_data.order_book import order_book_manager
+from octobot_trading.exchange_data.order_book import l2_order_book_manager
 from octobot_trading.exchange_data.order_book import channel
 
 from octobot_trading.exchange_data.order_book.channel import (
@@ -27,6 +28,10 @@ from octobot_trading.exchange_data.order_book.channel import (
 from octobot_trading.exchange_data.order_book.order_book_manager import (
     OrderBookManager,
 )
+from octobot_trading.exchange_data.order_book.l2_order_book_manager import (
+    L2OrderBookSide,
+    L2OrderBookManager,
+)
 from octobot_trading.exchange_data.order_book.channel.order_book_updater_simulator import (
     OrderBookUpdaterSimulator,
 )
@@ -38,5 +43,7 @@ __all__ = [
     "OrderBookTickerProducer",
     "OrderBookTickerChannel",
     "OrderBookManager",
+    "L2OrderBookSide",
+    "L2OrderBookManager",
     "OrderBookUpdaterSimulator",
 ]
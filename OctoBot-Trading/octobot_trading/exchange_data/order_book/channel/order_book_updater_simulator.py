@@ -41,6 +41,7 @@ class OrderBookUpdaterSimulator(order_book_updater.OrderBookUpdater):
                     exchange_name=self.exchange_name,
                     symbol=pair,
                     inferior_timestamp=timestamp,
+                    cursor=self.CHANNEL_NAME,
                     limit=1))[0]
                 if order_book_data[0] > self.last_timestamp_pushed:
                     self.last_timestamp_pushed = order_book_data[0]
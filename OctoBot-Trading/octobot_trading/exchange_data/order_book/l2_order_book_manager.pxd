@@ -0,0 +1,42 @@
+#  Drakkar-Software OctoBot-Trading
+#  Copyright (c) Drakkar-Software, All rights reserved.
+#
+#  This library is free software; you can redistribute it and/or
+#  modify it under the terms of the GNU Lesser General Public
+#  License as published by the Free Software Foundation; either
+#  version 3.0 of the License, or (at your option) any later version.
+#
+#  This library is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the GNU
+#  Lesser General Public License for more details.
+#
+#  You should have received a copy of the GNU Lesser General Public
+#  License along with this library.
+cimport octobot_trading.exchange_data.order_book.order_book_manager as order_book_manager
+
+
+cdef class L2OrderBookSide:
+    cdef public str side
+    cdef public bint is_best_price_last
+
+    cdef public object levels # sortedcontainers.SortedDict
+
+    cpdef void clear(self)
+    cpdef void set_levels(self, object price_levels)
+    cpdef void set_level(self, double price, double size)
+    cpdef void update_level(self, double price, double size)
+    cpdef void remove_level(self, double price)
+    cpdef object get_size(self, double price)
+    cpdef tuple get_best(self)
+    cpdef list get_depth(self, int count)
+
+
+cdef class L2OrderBookManager(order_book_manager.OrderBookManager):
+    cdef object _handle_book_delete(self, dict order) # using object to prevent ignoring KeyError
+    cdef object _handle_book_update(self, dict order) # using object to prevent ignoring KeyError
+    cdef object _handle_book_add(self, dict order) # using object to prevent ignoring KeyError
+    cdef L2OrderBookSide _get_side(self, dict order)
+
+cdef tuple _get_price_level(double price, double size, str side)
+cdef object _get_price_level_orders(double price, object size, str side)
@@ -0,0 +1,176 @@
+#  Drakkar-Software OctoBot-Trading
+#  Copyright (c) Drakkar-Software, All rights reserved.
+#
+#  This library is free software; you can redistribute it and/or
+#  modify it under the terms of the GNU Lesser General Public
+#  License as published by the Free Software Foundation; either
+#  version 3.0 of the License, or (at your option) any later version.
+#
+#  This library is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the GNU
+#  Lesser General Public License for more details.
+#
+#  You should have received a copy of the GNU Lesser General Public
+#  License along with this library.
+import sortedcontainers
+
+import octobot_trading.enums as enums
+import octobot_trading.exchange_data.order_book.order_book_manager as order_book_manager
+from octobot_trading.enums import ExchangeConstantsOrderBookInfoColumns as ECOBIC
+
+
+class L2OrderBookSide:
+    """
+    Price levels of an order book side, stored as a price: size SortedDict sorted by ascending price:
+    inserting, updating and removing a price level is O(log(n)) and reading the best levels doesn't copy
+    the whole side
+    """
+
+    def __init__(self, side):
+        self.side = side
+        # best price is the lowest ask and the highest bid
+        self.is_best_price_last = side == enums.TradeOrderSide.BUY.value
+        self.levels = sortedcontainers.SortedDict()
+
+    def __len__(self):
+        return len(self.levels)
+
+    def clear(self):
+        self.levels = sortedcontainers.SortedDict()
+
+    def set_levels(self, price_levels):
+        """
+        Replace every price level by the given (price, size) price levels
+        """
+        levels = sortedcontainers.SortedDict()
+        for price_level in price_levels:
+            if price_level[1]:
+                levels[float(price_level[0])] = float(price_level[1])
+        self.levels = levels
+
+    def set_level(self, price, size):
+        """
+        Insert or update the price level, remove it when size is 0
+        """
+        if size:
+            self.levels[price] = size
+        else:
+            self.levels.pop(price, None)
+
+    def update_level(self, price, size):
+        """
+        Update the price level size when the price level exists
+        """
+        if price in self.levels:
+            self.levels[price] = size
+
+    def remove_level(self, price):
+        self.levels.pop(price, None)
+
+    def get_size(self, price):
+        """
+        :return: the price level size, None when the price level doesn't exist
+        """
+        return self.levels.get(price, None)
+
+    def get_best(self):
+        """
+        :return: the (price, size) best price level, raises IndexError when the side is empty
+        """
+        return self.levels.peekitem(-1 if self.is_best_price_last else 0)
+
+    def get_depth(self, count):
+        """
+        :return: the (price, size) of the count best price levels, best price first
+        """
+        if self.is_best_price_last:
+            start = max(len(self.levels) - count, 0)
+            return self.levels.items()[start:][::-1]
+        return self.levels.items()[:count]
+
+
+class L2OrderBookManager(order_book_manager.OrderBookManager):
+    """
+    OrderBookManager keeping aggregated price levels only: each price level has a size and no order id.
+    Adding an order sets its price level size, deleting an order removes its price level.
+    """
+
+    def __init__(self):
+        super().__init__()
+        self.asks = L2OrderBookSide(enums.TradeOrderSide.SELL.value)
+        self.bids = L2OrderBookSide(enums.TradeOrderSide.BUY.value)
+
+    def handle_new_books(self, asks, bids, timestamp=None):
+        self.handle_price_levels_snapshot(asks, bids, timestamp=timestamp)
+
+    def handle_price_levels_snapshot(self, asks, bids, timestamp=None):
+        self.reset_order_book()
+        self.asks.set_levels(asks)
+        self.bids.set_levels(bids)
+        if timestamp:
+            self.timestamp = timestamp
+        self.order_book_initialized = True
+
+    def handle_price_levels_deltas(self, asks, bids, timestamp=None):
+        for price, size in asks:
+            self.asks.set_level(price, size)
+        for price, size in bids:
+            self.bids.set_level(price, size)
+        if timestamp:
+            self.timestamp = timestamp
+
+    def _handle_book_add(self, order):
+        self._get_side(order).set_level(float(order[ECOBIC.PRICE.value]), float(order[ECOBIC.SIZE.value]))
+
+    def _handle_book_delete(self, order):
+        self._get_side(order).remove_level(float(order[ECOBIC.PRICE.value]))
+
+    def _handle_book_update(self, order):
+        size = order.get(ECOBIC.SIZE.value, order_book_manager.INVALID_PARSED_VALUE)
+        if size != order_book_manager.INVALID_PARSED_VALUE:
+            self._get_side(order).update_level(float(order[ECOBIC.PRICE.value]), float(size))
+
+    def _get_side(self, order):
+        return self.bids if order[ECOBIC.SIDE.value] == enums.TradeOrderSide.BUY.value else self.asks
+
+    def get_ask(self):
+        price, size = self.asks.get_best()
+        return _get_price_level(price, size, enums.TradeOrderSide.SELL.value)
+
+    def get_bid(self):
+        price, size = self.bids.get_best()
+        return _get_price_level(price, size, enums.TradeOrderSide.BUY.value)
+
+    def get_asks(self, price):
+        return _get_price_level_orders(price, self.asks.get_size(price), enums.TradeOrderSide.SELL.value)
+
+    def get_bids(self, price):
+        return _get_price_level_orders(price, self.bids.get_size(price), enums.TradeOrderSide.BUY.value)
+
+    def get_asks_depth(self, count):
+        return self.asks.get_depth(count)
+
+    def get_bids_depth(self, count):
+        return self.bids.get_depth(count)
+
+
+def _get_price_level(price, size, side):
+    """
+    :return: the (price, orders) price level in OrderBookManager format
+    """
+    return price, _get_price_level_orders(price, size, side)
+
+
+def _get_price_level_orders(price, size, side):
+    """
+    :return: the price level as an OrderBookManager orders list, None when size is None
+    """
+    if size is None:
+        return None
+    return [{
+        ECOBIC.SIDE.value: side,
+        ECOBIC.PRICE.value: price,
+        ECOBIC.SIZE.value: size,
+        ECOBIC.ORDER_ID.value: None
+    }]
@@ -37,6 +37,8 @@ cdef class OrderBookManager(util.Initializable):
                                         double bid_quantity, double bid_price)
     cpdef void handle_new_book(self, dict orders)
     cpdef void handle_new_books(self, list asks, list bids, object timestamp=*)
+    cpdef void handle_price_levels_snapshot(self, list asks, list bids, object timestamp=*)
+    cpdef void handle_price_levels_deltas(self, list asks, list bids, object timestamp=*)
     cpdef void handle_book_adds(self, list orders)
     cpdef void handle_book_deletes(self, list orders)
     cpdef void handle_book_updates(self, list orders)
@@ -44,6 +46,8 @@ cdef class OrderBookManager(util.Initializable):
     cpdef tuple get_bid(self)
     cpdef object get_asks(self, double price)
     cpdef object get_bids(self, double price)
+    cpdef list get_asks_depth(self, int count)
+    cpdef list get_bids_depth(self, int count)
 
     cdef object _handle_book_delete(self, dict order) # using object to prevent ignoring KeyError
     cdef object _handle_book_update(self, dict order) # using object to prevent ignoring KeyError
@@ -53,6 +57,8 @@ cdef class OrderBookManager(util.Initializable):
     cdef void _remove_asks(self, double price)
     cdef void _remove_bids(self, double price)
 
+cdef object _get_orders_size(list orders)
 cdef int _order_id_index(str order_id, list order_list)
+cdef void _apply_price_levels(object book_side, list price_levels, str side)
 cdef list _convert_price_size_list_to_order(list price_size_list, str side)
-cdef dict _convert_price_size_to_order(list price_size, str side)
+cdef dict _convert_price_size_to_order(object price_size, str side)
@@ -14,6 +14,7 @@
 #  You should have received a copy of the GNU Lesser General Public
 #  License along with this library.
 import decimal
+import itertools
 import sortedcontainers
 
 import octobot_commons.logging as logging
@@ -66,6 +67,29 @@ class OrderBookManager(util.Initializable):
             self.timestamp = timestamp
         self.order_book_initialized = True
 
+    def handle_price_levels_snapshot(self, asks, bids, timestamp=None):
+        """
+        Replace the order book content by the given price levels
+        :param asks: the ask side (price, size) price levels
+        :param bids: the bid side (price, size) price levels
+        :param timestamp: the snapshot timestamp
+        """
+        self.reset_order_book()
+        self.handle_price_levels_deltas(asks, bids, timestamp=timestamp)
+        self.order_book_initialized = True
+
+    def handle_price_levels_deltas(self, asks, bids, timestamp=None):
+        """
+        Apply changed price levels only: a level is replaced by its new size and removed when its size is 0
+        :param asks: the changed ask side (price, size) price levels
+        :param bids: the changed bid side (price, size) price levels
+        :param timestamp: the update timestamp
+        """
+        _apply_price_levels(self.asks, asks, enums.TradeOrderSide.SELL.value)
+        _apply_price_levels(self.bids, bids, enums.TradeOrderSide.BUY.value)
+        if timestamp:
+            self.timestamp = timestamp
+
     def handle_book_adds(self, orders):
         for order in orders:
             try:
@@ -179,6 +203,36 @@ class OrderBookManager(util.Initializable):
     def get_bids(self, price):
         return self.bids.get(price, None)
 
+    def get_asks_depth(self, count):
+        """
+        :param count: the max number of price levels to return
+        :return: the (price, size) of the count best ask price levels, best price first
+        """
+        return [
+            (price, _get_orders_size(orders))
+            for price, orders in itertools.islice(self.asks.items(), count)
+        ]
+
+    def get_bids_depth(self, count):
+        """
+        :param count: the max number of price levels to return
+        :return: the (price, size) of the count best bid price levels, best price first
+        """
+        return [
+            (price, _get_orders_size(orders))
+            for price, orders in itertools.islice(reversed(self.bids.items()), count)
+        ]
+
+
+def _get_orders_size(orders):
+    """
+    :return: the total size of the given price level orders
+    """
+    size = 0
+    for order in orders:
+        size += order[ECOBIC.SIZE.value]
+    return size
+
 
 def _order_id_index(order_id, order_list):
     """
@@ -194,6 +248,20 @@ def _order_id_index(order_id, order_list):
     return ORDER_ID_NOT_FOUND
 
 
+def _apply_price_levels(book_side, price_levels, side):
+    """
+    Set each price level in the given book side, a 0 size removes the level
+    :param book_side: the asks or bids SortedDict to update
+    :param price_levels: the (price, size) price levels
+    :param side: the order side
+    """
+    for price, size in price_levels:
+        if size:
+            book_side[price] = [_convert_price_size_to_order((price, size), side)]
+        else:
+            book_side.pop(price, None)
+
+
 def _convert_price_size_list_to_order(price_size_list, side):
     """
     Convert a [price, size] list to the book order format
@@ -17,6 +17,7 @@
 from octobot_trading.exchange_data.prices cimport channel
 from octobot_trading.exchange_data.prices cimport prices_manager
 from octobot_trading.exchange_data.prices cimport price_events_manager
+from octobot_trading.exchange_data.prices cimport orders_matching_engine
 
 from octobot_trading.exchange_data.prices.channel cimport (
     MarkPriceUpdater,
@@ -31,6 +32,10 @@ from octobot_trading.exchange_data.prices.prices_manager cimport (
 from octobot_trading.exchange_data.prices.price_events_manager cimport (
     PriceEventsManager,
 )
+from octobot_trading.exchange_data.prices.orders_matching_engine cimport (
+    PriceTrigger,
+    OrdersMatchingEngine,
+)
 
 __all__ = [
     "MarkPriceUpdaterSimulator",
@@ -40,4 +45,6 @@ __all__ = [
     "calculate_mark_price_from_recent_trade_prices",
     "MarkPriceUpdater",
     "PriceEventsManager",
+    "PriceTrigger",
+    "OrdersMatchingEngine",
 ]
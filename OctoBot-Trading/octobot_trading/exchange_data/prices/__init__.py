@@ -17,6 +17,7 @@
 from octobot_trading.exchange_data.prices import channel
 from octobot_trading.exchange_data.prices import prices_manager
 from octobot_trading.exchange_data.prices import price_events_manager
+from octobot_trading.exchange_data.prices import orders_matching_engine
 
 from octobot_trading.exchange_data.prices.channel import (
     MarkPriceUpdater,
@@ -31,6 +32,10 @@ from octobot_trading.exchange_data.prices.prices_manager import (
 from octobot_trading.exchange_data.prices.price_events_manager import (
     PriceEventsManager,
 )
+from octobot_trading.exchange_data.prices.orders_matching_engine import (
+    PriceTrigger,
+    OrdersMatchingEngine,
+)
 
 __all__ = [
     "MarkPriceUpdaterSimulator",
@@ -40,4 +45,6 @@ __all__ = [
     "calculate_mark_price_from_recent_trade_prices",
     "MarkPriceUpdater",
     "PriceEventsManager",
+    "PriceTrigger",
+    "OrdersMatchingEngine",
 ]
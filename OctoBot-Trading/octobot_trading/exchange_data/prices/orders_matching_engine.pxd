@@ -0,0 +1,35 @@
+#  Drakkar-Software OctoBot-Trading
+#  Copyright (c) Drakkar-Software, All rights reserved.
+#
+#  This library is free software; you can redistribute it and/or
+#  modify it under the terms of the GNU Lesser General Public
+#  License as published by the Free Software Foundation; either
+#  version 3.0 of the License, or (at your option) any later version.
+#
+#  This library is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the GNU
+#  Lesser General Public License for more details.
+#
+#  You should have received a copy of the GNU Lesser General Public
+#  License along with this library.
+cimport octobot_trading.exchange_data.prices.price_events_manager as price_events_manager
+
+
+cdef class PriceTrigger:
+    cdef public object callback # coroutine function
+    cdef bint _is_set
+
+    cpdef bint is_set(self)
+    cpdef void set(self)
+
+
+cdef class OrdersMatchingEngine(price_events_manager.PriceEventsManager):
+    cdef list _triggered_triggers
+    cdef object _fill_task # asyncio.Task
+
+    cpdef object new_trigger(self, object price, double timestamp, bint trigger_above, object callback,
+                             bint allow_instant_fill=*) # return PriceTrigger
+    cpdef void schedule_trigger(self, PriceTrigger trigger)
+
+    cdef object _remove_and_set_event(self, object event_to_set) # return to propagate errors
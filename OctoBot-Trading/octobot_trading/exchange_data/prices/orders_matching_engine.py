@@ -0,0 +1,100 @@
+#  Drakkar-Software OctoBot-Trading
+#  Copyright (c) Drakkar-Software, All rights reserved.
+#
+#  This library is free software; you can redistribute it and/or
+#  modify it under the terms of the GNU Lesser General Public
+#  License as published by the Free Software Foundation; either
+#  version 3.0 of the License, or (at your option) any later version.
+#
+#  This library is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the GNU
+#  Lesser General Public License for more details.
+#
+#  You should have received a copy of the GNU Lesser General Public
+#  License along with this library.
+import asyncio
+
+import octobot_trading.exchange_data.prices.price_events_manager as price_events_manager
+
+
+class PriceTrigger:
+    """
+    Price event calling its callback from the OrdersMatchingEngine fill task once set
+    """
+
+    def __init__(self, callback):
+        self.callback = callback
+        self._is_set = False
+
+    def is_set(self):
+        return self._is_set
+
+    def set(self):
+        self._is_set = True
+
+
+class OrdersMatchingEngine(price_events_manager.PriceEventsManager):
+    """
+    Symbol price events manager also matching simulated orders.
+    Orders register a PriceTrigger in the price sorted books instead of waiting for an asyncio.Event
+    in their own task: on each recent trade or mark price, every crossed trigger is collected and its
+    callback (usually order.on_fill) is called in a single fill task.
+    """
+
+    def __init__(self):
+        super().__init__()
+        self._triggered_triggers = []
+        self._fill_task = None
+
+    def reset(self):
+        super().reset()
+        self._triggered_triggers = []
+        if self._fill_task is not None:
+            self._fill_task.cancel()
+            self._fill_task = None
+
+    def new_trigger(self, price, timestamp, trigger_above, callback, allow_instant_fill=True):
+        """
+        Create a new trigger at price and timestamp.
+        When instantly triggered, the returned trigger is already set and its callback is not scheduled.
+        Otherwise, callback will be called from the fill task once the required price conditions are met
+        :param price: the trigger price
+        :param timestamp: the timestamp to wait for
+        :param trigger_above: True if waiting for an upper price
+        :param callback: the coroutine function to call when triggered
+        :param allow_instant_fill: True if recent prices should be checked to set this trigger
+        :return: the price trigger
+        """
+        return self._register_event(PriceTrigger(callback), price, timestamp, trigger_above, allow_instant_fill)
+
+    def schedule_trigger(self, trigger):
+        """
+        Call the trigger callback from the fill task
+        :param trigger: the trigger to call
+        """
+        self._triggered_triggers.append(trigger)
+        if self._fill_task is None:
+            self._fill_task = asyncio.create_task(self._call_triggered_callbacks())
+
+    def _remove_and_set_event(self, event_to_set):
+        price_events_manager.PriceEventsManager._remove_and_set_event(self, event_to_set)
+        if isinstance(event_to_set, PriceTrigger):
+            self.schedule_trigger(event_to_set)
+
+    async def _call_triggered_callbacks(self):
+        """
+        Call every triggered callback in triggering order, including the ones triggered in the meantime
+        """
+        try:
+            while self._triggered_triggers:
+                triggers = self._triggered_triggers
+                self._triggered_triggers = []
+                for trigger in triggers:
+                    try:
+                        await trigger.callback()
+                    except Exception as e:
+                        self.logger.exception(e, True, f"Error when calling triggered price callback: {e}")
+        finally:
+            if self._fill_task is asyncio.current_task():
+                self._fill_task = None
@@ -20,7 +20,9 @@ cimport octobot_trading.util as util
 cdef class PriceEventsManager(util.Initializable):
     cdef object logger
 
-    cdef list events
+    cdef dict events
+    cdef object _trigger_above_events # SortedKeyList
+    cdef object _trigger_below_events # SortedKeyList
     cdef list _last_recent_prices
 
     cpdef void reset(self)
@@ -30,10 +32,14 @@ cdef class PriceEventsManager(util.Initializable):
     cpdef object remove_event(self, object event_to_remove) # object is an asyncio.Event
     cpdef void clear_recent_prices(self)
 
+    cdef object _register_event(self, object event, object price, double timestamp, bint trigger_above,
+                                bint allow_instant_fill)
     cdef bint _is_triggered_by_last_recent_prices(self, object price, double timestamp, bint trigger_above)
     cdef void _add_recent_price(self, object price, double timestamp)
     cdef object _remove_and_set_event(self, object event_to_set) # return to propagate errors
+    cdef void _add_event(self, tuple price_event_tuple)
     cdef object _remove_event(self, object event_to_remove) # object is an asyncio.Event
+    cdef object _get_book(self, bint trigger_above) # return SortedKeyList
     cdef list _check_events(self, object price, double timestamp)
 
-cdef tuple _new_price_event(object price, double timestamp, bint trigger_above)
+cdef tuple _new_price_event(object event, object price, double timestamp, bint trigger_above)
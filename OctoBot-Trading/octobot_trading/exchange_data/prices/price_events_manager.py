@@ -15,6 +15,7 @@
 #  License along with this library.
 import asyncio
 import decimal
+import sortedcontainers
 
 import octobot_commons.logging as logging
 from octobot_trading.enums import ExchangeConstantsOrderColumns as ECOC
@@ -24,18 +25,29 @@ class PriceEventsManager:
     """
     Manage price events for a specific price and timestamp
     Mainly used for updating Order status
+    Pending events are stored in two price sorted books (one for each trigger direction) to only
+    visit the crossed part of each book when a new price is handled
     """
 
     """
     The price event index from a price event tuple
     """
     PRICE_EVENT_INDEX = 2
+    """
+    The trigger direction index from a price event tuple
+    """
+    TRIGGER_ABOVE_INDEX = 3
     PRICE_KEY = "price"
     TIME_KEY = "time"
 
     def __init__(self):
         self.logger = logging.get_logger(self.__class__.__name__)
-        self.events = []
+        # price event tuples by event
+        self.events = {}
+        # price event tuples sorted by price: lowest first
+        self._trigger_above_events = sortedcontainers.SortedKeyList(key=_get_event_price)
+        # price event tuples sorted by price: highest first
+        self._trigger_below_events = sortedcontainers.SortedKeyList(key=_get_event_negative_price)
         self._last_recent_prices = []
 
     def reset(self):
@@ -44,6 +56,8 @@ class PriceEventsManager:
         """
         self.clear_recent_prices()
         self.events.clear()
+        self._trigger_above_events.clear()
+        self._trigger_below_events.clear()
 
     def handle_recent_trades(self, recent_trades):
         """
@@ -92,14 +106,22 @@ class PriceEventsManager:
         :param allow_instant_fill: True if recent prices should be checked to fill this event
         :return: the price event
         """
-        price_event_tuple = _new_price_event(price, timestamp, trigger_above)
+        return self._register_event(asyncio.Event(), price, timestamp, trigger_above, allow_instant_fill)
+
+    def _register_event(self, event, price, timestamp, trigger_above, allow_instant_fill):
+        """
+        Set the event if it is instantly triggered, add it to the pending events otherwise
+        :param event: the event to register, implementing is_set() and set()
+        :return: the registered event
+        """
+        price_event_tuple = _new_price_event(event, price, timestamp, trigger_above)
         if allow_instant_fill and self._is_triggered_by_last_recent_prices(price, timestamp, trigger_above):
             # don't add to self.events an event that is already set
-            price_event_tuple[PriceEventsManager.PRICE_EVENT_INDEX].set()
+            event.set()
         else:
             # this event will be set when conditions are met
-            self.events.append(price_event_tuple)
-        return price_event_tuple[PriceEventsManager.PRICE_EVENT_INDEX]
+            self._add_event(price_event_tuple)
+        return event
 
     def _is_triggered_by_last_recent_prices(self, price, timestamp, trigger_above):
         """
@@ -134,39 +156,69 @@ class PriceEventsManager:
         event_to_set.set()
         return self._remove_event(event_to_set)
 
+    def _add_event(self, price_event_tuple):
+        """
+        Add the price event tuple to events and to its price sorted book
+        :param price_event_tuple: the price event tuple to add
+        """
+        self.events[price_event_tuple[PriceEventsManager.PRICE_EVENT_INDEX]] = price_event_tuple
+        self._get_book(price_event_tuple[PriceEventsManager.TRIGGER_ABOVE_INDEX]).add(price_event_tuple)
+
     def _remove_event(self, event_to_remove):
         """
-        Remove the event from events list
+        Remove the event from events and from its price sorted book
         :param event_to_remove: the event to remove
         """
-        for price_event_data in self.events:
-            if event_to_remove in price_event_data:
-                return self.events.remove(price_event_data)
+        price_event_tuple = self.events.pop(event_to_remove, None)
+        if price_event_tuple is not None:
+            self._get_book(price_event_tuple[PriceEventsManager.TRIGGER_ABOVE_INDEX]).remove(price_event_tuple)
+
+    def _get_book(self, trigger_above):
+        """
+        :param trigger_above: True if waiting for an upper price
+        :return: the price sorted book associated to the trigger direction
+        """
+        return self._trigger_above_events if trigger_above else self._trigger_below_events
 
     def _check_events(self, price, timestamp):
         """
-        Check for each price, timestamp pair event if it should be triggered
+        Check for each price, timestamp pair event if it should be triggered.
+        Only the crossed part of each price sorted book is visited
         :param price: the price used to check
         :param timestamp: the timestamp used to check
         :return: the event list that match
         """
         return [
             event
-            for event_price, event_timestamp, event, trigger_above in self.events
-            if event_timestamp <= timestamp and
-            (
-                (trigger_above and event_price <= price) or
-                (not trigger_above and event_price >= price)
-            )
+            for book, max_key in ((self._trigger_above_events, price), (self._trigger_below_events, -price))
+            for _, event_timestamp, event, _ in book.irange_key(max_key=max_key)
+            if event_timestamp <= timestamp
         ]
 
 
-def _new_price_event(price, timestamp, trigger_above):
+def _new_price_event(event, price, timestamp, trigger_above):
     """
     Create a new price event item
+    :param event: the event to set when price conditions are met
     :param price: the price condition
     :param timestamp: the timestamp condition
     :param trigger_above: True if waiting for an upper price
     :return: a tuple to be added into events list
     """
-    return price, timestamp, asyncio.Event(), trigger_above
+    return price, timestamp, event, trigger_above
+
+
+def _get_event_price(price_event_tuple):
+    """
+    :param price_event_tuple: the price event tuple
+    :return: the price condition of the price event tuple
+    """
+    return price_event_tuple[0]
+
+
+def _get_event_negative_price(price_event_tuple):
+    """
+    :param price_event_tuple: the price event tuple
+    :return: the negative price condition of the price event tuple
+    """
+    return -price_event_tuple[0]
@@ -53,6 +53,7 @@ class RecentTradeUpdaterSimulator(recent_trade_updater.RecentTradeUpdater):
                     exchange_name=self.exchange_name,
                     symbol=pair,
                     inferior_timestamp=timestamp,
+                    cursor=self.CHANNEL_NAME,
                     limit=1))[0]
                 if recent_trades_data[0] > self.last_timestamp_pushed:
                     self.last_timestamp_pushed = recent_trades_data[0]
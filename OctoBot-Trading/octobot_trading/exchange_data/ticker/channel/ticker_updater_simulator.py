@@ -56,6 +56,7 @@ class TickerUpdaterSimulator(ticker_updater.TickerUpdater):
                     exchange_name=self.exchange_name,
                     symbol=pair,
                     inferior_timestamp=timestamp,
+                    cursor=self.CHANNEL_NAME,
                     limit=1))[0]
                 if ticker_data[0] > self.last_timestamp_pushed:
                     self.last_timestamp_pushed = ticker_data[0]
@@ -35,6 +35,12 @@ class AbstractWebsocketExchange:
     # Used to ignore a feed when at least one of the corresponding feed is supported
     IGNORED_FEED_PAIRS = {}
 
+    # Order book engine used to store websocket and exchange symbol data order books,
+    # exchange_data.OrderBookManager when None.
+    # Use exchange_data.L2OrderBookManager for faster price levels updates and depth reads when
+    # order ids are not required
+    ORDER_BOOK_MANAGER_CLASS = None
+
     def __init__(self,
                  config: object,
                  exchange_manager: object):
@@ -183,9 +189,13 @@ class AbstractWebsocketExchange:
         try:
             return self.books[symbol]
         except KeyError:
-            self.books[symbol] = exchange_data.OrderBookManager()
+            self.books[symbol] = self.get_order_book_manager_class()()
             return self.books[symbol]
 
+    @classmethod
+    def get_order_book_manager_class(cls):
+        return cls.ORDER_BOOK_MANAGER_CLASS or exchange_data.OrderBookManager
+
     def get_pair_from_exchange(self, pair):
         raise NotImplementedError("get_pair_from_exchange is not implemented")
 
@@ -38,8 +38,7 @@ import octobot_trading.constants as trading_constants
 import octobot_trading.enums as trading_enums
 import octobot_trading.exchanges.abstract_websocket_exchange as abstract_websocket
 import octobot_trading.exchanges.connectors.abstract_websocket_connector as abstract_websocket_connector
-from octobot_trading.enums import ExchangeConstantsOrderBookInfoColumns as ECOBIC, \
-    ExchangeConstantsTickersColumns as Ectc
+from octobot_trading.enums import ExchangeConstantsTickersColumns as Ectc
 from octobot_trading.enums import WebsocketFeeds as Feeds
 
 
@@ -97,6 +96,10 @@ class CryptofeedWebsocketConnector(abstract_websocket.AbstractWebsocketExchange)
 
     EXCHANGE_CONSTRUCTOR_KWARGS = {}
 
+    # When True, order book updates only apply the changed price levels when provided by cryptofeed
+    # instead of converting the whole book on each update
+    USE_BOOK_DELTAS = True
+
     def __init__(self, config: object, exchange_manager: object):
         super().__init__(config, exchange_manager)
         self.channels = []
@@ -574,21 +577,16 @@ class CryptofeedWebsocketConnector(abstract_websocket.AbstractWebsocketExchange)
     def _is_pair_independent_feed(self, feed):
         return feed in self.PAIR_INDEPENDENT_CHANNELS
 
-    def _convert_book_prices_to_orders(self, book_prices, book_side):
+    def _convert_book_prices_to_price_levels(self, book_prices):
         """
-        Convert a book_prices format : {PRICE_1: SIZE_1, PRICE_2: SIZE_2...}
-        to OctoBot's order book format
-        :param book_prices: an order book dictionary (order_book.SortedDict)
-        :param book_side: a TradeOrderSide value
-        :return: the list of order book data converted
+        Convert a book_prices format : [(PRICE_1, SIZE_1), (PRICE_2, SIZE_2)...]
+        to OctoBot's order book price levels format
+        :param book_prices: a list of (price, size) tuples (from an order book side or delta)
+        :return: the list of (price, size) price levels converted
         """
         return [
-            {
-                ECOBIC.PRICE.value: float(order_price),
-                ECOBIC.SIZE.value: float(order_size),
-                ECOBIC.SIDE.value: book_side,
-            }
-            for order_price, order_size in book_prices.to_dict().items()
+            (float(order_price), float(order_size))
+            for order_price, order_size in book_prices
         ]
 
     def _set_async_callbacks(self):
@@ -678,13 +676,15 @@ class CryptofeedWebsocketConnector(abstract_websocket.AbstractWebsocketExchange)
         symbol = self.get_pair_from_exchange(order_book.symbol)
         book_instance = self.get_book_instance(symbol)
 
-        book_instance.handle_book_adds(
-            self._convert_book_prices_to_orders(
-                book_prices=order_book.book.asks,
-                book_side=trading_enums.TradeOrderSide.SELL.value) +
-            self._convert_book_prices_to_orders(
-                book_prices=order_book.book.bids,
-                book_side=trading_enums.TradeOrderSide.BUY.value))
+        if self.USE_BOOK_DELTAS and order_book.delta is not None and book_instance.order_book_initialized:
+            book_instance.handle_price_levels_deltas(
+                asks=self._convert_book_prices_to_price_levels(order_book.delta[cryptofeed_constants.ASK]),
+                bids=self._convert_book_prices_to_price_levels(order_book.delta[cryptofeed_constants.BID]))
+        else:
+            # snapshot (or delta unavailable): replace the whole book
+            book_instance.handle_price_levels_snapshot(
+                asks=self._convert_book_prices_to_price_levels(order_book.book.asks.to_list()),
+                bids=self._convert_book_prices_to_price_levels(order_book.book.bids.to_list()))
 
         await self.push_to_channel(trading_constants.ORDER_BOOK_CHANNEL,
                                    symbol,
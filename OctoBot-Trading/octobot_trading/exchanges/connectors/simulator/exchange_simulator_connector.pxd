@@ -25,6 +25,9 @@ cdef class ExchangeSimulatorConnector(abstract_exchange.AbstractExchange):
 
     cdef public dict current_future_candles
 
+    cdef public dict fees_by_symbol
+    cdef public dict trade_fee_details_by_symbol
+
     cdef public bint is_authenticated
 
     cpdef object get_adapter_class(self, object adapter_class)
@@ -32,7 +35,11 @@ cdef class ExchangeSimulatorConnector(abstract_exchange.AbstractExchange):
     cpdef list get_available_time_frames(self)
     cpdef list get_backtesting_data_files(self)
     cpdef list get_time_frames(self, object importer)
+    cpdef void load_symbols_tables(self)
 
+    cdef void _load_symbol_tables(self, str symbol)
+    cdef dict _create_market_status(self)
+    cdef dict _create_fees(self)
     cdef void _read_fees_from_config(self, dict result_fees)
 
 # Should be cythonized with cython 3.0
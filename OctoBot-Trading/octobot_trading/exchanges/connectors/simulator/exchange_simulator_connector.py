@@ -18,7 +18,6 @@ import decimal
 import octobot_backtesting.api as backtesting_api
 import octobot_backtesting.importers as importers
 
-import octobot_commons.number_util as number_util
 import octobot_commons.symbols as symbol_util
 import octobot_commons.time_frame_manager as time_frame_manager
 import octobot_commons.constants as commons_constants
@@ -43,6 +42,10 @@ class ExchangeSimulatorConnector(abstract_exchange.AbstractExchange):
 
         self.current_future_candles = {}
 
+        # immutable per symbol tables, computed at initialize_impl
+        self.fees_by_symbol = {}
+        self.trade_fee_details_by_symbol = {}
+
         self.is_authenticated = False
 
     async def initialize_impl(self):
@@ -60,6 +63,31 @@ class ExchangeSimulatorConnector(abstract_exchange.AbstractExchange):
 
         # set exchange manager attributes
         self.exchange_manager.client_symbols = list(self.symbols)
+        self.load_symbols_tables()
+
+    def load_symbols_tables(self):
+        """
+        Computes the fees and trade fee details of each symbol. Simulated fees do not change
+        during a run: call it again only when the simulator fees configuration is updated
+        """
+        self.fees_by_symbol = {}
+        self.trade_fee_details_by_symbol = {}
+        for symbol in self.symbols:
+            self._load_symbol_tables(symbol)
+
+    def _load_symbol_tables(self, symbol):
+        fees = self._create_fees()
+        market_status = self._create_market_status()
+        precision = market_status[enums.ExchangeConstantsMarketStatusColumns.PRECISION.value][
+            enums.ExchangeConstantsMarketStatusColumns.PRECISION_PRICE.value]
+        currency, market = symbol_util.parse_symbol(symbol).base_and_quote()
+        self.fees_by_symbol[symbol] = fees
+        self.trade_fee_details_by_symbol[symbol] = (
+            currency,
+            market,
+            {fee_type: decimal.Decimal(str(rate)) for fee_type, rate in fees.items()},
+            decimal.Decimal(1).scaleb(-precision),
+        )
 
     def get_adapter_class(self, adapter_class):
         return adapter_class or exchange_simulator_adapter.ExchangeSimulatorAdapter
@@ -125,6 +153,10 @@ class ExchangeSimulatorConnector(abstract_exchange.AbstractExchange):
         return [backtesting_api.get_data_file_path(importer) for importer in self.exchange_importers]
 
     def get_market_status(self, symbol, price_example=0, with_fixer=True):
+        # building the market status literal is cheaper than copying a cached one: callers can edit it
+        return self._create_market_status()
+
+    def _create_market_status(self):
         return {
             # number of decimal digits "after the dot"
             enums.ExchangeConstantsMarketStatusColumns.PRECISION.value: {
@@ -152,6 +184,14 @@ class ExchangeSimulatorConnector(abstract_exchange.AbstractExchange):
         return timestamp / 1000
 
     def get_fees(self, symbol):
+        # return a copy: callers can edit it without changing the cached fees
+        try:
+            return self.fees_by_symbol[symbol].copy()
+        except KeyError:
+            self._load_symbol_tables(symbol)
+            return self.fees_by_symbol[symbol].copy()
+
+    def _create_fees(self):
         result_fees = {
             enums.ExchangeConstantsMarketPropertyColumns.TAKER.value: constants.CONFIG_DEFAULT_SIMULATOR_FEES,
             enums.ExchangeConstantsMarketPropertyColumns.MAKER.value: constants.CONFIG_DEFAULT_SIMULATOR_FEES,
@@ -172,7 +212,7 @@ class ExchangeSimulatorConnector(abstract_exchange.AbstractExchange):
                 self.config[commons_constants.CONFIG_SIMULATOR][commons_constants.CONFIG_SIMULATOR_FEES][
                     commons_constants.CONFIG_SIMULATOR_FEES_MAKER] / 100
 
-        if commons_constants.CONFIG_SIMULATOR_FEES_MAKER in self.config[commons_constants.CONFIG_SIMULATOR][
+        if commons_constants.CONFIG_SIMULATOR_FEES_TAKER in self.config[commons_constants.CONFIG_SIMULATOR][
            commons_constants.CONFIG_SIMULATOR_FEES]:
             result_fees[enums.ExchangeConstantsMarketPropertyColumns.TAKER.value] = \
                 self.config[commons_constants.CONFIG_SIMULATOR][commons_constants.CONFIG_SIMULATOR_FEES][
@@ -193,24 +233,26 @@ class ExchangeSimulatorConnector(abstract_exchange.AbstractExchange):
     def get_trade_fee(self, symbol, order_type, quantity, price, taker_or_maker):
         if not taker_or_maker:
             taker_or_maker = enums.ExchangeConstantsMarketPropertyColumns.TAKER.value
-        symbol_fees = self.get_fees(symbol)
-        rate = symbol_fees[taker_or_maker]
-        currency, market = symbol_util.parse_symbol(symbol).base_and_quote()
-        fee_currency = currency
-
-        precision = self.get_market_status(symbol)[enums.ExchangeConstantsMarketStatusColumns.PRECISION.value] \
-            [enums.ExchangeConstantsMarketStatusColumns.PRECISION_PRICE.value]
-        cost = float(number_util.round_into_str_with_max_digits(float(quantity) * rate, precision))
-
-        if util.get_order_side(order_type) == enums.TradeOrderSide.SELL.value:
-            cost = float(number_util.round_into_str_with_max_digits(cost * float(price), precision))
-            fee_currency = market
+        try:
+            currency, market, decimal_fees, cost_quantum = self.trade_fee_details_by_symbol[symbol]
+        except KeyError:
+            self._load_symbol_tables(symbol)
+            currency, market, decimal_fees, cost_quantum = self.trade_fee_details_by_symbol[symbol]
+        is_sell = util.get_order_side(order_type) == enums.TradeOrderSide.SELL.value
+        fee_currency = market if is_sell else currency
+        rate = decimal_fees[taker_or_maker]
+        if rate:
+            cost = (_to_decimal(quantity) * rate).quantize(cost_quantum)
+            if is_sell:
+                cost = (cost * _to_decimal(price)).quantize(cost_quantum)
+        else:
+            cost = constants.ZERO
 
         return {
             enums.FeePropertyColumns.TYPE.value: taker_or_maker,
             enums.FeePropertyColumns.CURRENCY.value: fee_currency,
-            enums.FeePropertyColumns.RATE.value: rate,
-            enums.FeePropertyColumns.COST.value: decimal.Decimal(str(cost)),
+            enums.FeePropertyColumns.RATE.value: self.fees_by_symbol[symbol][taker_or_maker],
+            enums.FeePropertyColumns.COST.value: cost,
         }
 
     def get_time_frames(self, importer):
@@ -236,3 +278,7 @@ class ExchangeSimulatorConnector(abstract_exchange.AbstractExchange):
         :return: the maximum number of simultaneous pairs * time_frame that this exchange can handle.
         """
         return constants.INFINITE_MAX_HANDLED_PAIRS_WITH_TIMEFRAME
+
+
+def _to_decimal(value):
+    return value if isinstance(value, decimal.Decimal) else decimal.Decimal(str(value))
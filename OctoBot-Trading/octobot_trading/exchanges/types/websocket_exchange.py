@@ -112,6 +112,12 @@ class WebSocketExchange(abstract_websocket.AbstractWebsocketExchange):
     def create_feeds(self):
         raise NotImplementedError("create_feeds is not implemented")
 
+    def get_order_book_manager_class(self):
+        # order books are stored by the exchange connector
+        if self.websocket_connector is None:
+            return super().get_order_book_manager_class()
+        return self.websocket_connector.get_order_book_manager_class()
+
     @classmethod
     def get_exchange_connector_class(cls, exchange_manager: object):
         raise NotImplementedError("get_exchange_connector_class is not implemented")
@@ -37,6 +37,7 @@ from octobot_trading.personal_data.orders import (
     parse_is_open,
     get_pnl_transaction_source_from_order,
     is_stop_order,
+    is_using_orders_matching_engine,
     create_as_chained_order,
     ensure_orders_relevancy,
     get_order_quantity_currency,
@@ -157,6 +158,7 @@ from octobot_trading.personal_data.trades import (
     create_trade_instance,
     TradesUpdater,
     Trade,
+    TradesArchive,
     compute_win_rate,
 )
 from octobot_trading.personal_data import transactions
@@ -228,6 +230,7 @@ __all__ = [
     "parse_is_open",
     "get_pnl_transaction_source_from_order",
     "is_stop_order",
+    "is_using_orders_matching_engine",
     "create_as_chained_order",
     "ensure_orders_relevancy",
     "get_order_quantity_currency",
@@ -339,6 +342,7 @@ __all__ = [
     "create_trade_instance",
     "TradesUpdater",
     "Trade",
+    "TradesArchive",
     "compute_win_rate",
     "ExchangePersonalData",
     "AUTHENTICATED_UPDATER_PRODUCERS",
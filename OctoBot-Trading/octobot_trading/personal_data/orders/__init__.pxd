@@ -87,6 +87,7 @@ from octobot_trading.personal_data.orders.order_util cimport (
     parse_is_cancelled,
     get_pnl_transaction_source_from_order,
     is_stop_order,
+    is_using_orders_matching_engine,
     is_associated_pending_order,
     get_order_quantity_currency,
     generate_order_id,
@@ -120,6 +121,7 @@ __all__ = [
     "parse_is_cancelled",
     "get_pnl_transaction_source_from_order",
     "is_stop_order",
+    "is_using_orders_matching_engine",
     "is_associated_pending_order",
     "get_order_quantity_currency",
     "generate_order_id",
@@ -85,6 +85,7 @@ from octobot_trading.personal_data.orders.order_util import (
     get_pre_order_data,
     get_pnl_transaction_source_from_order,
     is_stop_order,
+    is_using_orders_matching_engine,
     create_as_chained_order,
     is_associated_pending_order,
     apply_pending_order_from_created_order,
@@ -140,6 +141,7 @@ __all__ = [
     "get_up_to_date_price",
     "get_pre_order_data",
     "get_pnl_transaction_source_from_order",
+    "is_using_orders_matching_engine",
     "create_as_chained_order",
     "ensure_orders_relevancy",
     "get_order_quantity_currency",
@@ -136,6 +136,7 @@ cdef class Order(util.Initializable):
     cpdef void add_chained_order(self, object chained_order)
     cpdef bint should_be_created(self)
     cpdef void add_to_order_group(self, object order_group)
+    cpdef void update_orders_manager_indexes(self)
     cpdef object ensure_order_id(self)
     cdef void _update_total_cost(self)
 
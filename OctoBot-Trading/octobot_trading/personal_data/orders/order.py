@@ -130,6 +130,7 @@ class Order(util.Initializable):
                group=None, tag=None, quantity_currency=None) -> bool:
         changed: bool = False
         should_update_total_cost = False
+        should_update_indexes = False
 
         if order_id and self.order_id != order_id:
             self.order_id = order_id
@@ -137,6 +138,7 @@ class Order(util.Initializable):
         if symbol and self.symbol != symbol:
             self.currency, self.market = self.exchange_manager.get_exchange_quote_and_base(symbol)
             self.symbol = symbol
+            should_update_indexes = True
 
         if quantity_currency is None:
             if self.quantity_currency is None and self.symbol is not None:
@@ -260,12 +262,16 @@ class Order(util.Initializable):
         if group is not None:
             self.add_to_order_group(group)
 
-        if tag is not None:
+        if tag is not None and self.tag != tag:
             self.tag = tag
+            should_update_indexes = True
 
         if should_update_total_cost and not total_cost:
             self._update_total_cost()
 
+        if should_update_indexes:
+            self.update_orders_manager_indexes()
+
         return changed
 
     async def initialize_impl(self, **kwargs):
@@ -308,6 +314,17 @@ class Order(util.Initializable):
         if not self.is_open():
             logging.get_logger(self.get_logger_name()).warning(f"Adding order to group however order is not open.")
         self.order_group = order_group
+        self.update_orders_manager_indexes()
+
+    def update_orders_manager_indexes(self):
+        """
+        Keep orders manager indexes up to date when this order is already registered.
+        Should be called when the order symbol, tag or group changes
+        """
+        if self.exchange_manager is not None:
+            orders_manager = self.exchange_manager.exchange_personal_data.orders_manager
+            if orders_manager is not None:
+                orders_manager.update_order_indexes(self)
 
     def get_total_fees(self, currency):
         return order_util.get_fees_for_currency(self.fee, currency)
@@ -24,3 +24,4 @@ cdef class OrderState(state_class.State):
     cpdef bint is_filled(self)
     cpdef bint is_canceled(self)
     cpdef bint allows_new_status(self, object status)
+    cpdef void on_terminate(self)
@@ -96,6 +96,14 @@ class OrderState(state_class.State):
             self.order = new_order
             self.order.state = self
 
+    def on_terminate(self) -> None:
+        """
+        Called after terminate is complete, the order might have been updated: refresh its orders manager indexes
+        """
+        if self.order is not None:
+            self.order.update_orders_manager_indexes()
+        super().on_terminate()
+
     async def _synchronize_with_exchange(self, force_synchronization: bool = False) -> None:
         """
         Ask OrdersChannel Internal producer to refresh the order from the exchange
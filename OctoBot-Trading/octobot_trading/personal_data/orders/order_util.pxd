@@ -28,6 +28,7 @@ cpdef object get_max_order_quantity_for_price(object position, object available_
                                               object price, object side, str symbol)
 cpdef object get_pnl_transaction_source_from_order(object order)
 cpdef bint is_stop_order(object order_type)
+cpdef bint is_using_orders_matching_engine(object order)
 cpdef bint is_associated_pending_order(object pending_order, object created_order)
 cpdef object get_order_quantity_currency(object exchange_manager, str symbol, object side)
 cpdef str generate_order_id()
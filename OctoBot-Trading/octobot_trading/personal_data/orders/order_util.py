@@ -25,6 +25,7 @@ import octobot_commons.timestamp_util as timestamp_util
 import octobot_trading.constants as constants
 import octobot_trading.enums as enums
 import octobot_trading.errors as errors
+import octobot_trading.util as util
 import octobot_trading.exchanges.util.exchange_market_status_fixer as exchange_market_status_fixer
 from octobot_trading.enums import ExchangeConstantsMarketStatusColumns as Ecmsc
 
@@ -268,6 +269,18 @@ def is_stop_order(order_type):
                           enums.TraderOrderType.TRAILING_STOP, enums.TraderOrderType.TRAILING_STOP_LIMIT]
 
 
+def is_using_orders_matching_engine(order):
+    """
+    :return: True when the order should be filled by its symbol OrdersMatchingEngine instead of waiting
+    for its price in its own task: always for simulated orders in backtesting, when enabled in trader
+    simulator config for other simulated orders
+    """
+    return order.trader.simulate and (
+        order.exchange_manager.is_backtesting
+        or util.is_orders_matching_engine_enabled(order.exchange_manager.config)
+    )
+
+
 async def create_as_chained_order(order):
     order.is_waiting_for_chained_trigger = False
     if not order.trader.simulate and order.has_been_bundled:
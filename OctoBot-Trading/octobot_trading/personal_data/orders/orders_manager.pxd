@@ -30,6 +30,10 @@ cdef class OrdersManager(util.Initializable):
     cdef public dict order_groups
     cdef public list pending_creation_orders
     cdef public bint are_exchange_orders_initialized
+    cdef dict _orders_by_symbol
+    cdef dict _orders_by_tag
+    cdef dict _orders_by_group
+    cdef dict _indexed_keys
 
     cdef void _reset_orders(self)
     cdef void _check_orders_size(self)
@@ -37,10 +41,14 @@ cdef class OrdersManager(util.Initializable):
     cdef list _select_orders(self, object state=*, str symbol=*, int since=*, int limit=*, str tag=*)
     cdef object _get_pending_order(self, object created_order, bint should_pop)
     cdef void _add_order(self, str order_id, object order)
+    cdef object _pop_order(self, str order_id)
+    cdef void _add_to_indexes(self, str order_id, object order)
+    cdef void _remove_from_indexes(self, str order_id)
 
     cpdef order_class.Order get_order(self, str order_id)
     cpdef void register_pending_creation_order(self, object pending_order)
     cpdef bint has_order(self, str order_id)
+    cpdef void update_order_indexes(self, order_class.Order order)
     cpdef void remove_order_instance(self, order_class.Order order)
     cpdef void replace_order(self, str previous_id, order_class.Order order)
     cpdef list get_all_orders(self, str symbol=*, int since=*, int limit=*, str tag=*)
@@ -50,3 +58,6 @@ cdef class OrdersManager(util.Initializable):
     cpdef list get_order_from_group(self, str group_name)
     cpdef object get_or_create_group(self, object group_type, str group_name)
     cpdef void clear(self)
+
+cdef tuple _get_indexed_keys(order_class.Order order)
+cdef void _remove_from_index(dict index, object key, str order_id)
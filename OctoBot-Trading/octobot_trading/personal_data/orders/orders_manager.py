@@ -37,6 +37,12 @@ class OrdersManager(util.Initializable):
         self.orders_initialized = False  # TODO
         self.orders = collections.OrderedDict()
         self.order_groups = {}
+        # secondary indexes: orders by order_id by indexed value, kept in sync with self.orders
+        self._orders_by_symbol = {}
+        self._orders_by_tag = {}
+        self._orders_by_group = {}
+        # (symbol, tag, group name) of each indexed order, used to remove it from the indexes when they change
+        self._indexed_keys = {}
         # orders that are expected from exchange but have not yet been fetched: will be removed when fetched
         self.pending_creation_orders = []
         # if this the orders manager completed the initial exchange orders sync phase (only on real trader)
@@ -61,11 +67,7 @@ class OrdersManager(util.Initializable):
         return self.orders[order_id]
 
     def get_order_from_group(self, group_name):
-        return [
-            order
-            for order in self.orders.values()
-            if order.order_group is not None and order.order_group.name == group_name
-        ]
+        return list(self._orders_by_group.get(group_name, {}).values())
 
     def get_or_create_group(self, group_type, group_name):
         """
@@ -159,14 +161,53 @@ class OrdersManager(util.Initializable):
     def _add_order(self, order_id, order):
         if order_id is None:
             self.logger.warning(f"Adding order with None order_id to order manager: {order}")
+        if order_id in self.orders:
+            self._remove_from_indexes(order_id)
         self.orders[order_id] = order
+        self._add_to_indexes(order_id, order)
+
+    def _pop_order(self, order_id):
+        order = self.orders.pop(order_id, None)
+        if order is not None:
+            self._remove_from_indexes(order_id)
+        return order
+
+    def update_order_indexes(self, order):
+        """
+        Should be called when the symbol, tag or group of an order that might already be in this manager changes
+        :param order: the updated order
+        """
+        if self.orders.get(order.order_id) is order and \
+           self._indexed_keys.get(order.order_id) != _get_indexed_keys(order):
+            self._remove_from_indexes(order.order_id)
+            self._add_to_indexes(order.order_id, order)
+
+    def _add_to_indexes(self, order_id, order):
+        symbol, tag, group_name = self._indexed_keys[order_id] = _get_indexed_keys(order)
+        self._orders_by_symbol.setdefault(symbol, {})[order_id] = order
+        if tag is not None:
+            self._orders_by_tag.setdefault(tag, {})[order_id] = order
+        if group_name is not None:
+            self._orders_by_group.setdefault(group_name, {})[order_id] = order
+
+    def _remove_from_indexes(self, order_id):
+        # use indexed keys as the order symbol, tag or group might have changed since it has been indexed
+        try:
+            symbol, tag, group_name = self._indexed_keys.pop(order_id)
+        except KeyError:
+            return
+        _remove_from_index(self._orders_by_symbol, symbol, order_id)
+        if tag is not None:
+            _remove_from_index(self._orders_by_tag, tag, order_id)
+        if group_name is not None:
+            _remove_from_index(self._orders_by_group, group_name, order_id)
 
     def has_order(self, order_id) -> bool:
-        return order_id in set(self.orders.keys())
+        return order_id in self.orders
 
     def remove_order_instance(self, order):
         if self.has_order(order.order_id):
-            self.orders.pop(order.order_id, None)
+            self._pop_order(order.order_id)
             order.clear()
         else:
             self.logger.warning(f"Attempt to remove an order that is not in orders_manager: "
@@ -176,7 +217,7 @@ class OrdersManager(util.Initializable):
 
     def replace_order(self, previous_id, order):
         if self.has_order(previous_id):
-            self.orders.pop(previous_id, None)
+            self._pop_order(previous_id)
         self._add_order(order.order_id, order)
         self._check_orders_size()
 
@@ -184,6 +225,10 @@ class OrdersManager(util.Initializable):
     def _reset_orders(self):
         self.orders_initialized = False
         self.orders = collections.OrderedDict()
+        self._orders_by_symbol = {}
+        self._orders_by_tag = {}
+        self._orders_by_group = {}
+        self._indexed_keys = {}
         for group in self.order_groups.values():
             group.clear()
         self.order_groups = {}
@@ -193,9 +238,16 @@ class OrdersManager(util.Initializable):
             self._remove_oldest_orders(int(self.MAX_ORDERS_COUNT / 2))
 
     def _select_orders(self, state=None, symbol=None, since=-1, limit=-1, tag=None):
+        # use the narrowest available index, remaining filters are applied on its orders only
+        if symbol is not None:
+            candidates = self._orders_by_symbol.get(symbol, {}) if symbol else {}
+        elif tag is not None:
+            candidates = self._orders_by_tag.get(tag, {})
+        else:
+            candidates = self.orders
         orders = [
             order
-            for order in self.orders.values()
+            for order in candidates.values()
             if (
                     (state is None or order.status == state) and
                     (symbol is None or (symbol and order.symbol == symbol)) and
@@ -207,7 +259,8 @@ class OrdersManager(util.Initializable):
 
     def _remove_oldest_orders(self, nb_to_remove):
         for _ in range(nb_to_remove):
-            self.orders.popitem(last=False)
+            order_id, _ = self.orders.popitem(last=False)
+            self._remove_from_indexes(order_id)
 
     def clear(self):
         for order in self.orders.values():
@@ -215,6 +268,20 @@ class OrdersManager(util.Initializable):
         self._reset_orders()
 
 
+def _get_indexed_keys(order):
+    return order.symbol, order.tag, (None if order.order_group is None else order.order_group.name)
+
+
+def _remove_from_index(index, key, order_id):
+    try:
+        orders = index[key]
+        orders.pop(order_id, None)
+        if not orders:
+            index.pop(key)
+    except KeyError:
+        pass
+
+
 async def _update_order_from_raw(order, raw_order):
     """
     Calling order update from raw method
@@ -18,6 +18,7 @@ import asyncio
 import octobot_trading.enums as enums
 import octobot_trading.constants as constants
 import octobot_trading.personal_data.orders.order as order_class
+import octobot_trading.personal_data.orders.order_util as order_util
 
 
 class LimitOrder(order_class.Order):
@@ -54,12 +55,25 @@ class LimitOrder(order_class.Order):
             self._reset_events(price_time)
 
     def _create_hit_event(self, price_time):
-        self.limit_price_hit_event = self.exchange_manager.exchange_symbols_data.\
-            get_exchange_symbol_data(self.symbol).price_events_manager.\
-            new_event(self.origin_price, price_time, self.trigger_above, self.allow_instant_fill)
+        price_events_manager = self.exchange_manager.exchange_symbols_data.\
+            get_exchange_symbol_data(self.symbol).price_events_manager
+        if order_util.is_using_orders_matching_engine(self):
+            # filled by the orders matching engine: no hit task
+            self.limit_price_hit_event = price_events_manager.new_trigger(
+                self.origin_price, price_time, self.trigger_above, self.on_fill, self.allow_instant_fill
+            )
+        else:
+            self.limit_price_hit_event = price_events_manager.new_event(
+                self.origin_price, price_time, self.trigger_above, self.allow_instant_fill
+            )
 
     def _create_hit_task(self):
-        self.wait_for_hit_event_task = asyncio.create_task(self.wait_for_price_hit())
+        if isinstance(self.limit_price_hit_event, asyncio.Event):
+            self.wait_for_hit_event_task = asyncio.create_task(self.wait_for_price_hit())
+        elif self.limit_price_hit_event.is_set():
+            # instantly triggered price trigger: fill from the orders matching engine fill task
+            self.exchange_manager.exchange_symbols_data.get_exchange_symbol_data(self.symbol).\
+                price_events_manager.schedule_trigger(self.limit_price_hit_event)
 
     def _reset_events(self, price_time):
         """
@@ -17,8 +17,8 @@
 cimport octobot_trading.personal_data.orders.order as order_class
 
 cdef class TrailingStopOrder(order_class.Order):
-    cdef object trailing_stop_price_hit_event # object is asyncio.Event
-    cdef object trailing_price_hit_event # object is asyncio.Event
+    cdef object trailing_stop_price_hit_event # object is asyncio.Event or PriceTrigger
+    cdef object trailing_price_hit_event # object is asyncio.Event or PriceTrigger
     cdef object wait_for_stop_price_hit_event_task # object is asyncio.Event
     cdef object wait_for_price_hit_event_task # object is asyncio.Event
     cdef public object trailing_percent
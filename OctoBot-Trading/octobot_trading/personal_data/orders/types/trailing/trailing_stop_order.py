@@ -21,6 +21,7 @@ import octobot_commons.logging as logging
 import octobot_trading.enums as enums
 import octobot_trading.constants as constants
 import octobot_trading.personal_data.orders.order as order_class
+import octobot_trading.personal_data.orders.order_util as order_util
 
 
 class TrailingStopOrder(order_class.Order):
@@ -67,6 +68,17 @@ class TrailingStopOrder(order_class.Order):
         :param price_events_manager: the price events manager to use
         :param new_price: the new trailing price
         """
+        if order_util.is_using_orders_matching_engine(self):
+            # filled by the orders matching engine: no hit task
+            if self.trailing_stop_price_hit_event is None:
+                self.trailing_stop_price_hit_event = price_events_manager.new_trigger(
+                    self._calculate_stop_price(new_price), new_price_time,
+                    self.side is enums.TradeOrderSide.BUY, self.on_fill, self.allow_instant_fill)
+            if self.trailing_price_hit_event is None:
+                self.trailing_price_hit_event = price_events_manager.new_trigger(
+                    new_price, new_price_time, self.side is enums.TradeOrderSide.SELL, self._on_price_hit,
+                    allow_instant_fill=False)
+            return
         if self.trailing_stop_price_hit_event is None:
             self.trailing_stop_price_hit_event = price_events_manager.new_event(
                 self._calculate_stop_price(new_price), new_price_time,
@@ -96,14 +108,14 @@ class TrailingStopOrder(order_class.Order):
         if self.wait_for_price_hit_event_task is None and self.trailing_price_hit_event is not None:
             if self.trailing_price_hit_event.is_set():
                 await self._on_price_hit()
-            else:
+            elif isinstance(self.trailing_price_hit_event, asyncio.Event):
                 self.wait_for_price_hit_event_task = asyncio.create_task(
                     _wait_for_price_hit(self.trailing_price_hit_event, self._on_price_hit))
 
         if self.wait_for_stop_price_hit_event_task is None and self.trailing_stop_price_hit_event is not None:
             if self.trailing_stop_price_hit_event.is_set():
                 await self.on_fill()
-            else:
+            elif isinstance(self.trailing_stop_price_hit_event, asyncio.Event):
                 self.wait_for_stop_price_hit_event_task = asyncio.create_task(
                     _wait_for_price_hit(self.trailing_stop_price_hit_event, self.on_fill))
 
@@ -39,6 +39,22 @@ cdef class PortfolioValueHolder:
 
     cdef set missing_currency_data_in_exchange
 
+    cdef dict _current_holdings_values
+    cdef dict _current_holdings_quantities
+    cdef object _current_holdings_total_value
+    cdef object _current_holdings_reference_market
+    cdef dict _origin_holdings_values
+    cdef object _origin_holdings_total_value
+    cdef object _origin_holdings_reference_market
+    cdef object _origin_holdings_portfolio
+    cdef set _updated_price_currencies
+    cdef set _updated_value_currencies
+    cdef set _unvalued_currencies
+    cdef set _unvalued_origin_currencies
+    cdef set _outdated_value_currencies
+
+    cdef dict _price_data_symbols
+
     cdef portfolio_manager.PortfolioManager portfolio_manager
 
     cpdef bint update_origin_crypto_currencies_values(self, str symbol, object mark_price)
@@ -54,12 +70,20 @@ cdef class PortfolioValueHolder:
     cdef object _update_portfolio_current_value(self, dict portfolio, dict currencies_values=*, bint fill_currencies_values=*)
     cdef void _fill_currencies_values(self, dict currencies_values)
     cdef dict _update_portfolio_and_currencies_current_value(self)
+    cdef object _update_origin_portfolio_current_value(self)
+    cdef set _get_updated_holdings_currencies(self, dict portfolio)
+    cdef object _update_current_holdings_values(self, dict portfolio, set updated_holdings_currencies) # return object to propagate exceptions
+    cdef object _update_holdings_values(self, dict holdings_values, dict portfolio, set currencies)
+    cdef void _update_current_crypto_currencies_values(self, dict currencies_values)
+    cdef tuple _get_config_currencies(self)
     cdef object _check_currency_initialization(self, str currency, object currency_value)
     cdef void _recompute_origin_portfolio_initial_value(self)
     cdef void _try_to_ask_ticker_missing_symbol_data(self, str currency, str symbol, str reversed_symbol)
     cdef void _ask_ticker_data_for_currency(self, list symbols_to_add)
     cdef void _inform_no_matching_symbol(self, str currency)
     cdef object _has_price_data(self, str symbol) # return object to propagate exceptions
+    cdef void _clear_missing_price_data_symbols(self, str currency, str market)
+    cdef object _find_price_data_symbol(self, str symbol)
     cdef object _evaluate_config_crypto_currencies_and_portfolio_values(self,
                                                                 dict portfolio,
                                                                 bint ignore_missing_currency_data=*)
@@ -51,6 +51,27 @@ class PortfolioValueHolder:
         # set of currencies for which the current exchange is not providing any suitable price data
         self.missing_currency_data_in_exchange = set()
 
+        # current and origin portfolios valuations, updated currency by currency:
+        # value in reference market of each currency holdings
+        self._current_holdings_values = {}
+        self._current_holdings_quantities = {}
+        self._current_holdings_total_value = constants.ZERO
+        self._current_holdings_reference_market = None
+        self._origin_holdings_values = {}
+        self._origin_holdings_total_value = constants.ZERO
+        self._origin_holdings_reference_market = None
+        self._origin_holdings_portfolio = None
+        # currencies to evaluate again at the next valuation
+        self._updated_price_currencies = set()
+        self._updated_value_currencies = set()
+        self._unvalued_currencies = set()
+        self._unvalued_origin_currencies = set()
+        # currencies which price changed while their holdings were not considered
+        self._outdated_value_currencies = set()
+
+        # last_prices_by_trading_pair key to use for each symbol when their extra data differ, None when missing
+        self._price_data_symbols = {}
+
     def update_origin_crypto_currencies_values(self, symbol, mark_price):
         """
         Update origin cryptocurrencies value
@@ -62,12 +83,12 @@ class PortfolioValueHolder:
         # update origin values if this price has relevant data regarding the origin portfolio (using both quote and base)
         origin_currencies_should_be_updated = (
                 (
-                        currency not in set(self.origin_crypto_currencies_values.keys()) and
+                        currency not in self.origin_crypto_currencies_values and
                         market == self.portfolio_manager.reference_market
                 )
                 or
                 (
-                        market not in set(self.origin_crypto_currencies_values.keys()) and
+                        market not in self.origin_crypto_currencies_values and
                         currency == self.portfolio_manager.reference_market
                 )
         )
@@ -78,7 +99,13 @@ class PortfolioValueHolder:
                 self.origin_crypto_currencies_values[currency] = mark_price
             else:
                 self.origin_crypto_currencies_values[market] = constants.ONE / mark_price
+        if symbol not in self.last_prices_by_trading_pair:
+            # this symbol might be the price data of previously missing symbols
+            self._clear_missing_price_data_symbols(currency, market)
         self.last_prices_by_trading_pair[symbol] = mark_price
+        # only the value of these currencies might have changed
+        self._updated_price_currencies.add(currency)
+        self._updated_price_currencies.add(market)
         return origin_currencies_should_be_updated
 
     def get_current_crypto_currencies_values(self):
@@ -125,10 +152,37 @@ class PortfolioValueHolder:
         :return: the origin portfolio current value
         """
         if refresh_values:
-            self.current_crypto_currencies_values.update(
+            self._update_current_crypto_currencies_values(
                 self._evaluate_config_crypto_currencies_and_portfolio_values(self.origin_portfolio.portfolio))
-        return self._update_portfolio_current_value(self.origin_portfolio.portfolio,
-                                                    currencies_values=self.current_crypto_currencies_values)
+        return self._update_origin_portfolio_current_value()
+
+    def _update_origin_portfolio_current_value(self):
+        """
+        Update the origin portfolio current value.
+        Only currencies which value changed since the last valuation are evaluated
+        :return: the origin portfolio current value
+        """
+        portfolio = self.origin_portfolio.portfolio
+        if self._origin_holdings_portfolio is not portfolio or \
+           self._origin_holdings_reference_market != self.portfolio_manager.reference_market:
+            # evaluate every currency
+            self._origin_holdings_portfolio = portfolio
+            self._origin_holdings_reference_market = self.portfolio_manager.reference_market
+            self._origin_holdings_values = {}
+            self._origin_holdings_total_value = constants.ZERO
+            currencies_to_evaluate = set(portfolio)
+        else:
+            currencies_to_evaluate = self._updated_value_currencies | self._unvalued_origin_currencies
+        self._updated_value_currencies = set()
+        self._unvalued_origin_currencies = {
+            currency
+            for currency in currencies_to_evaluate
+            if currency not in self.current_crypto_currencies_values
+        }
+        self._origin_holdings_total_value += self._update_holdings_values(
+            self._origin_holdings_values, portfolio, currencies_to_evaluate
+        )
+        return self._origin_holdings_total_value
 
     def _init_portfolio_values_if_necessary(self, force_recompute_origin_portfolio):
         """
@@ -161,7 +215,7 @@ class PortfolioValueHolder:
         """
         values = currencies_values
         if values is None or fill_currencies_values:
-            self.current_crypto_currencies_values.update(
+            self._update_current_crypto_currencies_values(
                 self._evaluate_config_crypto_currencies_and_portfolio_values(portfolio))
             if fill_currencies_values:
                 self._fill_currencies_values(currencies_values)
@@ -181,10 +235,115 @@ class PortfolioValueHolder:
 
     def _update_portfolio_and_currencies_current_value(self):
         """
-        Update the portfolio current value with the current portfolio instance
+        Update the portfolio current value with the current portfolio instance.
+        Only currencies which price or quantity changed since the last valuation are evaluated
+        """
+        portfolio = self.portfolio_manager.portfolio.portfolio
+        if self._current_holdings_reference_market != self.portfolio_manager.reference_market:
+            # evaluate every currency
+            self._current_holdings_reference_market = self.portfolio_manager.reference_market
+            self._current_holdings_values = {}
+            self._current_holdings_quantities = {}
+            self._current_holdings_total_value = constants.ZERO
+            self._unvalued_currencies = set()
+            self._outdated_value_currencies = set()
+            self._updated_price_currencies.update(portfolio)
+            self._updated_price_currencies.update(self._get_config_currencies())
+            updated_holdings_currencies = set()
+        else:
+            updated_holdings_currencies = self._get_updated_holdings_currencies(portfolio)
+        self._update_current_holdings_values(portfolio, updated_holdings_currencies)
+        self.portfolio_current_value = self._current_holdings_total_value
+
+    def _get_updated_holdings_currencies(self, portfolio):
+        """
+        :param portfolio: the current portfolio
+        :return: the currencies which quantity changed since the last valuation
         """
-        self.portfolio_current_value = self._update_portfolio_current_value(
-            self.portfolio_manager.portfolio.portfolio)
+        updated_holdings_currencies = set()
+        for currency, asset in portfolio.items():
+            # decimal.Decimal are immutable: an updated quantity is a different instance
+            if asset.total is not self._current_holdings_quantities.get(currency):
+                updated_holdings_currencies.add(currency)
+        for currency in self._current_holdings_quantities:
+            if currency not in portfolio:
+                updated_holdings_currencies.add(currency)
+        return updated_holdings_currencies
+
+    def _update_current_holdings_values(self, portfolio, updated_holdings_currencies):
+        """
+        Evaluate currencies which price changed and update their holdings value in the portfolio current value
+        :param portfolio: the current portfolio
+        :param updated_holdings_currencies: currencies which quantity changed
+        """
+        config_currencies = self._get_config_currencies()
+        currencies_to_evaluate = self._updated_price_currencies | self._unvalued_currencies
+        for currency in updated_holdings_currencies:
+            if currency in self._outdated_value_currencies or currency not in self.current_crypto_currencies_values:
+                currencies_to_evaluate.add(currency)
+        self._updated_price_currencies = set()
+        evaluated_pair_values = {}
+        for currency in currencies_to_evaluate:
+            try:
+                if currency in config_currencies or (
+                    currency in portfolio and self._should_currency_be_considered(currency, portfolio, False)
+                ):
+                    evaluated_pair_values[currency] = self._evaluate_value(currency, constants.ONE)
+                    self._outdated_value_currencies.discard(currency)
+                else:
+                    # evaluate it when it will be considered
+                    self._outdated_value_currencies.add(currency)
+                self._unvalued_currencies.discard(currency)
+            except errors.MissingPriceDataError:
+                self._unvalued_currencies.add(currency)
+        self._update_current_crypto_currencies_values(evaluated_pair_values)
+        updated_holdings_currencies.update(currencies_to_evaluate)
+        self._current_holdings_total_value += self._update_holdings_values(
+            self._current_holdings_values, portfolio, updated_holdings_currencies
+        )
+        for currency in updated_holdings_currencies:
+            if currency in portfolio:
+                self._current_holdings_quantities[currency] = portfolio[currency].total
+            else:
+                self._current_holdings_quantities.pop(currency, None)
+
+    def _update_holdings_values(self, holdings_values, portfolio, currencies):
+        """
+        Evaluate the given currencies holdings using the current currencies values
+        :param holdings_values: the value of each currency holdings to update
+        :param portfolio: the evaluated portfolio
+        :param currencies: the currencies to evaluate
+        :return: the value difference of the updated holdings
+        """
+        value_delta = constants.ZERO
+        for currency in currencies:
+            value = constants.ZERO
+            if currency in portfolio and currency not in self.missing_currency_data_in_exchange:
+                value = self._get_currency_value(portfolio, currency, self.current_crypto_currencies_values)
+            value_delta += value - holdings_values.get(currency, constants.ZERO)
+            if value == constants.ZERO:
+                holdings_values.pop(currency, None)
+            else:
+                holdings_values[currency] = value
+        return value_delta
+
+    def _update_current_crypto_currencies_values(self, currencies_values):
+        """
+        Update current currencies values, origin portfolio holdings of these currencies will be evaluated again
+        :param currencies_values: the new currencies values
+        """
+        self.current_crypto_currencies_values.update(currencies_values)
+        self._updated_value_currencies.update(currencies_values)
+
+    def _get_config_currencies(self):
+        """
+        :return: the currencies of the first configured pair, which are always evaluated
+        """
+        if self.portfolio_manager.exchange_manager.exchange_config.all_config_symbol_pairs:
+            return symbol_util.parse_symbol(
+                self.portfolio_manager.exchange_manager.exchange_config.all_config_symbol_pairs[0]
+            ).base_and_quote()
+        return ()
 
     def _evaluate_value(self, currency, quantity, raise_error=True):
         """
@@ -266,12 +425,36 @@ class PortfolioValueHolder:
             return self.last_prices_by_trading_pair[symbol]
         except KeyError:
             # a settlement asset or other symbol extra data might be different, try to ignore it
-            to_find_symbol = symbol_util.parse_symbol(symbol)
-            for symbol_key in self.last_prices_by_trading_pair:
-                if symbol_util.parse_symbol(symbol_key).is_same_base_and_quote(to_find_symbol):
-                    return self.last_prices_by_trading_pair[symbol_key]
+            try:
+                price_data_symbol = self._price_data_symbols[symbol]
+            except KeyError:
+                price_data_symbol = self._price_data_symbols[symbol] = self._find_price_data_symbol(symbol)
+            if price_data_symbol is not None:
+                return self.last_prices_by_trading_pair[price_data_symbol]
         raise KeyError(symbol)
 
+    def _clear_missing_price_data_symbols(self, currency, market):
+        """
+        Forget missing price data of symbols with the given base and quote
+        :param currency: the symbol base
+        :param market: the symbol quote
+        """
+        for symbol in list(self._price_data_symbols):
+            if self._price_data_symbols[symbol] is None and \
+               symbol_util.parse_symbol(symbol).base_and_quote() == (currency, market):
+                self._price_data_symbols.pop(symbol)
+
+    def _find_price_data_symbol(self, symbol):
+        """
+        :param symbol: the symbol to find
+        :return: the last_prices_by_trading_pair key with the same base and quote as symbol, None if missing
+        """
+        to_find_symbol = symbol_util.parse_symbol(symbol)
+        for symbol_key in self.last_prices_by_trading_pair:
+            if symbol_util.parse_symbol(symbol_key).is_same_base_and_quote(to_find_symbol):
+                return symbol_key
+        return None
+
     def _try_to_ask_ticker_missing_symbol_data(self, currency, symbol, reversed_symbol):
         """
         Try to ask the ticker producer to watch additional symbols
@@ -340,10 +523,9 @@ class PortfolioValueHolder:
         :param evaluated_currencies: the list of evaluated currencies
         :param missing_tickers: the list of missing currencies
         """
-        if self.portfolio_manager.exchange_manager.exchange_config.all_config_symbol_pairs:
-            currency, market = symbol_util.parse_symbol(
-                self.portfolio_manager.exchange_manager.exchange_config.all_config_symbol_pairs[0]
-            ).base_and_quote()
+        config_currencies = self._get_config_currencies()
+        if config_currencies:
+            currency, market = config_currencies
             currency_to_evaluate = currency
             try:
                 if currency not in evaluated_currencies:
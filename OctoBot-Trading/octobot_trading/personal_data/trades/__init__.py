@@ -18,6 +18,7 @@ from octobot_trading.personal_data.trades import trades_manager
 from octobot_trading.personal_data.trades import trade_factory
 from octobot_trading.personal_data.trades import channel
 from octobot_trading.personal_data.trades import trade
+from octobot_trading.personal_data.trades import trades_archive
 
 from octobot_trading.personal_data.trades.trades_manager import (
     TradesManager,
@@ -35,6 +36,9 @@ from octobot_trading.personal_data.trades.channel import (
 from octobot_trading.personal_data.trades.trade import (
     Trade,
 )
+from octobot_trading.personal_data.trades.trades_archive import (
+    TradesArchive,
+)
 from octobot_trading.personal_data.trades.trades_util import (
     compute_win_rate,
 )
@@ -48,5 +52,6 @@ __all__ = [
     "create_trade_instance",
     "TradesUpdater",
     "Trade",
+    "TradesArchive",
     "compute_win_rate",
 ]
@@ -18,6 +18,13 @@ import octobot_trading.enums as enums
 
 
 class Trade:
+    __slots__ = (
+        "trader", "exchange_manager", "status", "creation_time", "trade_id", "origin_order_id", "simulated",
+        "is_closing_order", "symbol", "currency", "market", "taker_or_maker", "origin_price", "origin_quantity",
+        "trade_type", "side", "executed_quantity", "canceled_time", "executed_time", "fee", "executed_price",
+        "trade_profitability", "total_cost", "reduce_only", "tag", "quantity_currency", "exchange_trade_type",
+        "timestamp",
+    )
     CLOSING_TRADE_ORDER_STATUS = {enums.OrderStatus.CANCELED, enums.OrderStatus.FILLED, enums.OrderStatus.CLOSED}
 
     def __init__(self, trader):
@@ -0,0 +1,149 @@
+#  Drakkar-Software OctoBot-Trading
+#  Copyright (c) Drakkar-Software, All rights reserved.
+#
+#  This library is free software; you can redistribute it and/or
+#  modify it under the terms of the GNU Lesser General Public
+#  License as published by the Free Software Foundation; either
+#  version 3.0 of the License, or (at your option) any later version.
+#
+#  This library is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the GNU
+#  Lesser General Public License for more details.
+#
+#  You should have received a copy of the GNU Lesser General Public
+#  License along with this library.
+import numpy as np
+
+import octobot_trading.constants as constants
+import octobot_trading.enums as enums
+
+
+# categorical values (symbols, currencies, enums, ...) are stored as codes of the archive values table
+_TRADES_ARCHIVE_DTYPE = np.dtype([
+    ("trade_id", object),
+    ("origin_order_id", object),
+    ("symbol", np.int32),
+    ("status", np.int32),
+    ("side", np.int32),
+    ("trade_type", np.int32),
+    ("exchange_trade_type", np.int32),
+    ("taker_or_maker", np.int32),
+    ("quantity_currency", np.int32),
+    ("fee_currency", np.int32),
+    ("tag", np.int32),
+    ("time", np.float64),
+    ("executed_price", np.float64),
+    ("quantity", np.float64),
+    ("total_cost", np.float64),
+    ("fee_cost", np.float64),
+    ("reduce_only", np.bool_),
+    ("is_closing_order", np.bool_),
+])
+
+
+class TradesArchive:
+    """
+    Compact columnar storage of closed trades using a numpy structured array.
+    Archived trades are no longer Trade instances: only the values required to compute trading statistics are kept.
+    Paid fees are also summed as decimal values to keep exact totals.
+    """
+    INITIAL_SIZE = 1024
+
+    def __init__(self):
+        self.trades = np.zeros(self.INITIAL_SIZE, dtype=_TRADES_ARCHIVE_DTYPE)
+        self.trades_count = 0
+        self.paid_fees = {}
+        self._closing_trades_origin_order_ids = set()
+        self._values = []
+        self._codes = {}
+
+    def add_trade(self, trade):
+        """
+        Archives the given trade
+        :param trade: the trade to archive
+        """
+        if self.trades_count == len(self.trades):
+            trades = np.zeros(2 * len(self.trades), dtype=_TRADES_ARCHIVE_DTYPE)
+            trades[:self.trades_count] = self.trades
+            self.trades = trades
+        fee = trade.fee or {}
+        fee_cost = fee.get(enums.FeePropertyColumns.COST.value, constants.ZERO)
+        fee_currency = fee.get(enums.FeePropertyColumns.CURRENCY.value)
+        self.trades[self.trades_count] = (
+            trade.trade_id,
+            trade.origin_order_id,
+            self._get_code(trade.symbol),
+            self._get_code(trade.status),
+            self._get_code(trade.side),
+            self._get_code(trade.trade_type),
+            self._get_code(trade.exchange_trade_type),
+            self._get_code(trade.taker_or_maker),
+            self._get_code(trade.quantity_currency),
+            self._get_code(fee_currency),
+            self._get_code(trade.tag),
+            trade.get_time(),
+            trade.executed_price,
+            trade.get_quantity(),
+            trade.total_cost,
+            fee_cost,
+            trade.reduce_only,
+            trade.is_closing_order,
+        )
+        self.trades_count += 1
+        if trade.fee is not None:
+            self.paid_fees[fee_currency] = self.paid_fees.get(fee_currency, constants.ZERO) + fee_cost
+        if trade.is_closing_order:
+            self._closing_trades_origin_order_ids.add(trade.origin_order_id)
+
+    def has_closing_trade_with_order_id(self, order_id) -> bool:
+        return order_id in self._closing_trades_origin_order_ids
+
+    def count_trades(self, status=None, side=None, reduce_only=None,
+                     exchange_trade_types=None, exclude_exchange_trade_types=False) -> int:
+        """
+        :return: the number of archived trades matching every given filter
+        """
+        trades = self.get_trades()
+        mask = np.ones(self.trades_count, dtype=np.bool_)
+        if status is not None:
+            mask &= trades["status"] == self._codes.get(status, -1)
+        if side is not None:
+            mask &= trades["side"] == self._codes.get(side, -1)
+        if reduce_only is not None:
+            mask &= trades["reduce_only"] == reduce_only
+        if exchange_trade_types is not None:
+            is_in_types = np.isin(
+                trades["exchange_trade_type"],
+                [self._codes[trade_type] for trade_type in exchange_trade_types if trade_type in self._codes]
+            )
+            mask &= ~is_in_types if exclude_exchange_trade_types else is_in_types
+        return int(np.count_nonzero(mask))
+
+    def get_trades(self):
+        """
+        :return: a view on the archived trades
+        """
+        return self.trades[:self.trades_count]
+
+    def get_value(self, code):
+        """
+        :return: the value associated to the given categorical column code
+        """
+        return self._values[code]
+
+    def clear(self):
+        self.trades = np.zeros(self.INITIAL_SIZE, dtype=_TRADES_ARCHIVE_DTYPE)
+        self.trades_count = 0
+        self.paid_fees = {}
+        self._closing_trades_origin_order_ids = set()
+        self._values = []
+        self._codes = {}
+
+    def _get_code(self, value):
+        try:
+            return self._codes[value]
+        except KeyError:
+            code = self._codes[value] = len(self._values)
+            self._values.append(value)
+            return code
@@ -22,16 +22,22 @@ cdef class TradesManager(util.Initializable):
     cdef object trader
 
     cdef public object trades
+    cdef dict _trades_by_origin_order_id
+    cdef public object trades_archive
 
     cdef public bint trades_initialized
 
+    cdef void _add_trade(self, str trade_id, object trade)
     cdef void _check_trades_size(self)
     cdef void _reset_trades(self)
     cdef void _remove_oldest_trades(self, int nb_to_remove)
+    cdef void _archive_oldest_trades(self, int nb_to_archive)
+    cdef object _pop_oldest_trade(self)
 
     cpdef object get_trade(self, str trade_id)
     cpdef object upsert_trade(self, str trade_id, dict raw_trade)
     cpdef object upsert_trade_instance(self, object trade)
+    cpdef void enable_trades_archive(self)
     cpdef bint has_closing_trade_with_order_id(self, str order_id)
     cpdef dict get_total_paid_fees(self)
     cpdef void clear(self)
@@ -21,12 +21,15 @@ import octobot_commons.enums as commons_enums
 
 import octobot_trading.enums as enums
 import octobot_trading.personal_data as personal_data
+import octobot_trading.personal_data.trades.trades_archive as trades_archive
 import octobot_trading.util as util
 
 
 class TradesManager(util.Initializable):
     # memory usage for 100000 trades: approx 180 Mo
     MAX_TRADES_COUNT = 100000
+    # when the trades archive is enabled, only the most recent trades are kept as Trade instances
+    MAX_LIVE_TRADES_COUNT = 1000
 
     def __init__(self, trader):
         super().__init__()
@@ -34,6 +37,10 @@ class TradesManager(util.Initializable):
         self.trader = trader
         self.trades_initialized = False
         self.trades = collections.OrderedDict()
+        # trades by trade_id by origin order id, kept in sync with self.trades
+        self._trades_by_origin_order_id = {}
+        # columnar archive of the oldest trades, disabled by default
+        self.trades_archive = None
 
     async def initialize_impl(self):
         self._reset_trades()
@@ -50,24 +57,33 @@ class TradesManager(util.Initializable):
                 if trade_id in self.trades:
                     self.logger.debug(f"Replacement of an existing trade: {self.trades[trade_id].to_dict()} "
                                       f"by {created_trade.to_dict()} on id: {trade_id}")
-                self.trades[trade_id] = created_trade
+                self._add_trade(trade_id, created_trade)
                 self._check_trades_size()
                 return True
         return False
 
     def upsert_trade_instance(self, trade):
         if trade.trade_id not in self.trades:
-            self.trades[trade.trade_id] = trade
+            self._add_trade(trade.trade_id, trade)
+            self._check_trades_size()
+
+    def enable_trades_archive(self):
+        """
+        Enables the columnar trades archive: trades older than the MAX_LIVE_TRADES_COUNT most recent ones
+        are then moved into the archive instead of being kept as Trade instances
+        """
+        if self.trades_archive is None:
+            self.trades_archive = trades_archive.TradesArchive()
             self._check_trades_size()
 
     def has_closing_trade_with_order_id(self, order_id) -> bool:
-        for trade in self.trades.values():
-            if trade.origin_order_id == order_id and trade.is_closing_order:
+        for trade in self._trades_by_origin_order_id.get(order_id, {}).values():
+            if trade.is_closing_order:
                 return True
-        return False
+        return self.trades_archive is not None and self.trades_archive.has_closing_trade_with_order_id(order_id)
 
     def get_total_paid_fees(self):
-        total_fees = {}
+        total_fees = {} if self.trades_archive is None else dict(self.trades_archive.paid_fees)
         for trade in self.trades.values():
             if trade.fee is not None:
                 fee_cost = trade.fee[enums.FeePropertyColumns.COST.value]
@@ -84,17 +100,42 @@ class TradesManager(util.Initializable):
         return self.trades[trade_id]
 
     # private
+    def _add_trade(self, trade_id, trade):
+        self.trades[trade_id] = trade
+        self._trades_by_origin_order_id.setdefault(trade.origin_order_id, {})[trade_id] = trade
+
     def _check_trades_size(self):
-        if len(self.trades) > self.MAX_TRADES_COUNT:
+        if self.trades_archive is not None:
+            if len(self.trades) > self.MAX_LIVE_TRADES_COUNT:
+                self._archive_oldest_trades(len(self.trades) - self.MAX_LIVE_TRADES_COUNT)
+        elif len(self.trades) > self.MAX_TRADES_COUNT:
             self._remove_oldest_trades(int(self.MAX_TRADES_COUNT / 10))
 
     def _reset_trades(self):
         self.trades_initialized = False
         self.trades = collections.OrderedDict()
+        self._trades_by_origin_order_id = {}
+        if self.trades_archive is not None:
+            self.trades_archive.clear()
 
     def _remove_oldest_trades(self, nb_to_remove):
         for _ in range(nb_to_remove):
-            self.trades.popitem(last=False)
+            self._pop_oldest_trade()
+
+    def _archive_oldest_trades(self, nb_to_archive):
+        for _ in range(nb_to_archive):
+            trade = self._pop_oldest_trade()
+            self.trades_archive.add_trade(trade)
+            trade.trader = None
+            trade.exchange_manager = None
+
+    def _pop_oldest_trade(self):
+        trade_id, trade = self.trades.popitem(last=False)
+        origin_order_trades = self._trades_by_origin_order_id.get(trade.origin_order_id, {})
+        origin_order_trades.pop(trade_id, None)
+        if not origin_order_trades:
+            self._trades_by_origin_order_id.pop(trade.origin_order_id, None)
+        return trade
 
     def _set_initialized_event(self, symbol):
         # set init in updater as it's the only place we know if we fetched trades or not regardless of trades existence
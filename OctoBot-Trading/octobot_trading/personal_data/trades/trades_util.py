@@ -28,8 +28,17 @@ def compute_win_rate(exchange_manager):
     lost_trades_count = constants.ZERO
     won_trades_count = constants.ZERO
     entries = constants.ZERO
+    trades_manager = exchange_manager.exchange_personal_data.trades_manager
+    archive = trades_manager.trades_archive
     if exchange_manager.is_future:
-        for trade in exchange_manager.exchange_personal_data.trades_manager.trades.values():
+        if archive is not None:
+            lost_trades_count += archive.count_trades(status=trading_enums.OrderStatus.FILLED, reduce_only=True,
+                                                      exchange_trade_types=_LOSING_ORDER_TYPES)
+            won_trades_count += archive.count_trades(status=trading_enums.OrderStatus.FILLED, reduce_only=True,
+                                                     exchange_trade_types=_LOSING_ORDER_TYPES,
+                                                     exclude_exchange_trade_types=True)
+            entries += archive.count_trades(status=trading_enums.OrderStatus.FILLED, reduce_only=False)
+        for trade in trades_manager.trades.values():
             if trade.status is trading_enums.OrderStatus.FILLED:
                 if trade.reduce_only:
                     if trade.exchange_trade_type in _LOSING_ORDER_TYPES:
@@ -56,7 +65,15 @@ def compute_win_rate(exchange_manager):
                     else:
                         lost_trades_count += constants.ONE
     else:
-        for trade in exchange_manager.exchange_personal_data.trades_manager.trades.values():
+        if archive is not None:
+            lost_trades_count += archive.count_trades(status=trading_enums.OrderStatus.FILLED,
+                                                      side=trading_enums.TradeOrderSide.SELL,
+                                                      exchange_trade_types=_LOSING_ORDER_TYPES)
+            won_trades_count += archive.count_trades(status=trading_enums.OrderStatus.FILLED,
+                                                     side=trading_enums.TradeOrderSide.SELL,
+                                                     exchange_trade_types=_LOSING_ORDER_TYPES,
+                                                     exclude_exchange_trade_types=True)
+        for trade in trades_manager.trades.values():
             if trade.status is trading_enums.OrderStatus.FILLED and trade.side is trading_enums.TradeOrderSide.SELL:
                 if trade.exchange_trade_type in _LOSING_ORDER_TYPES:
                     lost_trades_count += constants.ONE
@@ -24,6 +24,7 @@ from octobot_trading.util.config_util cimport (
     is_trader_enabled,
     is_trader_simulator_enabled,
     is_trade_history_loading_enabled,
+    is_orders_matching_engine_enabled,
     is_currency_enabled,
     get_symbols,
     get_all_currencies,
@@ -39,6 +40,7 @@ __all__ = [
     "is_trader_enabled",
     "is_trader_simulator_enabled",
     "is_trade_history_loading_enabled",
+    "is_orders_matching_engine_enabled",
     "is_currency_enabled",
     "get_symbols",
     "get_all_currencies",
@@ -36,6 +36,7 @@ from octobot_trading.util.config_util import (
     is_trader_enabled,
     is_trader_simulator_enabled,
     is_trade_history_loading_enabled,
+    is_orders_matching_engine_enabled,
     is_currency_enabled,
     get_symbols,
     get_all_currencies,
@@ -54,6 +55,7 @@ __all__ = [
     "is_trader_enabled",
     "is_trader_simulator_enabled",
     "is_trade_history_loading_enabled",
+    "is_orders_matching_engine_enabled",
     "is_currency_enabled",
     "get_symbols",
     "get_all_currencies",
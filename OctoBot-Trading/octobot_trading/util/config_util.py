@@ -43,6 +43,15 @@ def is_trade_history_loading_enabled(config, default=True) -> bool:
         return default
 
 
+def is_orders_matching_engine_enabled(config, default=False) -> bool:
+    try:
+        return config[commons_constants.CONFIG_SIMULATOR].get(
+            commons_constants.CONFIG_SIMULATOR_ORDERS_MATCHING_ENGINE, default
+        )
+    except KeyError:
+        return default
+
+
 def is_currency_enabled(config, currency, default_value) -> bool:
     try:
         return config[commons_constants.CONFIG_CRYPTO_CURRENCIES][currency][commons_constants.CONFIG_ENABLED_OPTION]
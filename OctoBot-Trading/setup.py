@@ -56,6 +56,7 @@ packages_list = [
     "octobot_trading.exchange_data.contracts.margin_contract",
     "octobot_trading.exchange_data.contracts.future_contract",
     "octobot_trading.exchange_data.order_book.order_book_manager",
+    "octobot_trading.exchange_data.order_book.l2_order_book_manager",
     "octobot_trading.exchange_data.order_book.channel.order_book",
     "octobot_trading.exchange_data.order_book.channel.order_book_updater_simulator",
     "octobot_trading.exchange_data.order_book.channel.order_book_updater",
@@ -72,6 +73,7 @@ packages_list = [
     "octobot_trading.exchange_data.recent_trades.channel.recent_trade_updater_simulator",
     "octobot_trading.exchange_data.recent_trades.channel.recent_trade_updater",
     "octobot_trading.exchange_data.prices.price_events_manager",
+    "octobot_trading.exchange_data.prices.orders_matching_engine",
     "octobot_trading.exchange_data.prices.prices_manager",
     "octobot_trading.exchange_data.prices.channel.price",
     "octobot_trading.exchange_data.prices.channel.prices_updater_simulator",
@@ -20,6 +20,7 @@ import pytest
 import octobot_trading.api  # TODO fix circular import when importing octobot_trading.exchange_data first
 
 from octobot_trading.exchange_data.prices.price_events_manager import PriceEventsManager
+from octobot_trading.exchange_data.prices.orders_matching_engine import OrdersMatchingEngine
 from octobot_trading.exchange_data.prices.prices_manager import PricesManager
 from octobot_trading.exchange_data.recent_trades.recent_trades_manager import RecentTradesManager
 
@@ -29,6 +30,11 @@ def price_events_manager(event_loop):
     return PriceEventsManager()
 
 
+@pytest.fixture()
+def orders_matching_engine(event_loop):
+    return OrdersMatchingEngine()
+
+
 @pytest.fixture()
 def prices_manager(event_loop, backtesting_exchange_manager):
     return PricesManager(backtesting_exchange_manager)
@@ -155,6 +155,81 @@ def test_reach_max_candles_count_with_custom_candles_count():
                other_candles[-1][PriceIndexes.IND_PRICE_CLOSE.value])
 
 
+def test_ring_buffer_windows():
+    candles_manager = CandlesManager()
+    all_candles = _gen_candles(candles_manager.max_candles_count * 2 + 10)
+    for index, candle in enumerate(all_candles):
+        candles_manager.add_new_candle(candle)
+        expected_candles = all_candles[max(0, index + 1 - candles_manager.max_candles_count):index + 1]
+        if index % 97 == 0 or index > len(all_candles) - 3:
+            np.testing.assert_array_equal(candles_manager.get_symbol_time_candles(),
+                                          [candle[PriceIndexes.IND_PRICE_TIME.value] for candle in expected_candles])
+            np.testing.assert_array_equal(candles_manager.get_symbol_close_candles(5),
+                                          [candle[PriceIndexes.IND_PRICE_CLOSE.value]
+                                           for candle in expected_candles[-5:]])
+    assert candles_manager.time_candles[0] == all_candles[-candles_manager.max_candles_count][
+        PriceIndexes.IND_PRICE_TIME.value]
+    assert candles_manager.time_candles[-1] == all_candles[-1][PriceIndexes.IND_PRICE_TIME.value]
+
+
+def test_get_symbol_candles_views():
+    candles_manager = CandlesManager()
+    candles_manager.add_old_and_new_candles(_gen_candles(candles_manager.max_candles_count + 5))
+    close_candles = candles_manager.get_symbol_close_candles(10)
+    assert close_candles.flags.c_contiguous
+    assert not close_candles.flags.writeable
+    # no copy
+    assert np.shares_memory(close_candles, candles_manager.get_symbol_close_candles())
+    assert not np.shares_memory(candles_manager.get_symbol_volume_candles(10),
+                                candles_manager.get_symbol_close_candles(10))
+
+
+def test_add_new_candle_skips_known_candles():
+    candles_manager = CandlesManager()
+    candles = _gen_candles(5)
+    candles_manager.add_old_and_new_candles(candles)
+    assert candles_manager.close_candles_index == 5
+    # already added candles
+    candles_manager.add_new_candle(candles[-1])
+    candles_manager.add_new_candle(candles[1])
+    candles_manager.add_old_and_new_candles(candles[2:])
+    assert candles_manager.close_candles_index == 5
+    # only missing candles are added
+    candles_manager.add_old_and_new_candles(_gen_candles(8)[3:])
+    assert candles_manager.close_candles_index == 8
+    np.testing.assert_array_equal(candles_manager.get_symbol_time_candles(),
+                                  [candle[PriceIndexes.IND_PRICE_TIME.value] for candle in _gen_candles(8)])
+
+
+def test_get_symbol_candles_views_are_not_overwritten():
+    candles_manager = CandlesManager()
+    all_candles = _gen_candles(candles_manager.max_candles_count * 3)
+    candles_manager.add_old_and_new_candles(all_candles[:candles_manager.max_candles_count])
+    time_candles = candles_manager.get_symbol_time_candles()
+    last_close_candles = candles_manager.get_symbol_close_candles(10)
+    expected_time_candles = time_candles.copy()
+    expected_last_close_candles = last_close_candles.copy()
+    for candle in all_candles[candles_manager.max_candles_count:]:
+        candles_manager.add_new_candle(candle)
+    # previously returned views still contain the same candles
+    np.testing.assert_array_equal(time_candles, expected_time_candles)
+    np.testing.assert_array_equal(last_close_candles, expected_last_close_candles)
+    np.testing.assert_array_equal(candles_manager.get_symbol_close_candles(3),
+                                  [candle[PriceIndexes.IND_PRICE_CLOSE.value] for candle in all_candles[-3:]])
+
+
+def test_add_new_candle_ignores_older_candles():
+    candles_manager = CandlesManager()
+    candles = _gen_candles(6)
+    candles_manager.add_old_and_new_candles([candles[0], candles[3], candles[5]])
+    # candles are kept in chronological order: candles older than the latest one are not added
+    candles_manager.add_new_candle(candles[1])
+    candles_manager.add_new_candle(candles[4])
+    assert candles_manager.close_candles_index == 3
+    np.testing.assert_array_equal(candles_manager.get_symbol_time_candles(),
+                                  [candles[index][PriceIndexes.IND_PRICE_TIME.value] for index in (0, 3, 5)])
+
+
 def _test_data(candles_data, expected_len, expected_last_val):
     assert len(candles_data) == expected_len
     if expected_len > 0:
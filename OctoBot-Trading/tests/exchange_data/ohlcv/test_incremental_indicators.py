@@ -0,0 +1,204 @@
+#  Drakkar-Software OctoBot-Trading
+#  Copyright (c) Drakkar-Software, All rights reserved.
+#
+#  This library is free software; you can redistribute it and/or
+#  modify it under the terms of the GNU Lesser General Public
+#  License as published by the Free Software Foundation; either
+#  version 3.0 of the License, or (at your option) any later version.
+#
+#  This library is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the GNU
+#  Lesser General Public License for more details.
+#
+#  You should have received a copy of the GNU Lesser General Public
+#  License along with this library.
+import random
+import numpy as np
+import pytest
+
+from octobot_commons.enums import PriceIndexes
+from octobot_trading.exchange_data.ohlcv.candles_manager import CandlesManager
+from octobot_trading.exchange_data.ohlcv.preloaded_candles_manager import PreloadedCandlesManager
+from octobot_trading.exchange_data.ohlcv.incremental_indicators import EMAIndicator, RSIIndicator, \
+    MACDIndicator, BBandsIndicator, ADXIndicator, KVOIndicator
+
+CANDLES_COUNT = 500
+
+
+def test_ema_rsi_and_macd_are_equal_to_tulipy():
+    tulipy = pytest.importorskip("tulipy")
+    candles = _gen_candles(CANDLES_COUNT)
+    close = _get_values(candles, PriceIndexes.IND_PRICE_CLOSE)
+    np.testing.assert_array_equal(_get_indicator(candles, EMAIndicator, 20).get_values(), tulipy.ema(close, 20))
+    np.testing.assert_array_equal(_get_indicator(candles, RSIIndicator, 14).get_values(), tulipy.rsi(close, 14))
+    for periods in ((12, 26, 9), (5, 13, 4)):
+        macd_indicator = _get_indicator(candles, MACDIndicator, *periods)
+        for output, values in zip(MACDIndicator.OUTPUTS, tulipy.macd(close, *periods)):
+            np.testing.assert_array_equal(macd_indicator.get_values(output), values)
+
+
+def test_bbands_adx_and_kvo_are_equal_to_tulipy():
+    tulipy = pytest.importorskip("tulipy")
+    candles = _gen_candles(CANDLES_COUNT)
+    high, low, close, volume = (
+        _get_values(candles, price_index)
+        for price_index in (PriceIndexes.IND_PRICE_HIGH, PriceIndexes.IND_PRICE_LOW,
+                            PriceIndexes.IND_PRICE_CLOSE, PriceIndexes.IND_PRICE_VOL)
+    )
+    bbands_indicator = _get_indicator(candles, BBandsIndicator, 20, 2)
+    for output, values in zip(BBandsIndicator.OUTPUTS, tulipy.bbands(close, 20, 2)):
+        np.testing.assert_array_equal(bbands_indicator.get_values(output), values)
+        assert bbands_indicator.get_last_value(output) == values[-1]
+    for output, values in zip(BBandsIndicator.OUTPUTS, tulipy.bbands(close[-20:], 20, 2)):
+        # sums are rolled over the whole history
+        np.testing.assert_allclose(bbands_indicator.get_values(output, limit=1), values)
+    for period in (2, 5, 14):
+        np.testing.assert_array_equal(_get_indicator(candles, ADXIndicator, period).get_values(),
+                                      tulipy.adx(high, low, close, period))
+    kvo_indicator = _get_indicator(candles, KVOIndicator, 35, 55, 13)
+    kvo = tulipy.kvo(high, low, close, volume, 35, 55)
+    np.testing.assert_array_equal(kvo_indicator.get_values("kvo"), kvo)
+    np.testing.assert_array_equal(kvo_indicator.get_values("signal"), tulipy.ema(kvo, 13))
+
+
+def test_get_values():
+    candles = _gen_candles(30)
+    rsi_indicator = RSIIndicator(20, 14)
+    assert len(rsi_indicator.get_values()) == 0
+    assert np.isnan(rsi_indicator.get_last_value())
+    for candle in candles[:15]:
+        rsi_indicator.update(candle)
+    assert len(rsi_indicator.get_values()) == 1
+    with pytest.raises(ValueError):
+        rsi_indicator.get_values()[0] = 1
+    values = rsi_indicator.get_values()
+    for candle in candles[15:20]:
+        rsi_indicator.update(candle)
+    assert len(rsi_indicator.get_values()) == 20 - 14
+    assert len(rsi_indicator.get_values(limit=3)) == 3
+    assert rsi_indicator.get_values()[-1] == rsi_indicator.get_last_value("rsi")
+    assert not np.isnan(rsi_indicator.get_values()).any()
+    # returned values are never overwritten
+    assert values[0] == rsi_indicator.get_values()[0]
+
+
+def test_get_values_after_max_size():
+    candles = _gen_candles(CANDLES_COUNT)
+    rsi_indicator = RSIIndicator(20, 14)
+    for candle in candles[:40]:
+        rsi_indicator.update(candle)
+    values = rsi_indicator.get_values()
+    values_copy = np.array(values)
+    for candle in candles[40:]:
+        rsi_indicator.update(candle)
+    # only the latest max_size values are kept, computed from the first candle
+    assert len(rsi_indicator.get_values()) == 20
+    assert rsi_indicator.candles_count == CANDLES_COUNT
+    np.testing.assert_array_equal(rsi_indicator.get_values(),
+                                  _get_indicator(candles, RSIIndicator, 14).get_values()[-20:])
+    # returned values are never overwritten
+    np.testing.assert_array_equal(values, values_copy)
+
+
+def test_candles_manager_get_indicator():
+    candles = _gen_candles(CANDLES_COUNT)
+    candles_manager = CandlesManager()
+    candles_manager.replace_all_candles(candles[:100])
+    rsi_indicator = candles_manager.get_indicator(RSIIndicator, 14)
+    assert candles_manager.get_indicator(RSIIndicator, 14) is rsi_indicator
+    assert candles_manager.get_indicator(RSIIndicator, 10) is not rsi_indicator
+    assert len(rsi_indicator.get_values()) == 100 - 14
+    for candle in candles[100:]:
+        candles_manager.add_new_candle(candle)
+    # known candles are not given to indicators
+    candles_manager.add_old_and_new_candles(candles[-10:])
+    np.testing.assert_array_equal(rsi_indicator.get_values(), _get_indicator(candles, RSIIndicator, 14).get_values())
+
+    # created from stored candles
+    np.testing.assert_array_equal(candles_manager.get_indicator(MACDIndicator, 12, 26, 9).get_values("histogram"),
+                                  _get_indicator(candles, MACDIndicator, 12, 26, 9).get_values("histogram"))
+
+    # reset with candles
+    candles_manager.replace_all_candles(candles[:50])
+    assert candles_manager.get_indicator(RSIIndicator, 14) is not rsi_indicator
+    assert len(candles_manager.get_indicator(RSIIndicator, 14).get_values()) == 50 - 14
+
+
+def test_candles_manager_get_indicator_after_reaching_max_candles_count():
+    tulipy = pytest.importorskip("tulipy")
+    candles = _gen_candles(CandlesManager.MAX_CANDLES_COUNT + CANDLES_COUNT)
+    candles_manager = CandlesManager()
+    candles_manager.replace_all_candles(candles[:CandlesManager.MAX_CANDLES_COUNT - 1])
+    ema_indicator = candles_manager.get_indicator(EMAIndicator, 5)
+    assert len(ema_indicator.get_values()) == CandlesManager.MAX_CANDLES_COUNT - 1
+    for candle in candles[CandlesManager.MAX_CANDLES_COUNT - 1:]:
+        candles_manager.add_new_candle(candle)
+    assert candles_manager.reached_max
+    # still updated when the oldest candles are dropped
+    assert candles_manager.get_indicator(EMAIndicator, 5) is ema_indicator
+    assert ema_indicator.candles_count == len(candles)
+    ema_values = ema_indicator.get_values()
+    np.testing.assert_array_equal(ema_values, _get_indicator(candles, EMAIndicator, 5).get_values()[-len(ema_values):])
+    # tulipy restarts from the oldest stored candle: same values once the dropped candles weight has faded
+    stored_close = candles_manager.get_symbol_close_candles()
+    np.testing.assert_allclose(ema_indicator.get_values()[-100:], tulipy.ema(stored_close, 5)[-100:])
+    # created after reaching max_candles_count: seeded from stored candles
+    np.testing.assert_array_equal(candles_manager.get_indicator(RSIIndicator, 14).get_values(),
+                                  tulipy.rsi(stored_close, 14))
+
+    candles_manager.replace_all_candles(candles[:100])
+    assert len(candles_manager.get_indicator(EMAIndicator, 5).get_values()) == 100
+
+
+def test_preloaded_candles_manager_get_indicator():
+    tulipy = pytest.importorskip("tulipy")
+    candles = _gen_candles(CANDLES_COUNT)
+    candles_manager = PreloadedCandlesManager()
+    candles_manager.replace_all_candles(candles)
+    assert len(candles_manager.get_indicator(RSIIndicator, 14).get_values()) == 0
+    candles_manager.add_old_and_new_candles([candles[100]])
+    rsi_indicator = candles_manager.get_indicator(RSIIndicator, 14)
+    np.testing.assert_array_equal(rsi_indicator.get_values(),
+                                  tulipy.rsi(candles_manager.get_symbol_close_candles(), 14))
+    # advanced with the current candle
+    for candle in candles[101:300]:
+        candles_manager.add_old_and_new_candles([candle])
+        assert candles_manager.get_indicator(RSIIndicator, 14) is rsi_indicator
+    assert rsi_indicator.candles_count == candles_manager.get_symbol_candles_count()
+    np.testing.assert_array_equal(rsi_indicator.get_values(),
+                                  tulipy.rsi(candles_manager.get_symbol_close_candles(), 14))
+    # current candle moved back: recomputed
+    candles_manager.add_old_and_new_candles([candles[50]])
+    assert candles_manager.get_indicator(RSIIndicator, 14) is not rsi_indicator
+    np.testing.assert_array_equal(candles_manager.get_indicator(RSIIndicator, 14).get_values(),
+                                  tulipy.rsi(candles_manager.get_symbol_close_candles(), 14))
+
+
+def _get_indicator(candles, indicator_class, *indicator_params):
+    indicator = indicator_class(CandlesManager.MAX_CANDLES_COUNT, *indicator_params)
+    for candle in candles:
+        indicator.update(candle)
+    return indicator
+
+
+def _get_values(candles, price_index):
+    return np.array([candle[price_index.value] for candle in candles], dtype=np.float64)
+
+
+def _gen_candles(size) -> list:
+    rand = random.Random(42)
+    candles = []
+    close = 100
+    for seed in range(size):
+        open_price = close
+        close = max(1, close + rand.uniform(-3, 3))
+        candle = [0] * len(PriceIndexes)
+        candle[PriceIndexes.IND_PRICE_TIME.value] = seed * 60
+        candle[PriceIndexes.IND_PRICE_OPEN.value] = open_price
+        candle[PriceIndexes.IND_PRICE_HIGH.value] = max(open_price, close) + rand.uniform(0, 2)
+        candle[PriceIndexes.IND_PRICE_LOW.value] = min(open_price, close) - rand.uniform(0, 2)
+        candle[PriceIndexes.IND_PRICE_CLOSE.value] = close
+        candle[PriceIndexes.IND_PRICE_VOL.value] = rand.uniform(1, 100)
+        candles.append(candle)
+    return candles
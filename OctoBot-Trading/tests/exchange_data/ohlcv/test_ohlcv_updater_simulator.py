@@ -0,0 +1,161 @@
+#  Drakkar-Software OctoBot-Trading
+#  Copyright (c) Drakkar-Software, All rights reserved.
+#
+#  This library is free software; you can redistribute it and/or
+#  modify it under the terms of the GNU Lesser General Public
+#  License as published by the Free Software Foundation; either
+#  version 3.0 of the License, or (at your option) any later version.
+#
+#  This library is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the GNU
+#  Lesser General Public License for more details.
+#
+#  You should have received a copy of the GNU Lesser General Public
+#  License along with this library.
+import mock
+import pytest
+
+import octobot_trading.api
+import octobot_commons.enums as commons_enums
+import octobot_backtesting.constants as backtesting_constants
+from octobot_backtesting.importers.exchanges.exchange_importer import ExchangeDataImporter
+from octobot_trading.exchange_data.ohlcv.channel.ohlcv import OHLCVChannel
+from octobot_trading.exchange_data.ohlcv.channel.ohlcv_updater_simulator import OHLCVUpdaterSimulator
+
+# required to catch async loop context exceptions
+from tests import event_loop
+
+# All test coroutines will be treated as marked.
+pytestmark = pytest.mark.asyncio
+
+EXCHANGE_NAME = "binanceus"
+SYMBOLS = ["BTC/USDT", "ETH/USDT"]
+TIME_FRAMES = [commons_enums.TimeFrames.ONE_HOUR, commons_enums.TimeFrames.FOUR_HOURS]
+HOUR = 3600
+
+
+class _Importer(ExchangeDataImporter):
+    def __init__(self, rows_by_symbol_by_time_frame):
+        super().__init__({}, "")
+        self.symbols = SYMBOLS
+        self.rows_by_symbol_by_time_frame = rows_by_symbol_by_time_frame
+
+    async def get_ohlcv_from_timestamps(self, exchange_name=None, symbol=None,
+                                        time_frame=commons_enums.TimeFrames.ONE_HOUR,
+                                        limit=-1, inferior_timestamp=-1, superior_timestamp=-1, cursor="default"):
+        return [
+            row
+            for row in self.rows_by_symbol_by_time_frame[symbol][time_frame]
+            if row[0] >= inferior_timestamp and (superior_timestamp == -1 or row[0] <= superior_timestamp)
+        ]
+
+
+def _get_rows():
+    rows_by_symbol_by_time_frame = {}
+    for index, symbol in enumerate(SYMBOLS):
+        rows_by_symbol_by_time_frame[symbol] = {}
+        for time_frame in TIME_FRAMES:
+            time_frame_seconds = commons_enums.TimeFramesMinutes[time_frame] * 60
+            rows_by_symbol_by_time_frame[symbol][time_frame] = [
+                [timestamp, EXCHANGE_NAME, symbol.split("/")[0], symbol, time_frame.value,
+                 [timestamp, 1 + index, 2, 0.5, 1.5, 10]]
+                for timestamp in range(0, 48 * HOUR, time_frame_seconds)
+                # missing data
+                if not (symbol == SYMBOLS[1] and 10 * HOUR <= timestamp < 20 * HOUR)
+            ]
+    return rows_by_symbol_by_time_frame
+
+
+def _create_simulator(use_batched_updates, config=None):
+    exchange_manager = mock.Mock(exchange_name=EXCHANGE_NAME, id="exchange_id", config=config or {})
+    exchange_manager.exchange.backtesting.time_manager.current_timestamp = 0
+    exchange_manager.exchange.get_time_frames = mock.Mock(return_value=TIME_FRAMES)
+    exchange_manager.exchange.get_current_future_candles = mock.Mock(return_value={
+        symbol: {} for symbol in SYMBOLS
+    })
+    exchange_manager.exchange.get_pair_cryptocurrency = lambda symbol: symbol.split("/")[0]
+    exchange_manager.exchange_config.get_shortest_time_frame = mock.Mock(return_value=TIME_FRAMES[0])
+    exchange_manager.get_symbol_data.return_value.handle_candles_update = mock.AsyncMock()
+    channel = OHLCVChannel(exchange_manager)
+    channel.is_synchronized = True
+    simulator = OHLCVUpdaterSimulator(channel, _Importer(_get_rows()))
+    if use_batched_updates is not None:
+        simulator.use_batched_updates = use_batched_updates
+    return simulator
+
+
+async def _run(simulator, timestamps):
+    consumer = await simulator.channel.new_consumer(mock.AsyncMock())
+    batched_consumer = await simulator.channel.new_consumer(mock.AsyncMock(), batched=True)
+    for timestamp in timestamps:
+        await simulator.handle_timestamp(timestamp)
+    return _get_queue_content(consumer), _get_queue_content(batched_consumer)
+
+
+def _get_queue_content(consumer):
+    content = []
+    while not consumer.queue.empty():
+        content.append(consumer.queue.get_nowait())
+    return content
+
+
+async def test_get_filtered_consumers():
+    channel = _create_simulator(True).channel
+    consumer = await channel.new_consumer(mock.AsyncMock())
+    symbol_consumer = await channel.new_consumer(mock.AsyncMock(), symbol=SYMBOLS[0])
+    batched_consumer = await channel.new_consumer(mock.AsyncMock(), batched=True)
+    assert channel.get_filtered_consumers() == [consumer, symbol_consumer]
+    assert channel.get_filtered_consumers(symbol=SYMBOLS[1]) == [consumer]
+    assert channel.get_filtered_consumers(batched=True) == [batched_consumer]
+
+
+async def test_handle_timestamp_batched_updates():
+    timestamps = list(range(0, 30 * HOUR, HOUR))
+    legacy_notifications, legacy_batched_notifications = await _run(_create_simulator(False), timestamps)
+    notifications, batched_notifications = await _run(_create_simulator(True), timestamps)
+
+    # same notifications in both modes for symbol and time frame consumers
+    assert notifications == legacy_notifications
+    assert len(notifications) > len(timestamps)
+    # batched consumers are only notified using batched updates, once per timestamp
+    assert legacy_batched_notifications == []
+    assert [notification["timestamp"] for notification in batched_notifications] == timestamps
+    # missing data
+    assert SYMBOLS[1] not in batched_notifications[15]["candles"]
+    assert sum(len(notification["candles"][symbol])
+               for notification in batched_notifications
+               for symbol in notification["candles"]) == len(notifications)
+
+
+async def test_use_batched_updates_config():
+    assert _create_simulator(None).use_batched_updates is False
+    assert _create_simulator(None, {
+        backtesting_constants.CONFIG_BACKTESTING: {
+            backtesting_constants.CONFIG_BACKTESTING_USE_BATCHED_OHLCV_UPDATES: True
+        }
+    }).use_batched_updates is True
+
+
+async def test_handle_timestamp_batched_updates_after_time_reset():
+    # backtesting time goes back to an earlier timestamp: candles are selected again from this timestamp
+    timestamps = list(range(0, 30 * HOUR, HOUR)) + list(range(5 * HOUR, 20 * HOUR, HOUR))
+    legacy_notifications, _ = await _run(_create_simulator(False), timestamps)
+    notifications, batched_notifications = await _run(_create_simulator(True), timestamps)
+    assert notifications == legacy_notifications
+    assert [notification["timestamp"] for notification in batched_notifications] == \
+        timestamps[:30] + timestamps[31:]
+
+
+async def test_stop_resets_preloaded_candles():
+    simulator = _create_simulator(True)
+    legacy_simulator = _create_simulator(False)
+    timestamps = list(range(0, 10 * HOUR, HOUR))
+    await _run(simulator, timestamps)
+    await _run(legacy_simulator, timestamps)
+    await simulator.stop()
+    # preloaded candles are loaded again after stop
+    timestamps = list(range(10 * HOUR, 20 * HOUR, HOUR))
+    notifications, _ = await _run(simulator, timestamps)
+    legacy_notifications, _ = await _run(legacy_simulator, timestamps)
+    assert notifications == legacy_notifications
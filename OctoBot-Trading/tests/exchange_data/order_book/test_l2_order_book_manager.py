@@ -0,0 +1,135 @@
+#  Drakkar-Software OctoBot-Trading
+#  Copyright (c) Drakkar-Software, All rights reserved.
+#
+#  This library is free software; you can redistribute it and/or
+#  modify it under the terms of the GNU Lesser General Public
+#  License as published by the Free Software Foundation; either
+#  version 3.0 of the License, or (at your option) any later version.
+#
+#  This library is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the GNU
+#  Lesser General Public License for more details.
+#
+#  You should have received a copy of the GNU Lesser General Public
+#  License along with this library.
+import pytest
+import pytest_asyncio
+
+from octobot_trading.exchange_data.order_book.l2_order_book_manager import L2OrderBookManager, L2OrderBookSide
+from octobot_trading.enums import ExchangeConstantsOrderBookInfoColumns as ECOBIC
+from octobot_trading.enums import TradeOrderSide
+from tests.test_utils.random_numbers import random_order_book_side, random_timestamp
+from tests import event_loop
+
+pytestmark = pytest.mark.asyncio
+
+
+@pytest_asyncio.fixture()
+async def order_book_manager():
+    ob_manager = L2OrderBookManager()
+    await ob_manager.initialize()
+    return ob_manager
+
+
+async def test_order_book_side():
+    asks = L2OrderBookSide(TradeOrderSide.SELL.value)
+    bids = L2OrderBookSide(TradeOrderSide.BUY.value)
+    for side in (asks, bids):
+        side.set_levels([[11, 1], [9, 2], [10, 0], [12, 3]])
+        assert list(side.levels.keys()) == [9, 11, 12]
+        assert list(side.levels.values()) == [2, 1, 3]
+        side.set_level(10, 4)
+        side.set_level(12, 0)
+        side.set_level(9, 5)
+        # unknown level
+        side.set_level(13, 0)
+        assert list(side.levels.keys()) == [9, 10, 11]
+        assert list(side.levels.values()) == [5, 4, 1]
+        side.update_level(11, 6)
+        side.update_level(14, 6)
+        side.remove_level(10)
+        side.remove_level(15)
+        assert list(side.levels.keys()) == [9, 11]
+        assert side.get_size(11) == 6
+        assert side.get_size(10) is None
+        assert len(side) == 2
+    assert asks.get_best() == (9, 5)
+    assert bids.get_best() == (11, 6)
+    asks.set_levels([[price, 1] for price in range(1, 11)])
+    bids.set_levels([[price, 1] for price in range(1, 11)])
+    assert asks.get_depth(3) == [(1, 1), (2, 1), (3, 1)]
+    assert bids.get_depth(3) == [(10, 1), (9, 1), (8, 1)]
+    assert len(asks.get_depth(20)) == len(bids.get_depth(20)) == 10
+    assert asks.get_depth(0) == bids.get_depth(0) == []
+    asks.clear()
+    assert len(asks) == 0
+    with pytest.raises(IndexError):
+        asks.get_best()
+
+
+async def test_handle_new_books(order_book_manager):
+    ts = random_timestamp()
+    asks = random_order_book_side(count=100)
+    bids = random_order_book_side(count=100)
+    order_book_manager.handle_new_books(asks, bids, timestamp=ts)
+    assert order_book_manager.order_book_initialized
+    assert order_book_manager.timestamp == ts
+    assert order_book_manager.get_ask()[0] == min(price for price, _ in asks)
+    assert order_book_manager.get_bid()[0] == max(price for price, _ in bids)
+    order_book_manager.reset_order_book()
+    assert not order_book_manager.order_book_initialized
+    assert len(order_book_manager.asks) == len(order_book_manager.bids) == 0
+
+
+async def test_handle_price_levels(order_book_manager):
+    order_book_manager.handle_price_levels_snapshot(asks=[(11, 1), (12, 1), (13, 1)], bids=[(8, 1), (9, 1), (10, 1)])
+    order_book_manager.handle_price_levels_deltas(asks=[(11, 5), (12, 0), (14, 2)], bids=[(10, 0), (7, 0)])
+    assert order_book_manager.get_ask() == (11, [{
+        ECOBIC.SIDE.value: TradeOrderSide.SELL.value,
+        ECOBIC.PRICE.value: 11,
+        ECOBIC.SIZE.value: 5,
+        ECOBIC.ORDER_ID.value: None
+    }])
+    assert order_book_manager.get_bid()[0] == 9
+    assert order_book_manager.get_asks(14)[0][ECOBIC.SIZE.value] == 2
+    assert order_book_manager.get_asks(12) is None
+    assert order_book_manager.get_bids(8)[0][ECOBIC.SIDE.value] == TradeOrderSide.BUY.value
+    assert order_book_manager.get_asks_depth(2) == [(11, 5), (13, 1)]
+    assert order_book_manager.get_bids_depth(5) == [(9, 1), (8, 1)]
+
+
+async def test_handle_book_orders(order_book_manager):
+    order_book_manager.handle_book_adds([
+        get_test_order(TradeOrderSide.BUY.value, 10, 1),
+        get_test_order(TradeOrderSide.BUY.value, 9, 1),
+        get_test_order(TradeOrderSide.SELL.value, 11, 1),
+        get_test_order(TradeOrderSide.SELL.value, 12, 1),
+    ])
+    # same price level: replaces the price level size
+    order_book_manager.handle_book_adds([get_test_order(TradeOrderSide.BUY.value, 10, 3)])
+    assert order_book_manager.get_bids_depth(2) == [(10, 3), (9, 1)]
+    order_book_manager.handle_book_updates([
+        get_test_order(TradeOrderSide.SELL.value, 12, 4),
+        # unknown price level
+        get_test_order(TradeOrderSide.SELL.value, 13, 4),
+    ])
+    assert order_book_manager.get_asks_depth(5) == [(11, 1), (12, 4)]
+    order_book_manager.handle_book_deletes([
+        get_test_order(TradeOrderSide.SELL.value, 11, 4),
+        get_test_order(TradeOrderSide.BUY.value, 8, 4),
+    ])
+    assert order_book_manager.get_asks_depth(5) == [(12, 4)]
+    assert order_book_manager.get_bids_depth(5) == [(10, 3), (9, 1)]
+    # invalid orders are skipped
+    order_book_manager.handle_book_adds([{ECOBIC.PRICE.value: 1}])
+    assert order_book_manager.get_asks_depth(5) == [(12, 4)]
+
+
+def get_test_order(order_side, order_price, order_size):
+    return {
+        ECOBIC.SIDE.value: order_side,
+        ECOBIC.SIZE.value: order_size,
+        ECOBIC.PRICE.value: order_price,
+        ECOBIC.ORDER_ID.value: None
+    }
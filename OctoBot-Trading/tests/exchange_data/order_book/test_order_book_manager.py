@@ -197,6 +197,55 @@ async def test_handle_book_updates(order_book_manager):
     assert get_order_at_id_in_order_list("6", order_book_manager.asks)[ECOBIC.SIZE.value] == order_6_2[ECOBIC.SIZE.value]
 
 
+async def test_handle_price_levels_snapshot(order_book_manager):
+    ts = random_timestamp()
+    order_book_manager.handle_book_adds([get_test_order(TradeOrderSide.BUY.value, "1", order_price=1)])
+    order_book_manager.handle_price_levels_snapshot(asks=[(12, 1), (11, 2)], bids=[(9, 3), (10, 4)], timestamp=ts)
+    assert order_book_manager.order_book_initialized
+    assert order_book_manager.timestamp == ts
+    # previous orders are removed
+    assert list(order_book_manager.bids) == [9, 10]
+    assert list(order_book_manager.asks) == [11, 12]
+    assert order_book_manager.get_ask() == (11, [{
+        ECOBIC.SIDE.value: TradeOrderSide.SELL.value,
+        ECOBIC.PRICE.value: 11,
+        ECOBIC.SIZE.value: 2,
+        ECOBIC.ORDER_ID.value: None
+    }])
+    assert order_book_manager.get_bid()[1][0][ECOBIC.SIZE.value] == 4
+    assert order_book_manager.get_bid()[1][0][ECOBIC.SIDE.value] == TradeOrderSide.BUY.value
+
+
+async def test_handle_price_levels_deltas(order_book_manager):
+    order_book_manager.handle_price_levels_snapshot(asks=[(11, 1), (12, 1), (13, 1)], bids=[(8, 1), (9, 1), (10, 1)])
+    unchanged_ask_level = order_book_manager.get_asks(13)
+    order_book_manager.handle_price_levels_deltas(
+        # update 11, remove 12, add 14
+        asks=[(11, 5), (12, 0), (14, 2)],
+        # remove 10 and unknown 7
+        bids=[(10, 0), (7, 0)]
+    )
+    assert list(order_book_manager.asks) == [11, 13, 14]
+    assert list(order_book_manager.bids) == [8, 9]
+    assert order_book_manager.get_ask()[1][0][ECOBIC.SIZE.value] == 5
+    assert order_book_manager.get_asks(14)[0][ECOBIC.SIZE.value] == 2
+    assert order_book_manager.get_bid()[0] == 9
+    # unchanged levels are kept as is
+    assert order_book_manager.get_asks(13) is unchanged_ask_level
+    order_book_manager.handle_price_levels_deltas(asks=[], bids=[(10, 3)])
+    assert order_book_manager.get_bid()[1][0][ECOBIC.SIZE.value] == 3
+
+
+async def test_get_depth(order_book_manager):
+    order_book_manager.handle_price_levels_snapshot(asks=[(11, 1), (12, 2), (13, 3)], bids=[(8, 1), (9, 2), (10, 3)])
+    # several orders on the same price level
+    order_book_manager.handle_book_adds([get_test_order(TradeOrderSide.SELL.value, "1", order_price=11, order_size=4)])
+    assert order_book_manager.get_asks_depth(2) == [(11, 5), (12, 2)]
+    assert order_book_manager.get_bids_depth(2) == [(10, 3), (9, 2)]
+    assert order_book_manager.get_bids_depth(10) == [(10, 3), (9, 2), (8, 1)]
+    assert order_book_manager.get_asks_depth(0) == []
+
+
 def get_test_order(order_side, order_id, order_price=None, order_size=None):
     return {
         ECOBIC.SIDE.value: order_side,
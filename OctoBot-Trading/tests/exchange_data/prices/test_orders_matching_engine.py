@@ -0,0 +1,125 @@
+#  Drakkar-Software OctoBot-Trading
+#  Copyright (c) Drakkar-Software, All rights reserved.
+#
+#  This library is free software; you can redistribute it and/or
+#  modify it under the terms of the GNU Lesser General Public
+#  License as published by the Free Software Foundation; either
+#  version 3.0 of the License, or (at your option) any later version.
+#
+#  This library is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the GNU
+#  Lesser General Public License for more details.
+#
+#  You should have received a copy of the GNU Lesser General Public
+#  License along with this library.
+import asyncio
+import decimal
+import os
+import pytest
+from mock import AsyncMock
+
+from octobot_commons.asyncio_tools import wait_asyncio_next_cycle
+
+from tests.exchange_data import orders_matching_engine
+from tests import event_loop
+
+# All test coroutines will be treated as marked.
+pytestmark = pytest.mark.asyncio
+
+
+async def test_new_trigger(orders_matching_engine):
+    callback = AsyncMock()
+    trigger = orders_matching_engine.new_trigger(decimal.Decimal("10"), 0.0, True, callback)
+    assert not trigger.is_set()
+    orders_matching_engine.handle_price(decimal.Decimal("1"), 1.0)
+    # should not be instantly set
+    trigger = orders_matching_engine.new_trigger(decimal.Decimal("2"), 0.0, True, callback)
+    assert not trigger.is_set()
+    # should be instantly set
+    trigger = orders_matching_engine.new_trigger(decimal.Decimal("2"), 0.0, False, callback)
+    assert trigger.is_set()
+    # should not be instantly set
+    trigger = orders_matching_engine.new_trigger(decimal.Decimal("2"), 0.0, False, callback, allow_instant_fill=False)
+    assert not trigger.is_set()
+    await wait_asyncio_next_cycle()
+    # instantly set triggers are not scheduled
+    callback.assert_not_called()
+
+
+async def test_handle_price_calls_triggered_callbacks_in_a_single_task(orders_matching_engine):
+    calls = []
+    tasks = set()
+
+    def _callback(index):
+        async def _on_trigger():
+            calls.append(index)
+            tasks.add(asyncio.current_task())
+        return _on_trigger
+
+    triggers = [
+        orders_matching_engine.new_trigger(decimal.Decimal(str(10 + index)), 0.0, True, _callback(index))
+        for index in range(5)
+    ]
+    below_trigger = orders_matching_engine.new_trigger(decimal.Decimal("5"), 0.0, False, _callback(-1))
+    orders_matching_engine.handle_price(decimal.Decimal("12"), 1.0)
+    assert [trigger.is_set() for trigger in triggers] == [True, True, True, False, False]
+    assert not below_trigger.is_set()
+    # callbacks are called from the next loop iteration
+    assert calls == []
+    await wait_asyncio_next_cycle()
+    assert calls == [0, 1, 2]
+    assert len(tasks) == 1
+    orders_matching_engine.handle_price(decimal.Decimal("20"), 2.0)
+    orders_matching_engine.handle_price(decimal.Decimal("4"), 3.0)
+    await wait_asyncio_next_cycle()
+    assert calls == [0, 1, 2, 3, 4, -1]
+    if not os.getenv('CYTHON_IGNORE'):
+        assert not orders_matching_engine.events
+        assert orders_matching_engine._fill_task is None
+
+
+async def test_schedule_trigger(orders_matching_engine):
+    callback = AsyncMock()
+    orders_matching_engine.handle_price(decimal.Decimal("1"), 1.0)
+    trigger = orders_matching_engine.new_trigger(decimal.Decimal("2"), 0.0, False, callback)
+    assert trigger.is_set()
+    orders_matching_engine.schedule_trigger(trigger)
+    await wait_asyncio_next_cycle()
+    callback.assert_awaited_once()
+
+
+async def test_failing_callback(orders_matching_engine):
+    failing_callback = AsyncMock(side_effect=RuntimeError)
+    callback = AsyncMock()
+    orders_matching_engine.new_trigger(decimal.Decimal("10"), 0.0, True, failing_callback)
+    orders_matching_engine.new_trigger(decimal.Decimal("11"), 0.0, True, callback)
+    orders_matching_engine.handle_price(decimal.Decimal("12"), 1.0)
+    await wait_asyncio_next_cycle()
+    failing_callback.assert_awaited_once()
+    # following callbacks are still called
+    callback.assert_awaited_once()
+
+
+async def test_remove_event(orders_matching_engine):
+    callback = AsyncMock()
+    trigger = orders_matching_engine.new_trigger(decimal.Decimal("10"), 0.0, True, callback)
+    orders_matching_engine.remove_event(trigger)
+    orders_matching_engine.handle_price(decimal.Decimal("12"), 1.0)
+    await wait_asyncio_next_cycle()
+    assert not trigger.is_set()
+    callback.assert_not_called()
+
+
+async def test_reset(orders_matching_engine):
+    callback = AsyncMock()
+    orders_matching_engine.new_trigger(decimal.Decimal("10"), 0.0, True, callback)
+    orders_matching_engine.new_trigger(decimal.Decimal("5"), 0.0, False, callback)
+    orders_matching_engine.handle_price(decimal.Decimal("12"), 1.0)
+    orders_matching_engine.reset()
+    await wait_asyncio_next_cycle()
+    callback.assert_not_called()
+    if not os.getenv('CYTHON_IGNORE'):
+        assert not orders_matching_engine.events
+        assert not orders_matching_engine._triggered_triggers
+        assert orders_matching_engine._fill_task is None
@@ -31,10 +31,15 @@ pytestmark = pytest.mark.asyncio
 
 async def test_reset(price_events_manager):
     if not os.getenv('CYTHON_IGNORE'):
-        price_events_manager.events.append(None)
+        price_events_manager.new_event(decimal_random_price(), random_timestamp(), True)
+        price_events_manager.new_event(decimal_random_price(), random_timestamp(), False)
         assert price_events_manager.events
+        assert price_events_manager._trigger_above_events
+        assert price_events_manager._trigger_below_events
         price_events_manager.reset()
         assert not price_events_manager.events
+        assert not price_events_manager._trigger_above_events
+        assert not price_events_manager._trigger_below_events
 
 
 async def test_new_event(price_events_manager):
@@ -158,6 +163,42 @@ async def test_handle_price(price_events_manager):
         price_event_1_set.assert_called_once()
 
 
+async def test_handle_price_sorted_books(price_events_manager):
+    above_events = [
+        price_events_manager.new_event(decimal.Decimal(str(price)), 10, True)
+        for price in (30, 10, 20, 20, 40)
+    ]
+    below_events = [
+        price_events_manager.new_event(decimal.Decimal(str(price)), 10, False)
+        for price in (5, 8, 3, 8)
+    ]
+    future_above_event = price_events_manager.new_event(decimal.Decimal("15"), 100, True)
+
+    price_events_manager.handle_price(decimal.Decimal("25"), 20)
+    assert [event.is_set() for event in above_events] == [False, True, True, True, False]
+    assert not any(event.is_set() for event in below_events)
+    # crossed but waiting for a later timestamp
+    assert not future_above_event.is_set()
+    if not os.getenv('CYTHON_IGNORE'):
+        assert len(price_events_manager.events) == 7
+        assert [price_event[0] for price_event in price_events_manager._trigger_above_events] == \
+            [decimal.Decimal("15"), decimal.Decimal("30"), decimal.Decimal("40")]
+        assert [price_event[0] for price_event in price_events_manager._trigger_below_events] == \
+            [decimal.Decimal("8"), decimal.Decimal("8"), decimal.Decimal("5"), decimal.Decimal("3")]
+
+    price_events_manager.handle_price(decimal.Decimal("8"), 20)
+    assert [event.is_set() for event in below_events] == [False, True, False, True]
+    price_events_manager.handle_price(decimal.Decimal("1"), 20)
+    assert all(event.is_set() for event in below_events)
+    assert not future_above_event.is_set()
+    price_events_manager.handle_price(decimal.Decimal("35"), 100)
+    assert future_above_event.is_set()
+    assert [event.is_set() for event in above_events] == [True, True, True, True, False]
+    if not os.getenv('CYTHON_IGNORE'):
+        assert len(price_events_manager.events) == 1
+        assert not price_events_manager._trigger_below_events
+
+
 async def test_remove_event(price_events_manager):
     event_1 = price_events_manager.new_event(decimal_random_price(), random_timestamp(), True)
     event_2 = price_events_manager.new_event(decimal_random_price(), random_timestamp(), False)
@@ -171,3 +212,5 @@ async def test_remove_event(price_events_manager):
         price_events_manager.remove_event(event_2)
         assert event_2 not in price_events_manager.events
         assert len(price_events_manager.events) == 0
+        assert not price_events_manager._trigger_above_events
+        assert not price_events_manager._trigger_below_events
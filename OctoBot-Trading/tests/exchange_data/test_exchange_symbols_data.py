@@ -13,10 +13,14 @@
 #
 #  You should have received a copy of the GNU Lesser General Public
 #  License along with this library.
+import mock
 import pytest
 import pytest_asyncio
 
 from octobot_trading.exchange_data.exchange_symbols_data import ExchangeSymbolsData
+from octobot_trading.exchanges.exchange_manager import ExchangeManager
+from octobot_trading.exchange_data.order_book.order_book_manager import OrderBookManager
+from octobot_trading.exchange_data.order_book.l2_order_book_manager import L2OrderBookManager
 
 # Import required fixtures
 from tests import event_loop
@@ -43,3 +47,12 @@ async def test_get_exchange_symbol_data_without_creation(exchange_symbols_data):
     exchange_symbols_data.get_exchange_symbol_data("ETH/USDT", allow_creation=True)
     with pytest.raises(KeyError):
         exchange_symbols_data.get_exchange_symbol_data("ETH/BTC", allow_creation=False)
+
+
+async def test_get_exchange_symbol_data_order_book_manager():
+    exchange_symbols_data = ExchangeSymbolsData(ExchangeManager({}, "binanceus"))
+    assert type(exchange_symbols_data.get_exchange_symbol_data("BTC/USDT").order_book_manager) is OrderBookManager
+    web_socket = mock.Mock(get_order_book_manager_class=mock.Mock(return_value=L2OrderBookManager))
+    with mock.patch.object(exchange_symbols_data.exchange_manager, "exchange_web_socket", web_socket):
+        assert type(exchange_symbols_data.get_exchange_symbol_data("ETH/USDT").order_book_manager) \
+            is L2OrderBookManager
@@ -17,6 +17,7 @@
 import mock
 import os
 import octobot_trading.exchanges as exchanges
+import octobot_trading.exchange_data as exchange_data
 from octobot_trading.enums import WebsocketFeeds as Feeds
 import pytest
 
@@ -67,3 +68,11 @@ async def test_should_ignore_feed(exchange_manager):
     assert not abstract_ws_exchange.should_ignore_feed(Feeds.TICKER)
     assert abstract_ws_exchange.should_ignore_feed(Feeds.TRADES)
 
+
+
+async def test_get_order_book_manager_class():
+    class L2WebsocketExchange(exchanges.AbstractWebsocketExchange):
+        ORDER_BOOK_MANAGER_CLASS = exchange_data.L2OrderBookManager
+
+    assert exchanges.AbstractWebsocketExchange.get_order_book_manager_class() is exchange_data.OrderBookManager
+    assert L2WebsocketExchange.get_order_book_manager_class() is exchange_data.L2OrderBookManager
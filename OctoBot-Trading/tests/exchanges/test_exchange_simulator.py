@@ -18,7 +18,8 @@ import decimal
 import pytest
 import octobot_trading.constants as constants
 import octobot_commons.constants as commons_constants
-from octobot_trading.enums import FeePropertyColumns, ExchangeConstantsMarketPropertyColumns, TraderOrderType
+from octobot_trading.enums import FeePropertyColumns, ExchangeConstantsMarketPropertyColumns, TraderOrderType, \
+    ExchangeConstantsMarketStatusColumns
 from octobot_trading.api.exchange import cancel_ccxt_throttle_task
 
 # Import required fixtures
@@ -90,6 +91,20 @@ async def test_get_trade_fee(backtesting_trader):
                 ExchangeConstantsMarketPropertyColumns.TAKER.value)
 
 
+async def test_get_market_status_and_fees_are_copies(backtesting_trader):
+    _, exchange_manager, trader_inst = backtesting_trader
+    market_status = exchange_manager.exchange.get_market_status(DEFAULT_BACKTESTING_SYMBOL)
+    market_status[ExchangeConstantsMarketStatusColumns.PRECISION.value][
+        ExchangeConstantsMarketStatusColumns.PRECISION_PRICE.value] = 2
+    assert exchange_manager.exchange.get_market_status(DEFAULT_BACKTESTING_SYMBOL)[
+               ExchangeConstantsMarketStatusColumns.PRECISION.value][
+               ExchangeConstantsMarketStatusColumns.PRECISION_PRICE.value] == 8
+    fees = exchange_manager.exchange.get_fees(DEFAULT_BACKTESTING_SYMBOL)
+    fees[ExchangeConstantsMarketPropertyColumns.TAKER.value] = 1
+    assert exchange_manager.exchange.get_fees(DEFAULT_BACKTESTING_SYMBOL)[
+               ExchangeConstantsMarketPropertyColumns.TAKER.value] == constants.CONFIG_DEFAULT_SIMULATOR_FEES
+
+
 async def test_stop(backtesting_trader):
     _, exchange_manager, trader_inst = backtesting_trader
     await exchange_manager.exchange.stop()
@@ -0,0 +1,134 @@
+#  Drakkar-Software OctoBot
+#  Copyright (c) Drakkar-Software, All rights reserved.
+#
+#  This library is free software; you can redistribute it and/or
+#  modify it under the terms of the GNU Lesser General Public
+#  License as published by the Free Software Foundation; either
+#  version 3.0 of the License, or (at your option) any later version.
+#
+#  This library is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the GNU
+#  Lesser General Public License for more details.
+#
+#  You should have received a copy of the GNU Lesser General Public
+#  License along with this library.
+import decimal
+
+import pytest
+
+import octobot_trading.personal_data as personal_data
+import octobot_trading.enums as enums
+from tests import event_loop
+from tests.exchanges import simulated_trader, simulated_exchange_manager
+from tests.personal_data.orders import created_order
+
+# All test coroutines will be treated as marked.
+pytestmark = pytest.mark.asyncio
+
+
+def _limit_order(trader_instance, order_id, symbol, tag=None, group=None):
+    order = created_order(personal_data.BuyLimitOrder, enums.TraderOrderType.BUY_LIMIT, trader_instance)
+    order.update(
+        order_id=order_id,
+        symbol=symbol,
+        price=decimal.Decimal(10),
+        quantity=decimal.Decimal(1),
+        order_type=enums.TraderOrderType.BUY_LIMIT,
+        tag=tag,
+        group=group,
+    )
+    return order
+
+
+async def test_select_orders_from_indexes(simulated_trader):
+    _, exchange_manager, trader_instance = simulated_trader
+    orders_manager = exchange_manager.exchange_personal_data.orders_manager
+    btc_order_1 = _limit_order(trader_instance, "1", "BTC/USDT", tag="grid")
+    eth_order = _limit_order(trader_instance, "2", "ETH/USDT", tag="grid")
+    btc_order_2 = _limit_order(trader_instance, "3", "BTC/USDT")
+    for order in (btc_order_1, eth_order, btc_order_2):
+        assert await orders_manager.upsert_order_instance(order)
+    assert orders_manager.has_order("1")
+    assert not orders_manager.has_order("4")
+
+    assert orders_manager.get_open_orders() == [btc_order_1, eth_order, btc_order_2]
+    assert orders_manager.get_open_orders(symbol="BTC/USDT") == [btc_order_1, btc_order_2]
+    assert orders_manager.get_open_orders(symbol="BTC/USDT", limit=1) == [btc_order_1]
+    assert orders_manager.get_open_orders(symbol="XRP/USDT") == []
+    assert orders_manager.get_open_orders(symbol="") == []
+    assert orders_manager.get_open_orders(tag="grid") == [btc_order_1, eth_order]
+    assert orders_manager.get_open_orders(symbol="BTC/USDT", tag="grid") == [btc_order_1]
+    assert orders_manager.get_closed_orders(symbol="BTC/USDT") == []
+
+    # status is checked on indexed orders
+    btc_order_2.status = enums.OrderStatus.CLOSED
+    assert orders_manager.get_open_orders(symbol="BTC/USDT") == [btc_order_1]
+    assert orders_manager.get_closed_orders(symbol="BTC/USDT") == [btc_order_2]
+
+    orders_manager.remove_order_instance(btc_order_1)
+    assert not orders_manager.has_order("1")
+    assert orders_manager.get_all_orders(symbol="BTC/USDT") == [btc_order_2]
+    assert orders_manager.get_open_orders(tag="grid") == [eth_order]
+
+    # order id change
+    eth_order.order_id = "5"
+    orders_manager.replace_order("2", eth_order)
+    assert not orders_manager.has_order("2")
+    assert orders_manager.get_order("5") is eth_order
+    assert orders_manager.get_open_orders(symbol="ETH/USDT") == [eth_order]
+    assert orders_manager.get_open_orders(tag="grid") == [eth_order]
+
+    orders_manager.clear()
+    assert orders_manager.get_all_orders(symbol="BTC/USDT") == []
+    assert orders_manager.get_all_orders(tag="grid") == []
+
+
+async def test_get_order_from_group(simulated_trader):
+    _, exchange_manager, trader_instance = simulated_trader
+    orders_manager = exchange_manager.exchange_personal_data.orders_manager
+    oco_group = orders_manager.create_group(personal_data.OneCancelsTheOtherOrderGroup, "oco")
+    other_group = orders_manager.create_group(personal_data.OneCancelsTheOtherOrderGroup, "other")
+    order_1 = _limit_order(trader_instance, "1", "BTC/USDT", group=oco_group)
+    order_2 = _limit_order(trader_instance, "2", "BTC/USDT")
+    order_3 = _limit_order(trader_instance, "3", "BTC/USDT", group=other_group)
+    for order in (order_1, order_2, order_3):
+        assert await orders_manager.upsert_order_instance(order)
+    assert orders_manager.get_order_from_group("oco") == [order_1]
+    assert oco_group.get_group_open_orders() == [order_1]
+    assert orders_manager.get_order_from_group("unknown") == []
+
+    # group added on an already registered order
+    order_2.add_to_order_group(oco_group)
+    assert orders_manager.get_order_from_group("oco") == [order_1, order_2]
+
+    orders_manager.remove_order_instance(order_1)
+    assert orders_manager.get_order_from_group("oco") == [order_2]
+    assert orders_manager.get_order_from_group("other") == [order_3]
+
+
+async def test_update_order_indexes(simulated_trader):
+    _, exchange_manager, trader_instance = simulated_trader
+    orders_manager = exchange_manager.exchange_personal_data.orders_manager
+    oco_group = orders_manager.create_group(personal_data.OneCancelsTheOtherOrderGroup, "oco")
+    other_group = orders_manager.create_group(personal_data.OneCancelsTheOtherOrderGroup, "other")
+    order_1 = _limit_order(trader_instance, "1", "BTC/USDT", tag="grid", group=oco_group)
+    order_2 = _limit_order(trader_instance, "2", "BTC/USDT", tag="grid")
+    for order in (order_1, order_2):
+        assert await orders_manager.upsert_order_instance(order)
+
+    # group change: order is only in its new group
+    order_1.add_to_order_group(other_group)
+    assert orders_manager.get_order_from_group("oco") == []
+    assert orders_manager.get_order_from_group("other") == [order_1]
+
+    # tag change: order is only selected with its new tag
+    order_1.update(symbol="BTC/USDT", tag="dca")
+    assert orders_manager.get_open_orders(tag="grid") == [order_2]
+    assert orders_manager.get_open_orders(tag="dca") == [order_1]
+
+    # removed using its current tag and group
+    orders_manager.remove_order_instance(order_1)
+    assert orders_manager.get_order_from_group("other") == []
+    assert orders_manager.get_all_orders(tag="dca") == []
+    assert orders_manager.get_all_orders(tag="grid") == [order_2]
@@ -15,9 +15,11 @@
 #  License along with this library.
 import decimal
 import os
+import mock
 import pytest
 
 import octobot_trading.constants as constants
+import octobot_trading.errors as errors
 from tests.test_utils.random_numbers import decimal_random_quantity, decimal_random_price, random_price
 
 from tests.exchanges import backtesting_trader, backtesting_config, backtesting_exchange_manager, fake_backtesting
@@ -198,3 +200,95 @@ async def test_update_origin_crypto_currencies_values(backtesting_trader):
     assert portfolio_value_holder.update_origin_crypto_currencies_values("BTC/USDT", decimal.Decimal(str(100))) is True
     assert portfolio_value_holder.origin_crypto_currencies_values["USDT"] == decimal.Decimal(constants.ONE / decimal.Decimal(100))
     assert portfolio_value_holder.last_prices_by_trading_pair["BTC/USDT"] == decimal.Decimal(str(100))
+
+
+async def test_incremental_portfolio_current_value(backtesting_trader):
+    config, exchange_manager, trader = backtesting_trader
+    portfolio_manager = exchange_manager.exchange_personal_data.portfolio_manager
+    portfolio_value_holder = portfolio_manager.portfolio_value_holder
+
+    portfolio_manager.reference_market = "USDT"
+    exchange_manager.client_symbols.extend(["BTC/USDT", "ETH/USDT", "XRP/USDT"])
+    portfolio_manager.portfolio.update_portfolio_from_balance({
+        'BTC': {'available': decimal.Decimal("1"), 'total': decimal.Decimal("1")},
+        'ETH': {'available': decimal.Decimal("10"), 'total': decimal.Decimal("10")},
+        'XRP': {'available': decimal.Decimal("1000"), 'total': decimal.Decimal("1000")},
+        'USDT': {'available': decimal.Decimal("1000"), 'total': decimal.Decimal("1000")}
+    }, True)
+    portfolio_manager.handle_mark_price_update("BTC/USDT", decimal.Decimal("20000"))
+    portfolio_manager.handle_mark_price_update("ETH/USDT", decimal.Decimal("1000"))
+    portfolio_manager.handle_mark_price_update("XRP/USDT", decimal.Decimal("0.5"))
+    assert portfolio_value_holder.portfolio_current_value == decimal.Decimal("31500")
+    origin_portfolio_current_value = portfolio_value_holder.get_origin_portfolio_current_value()
+
+    # price update: only ETH is evaluated again
+    with mock.patch.object(portfolio_value_holder, "_evaluate_value",
+                           mock.Mock(side_effect=portfolio_value_holder._evaluate_value)) as _evaluate_value_mock:
+        portfolio_manager.handle_mark_price_update("ETH/USDT", decimal.Decimal("1100"))
+        assert {call.args[0] for call in _evaluate_value_mock.call_args_list} == {"ETH", "USDT"}
+    assert portfolio_value_holder.portfolio_current_value == decimal.Decimal("32500")
+    assert portfolio_value_holder.get_origin_portfolio_current_value() == \
+        origin_portfolio_current_value + decimal.Decimal("1000")
+
+    # balance update: holdings values are updated without evaluating currencies again
+    portfolio_manager.portfolio.update_portfolio_from_balance({
+        'BTC': {'available': decimal.Decimal("1"), 'total': decimal.Decimal("1")},
+        'ETH': {'available': decimal.Decimal("10"), 'total': decimal.Decimal("10")},
+        'XRP': {'available': decimal.Decimal("0"), 'total': decimal.Decimal("0")},
+        'USDT': {'available': decimal.Decimal("1500"), 'total': decimal.Decimal("1500")}
+    }, True)
+    with mock.patch.object(portfolio_value_holder, "_evaluate_value",
+                           mock.Mock(side_effect=portfolio_value_holder._evaluate_value)) as _evaluate_value_mock:
+        portfolio_manager.handle_balance_updated()
+        _evaluate_value_mock.assert_not_called()
+    assert portfolio_value_holder.portfolio_current_value == decimal.Decimal("32500")
+    assert portfolio_value_holder.get_current_holdings_values() == {
+        'BTC': decimal.Decimal("20000"),
+        'ETH': decimal.Decimal("11000"),
+        'XRP': constants.ZERO,
+        'USDT': decimal.Decimal("1500"),
+    }
+
+    # price update of a currency that is not held: evaluated when held again
+    portfolio_manager.handle_mark_price_update("XRP/USDT", decimal.Decimal("1"))
+    portfolio_manager.portfolio.update_portfolio_from_balance({
+        'XRP': {'available': decimal.Decimal("100"), 'total': decimal.Decimal("100")},
+    }, False)
+    portfolio_manager.handle_balance_updated()
+    assert portfolio_value_holder.portfolio_current_value == decimal.Decimal("32600")
+    assert portfolio_value_holder.get_current_holdings_values()["XRP"] == decimal.Decimal("100")
+
+    # reference market update: every currency is evaluated again (no ETH/BTC price)
+    portfolio_manager.reference_market = "BTC"
+    portfolio_manager.handle_balance_updated()
+    assert portfolio_value_holder.portfolio_current_value == decimal.Decimal("1.075")
+
+
+async def test_convert_currency_value_using_last_prices_with_settlement_asset(backtesting_trader):
+    config, exchange_manager, trader = backtesting_trader
+    portfolio_value_holder = exchange_manager.exchange_personal_data.portfolio_manager.portfolio_value_holder
+
+    with pytest.raises(errors.MissingPriceDataError):
+        portfolio_value_holder.convert_currency_value_using_last_prices(decimal.Decimal("2"), "BTC", "USDT")
+    portfolio_value_holder.update_origin_crypto_currencies_values("BTC/USDT:USDT", decimal.Decimal("20000"))
+    assert portfolio_value_holder.convert_currency_value_using_last_prices(decimal.Decimal("2"), "BTC", "USDT") == \
+        decimal.Decimal("40000")
+    portfolio_value_holder.update_origin_crypto_currencies_values("BTC/USDT:USDT", decimal.Decimal("30000"))
+    assert portfolio_value_holder.convert_currency_value_using_last_prices(decimal.Decimal("2"), "BTC", "USDT") == \
+        decimal.Decimal("60000")
+    assert portfolio_value_holder.convert_currency_value_using_last_prices(decimal.Decimal("60000"), "USDT", "BTC") == \
+        decimal.Decimal("2")
+
+
+async def test_get_last_price_data_after_missing_price_data(backtesting_trader):
+    config, exchange_manager, trader = backtesting_trader
+    portfolio_value_holder = exchange_manager.exchange_personal_data.portfolio_manager.portfolio_value_holder
+
+    with pytest.raises(KeyError):
+        portfolio_value_holder._get_last_price_data("BTC/USDT:USDT")
+    with pytest.raises(KeyError):
+        portfolio_value_holder._get_last_price_data("BTC/USDT")
+    # previously missing symbols with the same base and quote are now using this price
+    portfolio_value_holder.update_origin_crypto_currencies_values("BTC/USDT", decimal.Decimal("20000"))
+    assert portfolio_value_holder._get_last_price_data("BTC/USDT:USDT") == decimal.Decimal("20000")
+    assert portfolio_value_holder._get_last_price_data("BTC/USDT") == decimal.Decimal("20000")
@@ -13,6 +13,7 @@
 #
 #  You should have received a copy of the GNU Lesser General Public
 #  License along with this library.
+import os
 import pytest
 
 from tests import event_loop
@@ -33,17 +34,37 @@ def test_has_closing_trade_with_order_id(trade_manager_and_trader):
     trade_manager, trader = trade_manager_and_trader
     assert trade_manager.has_closing_trade_with_order_id(None) is False
     assert trade_manager.has_closing_trade_with_order_id("None") is False
-    trade = personal_data.Trade(trader)
-    trade.trade_id = "id"
-    trade.is_closing_order = False
-    trade.origin_order_id = "None"
-    trade_manager.trades["id"] = trade
+    trade_manager.upsert_trade_instance(_create_trade(trader, "id", "None", False))
     # trade is not closing order not has the right origin_order_id
     assert trade_manager.has_closing_trade_with_order_id("id") is False
+    assert trade_manager.has_closing_trade_with_order_id("None") is False
+    trade_manager.upsert_trade_instance(_create_trade(trader, "id2", "None", True))
     # trade does not has the right origin_order_id
-    trade.is_closing_order = True
     assert trade_manager.has_closing_trade_with_order_id("id2") is False
     assert trade_manager.has_closing_trade_with_order_id("id") is False
-    trade.origin_order_id = "id"
+    assert trade_manager.has_closing_trade_with_order_id("None") is True
+    trade_manager.upsert_trade_instance(_create_trade(trader, "id3", "id", True))
     # trade is closing this order
     assert trade_manager.has_closing_trade_with_order_id("id") is True
+
+
+def test_remove_oldest_trades(trade_manager_and_trader):
+    trade_manager, trader = trade_manager_and_trader
+    trade_manager.upsert_trade_instance(_create_trade(trader, "id", "order_1", True))
+    trade_manager.upsert_trade_instance(_create_trade(trader, "id2", "order_2", True))
+    assert trade_manager.has_closing_trade_with_order_id("order_1") is True
+    if not os.getenv('CYTHON_IGNORE'):
+        trade_manager._remove_oldest_trades(1)
+        assert list(trade_manager.trades) == ["id2"]
+        assert trade_manager.has_closing_trade_with_order_id("order_1") is False
+        assert trade_manager.has_closing_trade_with_order_id("order_2") is True
+    trade_manager.clear()
+    assert trade_manager.has_closing_trade_with_order_id("order_2") is False
+
+
+def _create_trade(trader, trade_id, origin_order_id, is_closing_order):
+    trade = personal_data.Trade(trader)
+    trade.trade_id = trade_id
+    trade.origin_order_id = origin_order_id
+    trade.is_closing_order = is_closing_order
+    return trade
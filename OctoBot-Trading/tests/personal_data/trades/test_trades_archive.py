@@ -0,0 +1,126 @@
+#  Drakkar-Software OctoBot-Trading
+#  Copyright (c) Drakkar-Software, All rights reserved.
+#
+#  This library is free software; you can redistribute it and/or
+#  modify it under the terms of the GNU Lesser General Public
+#  License as published by the Free Software Foundation; either
+#  version 3.0 of the License, or (at your option) any later version.
+#
+#  This library is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the GNU
+#  Lesser General Public License for more details.
+#
+#  You should have received a copy of the GNU Lesser General Public
+#  License along with this library.
+import decimal
+
+import mock
+import pytest
+
+from tests import event_loop
+import octobot_trading.api as api
+import octobot_trading.personal_data as personal_data
+import octobot_trading.enums as enums
+
+pytestmark = pytest.mark.asyncio
+
+
+@pytest.fixture
+def trader():
+    exchange_manager = mock.Mock(exchange=mock.Mock(get_exchange_current_time=mock.Mock(return_value=1)),
+                                 is_future=False)
+    return mock.Mock(exchange_manager=exchange_manager, parse_order_id=mock.Mock(return_value=None), simulate=True)
+
+
+def _trade(trader, trade_id, side=enums.TradeOrderSide.SELL, status=enums.OrderStatus.FILLED,
+           exchange_trade_type=enums.TradeOrderType.LIMIT, fee_cost="0.1", fee_currency="USDT", reduce_only=False):
+    trade = personal_data.Trade(trader)
+    trade.trade_id = trade.origin_order_id = trade_id
+    trade.symbol = "BTC/USDT"
+    trade.side = side
+    trade.status = status
+    trade.exchange_trade_type = exchange_trade_type
+    trade.executed_price = decimal.Decimal("20000")
+    trade.executed_quantity = decimal.Decimal("0.5")
+    trade.total_cost = decimal.Decimal("10000")
+    trade.executed_time = 10
+    trade.reduce_only = reduce_only
+    trade.is_closing_order = status is not enums.OrderStatus.OPEN
+    trade.fee = None if fee_cost is None else {
+        enums.FeePropertyColumns.COST.value: decimal.Decimal(fee_cost),
+        enums.FeePropertyColumns.CURRENCY.value: fee_currency,
+    }
+    return trade
+
+
+def test_add_trade(trader):
+    archive = personal_data.TradesArchive()
+    for index in range(archive.INITIAL_SIZE + 1):
+        archive.add_trade(_trade(trader, str(index)))
+    assert archive.trades_count == archive.INITIAL_SIZE + 1
+    trades = archive.get_trades()
+    assert len(trades) == archive.INITIAL_SIZE + 1
+    assert trades[-1]["trade_id"] == str(archive.INITIAL_SIZE)
+    assert archive.get_value(trades[0]["symbol"]) == "BTC/USDT"
+    assert archive.get_value(trades[0]["side"]) is enums.TradeOrderSide.SELL
+    assert trades[0]["executed_price"] == 20000
+    assert trades[0]["quantity"] == 0.5
+    assert trades[0]["time"] == 10
+    assert archive.paid_fees == {"USDT": decimal.Decimal("0.1") * (archive.INITIAL_SIZE + 1)}
+    assert archive.has_closing_trade_with_order_id("1")
+    assert not archive.has_closing_trade_with_order_id("-1")
+    archive.clear()
+    assert archive.trades_count == 0
+    assert archive.paid_fees == {}
+    assert not archive.has_closing_trade_with_order_id("1")
+
+
+def test_count_trades(trader):
+    archive = personal_data.TradesArchive()
+    archive.add_trade(_trade(trader, "1"))
+    archive.add_trade(_trade(trader, "2", exchange_trade_type=enums.TradeOrderType.STOP_LOSS))
+    archive.add_trade(_trade(trader, "3", side=enums.TradeOrderSide.BUY, reduce_only=True))
+    archive.add_trade(_trade(trader, "4", status=enums.OrderStatus.CANCELED, fee_cost=None))
+    assert archive.count_trades() == 4
+    assert archive.count_trades(status=enums.OrderStatus.FILLED) == 3
+    assert archive.count_trades(status=enums.OrderStatus.OPEN) == 0
+    assert archive.count_trades(side=enums.TradeOrderSide.SELL) == 3
+    assert archive.count_trades(reduce_only=True) == 1
+    assert archive.count_trades(status=enums.OrderStatus.FILLED, side=enums.TradeOrderSide.SELL,
+                                exchange_trade_types=[enums.TradeOrderType.STOP_LOSS]) == 1
+    assert archive.count_trades(status=enums.OrderStatus.FILLED, side=enums.TradeOrderSide.SELL,
+                                exchange_trade_types=[enums.TradeOrderType.STOP_LOSS],
+                                exclude_exchange_trade_types=True) == 1
+    assert archive.count_trades(exchange_trade_types=[enums.TradeOrderType.TAKE_PROFIT]) == 0
+    assert archive.paid_fees == {"USDT": decimal.Decimal("0.3")}
+
+
+def test_trades_manager_archive(trader):
+    trades_manager = personal_data.TradesManager(trader)
+    trader.exchange_manager.exchange_personal_data.trades_manager = trades_manager
+    trades_manager.upsert_trade_instance(_trade(trader, "1", exchange_trade_type=enums.TradeOrderType.STOP_LOSS))
+    trades_manager.upsert_trade_instance(_trade(trader, "2", fee_currency="BTC"))
+    for index in range(3, trades_manager.MAX_LIVE_TRADES_COUNT + 3):
+        trades_manager.upsert_trade_instance(_trade(trader, str(index), side=enums.TradeOrderSide.BUY))
+    trades_manager.upsert_trade_instance(_trade(trader, "last"))
+    total_fees = api.get_total_paid_trading_fees(trader.exchange_manager)
+    win_rate = api.get_win_rate(trader.exchange_manager)
+    api.enable_trades_archive(trader.exchange_manager)
+    assert len(trades_manager.trades) == trades_manager.MAX_LIVE_TRADES_COUNT
+    assert "1" not in trades_manager.trades and "2" not in trades_manager.trades and "3" not in trades_manager.trades
+    assert trades_manager.trades_archive.trades_count == 3
+    assert trades_manager.has_closing_trade_with_order_id("1")
+    assert trades_manager.has_closing_trade_with_order_id("last")
+    # archived trades are still considered
+    assert api.get_total_paid_trading_fees(trader.exchange_manager) == total_fees == {
+        "USDT": decimal.Decimal("0.1") * (trades_manager.MAX_LIVE_TRADES_COUNT + 2), "BTC": decimal.Decimal("0.1")
+    }
+    assert api.get_win_rate(trader.exchange_manager) == win_rate == decimal.Decimal(2) / 3
+    # new trades are archived when exceeding MAX_LIVE_TRADES_COUNT
+    trades_manager.upsert_trade_instance(_trade(trader, "new"))
+    assert len(trades_manager.trades) == trades_manager.MAX_LIVE_TRADES_COUNT
+    assert trades_manager.trades_archive.trades_count == 4
+    trades_manager.clear()
+    assert trades_manager.trades_archive.trades_count == 0
+    assert not trades_manager.has_closing_trade_with_order_id("1")
@@ -0,0 +1,32 @@
+#  Drakkar-Software OctoBot-Trading
+#  Copyright (c) Drakkar-Software, All rights reserved.
+#
+#  This library is free software; you can redistribute it and/or
+#  modify it under the terms of the GNU Lesser General Public
+#  License as published by the Free Software Foundation; either
+#  version 3.0 of the License, or (at your option) any later version.
+#
+#  This library is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the GNU
+#  Lesser General Public License for more details.
+#
+#  You should have received a copy of the GNU Lesser General Public
+#  License along with this library.
+import octobot_trading.enums as enums
+import octobot_trading.personal_data as personal_data
+
+from tests.exchanges import DEFAULT_BACKTESTING_SYMBOL
+
+
+def create_grid_limit_order(trader_inst, is_buy, price, quantity, current_price):
+    order_class = personal_data.BuyLimitOrder if is_buy else personal_data.SellLimitOrder
+    order = order_class(trader_inst)
+    order.update(
+        order_type=enums.TraderOrderType.BUY_LIMIT if is_buy else enums.TraderOrderType.SELL_LIMIT,
+        symbol=DEFAULT_BACKTESTING_SYMBOL,
+        current_price=current_price,
+        quantity=quantity,
+        price=price,
+    )
+    return order
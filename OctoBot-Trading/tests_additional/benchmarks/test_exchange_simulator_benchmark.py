@@ -0,0 +1,85 @@
+#  Drakkar-Software OctoBot-Trading
+#  Copyright (c) Drakkar-Software, All rights reserved.
+#
+#  This library is free software; you can redistribute it and/or
+#  modify it under the terms of the GNU Lesser General Public
+#  License as published by the Free Software Foundation; either
+#  version 3.0 of the License, or (at your option) any later version.
+#
+#  This library is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the GNU
+#  Lesser General Public License for more details.
+#
+#  You should have received a copy of the GNU Lesser General Public
+#  License along with this library.
+import decimal
+import time
+
+import mock
+import pytest
+
+import octobot_commons.constants as commons_constants
+import octobot_trading.enums as enums
+
+# Import required fixtures
+from tests import event_loop
+from tests.exchanges import backtesting_trader, backtesting_config, backtesting_exchange_manager, fake_backtesting
+from tests_additional.benchmarks.grid_util import create_grid_limit_order
+
+# All test coroutines will be treated as marked.
+pytestmark = pytest.mark.asyncio
+
+GRID_LEVELS = 20
+GRID_PRICE = decimal.Decimal("20000")
+GRID_STEP = decimal.Decimal("10")
+GRID_QUANTITY = decimal.Decimal("0.0001")
+FILLS_COUNT = 2000
+
+
+async def _fill_grid_orders(trader_inst, get_trade_fee):
+    fees = []
+    elapsed = 0
+
+    def _timed_get_trade_fee(*args, **kwargs):
+        # only measure fees computations: the rest of a fill is the same in both runs
+        nonlocal elapsed
+        t0 = time.perf_counter()
+        fee = get_trade_fee(*args, **kwargs)
+        elapsed += time.perf_counter() - t0
+        return fee
+
+    exchange = trader_inst.exchange_manager.exchange.connector
+    with mock.patch.object(exchange, "get_trade_fee", mock.Mock(side_effect=_timed_get_trade_fee)):
+        for index in range(FILLS_COUNT):
+            # price goes up and down through the grid: buy orders are filled then sell orders
+            is_buy = (index // GRID_LEVELS) % 2 == 0
+            order = create_grid_limit_order(trader_inst, is_buy, GRID_PRICE + GRID_STEP * (index % GRID_LEVELS),
+                                            GRID_QUANTITY, GRID_PRICE)
+            await order.initialize()
+            await order.on_fill(force_fill=True)
+            fees.append(order.fee)
+    return elapsed, fees
+
+
+async def test_grid_orders_fills_per_second(backtesting_trader):
+    config, exchange_manager, trader_inst = backtesting_trader
+    config[commons_constants.CONFIG_SIMULATOR][commons_constants.CONFIG_SIMULATOR_FEES] = {
+        commons_constants.CONFIG_SIMULATOR_FEES_MAKER: 0.05,
+        commons_constants.CONFIG_SIMULATOR_FEES_TAKER: 0.1
+    }
+    exchange = exchange_manager.exchange.connector
+    exchange.load_symbols_tables()
+    origin_get_trade_fee = exchange.get_trade_fee
+
+    def _reloading_get_trade_fee(*args, **kwargs):
+        # recompute fees and market status at each fill
+        exchange.load_symbols_tables()
+        exchange.trade_fee_details_by_symbol.clear()
+        return origin_get_trade_fee(*args, **kwargs)
+
+    reloading_elapsed, reloading_fees = await _fill_grid_orders(trader_inst, _reloading_get_trade_fee)
+    cached_elapsed, cached_fees = await _fill_grid_orders(trader_inst, origin_get_trade_fee)
+    assert cached_fees == reloading_fees
+    assert all(fee[enums.FeePropertyColumns.COST.value] > 0 for fee in cached_fees)
+    assert cached_elapsed < reloading_elapsed
@@ -0,0 +1,75 @@
+#  Drakkar-Software OctoBot-Trading
+#  Copyright (c) Drakkar-Software, All rights reserved.
+#
+#  This library is free software; you can redistribute it and/or
+#  modify it under the terms of the GNU Lesser General Public
+#  License as published by the Free Software Foundation; either
+#  version 3.0 of the License, or (at your option) any later version.
+#
+#  This library is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the GNU
+#  Lesser General Public License for more details.
+#
+#  You should have received a copy of the GNU Lesser General Public
+#  License along with this library.
+import random
+import time
+
+import pytest
+
+from octobot_trading.exchange_data.order_book.order_book_manager import OrderBookManager
+from octobot_trading.exchange_data.order_book.l2_order_book_manager import L2OrderBookManager
+
+pytestmark = pytest.mark.asyncio
+
+LEVELS = 1000
+UPDATES = 5000
+CHANGED_LEVELS_BY_UPDATE = 10
+DEPTH = 20
+TICK_SIZE = 0.5
+
+
+def _record_book_deltas(seed=1):
+    """
+    :return: a (asks, bids) snapshot and UPDATES (asks, bids) deltas of a book following a random walk mid price
+    """
+    rand = random.Random(seed)
+    mid_price = 20000
+    asks = [(mid_price + TICK_SIZE * index, rand.randint(1, 100) / 10) for index in range(1, LEVELS + 1)]
+    bids = [(mid_price - TICK_SIZE * index, rand.randint(1, 100) / 10) for index in range(1, LEVELS + 1)]
+    deltas = []
+    for _ in range(UPDATES):
+        mid_price += TICK_SIZE * rand.randint(-2, 2)
+        ask_deltas = [
+            (mid_price + TICK_SIZE * rand.randint(1, LEVELS), rand.choice((0, rand.randint(1, 100) / 10)))
+            for _ in range(CHANGED_LEVELS_BY_UPDATE)
+        ]
+        bid_deltas = [
+            (mid_price - TICK_SIZE * rand.randint(1, LEVELS), rand.choice((0, rand.randint(1, 100) / 10)))
+            for _ in range(CHANGED_LEVELS_BY_UPDATE)
+        ]
+        deltas.append((ask_deltas, bid_deltas))
+    return (asks, bids), deltas
+
+
+def _replay(order_book_manager, snapshot, deltas):
+    depths = []
+    t0 = time.perf_counter()
+    order_book_manager.handle_price_levels_snapshot(*snapshot)
+    for asks, bids in deltas:
+        order_book_manager.handle_price_levels_deltas(asks, bids)
+        # read best prices and depth after each update like depth consuming trading modes
+        order_book_manager.get_ask()
+        order_book_manager.get_bid()
+        depths.append((order_book_manager.get_asks_depth(DEPTH), order_book_manager.get_bids_depth(DEPTH)))
+    return time.perf_counter() - t0, depths
+
+
+async def test_l2_order_book_manager_updates_per_second():
+    snapshot, deltas = _record_book_deltas()
+    sorted_dict_elapsed, sorted_dict_depths = _replay(OrderBookManager(), snapshot, deltas)
+    l2_elapsed, l2_depths = _replay(L2OrderBookManager(), snapshot, deltas)
+    # same order book content
+    assert l2_depths == sorted_dict_depths
+    assert l2_elapsed < sorted_dict_elapsed
@@ -0,0 +1,89 @@
+#  Drakkar-Software OctoBot-Trading
+#  Copyright (c) Drakkar-Software, All rights reserved.
+#
+#  This library is free software; you can redistribute it and/or
+#  modify it under the terms of the GNU Lesser General Public
+#  License as published by the Free Software Foundation; either
+#  version 3.0 of the License, or (at your option) any later version.
+#
+#  This library is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the GNU
+#  Lesser General Public License for more details.
+#
+#  You should have received a copy of the GNU Lesser General Public
+#  License along with this library.
+import asyncio
+import decimal
+import time
+
+import mock
+import pytest
+
+import octobot_commons.asyncio_tools as asyncio_tools
+import octobot_trading.enums as enums
+import octobot_trading.personal_data.orders.order_util as order_util
+
+# Import required fixtures
+from tests import event_loop
+from tests.exchanges import backtesting_trader, backtesting_config, backtesting_exchange_manager, fake_backtesting, \
+    DEFAULT_BACKTESTING_SYMBOL
+from tests_additional.benchmarks.grid_util import create_grid_limit_order
+
+# All test coroutines will be treated as marked.
+pytestmark = pytest.mark.asyncio
+
+GRID_LEVELS = 500
+GRID_PRICE = decimal.Decimal("1000")
+GRID_STEP = decimal.Decimal("1")
+GRID_QUANTITY = decimal.Decimal("0.001")
+
+
+async def _create_grid_orders(trader_inst):
+    orders = []
+    for index in range(GRID_LEVELS):
+        is_buy = index % 2 == 0
+        price_delta = GRID_STEP * (index // 2 + 1)
+        order = create_grid_limit_order(trader_inst, is_buy,
+                                        GRID_PRICE - price_delta if is_buy else GRID_PRICE + price_delta,
+                                        GRID_QUANTITY, GRID_PRICE)
+        orders.append(await trader_inst.create_order(order))
+    return orders
+
+
+async def _fill_grid_orders(trader_inst, exchange_manager):
+    symbol_data = exchange_manager.exchange_symbols_data.get_exchange_symbol_data(DEFAULT_BACKTESTING_SYMBOL)
+    orders = await _create_grid_orders(trader_inst)
+    pending_tasks_count = len(asyncio.all_tasks())
+    timestamp = exchange_manager.exchange.get_exchange_current_time()
+    # price goes down through buy orders then up through sell orders
+    prices = list(range(int(GRID_PRICE), int(GRID_PRICE) - GRID_LEVELS, -1)) + \
+        list(range(int(GRID_PRICE), int(GRID_PRICE) + GRID_LEVELS))
+    t0 = time.perf_counter()
+    for price in prices:
+        symbol_data.handle_recent_trade_update([{
+            enums.ExchangeConstantsOrderColumns.PRICE.value: float(price),
+            enums.ExchangeConstantsOrderColumns.TIMESTAMP.value: timestamp,
+            enums.ExchangeConstantsOrderColumns.ID.value: str(price),
+        }])
+        await asyncio_tools.wait_asyncio_next_cycle()
+    elapsed = time.perf_counter() - t0
+    assert all(order.is_filled() for order in orders)
+    return elapsed, pending_tasks_count, [(order.origin_price, order.filled_price, order.fee) for order in orders]
+
+
+async def test_grid_orders_fills_per_second(backtesting_trader):
+    config, exchange_manager, trader_inst = backtesting_trader
+    usdt_portfolio = exchange_manager.exchange_personal_data.portfolio_manager.portfolio.get_currency_portfolio("USDT")
+    initial_usdt = usdt_portfolio.total
+    with mock.patch.object(order_util, "is_using_orders_matching_engine", mock.Mock(return_value=False)):
+        tasks_elapsed, tasks_pending_tasks_count, tasks_fills = await _fill_grid_orders(trader_inst, exchange_manager)
+    tasks_usdt_profits = usdt_portfolio.total - initial_usdt
+    engine_elapsed, engine_pending_tasks_count, engine_fills = await _fill_grid_orders(trader_inst, exchange_manager)
+    engine_usdt_profits = usdt_portfolio.total - initial_usdt - tasks_usdt_profits
+    # same fills and portfolio updates
+    assert engine_fills == tasks_fills
+    assert engine_usdt_profits == tasks_usdt_profits > 0
+    # no task by open order with the orders matching engine
+    assert tasks_pending_tasks_count - engine_pending_tasks_count == GRID_LEVELS
+    assert engine_elapsed < tasks_elapsed
@@ -0,0 +1,77 @@
+#  Drakkar-Software OctoBot-Trading
+#  Copyright (c) Drakkar-Software, All rights reserved.
+#
+#  This library is free software; you can redistribute it and/or
+#  modify it under the terms of the GNU Lesser General Public
+#  License as published by the Free Software Foundation; either
+#  version 3.0 of the License, or (at your option) any later version.
+#
+#  This library is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the GNU
+#  Lesser General Public License for more details.
+#
+#  You should have received a copy of the GNU Lesser General Public
+#  License along with this library.
+import decimal
+import os
+import random
+import time
+
+import pytest
+
+from tests.exchanges import backtesting_trader, backtesting_config, backtesting_exchange_manager, fake_backtesting
+from tests import event_loop
+
+# All test coroutines will be treated as marked.
+pytestmark = pytest.mark.asyncio
+
+REFERENCE_MARKET = "USDT"
+ASSETS_COUNT = 60
+TICKS_COUNT = 3000
+
+
+def _tick(portfolio_manager, symbol, price, full_revaluation):
+    if full_revaluation:
+        # forget previous valuations to evaluate every currency
+        portfolio_manager.portfolio_value_holder._current_holdings_reference_market = None
+        portfolio_manager.portfolio_value_holder._origin_holdings_portfolio = None
+    portfolio_manager.handle_mark_price_update(symbol, price)
+    return portfolio_manager.portfolio_value_holder.portfolio_current_value
+
+
+def _run_ticks(portfolio_manager, initial_prices, ticks, full_revaluation):
+    for symbol, price in initial_prices:
+        portfolio_manager.handle_mark_price_update(symbol, price)
+    t0 = time.perf_counter()
+    values = [_tick(portfolio_manager, symbol, price, full_revaluation) for symbol, price in ticks]
+    return time.perf_counter() - t0, values
+
+
+async def test_mark_price_updates_per_second(backtesting_trader):
+    if os.getenv('CYTHON_IGNORE'):
+        return
+    config, exchange_manager, trader = backtesting_trader
+    portfolio_manager = exchange_manager.exchange_personal_data.portfolio_manager
+    portfolio_manager.reference_market = REFERENCE_MARKET
+    currencies = [f"COIN{index}" for index in range(ASSETS_COUNT)]
+    exchange_manager.client_symbols.extend(f"{currency}/{REFERENCE_MARKET}" for currency in currencies)
+    portfolio_manager.portfolio.update_portfolio_from_balance({
+        currency: {'available': decimal.Decimal("10"), 'total': decimal.Decimal("10")}
+        for currency in currencies + [REFERENCE_MARKET]
+    }, True)
+    initial_prices = [
+        (f"{currency}/{REFERENCE_MARKET}", decimal.Decimal(index + 1))
+        for index, currency in enumerate(currencies)
+    ]
+    randomizer = random.Random(1)
+    ticks = [
+        (f"{randomizer.choice(currencies)}/{REFERENCE_MARKET}", decimal.Decimal(randomizer.randint(1, 1000)))
+        for _ in range(TICKS_COUNT)
+    ]
+
+    full_elapsed, full_values = _run_ticks(portfolio_manager, initial_prices, ticks, True)
+    incremental_elapsed, incremental_values = _run_ticks(portfolio_manager, initial_prices, ticks, False)
+    # same portfolio values after each tick
+    assert incremental_values == full_values
+    assert incremental_elapsed < full_elapsed
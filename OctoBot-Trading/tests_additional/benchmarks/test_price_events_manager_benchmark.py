@@ -0,0 +1,123 @@
+#  Drakkar-Software OctoBot-Trading
+#  Copyright (c) Drakkar-Software, All rights reserved.
+#
+#  This library is free software; you can redistribute it and/or
+#  modify it under the terms of the GNU Lesser General Public
+#  License as published by the Free Software Foundation; either
+#  version 3.0 of the License, or (at your option) any later version.
+#
+#  This library is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the GNU
+#  Lesser General Public License for more details.
+#
+#  You should have received a copy of the GNU Lesser General Public
+#  License along with this library.
+import decimal
+import random
+import time
+import pytest
+
+from octobot_trading.exchange_data.prices.price_events_manager import PriceEventsManager
+# required to catch async loop context exceptions
+from tests import event_loop
+
+# All test coroutines will be treated as marked.
+pytestmark = pytest.mark.asyncio
+
+OPEN_ORDERS_COUNT = 10000
+TICKS_COUNT = 1000000
+# the linear scan reference is way too slow to run TICKS_COUNT ticks
+LINEAR_SCAN_TICKS_COUNT = 2000
+MID_PRICE = 10000
+GRID_STEP = decimal.Decimal("0.5")
+
+
+class LinearScanPriceEventsManager(PriceEventsManager):
+    """
+    Reference implementation: check every registered event on each price
+    """
+    def __init__(self):
+        super().__init__()
+        self.linear_events = []
+
+    def reset(self):
+        super().reset()
+        self.linear_events.clear()
+
+    def _add_event(self, price_event_tuple):
+        self.linear_events.append(price_event_tuple)
+
+    def _remove_event(self, event_to_remove):
+        for price_event_data in self.linear_events:
+            if event_to_remove in price_event_data:
+                return self.linear_events.remove(price_event_data)
+
+    def _check_events(self, price, timestamp):
+        return [
+            event
+            for event_price, event_timestamp, event, trigger_above in self.linear_events
+            if event_timestamp <= timestamp and
+            (
+                (trigger_above and event_price <= price) or
+                (not trigger_above and event_price >= price)
+            )
+        ]
+
+
+def _create_grid(price_events_manager):
+    trigger_above_by_event = {}
+    half_count = OPEN_ORDERS_COUNT // 2
+    for index in range(1, half_count + 1):
+        _new_grid_event(price_events_manager, trigger_above_by_event, MID_PRICE + index * GRID_STEP, 0, True)
+        _new_grid_event(price_events_manager, trigger_above_by_event, MID_PRICE - index * GRID_STEP, 0, False)
+    return trigger_above_by_event
+
+
+def _new_grid_event(price_events_manager, trigger_above_by_event, price, timestamp, trigger_above):
+    event = price_events_manager.new_event(price, timestamp, trigger_above, allow_instant_fill=False)
+    trigger_above_by_event[event] = trigger_above
+
+
+def _generate_ticks(ticks_count):
+    # random walk around the middle of the grid
+    rand = random.Random(42)
+    price = decimal.Decimal(MID_PRICE)
+    ticks = []
+    for timestamp in range(1, ticks_count + 1):
+        price += GRID_STEP * rand.randint(-2, 2)
+        ticks.append((price, timestamp))
+    return ticks
+
+
+def _run(price_events_manager, ticks):
+    trigger_above_by_event = _create_grid(price_events_manager)
+    triggered_count = 0
+    t0 = time.perf_counter()
+    for price, timestamp in ticks:
+        for event in price_events_manager._check_events(price, timestamp):
+            price_events_manager._remove_and_set_event(event)
+            triggered_count += 1
+            # refill the grid on the other side like a grid trading mode would
+            trigger_above = not trigger_above_by_event.pop(event)
+            refill_price = price + GRID_STEP if trigger_above else price - GRID_STEP
+            _new_grid_event(price_events_manager, trigger_above_by_event, refill_price, timestamp, trigger_above)
+    return time.perf_counter() - t0, triggered_count
+
+
+async def test_price_events_manager_ticks_per_second():
+    ticks = _generate_ticks(TICKS_COUNT)
+
+    linear_elapsed, linear_triggered = _run(LinearScanPriceEventsManager(), ticks[:LINEAR_SCAN_TICKS_COUNT])
+    sorted_elapsed, sorted_triggered = _run(PriceEventsManager(), ticks[:LINEAR_SCAN_TICKS_COUNT])
+    assert linear_triggered == sorted_triggered
+
+    full_elapsed, full_triggered = _run(PriceEventsManager(), ticks)
+    linear_ticks_per_second = LINEAR_SCAN_TICKS_COUNT / linear_elapsed
+    sorted_ticks_per_second = TICKS_COUNT / full_elapsed
+    print(f"\n{OPEN_ORDERS_COUNT} open orders: "
+          f"linear scan: {linear_ticks_per_second:.0f} ticks/s, "
+          f"sorted books: {sorted_ticks_per_second:.0f} ticks/s "
+          f"({TICKS_COUNT} ticks, {full_triggered} triggered events in {full_elapsed:.2f}s), "
+          f"speedup: x{sorted_ticks_per_second / linear_ticks_per_second:.1f}")
+    assert sorted_elapsed < linear_elapsed
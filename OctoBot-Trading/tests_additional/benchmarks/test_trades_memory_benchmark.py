@@ -0,0 +1,113 @@
+#  Drakkar-Software OctoBot-Trading
+#  Copyright (c) Drakkar-Software, All rights reserved.
+#
+#  This library is free software; you can redistribute it and/or
+#  modify it under the terms of the GNU Lesser General Public
+#  License as published by the Free Software Foundation; either
+#  version 3.0 of the License, or (at your option) any later version.
+#
+#  This library is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the GNU
+#  Lesser General Public License for more details.
+#
+#  You should have received a copy of the GNU Lesser General Public
+#  License along with this library.
+import decimal
+import gc
+import tracemalloc
+import uuid
+
+import pytest
+
+# required to catch async loop context exceptions
+from tests import event_loop
+import octobot_trading.api
+import octobot_trading.personal_data as personal_data
+import octobot_trading.enums as enums
+
+# All test coroutines will be treated as marked.
+pytestmark = pytest.mark.asyncio
+
+TRADES_COUNT = 100000
+MIN_MEMORY_REDUCTION_RATIO = 5
+
+
+class _Exchange:
+    def get_exchange_current_time(self):
+        return 1
+
+
+class _ExchangeManager:
+    def __init__(self):
+        self.exchange = _Exchange()
+
+
+class _Trader:
+    # mocks would keep track of every call and use more memory than trades themselves
+    def __init__(self):
+        self.exchange_manager = _ExchangeManager()
+        self.simulate = True
+
+    def parse_order_id(self, order_id):
+        return order_id
+
+
+def _trade(trader, index):
+    # values are created like in Trade.update_from_order: each trade has its own decimals, ids and fees
+    trade = personal_data.Trade(trader)
+    trade.trade_id = trade.origin_order_id = str(uuid.uuid4())
+    trade.symbol = "BTC/USDT"
+    trade.currency = "BTC"
+    trade.market = "USDT"
+    trade.taker_or_maker = enums.ExchangeConstantsMarketPropertyColumns.TAKER.value
+    trade.status = enums.OrderStatus.FILLED
+    trade.side = enums.TradeOrderSide.SELL if index % 2 else enums.TradeOrderSide.BUY
+    trade.trade_type = enums.TraderOrderType.SELL_LIMIT if index % 2 else enums.TraderOrderType.BUY_LIMIT
+    trade.exchange_trade_type = enums.TradeOrderType.LIMIT
+    trade.origin_price = decimal.Decimal(20000 + index) / decimal.Decimal(100)
+    trade.executed_price = decimal.Decimal(20000 + index) / decimal.Decimal(100)
+    trade.origin_quantity = decimal.Decimal(index + 1) / decimal.Decimal(1000)
+    trade.executed_quantity = decimal.Decimal(index + 1) / decimal.Decimal(1000)
+    trade.total_cost = trade.executed_price * trade.executed_quantity
+    trade.quantity_currency = "BTC"
+    trade.creation_time = trade.executed_time = 1600000000 + index * 60
+    trade.is_closing_order = True
+    trade.fee = {
+        enums.FeePropertyColumns.COST.value: trade.total_cost / decimal.Decimal(1000),
+        enums.FeePropertyColumns.CURRENCY.value: "USDT",
+        enums.FeePropertyColumns.RATE.value: decimal.Decimal("0.001"),
+        enums.FeePropertyColumns.TYPE.value: enums.ExchangeConstantsMarketPropertyColumns.TAKER.value,
+    }
+    return trade
+
+
+def _measure_trades_manager_memory(trader, use_archive):
+    gc.collect()
+    tracemalloc.start()
+    trades_manager = personal_data.TradesManager(trader)
+    if use_archive:
+        trades_manager.enable_trades_archive()
+    for index in range(TRADES_COUNT):
+        trades_manager.upsert_trade_instance(_trade(trader, index))
+    gc.collect()
+    used_memory, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return used_memory, trades_manager
+
+
+async def test_trades_archive_memory_usage():
+    trader = _Trader()
+    trades_memory, trades_manager = _measure_trades_manager_memory(trader, False)
+    total_fees = trades_manager.get_total_paid_fees()
+    trades_manager.clear()
+    del trades_manager
+    archive_memory, archived_trades_manager = _measure_trades_manager_memory(trader, True)
+    assert archived_trades_manager.trades_archive.trades_count == \
+           TRADES_COUNT - archived_trades_manager.MAX_LIVE_TRADES_COUNT
+    assert archived_trades_manager.get_total_paid_fees() == total_fees
+    ratio = trades_memory / archive_memory
+    print(f"\n{TRADES_COUNT} trades: Trade instances: {trades_memory / 1024 ** 2:.1f} MB, "
+          f"with trades archive ({archived_trades_manager.MAX_LIVE_TRADES_COUNT} live trades): "
+          f"{archive_memory / 1024 ** 2:.1f} MB, reduction: x{ratio:.1f}")
+    assert ratio >= MIN_MEMORY_REDUCTION_RATIO
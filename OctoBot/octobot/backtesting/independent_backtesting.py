@@ -169,6 +169,7 @@ class IndependentBacktesting:
     async def _post_backtesting_end_callback(self):
         # re enable logs
         commons_logging.set_error_publication_enabled(True)
+        commons_logging.flush_log_notifications()
         if self.stop_when_finished:
             await self.stop()
         else:
@@ -197,18 +198,27 @@ class IndependentBacktesting:
 
     async def _register_available_data(self):
         for data_file in self.backtesting_files:
-            data_file_path = data_file
-            if not path.isfile(data_file_path):
-                data_file_path = path.join(self.data_file_path, data_file)
-            description = await backtesting_data.get_file_description(data_file_path)
-            if description is None:
-                raise RuntimeError(f"Impossible to start backtesting: missing or invalid data file: {data_file}")
-            exchange_name = description[backtesting_enums.DataFormatKeys.EXCHANGE.value]
+            exchange_name, symbols = await self._get_data_file_exchange_and_symbols(data_file)
             if exchange_name not in self.symbols_to_create_exchange_classes:
                 self.symbols_to_create_exchange_classes[exchange_name] = []
-            for symbol in description[backtesting_enums.DataFormatKeys.SYMBOLS.value]:
+            for symbol in symbols:
                 self.symbols_to_create_exchange_classes[exchange_name].append(symbol_util.parse_symbol(symbol))
 
+    async def _get_data_file_exchange_and_symbols(self, data_file):
+        if self.backtesting_data is not None and self.backtesting_data.importers_by_data_file:
+            importer = self.backtesting_data.importers_by_data_file.get(data_file)
+            if importer is not None:
+                # already loaded data file: no need to read its description again
+                return importer.exchange_name, importer.symbols
+        data_file_path = data_file
+        if not path.isfile(data_file_path):
+            data_file_path = path.join(self.data_file_path, data_file)
+        description = await backtesting_data.get_file_description(data_file_path)
+        if description is None:
+            raise RuntimeError(f"Impossible to start backtesting: missing or invalid data file: {data_file}")
+        return description[backtesting_enums.DataFormatKeys.EXCHANGE.value], \
+            description[backtesting_enums.DataFormatKeys.SYMBOLS.value]
+
     def _init_default_config_values(self):
         self.risk = copy.deepcopy(self.octobot_origin_config[common_constants.CONFIG_TRADING][
                                       common_constants.CONFIG_TRADER_RISK])
@@ -191,6 +191,13 @@ OPTIMIZER_DEFAULT_MAX_MUTATION_PROBABILITY_PERCENT = decimal.Decimal(95)
 OPTIMIZER_DEFAULT_MIN_MUTATION_PROBABILITY_PERCENT = decimal.Decimal(10)
 OPTIMIZER_DEFAULT_MAX_MUTATION_NUMBER_MULTIPLIER = 3
 OPTIMIZER_DEFAULT_DB_UPDATE_PERIOD = 15
+OPTIMIZER_DEFAULT_SHARED_MEMORY_DATA = True
+# search strategies
+OPTIMIZER_DEFAULT_SEARCH_BATCH_RUNS_BY_PROCESS = 2
+OPTIMIZER_DEFAULT_HALVING_REDUCTION_FACTOR = 3
+OPTIMIZER_DEFAULT_HALVING_MAX_RUNGS = 3
+OPTIMIZER_DEFAULT_TPE_STARTUP_RUNS = 20
+OPTIMIZER_DEFAULT_TPE_GOOD_RUNS_RATIO = 0.25
 
 # Databases
 DEFAULT_MAX_TOTAL_RUN_DATABASES_SIZE = 1000000000   # 1GB
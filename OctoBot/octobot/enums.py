@@ -29,6 +29,8 @@ class CommunityEnvironments(enum.Enum):
 class OptimizerModes(enum.Enum):
     NORMAL = "normal"
     GENETIC = "genetic"
+    SUCCESSIVE_HALVING = "successive_halving"
+    TPE = "tpe"
 
 
 class OptimizerConfig(enum.Enum):
@@ -45,6 +47,7 @@ class OptimizerConfig(enum.Enum):
     IDLE_CORES = "idle_cores"
     NOTIFY_WHEN_COMPLETE = "notify_when_complete"
     DB_UPDATE_PERIOD = "db_update_period"
+    SHARED_MEMORY_DATA = "shared_memory_data"
     MODE = "mode"
     MAX_OPTIMIZER_RUNS = "max_optimizer_runs"
     INITIAL_GENERATION_COUNT = "initial_generation_count"
@@ -60,3 +63,7 @@ class OptimizerConfig(enum.Enum):
     DEFAULT_CROSSOVER_PERCENT = "default_crossover_percent"
     STAY_WITHIN_BOUNDARIES = "stay_within_boundaries"
     TARGET_FITNESS_SCORE = "target_fitness_score"
+    HALVING_REDUCTION_FACTOR = "halving_reduction_factor"
+    HALVING_MAX_RUNGS = "halving_max_rungs"
+    TPE_STARTUP_RUNS = "tpe_startup_runs"
+    TPE_GOOD_RUNS_RATIO = "tpe_good_runs_ratio"
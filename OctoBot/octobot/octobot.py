@@ -189,6 +189,8 @@ class OctoBot:
             await os_clock_sync.stop_clock_synchronizer()
             await system_resources_watcher.stop_system_resources_watcher()
             service_api.stop_services()
+            # notify pending logs before stopping interfaces
+            logging.flush_log_notifications()
             await self.interface_producer.stop()
             await databases.close_bot_storage(self.bot_id)
 
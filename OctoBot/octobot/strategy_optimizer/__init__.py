@@ -18,6 +18,7 @@ from octobot.strategy_optimizer import test_suite_result
 from octobot.strategy_optimizer import strategy_optimizer
 from octobot.strategy_optimizer import strategy_design_optimizer
 from octobot.strategy_optimizer import strategy_test_suite
+from octobot.strategy_optimizer import search_strategies
 
 from octobot.strategy_optimizer.test_suite_result import (
     TestSuiteResult,
@@ -41,6 +42,11 @@ from octobot.strategy_optimizer.scored_run_result import (
 from octobot.strategy_optimizer.optimizer_constraint import (
     OptimizerConstraint,
 )
+from octobot.strategy_optimizer.search_strategies import (
+    AbstractSearchStrategy,
+    SuccessiveHalvingSearchStrategy,
+    TPESearchStrategy,
+)
 from octobot.strategy_optimizer.strategy_design_optimizer import (
     StrategyDesignOptimizer,
 )
@@ -60,6 +66,9 @@ __all__ = [
     "OptimizerSettings",
     "ScoredRunResult",
     "OptimizerConstraint",
+    "AbstractSearchStrategy",
+    "SuccessiveHalvingSearchStrategy",
+    "TPESearchStrategy",
     "StrategyDesignOptimizer",
     "StrategyTestSuite",
     "create_most_advanced_strategy_design_optimizer",
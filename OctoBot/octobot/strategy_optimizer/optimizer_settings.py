@@ -51,6 +51,9 @@ class OptimizerSettings:
         # update run database at the end of each period
         self.db_update_period = int(settings_dict.get(enums.OptimizerConfig.DB_UPDATE_PERIOD.value,
                                                       constants.OPTIMIZER_DEFAULT_DB_UPDATE_PERIOD))
+        # decode data files once and share their candles with every optimizer process
+        self.shared_memory_data = settings_dict.get(enums.OptimizerConfig.SHARED_MEMORY_DATA.value,
+                                                    constants.OPTIMIZER_DEFAULT_SHARED_MEMORY_DATA)
         # AI / genetic
         self.max_optimizer_runs = settings_dict.get(enums.OptimizerConfig.MAX_OPTIMIZER_RUNS.value,
                                                     constants.OPTIMIZER_DEFAULT_MAX_OPTIMIZER_RUNS)
@@ -87,6 +90,16 @@ class OptimizerSettings:
         self.target_fitness_score = settings_dict.get(enums.OptimizerConfig.TARGET_FITNESS_SCORE.value)
         self.stay_within_boundaries = settings_dict.get(enums.OptimizerConfig.STAY_WITHIN_BOUNDARIES.value,
                                                         False)
+        # search strategies
+        self.halving_reduction_factor = int(settings_dict.get(
+            enums.OptimizerConfig.HALVING_REDUCTION_FACTOR.value,
+            constants.OPTIMIZER_DEFAULT_HALVING_REDUCTION_FACTOR))
+        self.halving_max_rungs = int(settings_dict.get(enums.OptimizerConfig.HALVING_MAX_RUNGS.value,
+                                                       constants.OPTIMIZER_DEFAULT_HALVING_MAX_RUNGS))
+        self.tpe_startup_runs = int(settings_dict.get(enums.OptimizerConfig.TPE_STARTUP_RUNS.value,
+                                                      constants.OPTIMIZER_DEFAULT_TPE_STARTUP_RUNS))
+        self.tpe_good_runs_ratio = float(settings_dict.get(enums.OptimizerConfig.TPE_GOOD_RUNS_RATIO.value,
+                                                           constants.OPTIMIZER_DEFAULT_TPE_GOOD_RUNS_RATIO))
 
     def get_constraint(self, constraint_key):
         if constraint_key in self.constraints_by_key:
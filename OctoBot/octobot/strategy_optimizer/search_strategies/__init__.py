@@ -0,0 +1,34 @@
+#  Drakkar-Software OctoBot
+#  Copyright (c) Drakkar-Software, All rights reserved.
+#
+#  This library is free software; you can redistribute it and/or
+#  modify it under the terms of the GNU Lesser General Public
+#  License as published by the Free Software Foundation; either
+#  version 3.0 of the License, or (at your option) any later version.
+#
+#  This library is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the GNU
+#  Lesser General Public License for more details.
+#
+#  You should have received a copy of the GNU Lesser General Public
+#  License along with this library.
+
+from octobot.strategy_optimizer.search_strategies import abstract_search_strategy
+from octobot.strategy_optimizer.search_strategies.abstract_search_strategy import (
+    AbstractSearchStrategy,
+)
+from octobot.strategy_optimizer.search_strategies import successive_halving_search_strategy
+from octobot.strategy_optimizer.search_strategies.successive_halving_search_strategy import (
+    SuccessiveHalvingSearchStrategy,
+)
+from octobot.strategy_optimizer.search_strategies import tpe_search_strategy
+from octobot.strategy_optimizer.search_strategies.tpe_search_strategy import (
+    TPESearchStrategy,
+)
+
+__all__ = [
+    "AbstractSearchStrategy",
+    "SuccessiveHalvingSearchStrategy",
+    "TPESearchStrategy",
+]
@@ -0,0 +1,145 @@
+#  Drakkar-Software OctoBot
+#  Copyright (c) Drakkar-Software, All rights reserved.
+#
+#  This library is free software; you can redistribute it and/or
+#  modify it under the terms of the GNU Lesser General Public
+#  License as published by the Free Software Foundation; either
+#  version 3.0 of the License, or (at your option) any later version.
+#
+#  This library is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the GNU
+#  Lesser General Public License for more details.
+#
+#  You should have received a copy of the GNU Lesser General Public
+#  License along with this library.
+import abc
+import itertools
+import math
+import random
+
+
+class AbstractSearchStrategy(abc.ABC):
+    """
+    Selects optimizer runs batch by batch instead of enumerating every combination of the user inputs values.
+    A run is identified by a tuple containing the index of the selected value of each user input.
+    """
+    FULL_WINDOW_RATIO = 1
+    # max random picks for each requested run when sampling the search space
+    MAX_SAMPLING_ATTEMPTS_BY_RUN = 100
+
+    def __init__(self, iterations, is_run_allowed, max_runs, seed=None):
+        """
+        :param iterations: the possible run inputs of each user input
+        :param is_run_allowed: callable returning False when a run (a list of run inputs) is filtered out
+        :param max_runs: the runs budget of this strategy
+        :param seed: random seed, used to reproduce a search
+        """
+        self.iterations = iterations
+        self.is_run_allowed = is_run_allowed
+        self.max_runs = max_runs
+        self.random = random.Random(seed)
+        self.scores = {}
+
+    @abc.abstractmethod
+    def sample_initial_runs(self) -> list:
+        """
+        :return: the runs to schedule before the search has any result
+        """
+        raise NotImplementedError("sample_initial_runs is not implemented")
+
+    @abc.abstractmethod
+    def set_initial_runs(self, runs):
+        """
+        Starts the search from the given runs (usually the scheduled runs from sample_initial_runs)
+        """
+        raise NotImplementedError("set_initial_runs is not implemented")
+
+    @abc.abstractmethod
+    def get_next_runs(self) -> list:
+        """
+        :return: the runs to execute and score next, an empty list when the search is complete
+        """
+        raise NotImplementedError("get_next_runs is not implemented")
+
+    @abc.abstractmethod
+    def register_scores(self, scores_by_run: dict):
+        """
+        :param scores_by_run: the score of each run returned by get_next_runs, None for runs
+        that have been excluded by optimizer filters (or that failed)
+        """
+        raise NotImplementedError("register_scores is not implemented")
+
+    @abc.abstractmethod
+    def is_complete(self) -> bool:
+        raise NotImplementedError("is_complete is not implemented")
+
+    def get_window_ratio(self) -> float:
+        """
+        :return: the ratio of the optimizer time window to use for the runs returned by get_next_runs
+        """
+        return self.FULL_WINDOW_RATIO
+
+    def get_best_run(self):
+        """
+        :return: the best scored run, None if no run has a score
+        """
+        scored_runs = [(score, run) for run, score in self.scores.items() if score is not None]
+        if not scored_runs:
+            return None
+        return max(scored_runs, key=lambda element: element[0])[1]
+
+    def get_run(self, run) -> list:
+        """
+        :return: the run inputs of the given run
+        """
+        return [self.iterations[dimension][value_index] for dimension, value_index in enumerate(run)]
+
+    def get_space_size(self) -> int:
+        return math.prod(len(values) for values in self.iterations)
+
+    def is_allowed(self, run) -> bool:
+        return self.is_run_allowed(self.get_run(run))
+
+    def sample_runs(self, count, excluded_runs, sampler=None) -> list:
+        """
+        :param count: the number of runs to sample
+        :param excluded_runs: runs that can't be selected
+        :param sampler: callable returning a run, uniform sampling when unset
+        :return: up to count unique allowed runs that are not in excluded_runs
+        """
+        if sampler is None and self.get_space_size() <= count * self.MAX_SAMPLING_ATTEMPTS_BY_RUN:
+            # small search space: pick from every run to avoid missing the last remaining ones
+            return self._sample_from_all_runs(count, excluded_runs)
+        sampler = sampler or self.sample_uniform_run
+        runs = []
+        selected_runs = set(excluded_runs)
+        for _ in range(count * self.MAX_SAMPLING_ATTEMPTS_BY_RUN):
+            if len(runs) >= count:
+                break
+            run = sampler()
+            if run in selected_runs:
+                continue
+            selected_runs.add(run)
+            if self.is_allowed(run):
+                runs.append(run)
+        return runs
+
+    def sample_uniform_run(self) -> tuple:
+        return tuple(self.random.randrange(len(values)) for values in self.iterations)
+
+    def _sample_from_all_runs(self, count, excluded_runs) -> list:
+        excluded_runs = set(excluded_runs)
+        all_runs = [
+            run
+            for run in itertools.product(*(range(len(values)) for values in self.iterations))
+            if run not in excluded_runs
+        ]
+        self.random.shuffle(all_runs)
+        runs = []
+        for run in all_runs:
+            if len(runs) >= count:
+                break
+            if self.is_allowed(run):
+                runs.append(run)
+        return runs
@@ -0,0 +1,83 @@
+#  Drakkar-Software OctoBot
+#  Copyright (c) Drakkar-Software, All rights reserved.
+#
+#  This library is free software; you can redistribute it and/or
+#  modify it under the terms of the GNU Lesser General Public
+#  License as published by the Free Software Foundation; either
+#  version 3.0 of the License, or (at your option) any later version.
+#
+#  This library is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the GNU
+#  Lesser General Public License for more details.
+#
+#  You should have received a copy of the GNU Lesser General Public
+#  License along with this library.
+import math
+
+import octobot.strategy_optimizer.search_strategies.abstract_search_strategy as abstract_search_strategy
+
+
+class SuccessiveHalvingSearchStrategy(abstract_search_strategy.AbstractSearchStrategy):
+    """
+    Every initial run is first executed on a short time window. Only the best 1 / reduction_factor runs
+    are then executed again on a reduction_factor times larger window, until the full window is reached.
+    Filtered out runs are never promoted.
+    """
+
+    def __init__(self, iterations, is_run_allowed, max_runs, reduction_factor=3, max_rungs=3, seed=None):
+        """
+        :param max_runs: the number of initial runs
+        :param reduction_factor: the ratio of runs dropped and the window growth factor between two rungs
+        :param max_rungs: the maximum number of reduced windows before the full window
+        """
+        super().__init__(iterations, is_run_allowed, max_runs, seed=seed)
+        self.reduction_factor = reduction_factor
+        self.max_rungs = max_rungs
+        self.rungs_count = 0
+        self.rung = 0
+        self.rung_runs = []
+        self.complete = False
+
+    def sample_initial_runs(self) -> list:
+        return self.sample_runs(self.max_runs, ())
+
+    def set_initial_runs(self, runs):
+        self.rung_runs = list(dict.fromkeys(runs))
+        self.rungs_count = self._get_rungs_count(len(self.rung_runs))
+        self.rung = 0
+        self.scores = {}
+        self.complete = not self.rung_runs
+
+    def get_next_runs(self) -> list:
+        return [] if self.complete else list(self.rung_runs)
+
+    def get_window_ratio(self) -> float:
+        return self.reduction_factor ** (self.rung - self.rungs_count)
+
+    def register_scores(self, scores_by_run: dict):
+        rung_scores = {run: scores_by_run.get(run) for run in self.rung_runs}
+        if self.rung >= self.rungs_count:
+            # full window scores: search complete
+            self.scores = rung_scores
+            self.complete = True
+            return
+        scored_runs = sorted(
+            (run for run, score in rung_scores.items() if score is not None),
+            key=lambda run: rung_scores[run],
+            reverse=True
+        )
+        self.rung_runs = scored_runs[:math.ceil(len(self.rung_runs) / self.reduction_factor)]
+        self.rung += 1
+        # stop when every run has been filtered out
+        self.complete = not self.rung_runs
+
+    def is_complete(self) -> bool:
+        return self.complete
+
+    def _get_rungs_count(self, runs_count):
+        # keep at least reduction_factor runs in the last reduced window
+        rungs_count = 0
+        while rungs_count < self.max_rungs and self.reduction_factor ** (rungs_count + 1) <= runs_count:
+            rungs_count += 1
+        return rungs_count
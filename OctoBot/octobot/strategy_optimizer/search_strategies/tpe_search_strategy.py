@@ -0,0 +1,143 @@
+#  Drakkar-Software OctoBot
+#  Copyright (c) Drakkar-Software, All rights reserved.
+#
+#  This library is free software; you can redistribute it and/or
+#  modify it under the terms of the GNU Lesser General Public
+#  License as published by the Free Software Foundation; either
+#  version 3.0 of the License, or (at your option) any later version.
+#
+#  This library is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the GNU
+#  Lesser General Public License for more details.
+#
+#  You should have received a copy of the GNU Lesser General Public
+#  License along with this library.
+import collections
+import math
+
+import octobot.strategy_optimizer.search_strategies.abstract_search_strategy as abstract_search_strategy
+
+
+class TPESearchStrategy(abstract_search_strategy.AbstractSearchStrategy):
+    """
+    Tree-structured Parzen Estimator: after random startup runs, scored runs are split into good runs
+    (the best good_runs_ratio of them) and bad runs. Candidates are sampled from the good runs values
+    distribution and the ones that are the most likely to be good rather than bad are executed next.
+    Filtered out runs are bad runs.
+    """
+    CANDIDATES_COUNT = 24
+    # kernel width of ordered user inputs, as a ratio of their values count
+    ORDERED_BANDWIDTH_RATIO = 0.1
+
+    def __init__(self, iterations, is_run_allowed, max_runs, batch_size=1, startup_runs=20,
+                 good_runs_ratio=0.25, ordered_dimensions=None, seed=None):
+        """
+        :param max_runs: the total number of runs
+        :param batch_size: the number of runs to suggest at once
+        :param startup_runs: the number of random runs before using the estimator
+        :param good_runs_ratio: the ratio of best runs considered as good runs
+        :param ordered_dimensions: for each user input, True when its values are ordered (numbers)
+        """
+        super().__init__(iterations, is_run_allowed, max_runs, seed=seed)
+        self.batch_size = max(1, batch_size)
+        self.startup_runs = startup_runs
+        self.good_runs_ratio = good_runs_ratio
+        self.ordered_dimensions = ordered_dimensions or [False] * len(iterations)
+        self.pending_runs = []
+        self.exhausted = False
+
+    def sample_initial_runs(self) -> list:
+        return self.sample_runs(min(self.startup_runs, self.max_runs), ())
+
+    def set_initial_runs(self, runs):
+        self.pending_runs = list(dict.fromkeys(runs))[:self.max_runs]
+        self.scores = {}
+        self.exhausted = False
+
+    def get_next_runs(self) -> list:
+        if not self.pending_runs:
+            self.pending_runs = self._get_new_runs(min(self.batch_size, self.max_runs - len(self.scores)))
+            self.exhausted = not self.pending_runs
+        return list(self.pending_runs)
+
+    def register_scores(self, scores_by_run: dict):
+        for run in self.pending_runs:
+            self.scores[run] = None
+        self.scores.update(scores_by_run)
+        self.pending_runs = []
+
+    def is_complete(self) -> bool:
+        return self.exhausted or len(self.scores) >= self.max_runs
+
+    def _get_new_runs(self, count) -> list:
+        if count <= 0:
+            return []
+        if len(self.scores) < self.startup_runs:
+            return self.sample_runs(count, self.scores)
+        good_runs, bad_runs = self._split_runs()
+        if not good_runs:
+            return self.sample_runs(count, self.scores)
+        good_densities = [
+            self._get_density(dimension, [run[dimension] for run in good_runs])
+            for dimension in range(len(self.iterations))
+        ]
+        bad_densities = [
+            self._get_density(dimension, [run[dimension] for run in bad_runs])
+            for dimension in range(len(self.iterations))
+        ]
+        runs = []
+        excluded_runs = set(self.scores)
+        for _ in range(count):
+            candidates = self.sample_runs(
+                self.CANDIDATES_COUNT, excluded_runs, sampler=lambda: self._sample_run(good_densities)
+            ) or self.sample_runs(1, excluded_runs)
+            if not candidates:
+                break
+            run = max(candidates, key=lambda candidate: self._get_log_ratio(candidate, good_densities, bad_densities))
+            runs.append(run)
+            excluded_runs.add(run)
+        return runs
+
+    def _split_runs(self):
+        ordered_runs = sorted(
+            self.scores,
+            key=lambda run: (self.scores[run] is not None, self.scores[run] or 0),
+            reverse=True
+        )
+        good_runs_count = max(1, math.ceil(self.good_runs_ratio * len(ordered_runs)))
+        good_runs = [run for run in ordered_runs[:good_runs_count] if self.scores[run] is not None]
+        return good_runs, ordered_runs[len(good_runs):]
+
+    def _get_density(self, dimension, value_indexes) -> list:
+        values_count = len(self.iterations[dimension])
+        # uniform prior: every value can still be selected
+        densities = [1 / values_count] * values_count
+        bandwidth = max(1.0, values_count * self.ORDERED_BANDWIDTH_RATIO) \
+            if self.ordered_dimensions[dimension] else None
+        for value_index, occurrences in collections.Counter(value_indexes).items():
+            if bandwidth is None:
+                densities[value_index] += occurrences
+                continue
+            kernel = [
+                math.exp(-0.5 * ((index - value_index) / bandwidth) ** 2)
+                for index in range(values_count)
+            ]
+            kernel_sum = sum(kernel)
+            for index, weight in enumerate(kernel):
+                densities[index] += occurrences * weight / kernel_sum
+        total = sum(densities)
+        return [density / total for density in densities]
+
+    def _sample_run(self, densities) -> tuple:
+        return tuple(
+            self.random.choices(range(len(dimension_densities)), weights=dimension_densities)[0]
+            for dimension_densities in densities
+        )
+
+    @staticmethod
+    def _get_log_ratio(run, good_densities, bad_densities) -> float:
+        return sum(
+            math.log(good_densities[dimension][value_index]) - math.log(bad_densities[dimension][value_index])
+            for dimension, value_index in enumerate(run)
+        )
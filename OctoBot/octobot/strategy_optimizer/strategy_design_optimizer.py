@@ -33,7 +33,10 @@ import random
 
 import octobot.strategy_optimizer.optimizer_settings as optimizer_settings_import
 import octobot.strategy_optimizer.optimizer_filter as optimizer_filter
+import octobot.strategy_optimizer.scored_run_result as scored_run_result
+import octobot.strategy_optimizer.search_strategies as search_strategies
 import octobot.enums as enums
+import octobot.constants as constants
 import octobot_commons.optimization_campaign as optimization_campaign
 import octobot_commons.constants as commons_constants
 import octobot_commons.enums as commons_enums
@@ -42,6 +45,8 @@ import octobot_commons.logging as commons_logging
 import octobot_commons.multiprocessing_util as multiprocessing_util
 import octobot_commons.databases as databases
 import octobot_commons.dict_util as dict_util
+import octobot_backtesting.api as backtesting_api
+import octobot_backtesting.enums as backtesting_enums
 import octobot_backtesting.errors as backtesting_errors
 import octobot_tentacles_manager.api as tentacles_manager_api
 import octobot_tentacles_manager.constants as tentacles_manager_constants
@@ -66,6 +71,7 @@ class StrategyDesignOptimizer:
     SHARED_KEEP_RUNNING_KEY = "keep_running"
     SHARED_RUN_TIMES_KEY = "run_times"
     SHARED_RUNS_QUEUES_KEY = "runs_queues"
+    SHARED_DATA_HEADERS_KEY = "data_headers"
     START_QUEUE_KEY = "start_queue"
     DONE_QUEUE_KEY = "done_queue"
 
@@ -89,6 +95,10 @@ class StrategyDesignOptimizer:
     CONFIG_ROLE = "role"
     LAST_CREATED_QUEUE = f"last_created_queue{commons_constants.CONFIG_FILE_EXT}"
     LAST_CREATED_QUEUE_CONFIG = f"last_created_queue_config{commons_constants.CONFIG_FILE_EXT}"
+    SEARCH_STRATEGY_BY_MODE = {
+        enums.OptimizerModes.SUCCESSIVE_HALVING.value: search_strategies.SuccessiveHalvingSearchStrategy,
+        enums.OptimizerModes.TPE.value: search_strategies.TPESearchStrategy,
+    }
 
     def __init__(self, trading_mode, config, tentacles_setup_config, optimizer_settings=None):
         self.logger = commons_logging.get_logger(self.__class__.__name__)
@@ -145,7 +155,11 @@ class StrategyDesignOptimizer:
         lock = multiprocessing.RLock()
         shared_keep_running = multiprocessing.Value(ctypes.c_bool, True)
         shared_run_time = multiprocessing.Array(ctypes.c_float, [0.0 for _ in range(self.active_processes_count)])
+        shared_memory_data = None
         try:
+            shared_memory_data = await self._create_shared_memory_data(optimizer_settings)
+            shared_data_headers = backtesting_api.get_shared_memory_data_headers(shared_memory_data) \
+                if shared_memory_data else {}
             async for selected_optimizer_ids in self._all_optimizer_ids(optimizer_ids,
                                                                         optimizer_settings.empty_the_queue):
                 run_queues_by_optimizer_id = {
@@ -157,7 +171,7 @@ class StrategyDesignOptimizer:
                     await self._run_multi_processed_optimizer(
                         optimizer_settings, lock,
                         shared_keep_running, shared_run_time,
-                        run_queues_by_optimizer_id
+                        run_queues_by_optimizer_id, shared_data_headers
                     )
                 finally:
                     # properly empty and close queues to avoid underlying thread issues
@@ -176,6 +190,8 @@ class StrategyDesignOptimizer:
             self.logger.exception(e, True, f"Error when running optimizer processes: {e}")
             success = False
         finally:
+            if shared_memory_data is not None:
+                backtesting_api.close_shared_memory_data(shared_memory_data)
             if optimizer_settings.notify_when_complete:
                 await self._send_optimizer_finished_notification()
             self.process_pool_handle = None
@@ -186,7 +202,7 @@ class StrategyDesignOptimizer:
 
     async def _run_multi_processed_optimizer(self, optimizer_settings,
                                              lock, shared_keep_running, shared_run_time,
-                                             run_queues_by_optimizer_id):
+                                             run_queues_by_optimizer_id, shared_data_headers):
         with multiprocessing_util.registered_lock_and_shared_elements(
                 commons_enums.MultiprocessingLocks.DBLock.value,
                 lock,
@@ -194,6 +210,7 @@ class StrategyDesignOptimizer:
                     self.SHARED_KEEP_RUNNING_KEY: shared_keep_running,
                     self.SHARED_RUN_TIMES_KEY: shared_run_time,
                     self.SHARED_RUNS_QUEUES_KEY: run_queues_by_optimizer_id,
+                    self.SHARED_DATA_HEADERS_KEY: shared_data_headers,
                 }), \
                 concurrent.futures.ProcessPoolExecutor(
                     max_workers=self.active_processes_count,
@@ -204,6 +221,7 @@ class StrategyDesignOptimizer:
                                   self.SHARED_KEEP_RUNNING_KEY: shared_keep_running,
                                   self.SHARED_RUN_TIMES_KEY: shared_run_time,
                                   self.SHARED_RUNS_QUEUES_KEY: run_queues_by_optimizer_id,
+                                  self.SHARED_DATA_HEADERS_KEY: shared_data_headers,
                               })) as pool:
             coros = []
             self.logger.info(f"Dispatching optimizer backtesting runs into {self.active_processes_count} "
@@ -227,6 +245,254 @@ class StrategyDesignOptimizer:
                 )
             self.process_pool_handle = await asyncio.gather(*coros)
 
+    async def search_optimize(self, optimizer_settings):
+        success = True
+        try:
+            for optimizer_id in optimizer_settings.optimizer_ids or [optimizer_settings.optimizer_id]:
+                if not self._should_keep_running():
+                    break
+                success = await self._search_optimize(optimizer_settings, optimizer_id) and success
+        except Exception as e:
+            self.logger.exception(e, True, f"Error when running optimizer search: {e}")
+            success = False
+        finally:
+            if optimizer_settings.notify_when_complete:
+                await self._send_optimizer_finished_notification()
+            self.is_computing = False
+            self.is_finished = True
+        return success
+
+    async def _search_optimize(self, optimizer_settings, optimizer_id):
+        # runs are selected batch by batch according to the scores of the previous ones
+        iterations = [i for i in self._get_config_possible_iterations() if i]
+        search_strategy = self._create_search_strategy(optimizer_settings, iterations)
+        search_strategy.set_initial_runs(
+            await self._get_queued_search_runs(optimizer_id, iterations) or search_strategy.sample_initial_runs()
+        )
+        time_bounds = None
+        window_ratio = None
+        results_by_run = {}
+        while self._should_keep_running() and not search_strategy.is_complete():
+            runs = search_strategy.get_next_runs()
+            if not runs:
+                break
+            if search_strategy.get_window_ratio() != window_ratio:
+                # scores are only comparable on the same time window
+                window_ratio = search_strategy.get_window_ratio()
+                results_by_run = {}
+            start_timestamp, end_timestamp = optimizer_settings.start_timestamp, optimizer_settings.end_timestamp
+            if window_ratio < search_strategies.AbstractSearchStrategy.FULL_WINDOW_RATIO:
+                time_bounds = time_bounds or await self._get_search_time_bounds(optimizer_settings)
+                start_timestamp = time_bounds[1] - (time_bounds[1] - time_bounds[0]) * window_ratio
+                end_timestamp = time_bounds[1]
+            self.logger.info(f"Running {len(runs)} optimizer runs on {round(window_ratio * 100, 2)}% "
+                             f"of the time window.")
+            results_by_run.update(await self._run_search_batch(
+                optimizer_settings, optimizer_id, search_strategy, runs, start_timestamp, end_timestamp
+            ))
+            search_strategy.register_scores(
+                self._get_search_scores(optimizer_settings, search_strategy, results_by_run)
+            )
+        if (best_run := search_strategy.get_best_run()) is not None:
+            self.logger.info(f"Best optimizer run: {self._get_schedulable_run(search_strategy.get_run(best_run))}")
+        return True
+
+    def _create_search_strategy(self, optimizer_settings, iterations):
+        strategy_class = self.SEARCH_STRATEGY_BY_MODE[optimizer_settings.optimizer_mode]
+        if strategy_class is search_strategies.SuccessiveHalvingSearchStrategy:
+            return strategy_class(
+                iterations, self._is_run_allowed, optimizer_settings.queue_size,
+                reduction_factor=optimizer_settings.halving_reduction_factor,
+                max_rungs=optimizer_settings.halving_max_rungs,
+            )
+        if strategy_class is search_strategies.TPESearchStrategy:
+            processes_count = max(1, multiprocessing.cpu_count() - abs(optimizer_settings.required_idle_cores))
+            return strategy_class(
+                iterations, self._is_run_allowed, optimizer_settings.queue_size,
+                batch_size=processes_count * constants.OPTIMIZER_DEFAULT_SEARCH_BATCH_RUNS_BY_PROCESS,
+                startup_runs=optimizer_settings.tpe_startup_runs,
+                good_runs_ratio=optimizer_settings.tpe_good_runs_ratio,
+                ordered_dimensions=[
+                    all(isinstance(run_input[self.CONFIG_VALUE], (int, float))
+                        and not isinstance(run_input[self.CONFIG_VALUE], bool)
+                        for run_input in values)
+                    for values in iterations
+                ],
+            )
+        return strategy_class(iterations, self._is_run_allowed, optimizer_settings.queue_size)
+
+    async def _get_queued_search_runs(self, optimizer_id, iterations) -> list:
+        async with databases.DBReader.database(self.run_dbs_identifier.get_optimizer_runs_schedule_identifier(),
+                                               with_lock=True) as reader:
+            run_data = await self._get_run_data_from_db(optimizer_id, reader)
+        if not run_data:
+            return []
+        indexes_by_run_input = {
+            self._get_run_input_identifier(run_input): (dimension, index)
+            for dimension, values in enumerate(iterations)
+            for index, run_input in enumerate(values)
+        }
+        runs = []
+        for run_details in run_data[0][self.CONFIG_RUNS].values():
+            run = [None] * len(iterations)
+            for run_input in run_details:
+                if (run_input_index := indexes_by_run_input.get(self._get_run_input_identifier(run_input))) is None:
+                    break
+                run[run_input_index[0]] = run_input_index[1]
+            if None not in run:
+                runs.append(tuple(run))
+        return runs
+
+    def _get_run_input_identifier(self, run_input):
+        return json.dumps([
+            run_input[self.CONFIG_USER_INPUT], run_input[self.CONFIG_TENTACLE], run_input[self.CONFIG_VALUE]
+        ])
+
+    def _get_schedulable_run(self, run) -> list:
+        # do not store self.CONFIG_KEY
+        return [
+            {key: value for key, value in run_input.items() if key != self.CONFIG_KEY}
+            for run_input in run
+        ]
+
+    async def _get_search_time_bounds(self, optimizer_settings):
+        start_timestamps = []
+        end_timestamps = []
+        for data_file in optimizer_settings.data_files or []:
+            if description := await backtesting_api.get_file_description(data_file):
+                start_timestamps.append(description[backtesting_enums.DataFormatKeys.START_TIMESTAMP.value])
+                end_timestamps.append(description[backtesting_enums.DataFormatKeys.END_TIMESTAMP.value])
+        start_timestamp = optimizer_settings.start_timestamp or max(start_timestamps, default=0)
+        end_timestamp = optimizer_settings.end_timestamp or min(end_timestamps, default=0)
+        if not start_timestamp or not end_timestamp or start_timestamp >= end_timestamp:
+            raise RuntimeError(f"{optimizer_settings.optimizer_mode} optimizer mode requires a time window: "
+                               f"please set a start and end timestamp.")
+        return start_timestamp, end_timestamp
+
+    async def _run_search_batch(self, optimizer_settings, optimizer_id, search_strategy, runs,
+                                start_timestamp, end_timestamp) -> dict:
+        run_data = {
+            index: self._get_schedulable_run(search_strategy.get_run(run))
+            for index, run in enumerate(runs)
+        }
+        last_backtesting_id = max(
+            (result[commons_enums.BacktestingMetadata.ID.value]
+             for result in await self._get_optimizer_run_results(optimizer_id)),
+            default=0
+        )
+        batch_settings = copy.copy(optimizer_settings)
+        batch_settings.optimizer_ids = [optimizer_id]
+        batch_settings.empty_the_queue = False
+        batch_settings.notify_when_complete = False
+        batch_settings.start_timestamp = start_timestamp
+        batch_settings.end_timestamp = end_timestamp
+        await self._save_run_schedule(run_data, optimizer_id=optimizer_id)
+        await self.multi_processed_optimize(batch_settings, run_data_by_optimizer_id={optimizer_id: run_data})
+        self.is_computing = True
+        batch_results = [
+            result
+            for result in await self._get_optimizer_run_results(optimizer_id)
+            if result[commons_enums.BacktestingMetadata.ID.value] > last_backtesting_id
+        ]
+        if search_strategy.get_window_ratio() < search_strategies.AbstractSearchStrategy.FULL_WINDOW_RATIO:
+            await self._store_partial_window_results(optimizer_id, batch_results)
+        # runs without result failed
+        return {
+            run: next(
+                (result for result in batch_results if self._is_using_these_user_inputs(result, run_data[index])),
+                None
+            )
+            for index, run in enumerate(runs)
+        }
+
+    async def _store_partial_window_results(self, optimizer_id, results):
+        # partial time window results are only used to select the next runs: move them out of the
+        # optimizer results to never compare them with full time window results
+        if not results:
+            return
+        run_dbs_identifier = databases.RunDatabasesIdentifier(
+            self.trading_mode, self.optimization_campaign_name, optimizer_id=optimizer_id
+        )
+        async with databases.DBWriter.database(run_dbs_identifier.get_backtesting_metadata_identifier(),
+                                               with_lock=True) as writer:
+            await writer.log_many(commons_enums.DBTables.PARTIAL_WINDOW_METADATA.value, results)
+            query = await writer.search()
+            await writer.delete(
+                commons_enums.DBTables.METADATA.value,
+                query[commons_enums.BacktestingMetadata.ID.value].one_of(
+                    [result[commons_enums.BacktestingMetadata.ID.value] for result in results]
+                )
+            )
+
+    async def _get_optimizer_run_results(self, optimizer_id) -> list:
+        run_dbs_identifier = databases.RunDatabasesIdentifier(
+            self.trading_mode, self.optimization_campaign_name, optimizer_id=optimizer_id
+        )
+        try:
+            async with databases.DBReader.database(run_dbs_identifier.get_backtesting_metadata_identifier(),
+                                                   with_lock=True) as reader:
+                return await reader.all(commons_enums.DBTables.METADATA.value)
+        except commons_errors.DatabaseNotFoundError:
+            return []
+
+    def _get_search_scores(self, optimizer_settings, search_strategy, results_by_run) -> dict:
+        # excluded runs and runs without result get a None score
+        valid_results_by_run = {
+            run: result
+            for run, result in results_by_run.items()
+            if result is not None and not self._is_excluded_result(optimizer_settings, result)
+        }
+        fitness_parameters = copy.deepcopy(optimizer_settings.fitness_parameters)
+        for result in valid_results_by_run.values():
+            for fitness_parameter in fitness_parameters:
+                fitness_parameter.update_ratio(result)
+        scores = {run: None for run in results_by_run}
+        for run, result in valid_results_by_run.items():
+            scored_result = scored_run_result.ScoredRunResult(result, search_strategy.get_run(run))
+            scored_result.compute_score(fitness_parameters)
+            scores[run] = scored_result.score
+        return scores
+
+    @staticmethod
+    def _is_excluded_result(optimizer_settings, result) -> bool:
+        for exclude_filter in optimizer_settings.exclude_filters:
+            result_filter = copy.copy(exclude_filter)
+            try:
+                result_filter.load_values(result)
+            except KeyError:
+                continue
+            if result_filter.is_filtered():
+                return True
+        return False
+
+    async def _create_shared_memory_data(self, optimizer_settings):
+        if not optimizer_settings.shared_memory_data:
+            return None
+        try:
+            t0 = time.time()
+            shared_memory_data = await backtesting_api.create_and_init_shared_memory_data(
+                optimizer_settings.data_files, self.config
+            )
+            self.logger.info(f"Shared {len(backtesting_api.get_shared_memory_data_headers(shared_memory_data))} "
+                             f"data files with optimizer processes in {round(time.time() - t0, 3)} seconds.")
+            return shared_memory_data
+        except Exception as e:
+            self.logger.exception(e, True, f"Error when sharing data files with optimizer processes, "
+                                           f"each backtesting will read data files: {e}")
+            return None
+
+    async def _create_backtesting_data(self, data_files, tentacles_setup_config):
+        try:
+            shared_data_headers = multiprocessing_util.get_shared_element(self.SHARED_DATA_HEADERS_KEY)
+        except KeyError:
+            # not running in optimizer processes
+            return None
+        if not shared_data_headers:
+            return None
+        return await backtesting_api.create_and_init_shared_memory_backtest_data(
+            data_files, self.config, tentacles_setup_config, shared_data_headers
+        )
+
     async def _all_optimizer_ids(self, prioritized_ids, empty_the_queue):
         if prioritized_ids:
             yield prioritized_ids
@@ -454,6 +720,8 @@ class StrategyDesignOptimizer:
     def _get_optimization_func(self, optimizer_settings: optimizer_settings_import.OptimizerSettings):
         if optimizer_settings.optimizer_mode == enums.OptimizerModes.NORMAL.value:
             return self.multi_processed_optimize
+        if optimizer_settings.optimizer_mode in self.SEARCH_STRATEGY_BY_MODE:
+            return self.search_optimize
         return None
 
     async def resume(self, optimizer_settings: optimizer_settings_import.OptimizerSettings):
@@ -641,21 +909,23 @@ class StrategyDesignOptimizer:
                                start_timestamp=None, end_timestamp=None):
         self.logger.debug(f"Running optimizer with id {optimizer_id} "
                           f"on backtesting {run_id} with config {run_config}")
-        self._update_config_for_optimizer(optimizer_id, run_id)
         tentacles_setup_config = self._get_custom_tentacles_setup_config(optimizer_id, run_id, run_config)
         independent_backtesting = None
+        backtesting_data = None
         try:
             import octobot.api.backtesting as octobot_backtesting_api
             # reset possible remaining caches
             await databases.CacheManager().reset()
-            config_to_use = copy.deepcopy(self.config)
+            # attach to data files decoded by the parent process when available
+            backtesting_data = await self._create_backtesting_data(data_files, tentacles_setup_config)
             independent_backtesting = octobot_backtesting_api.create_independent_backtesting(
-                config_to_use,
+                self._get_run_config(optimizer_id, run_id),
                 tentacles_setup_config,
                 data_files,
                 start_timestamp=start_timestamp,
                 end_timestamp=end_timestamp,
                 enforce_total_databases_max_size_after_run=False,
+                backtesting_data=backtesting_data,
             )
             await octobot_backtesting_api.initialize_and_run_independent_backtesting(independent_backtesting,
                                                                                      log_errors=False)
@@ -670,10 +940,17 @@ class StrategyDesignOptimizer:
         finally:
             if independent_backtesting is not None:
                 await independent_backtesting.stop()
+            if backtesting_data is not None:
+                await backtesting_api.stop_backtest_data(backtesting_data)
 
-    def _update_config_for_optimizer(self, optimizer_id, run_id):
-        self.config[commons_constants.CONFIG_OPTIMIZER_ID] = optimizer_id
-        self.config[commons_constants.CONFIG_BACKTESTING_ID] = run_id
+    def _get_run_config(self, optimizer_id, run_id):
+        # independent backtestings only read their origin config: share self.config between runs
+        # and overlay the run ids instead of deep copying it for each run
+        return {
+            **self.config,
+            commons_constants.CONFIG_OPTIMIZER_ID: optimizer_id,
+            commons_constants.CONFIG_BACKTESTING_ID: run_id,
+        }
 
     def _updated_nested_tentacle_config(self, nested_tentacles, user_input, config_value, local_tentacle_config):
         cleaned_tentacle_name = nested_tentacles[0].replace(" ", "_")
@@ -738,11 +1015,19 @@ class StrategyDesignOptimizer:
 
     def _generate_runs(self):
         iterations = [i for i in self._get_config_possible_iterations() if i]
-        runs = {
-            index: run
-            for index, run in enumerate(itertools.product(*iterations))
-            if self._is_run_allowed(run)
-        }
+        if self.optimizer_settings.optimizer_mode in self.SEARCH_STRATEGY_BY_MODE:
+            # only schedule the initial runs of the search, next runs depend on their results
+            search_strategy = self._create_search_strategy(self.optimizer_settings, iterations)
+            runs = {
+                index: search_strategy.get_run(run)
+                for index, run in enumerate(search_strategy.sample_initial_runs())
+            }
+        else:
+            runs = {
+                index: run
+                for index, run in enumerate(itertools.product(*iterations))
+                if self._is_run_allowed(run)
+            }
         if runs:
             shuffled_runs = self.shuffle_and_select_runs(runs, select_size=self.optimizer_settings.queue_size)
             for run in shuffled_runs.values():
@@ -871,16 +1156,17 @@ class StrategyDesignOptimizer:
         except FileNotFoundError as err:
             self.logger.debug(f"Skipped run schedule and config save: {err}")
 
-    async def _save_run_schedule(self, runs):
+    async def _save_run_schedule(self, runs, optimizer_id=None):
+        optimizer_id = self.optimizer_settings.optimizer_id if optimizer_id is None else optimizer_id
         self.runs_schedule = {
             self.CONFIG_RUNS: runs,
-            self.CONFIG_ID: self.optimizer_settings.optimizer_id
+            self.CONFIG_ID: optimizer_id
         }
         self.total_nb_runs = len(runs)
         async with databases.DBWriterReader.database(self.run_dbs_identifier.get_optimizer_runs_schedule_identifier(),
                                                      with_lock=True) as writer_reader:
             try:
-                existing_runs = await self._get_run_data_from_db(self.optimizer_settings.optimizer_id, writer_reader)
+                existing_runs = await self._get_run_data_from_db(optimizer_id, writer_reader)
                 if existing_runs:
                     merged_runs = {
                         self.get_run_hash(run_data): run_data
@@ -897,7 +1183,7 @@ class StrategyDesignOptimizer:
                         for index, details in enumerate(merged_runs.values())
                     }
                     await writer_reader.delete(self.RUN_SCHEDULE_TABLE, (await writer_reader.search()).id ==
-                                               self.optimizer_settings.optimizer_id)
+                                               optimizer_id)
                 await writer_reader.log(self.RUN_SCHEDULE_TABLE, self.runs_schedule)
             except json.JSONDecodeError:
                 self.logger.error(f"Invalid data in run schedule, clearing runs.")
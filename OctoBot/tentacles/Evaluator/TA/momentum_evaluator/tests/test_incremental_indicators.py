@@ -0,0 +1,101 @@
+#  Drakkar-Software OctoBot-Tentacles
+#  Copyright (c) Drakkar-Software, All rights reserved.
+#
+#  This library is free software; you can redistribute it and/or
+#  modify it under the terms of the GNU Lesser General Public
+#  License as published by the Free Software Foundation; either
+#  version 3.0 of the License, or (at your option) any later version.
+#
+#  This library is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the GNU
+#  Lesser General Public License for more details.
+#
+#  You should have received a copy of the GNU Lesser General Public
+#  License along with this library.
+import random
+import mock
+import numpy
+import pytest
+import tulipy
+
+import tests.test_utils.config as test_utils_config
+import octobot_commons.enums as commons_enums
+import octobot_trading.exchange_data as trading_exchange_data
+import tentacles.Evaluator.TA as TA
+
+
+# All test coroutines will be treated as marked.
+pytestmark = pytest.mark.asyncio
+
+TIME_FRAME = commons_enums.TimeFrames.ONE_HOUR
+CANDLES_COUNT = trading_exchange_data.CandlesManager.MAX_CANDLES_COUNT + 200
+
+
+@pytest.mark.parametrize("is_preloaded", [True, False])
+async def test_rsi_evaluator_uses_incremental_indicator(is_preloaded):
+    candles_manager = await _get_candles_manager(is_preloaded)
+    close = numpy.array(candles_manager.get_symbol_close_candles())
+    evaluator = TA.RSIMomentumEvaluator(test_utils_config.load_test_tentacles_config())
+    # tulipy restarts from the oldest stored candle: same values once the dropped candles weight has faded
+    expected_rsi = tulipy.rsi(close, evaluator.period_length)[-100:]
+    with mock.patch.object(evaluator, "get_exchange_symbol_data",
+                           mock.Mock(return_value=mock.Mock(symbol_candles={TIME_FRAME: candles_manager}))), \
+            mock.patch.object(tulipy, "rsi", mock.Mock()) as rsi_mock, \
+            mock.patch.object(evaluator, "_evaluate_rsi", mock.AsyncMock()) as _evaluate_rsi_mock:
+        await evaluator.ohlcv_callback("binance", "0a", "Bitcoin", "BTC/USDT", TIME_FRAME.value, {}, False)
+        rsi_mock.assert_not_called()
+        _evaluate_rsi_mock.assert_awaited_once()
+        numpy.testing.assert_allclose(_evaluate_rsi_mock.mock_calls[0].args[3][-100:], expected_rsi)
+
+
+@pytest.mark.parametrize("is_preloaded", [True, False])
+async def test_bollinger_bands_evaluator_uses_incremental_indicator(is_preloaded):
+    candles_manager = await _get_candles_manager(is_preloaded)
+    evaluator = TA.BBMomentumEvaluator(test_utils_config.load_test_tentacles_config())
+    expected_bands = tulipy.bbands(candles_manager.get_symbol_close_candles(evaluator.period_length),
+                                   evaluator.period_length, 2)
+    with mock.patch.object(evaluator, "get_exchange_symbol_data",
+                           mock.Mock(return_value=mock.Mock(symbol_candles={TIME_FRAME: candles_manager}))), \
+            mock.patch.object(tulipy, "bbands", mock.Mock()) as bbands_mock, \
+            mock.patch.object(evaluator, "_evaluate_bands", mock.AsyncMock()) as _evaluate_bands_mock:
+        await evaluator.ohlcv_callback("binance", "0a", "Bitcoin", "BTC/USDT", TIME_FRAME.value, {}, False)
+        bbands_mock.assert_not_called()
+        _evaluate_bands_mock.assert_awaited_once()
+        for band, expected_band in zip(_evaluate_bands_mock.mock_calls[0].args[4:7], expected_bands):
+            numpy.testing.assert_allclose(band, expected_band)
+
+
+async def _get_candles_manager(is_preloaded):
+    candles = _gen_candles(CANDLES_COUNT)
+    if is_preloaded:
+        candles_manager = trading_exchange_data.PreloadedCandlesManager()
+        await candles_manager.initialize()
+        candles_manager.replace_all_candles(candles)
+        # backtesting: move to the last candles
+        for candle in candles[-CANDLES_COUNT // 2:]:
+            candles_manager.add_old_and_new_candles([candle])
+    else:
+        # more candles than max_candles_count: the oldest ones are dropped
+        candles_manager = trading_exchange_data.CandlesManager()
+        await candles_manager.initialize()
+        candles_manager.replace_all_candles(candles)
+    return candles_manager
+
+
+def _gen_candles(size):
+    rand = random.Random(42)
+    candles = []
+    close = 100
+    for index in range(size):
+        open_price = close
+        close = max(1, close + rand.uniform(-3, 3))
+        candle = [0] * len(commons_enums.PriceIndexes)
+        candle[commons_enums.PriceIndexes.IND_PRICE_TIME.value] = index * 3600
+        candle[commons_enums.PriceIndexes.IND_PRICE_OPEN.value] = open_price
+        candle[commons_enums.PriceIndexes.IND_PRICE_HIGH.value] = max(open_price, close) + rand.uniform(0, 2)
+        candle[commons_enums.PriceIndexes.IND_PRICE_LOW.value] = min(open_price, close) - rand.uniform(0, 2)
+        candle[commons_enums.PriceIndexes.IND_PRICE_CLOSE.value] = close
+        candle[commons_enums.PriceIndexes.IND_PRICE_VOL.value] = rand.uniform(1, 100)
+        candles.append(candle)
+    return candles
@@ -123,6 +123,27 @@ async def _load_historical_values(meta_database, exchange, with_candles=True,
     return price_data, trades_data, moving_portfolio_data, trading_type, metadata
 
 
+async def get_plotted_series(meta_database, title=None, time_frame=None, start_time=None, end_time=None,
+                             exchange=None, symbol=None):
+    """
+    :return: the plotted series of the given symbol database, each series contains its style
+    and its x, y, z, open, high, low, close and volume values within [start_time, end_time] (in milliseconds)
+    """
+    symbol_db = meta_database.get_symbol_db(exchange or meta_database.run_dbs_identifier.context.exchange_name,
+                                            symbol or meta_database.run_dbs_identifier.context.symbol)
+    return await symbol_db.select_series(title=title, time_frame=time_frame, min_x=start_time, max_x=end_time)
+
+
+def _get_series_rows(series):
+    return [
+        {
+            column: series[column][index]
+            for column in series["columns"]
+        }
+        for index in range(len(series["x"]))
+    ]
+
+
 async def backtesting_data(meta_database, data_label):
     metadata_from_run = await meta_database.get_backtesting_metadata_from_run()
     for key, value in metadata_from_run.items():
@@ -582,6 +603,10 @@ async def plot_table(meta_database, plotted_element, data_source, columns=None,
         symbol_db = meta_database.get_symbol_db(exchange, symbol)
         if cache_value is None:
             data = await symbol_db.all(data_source)
+            if not data:
+                # plotted values are stored as columnar series
+                for series in await symbol_db.select_series(title=data_source):
+                    data += _get_series_rows(series)
         else:
             query = (await symbol_db.search()).title == data_source
             cache_data = await symbol_db.select(commons_enums.DBTables.CACHE_SOURCE.value, query)
@@ -0,0 +1,115 @@
+#  This file is part of OctoBot (https://github.com/Drakkar-Software/OctoBot)
+#  Copyright (c) 2023 Drakkar-Software, All rights reserved.
+#
+#  OctoBot is free software; you can redistribute it and/or
+#  modify it under the terms of the GNU General Public License
+#  as published by the Free Software Foundation; either
+#  version 3.0 of the License, or (at your option) any later version.
+#
+#  OctoBot is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the GNU
+#  General Public License for more details.
+#
+#  You should have received a copy of the GNU General Public
+#  License along with OctoBot. If not, see <https://www.gnu.org/licenses/>.
+import pytest
+
+import octobot.strategy_optimizer.search_strategies as search_strategies
+
+SIZES = (10, 8, 2)
+OPTIMUM = (7, 2, 1)
+
+
+def _get_iterations():
+    return [
+        [{"value": value} for value in range(size)]
+        for size in SIZES
+    ]
+
+
+def _get_score(run):
+    return -sum(((value - optimum) / size) ** 2 for value, optimum, size in zip(run, OPTIMUM, SIZES))
+
+
+def _is_run_allowed(run):
+    # value 9 of the 1st user input is filtered out
+    return run[0]["value"] != 9
+
+
+def test_abstract_search_strategy():
+    with pytest.raises(TypeError):
+        search_strategies.AbstractSearchStrategy(_get_iterations(), _is_run_allowed, 50)
+
+
+def test_sample_initial_runs():
+    strategy = search_strategies.SuccessiveHalvingSearchStrategy(_get_iterations(), _is_run_allowed, 50, seed=1)
+    runs = strategy.sample_initial_runs()
+    assert len(runs) == len(set(runs)) == 50
+    assert all(run[0] != 9 for run in runs)
+    assert strategy.get_run(runs[0]) == [{"value": runs[0][0]}, {"value": runs[0][1]}, {"value": runs[0][2]}]
+    # every allowed run: 9 * 8 * 2
+    assert len(strategy.sample_runs(1000, ())) == 144
+
+
+def test_successive_halving_search():
+    strategy = search_strategies.SuccessiveHalvingSearchStrategy(
+        _get_iterations(), _is_run_allowed, 100, reduction_factor=3, max_rungs=3, seed=1
+    )
+    strategy.set_initial_runs(strategy.sample_initial_runs())
+    window_ratios = []
+    runs_counts = []
+    while not strategy.is_complete():
+        runs = strategy.get_next_runs()
+        window_ratios.append(strategy.get_window_ratio())
+        runs_counts.append(len(runs))
+        strategy.register_scores({run: _get_score(run) for run in runs})
+    assert window_ratios == [1 / 27, 1 / 9, 1 / 3, 1]
+    assert runs_counts == [100, 34, 12, 4]
+    assert strategy.get_next_runs() == []
+    best_run = strategy.get_best_run()
+    assert best_run == max(strategy.scores, key=_get_score)
+    assert _get_score(best_run) > -0.1
+
+
+def test_successive_halving_search_drops_filtered_runs():
+    strategy = search_strategies.SuccessiveHalvingSearchStrategy(_get_iterations(), _is_run_allowed, 9, seed=1)
+    strategy.set_initial_runs(strategy.sample_initial_runs())
+    runs = strategy.get_next_runs()
+    strategy.register_scores({run: 1 if run == runs[0] else None for run in runs})
+    assert strategy.get_next_runs() == [runs[0]]
+    strategy.register_scores({run: None for run in strategy.get_next_runs()})
+    assert strategy.is_complete()
+    assert strategy.get_best_run() is None
+
+
+def test_tpe_search():
+    strategy = search_strategies.TPESearchStrategy(
+        _get_iterations(), _is_run_allowed, 40, batch_size=4, startup_runs=10,
+        ordered_dimensions=[True, True, False], seed=1
+    )
+    strategy.set_initial_runs(strategy.sample_initial_runs())
+    scores = {}
+    while not strategy.is_complete():
+        runs = strategy.get_next_runs()
+        assert runs
+        assert strategy.get_window_ratio() == 1
+        assert not set(runs).intersection(scores)
+        scores.update({run: _get_score(run) for run in runs})
+        strategy.register_scores(scores)
+    assert len(scores) == 40
+    assert _get_score(strategy.get_best_run()) > -0.05
+
+
+def test_tpe_search_exhausted_space():
+    strategy = search_strategies.TPESearchStrategy([[{"value": 1}, {"value": 2}]], lambda _: True, 10,
+                                                   batch_size=4, startup_runs=1, seed=1)
+    strategy.set_initial_runs(strategy.sample_initial_runs())
+    runs = strategy.get_next_runs()
+    strategy.register_scores({run: 1 for run in runs})
+    runs = strategy.get_next_runs()
+    assert len(runs) == 1
+    strategy.register_scores({run: None for run in runs})
+    assert strategy.get_next_runs() == []
+    assert strategy.is_complete()
+    assert strategy.scores[strategy.get_best_run()] == 1
@@ -108,3 +108,120 @@ async def test_resume_normal_mode(optimizer_inputs):
         _get_total_nb_runs_mock.assert_called_once_with(optimizer_settings.optimizer_ids)
         multi_processed_optimize_mock.assert_awaited_once_with(optimizer_settings)
 
+
+
+@pytest.mark.parametrize("mode", [enums.OptimizerModes.SUCCESSIVE_HALVING.value, enums.OptimizerModes.TPE.value])
+async def test_resume_search_modes(optimizer_inputs, mode):
+    tentacles_setup_config, trading_mode = optimizer_inputs
+    optimizer_settings = bot_module_api.create_strategy_optimizer_settings({
+        enums.OptimizerConfig.OPTIMIZER_CONFIG.value: MOCKED_OPTIMIZER_CONFIG,
+        enums.OptimizerConfig.OPTIMIZER_IDS.value: [1],
+        enums.OptimizerConfig.MODE.value: mode,
+    })
+    optimizer = bot_module_api.create_design_strategy_optimizer(
+        trading_mode,
+        optimizer_settings,
+        None,
+        tentacles_setup_config,
+    )
+    with mock.patch.object(optimizer, "_get_total_nb_runs", mock.AsyncMock(return_value=5)), \
+            mock.patch.object(optimizer, "multi_processed_optimize", mock.AsyncMock()) as multi_processed_optimize_mock, \
+            mock.patch.object(optimizer, "search_optimize",
+                              mock.AsyncMock(return_value=True)) as search_optimize_mock:
+        assert await optimizer.resume(optimizer_settings) is True
+        search_optimize_mock.assert_awaited_once_with(optimizer_settings)
+        multi_processed_optimize_mock.assert_not_called()
+
+
+@pytest.mark.parametrize("window_ratio, is_partial_window", [(0.25, True), (1, False)])
+async def test_run_search_batch_stores_partial_window_results(optimizer_inputs, window_ratio, is_partial_window):
+    tentacles_setup_config, trading_mode = optimizer_inputs
+    optimizer_settings = bot_module_api.create_strategy_optimizer_settings({
+        enums.OptimizerConfig.OPTIMIZER_CONFIG.value: MOCKED_OPTIMIZER_CONFIG,
+        enums.OptimizerConfig.MODE.value: enums.OptimizerModes.SUCCESSIVE_HALVING.value,
+    })
+    optimizer = bot_module_api.create_design_strategy_optimizer(
+        trading_mode,
+        optimizer_settings,
+        None,
+        tentacles_setup_config,
+    )
+    search_strategy = mock.Mock(get_run=mock.Mock(return_value=[]),
+                                get_window_ratio=mock.Mock(return_value=window_ratio))
+    previous_result = {commons_enums.BacktestingMetadata.ID.value: 1}
+    batch_result = {commons_enums.BacktestingMetadata.ID.value: 2}
+    with mock.patch.object(optimizer, "_get_optimizer_run_results",
+                           mock.AsyncMock(side_effect=[[previous_result], [previous_result, batch_result]])), \
+            mock.patch.object(optimizer, "_save_run_schedule", mock.AsyncMock()), \
+            mock.patch.object(optimizer, "multi_processed_optimize", mock.AsyncMock()), \
+            mock.patch.object(optimizer, "_is_using_these_user_inputs", mock.Mock(return_value=True)), \
+            mock.patch.object(optimizer, "_store_partial_window_results", mock.AsyncMock()) \
+            as _store_partial_window_results_mock:
+        assert await optimizer._run_search_batch(optimizer_settings, 1, search_strategy, [(0, )], 0, 1) == \
+               {(0, ): batch_result}
+        if is_partial_window:
+            # partial window results are not stored with other optimizer results
+            _store_partial_window_results_mock.assert_awaited_once_with(1, [batch_result])
+        else:
+            _store_partial_window_results_mock.assert_not_called()
+
+
+async def test_get_run_config(optimizer_inputs):
+    tentacles_setup_config, trading_mode = optimizer_inputs
+    optimizer_settings = bot_module_api.create_strategy_optimizer_settings({
+        enums.OptimizerConfig.OPTIMIZER_CONFIG.value: MOCKED_OPTIMIZER_CONFIG,
+    })
+    config = {commons_constants.CONFIG_EXCHANGES: {"binance": {}}}
+    optimizer = bot_module_api.create_design_strategy_optimizer(
+        trading_mode,
+        optimizer_settings,
+        config,
+        tentacles_setup_config,
+    )
+    run_config = optimizer._get_run_config(1, 2)
+    assert run_config == {
+        commons_constants.CONFIG_EXCHANGES: {"binance": {}},
+        commons_constants.CONFIG_OPTIMIZER_ID: 1,
+        commons_constants.CONFIG_BACKTESTING_ID: 2,
+    }
+    # base config is shared and not updated
+    assert run_config[commons_constants.CONFIG_EXCHANGES] is config[commons_constants.CONFIG_EXCHANGES]
+    assert config == {commons_constants.CONFIG_EXCHANGES: {"binance": {}}}
+
+async def test_get_search_scores(optimizer_inputs):
+    tentacles_setup_config, trading_mode = optimizer_inputs
+    optimizer_settings = bot_module_api.create_strategy_optimizer_settings({
+        enums.OptimizerConfig.OPTIMIZER_CONFIG.value: MOCKED_OPTIMIZER_CONFIG,
+        enums.OptimizerConfig.MODE.value: enums.OptimizerModes.TPE.value,
+    })
+    optimizer = bot_module_api.create_design_strategy_optimizer(
+        trading_mode,
+        optimizer_settings,
+        None,
+        tentacles_setup_config,
+    )
+    search_strategy = mock.Mock(get_run=mock.Mock(return_value=[]))
+    results_by_run = {
+        (0, ): {
+            commons_enums.BacktestingMetadata.PERCENT_GAINS.value: 10,
+            commons_enums.BacktestingMetadata.TRADES.value: 3,
+            commons_enums.BacktestingMetadata.COEFFICIENT_OF_DETERMINATION_MAX_BALANCE.value: 0.5,
+        },
+        (1, ): {
+            commons_enums.BacktestingMetadata.PERCENT_GAINS.value: 20,
+            commons_enums.BacktestingMetadata.TRADES.value: 5,
+            commons_enums.BacktestingMetadata.COEFFICIENT_OF_DETERMINATION_MAX_BALANCE.value: 0.5,
+        },
+        # filtered out: no trade
+        (2, ): {
+            commons_enums.BacktestingMetadata.PERCENT_GAINS.value: 30,
+            commons_enums.BacktestingMetadata.TRADES.value: 0,
+            commons_enums.BacktestingMetadata.COEFFICIENT_OF_DETERMINATION_MAX_BALANCE.value: 0.5,
+        },
+        # failed run
+        (3, ): None,
+    }
+    scores = optimizer._get_search_scores(optimizer_settings, search_strategy, results_by_run)
+    assert scores[(1, )] > scores[(0, )]
+    assert scores[(2, )] is None
+    assert scores[(3, )] is None